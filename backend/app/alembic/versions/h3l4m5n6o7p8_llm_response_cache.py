@@ -0,0 +1,40 @@
+"""Add llmresponsecache for content-addressed annotation responses.
+
+Revision ID: h3l4m5n6o7p8
+Revises: g2k3l4m5n6o7
+Create Date: 2026-10-16
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision = "h3l4m5n6o7p8"
+down_revision = "g2k3l4m5n6o7"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "llmresponsecache",
+        sa.Column("key", sa.String(64), nullable=False),
+        sa.Column("infospace_id", sa.Integer(), nullable=False),
+        sa.Column("source_run_id", sa.Integer(), nullable=True),
+        sa.Column("response", postgresql.JSONB(), nullable=True),
+        sa.Column("size_bytes", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("hit_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("last_hit_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["infospace_id"], ["infospace.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("key"),
+    )
+    op.create_index("ix_llmresponsecache_infospace_id", "llmresponsecache", ["infospace_id"])
+    op.create_index("ix_llmresponsecache_last_hit_at", "llmresponsecache", ["last_hit_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_llmresponsecache_last_hit_at", table_name="llmresponsecache")
+    op.drop_index("ix_llmresponsecache_infospace_id", table_name="llmresponsecache")
+    op.drop_table("llmresponsecache")
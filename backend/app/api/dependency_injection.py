@@ -1,6 +1,6 @@
 from __future__ import annotations
 import logging
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Generator
 from typing import Annotated, Any, Optional, Union
 
 from fastapi import Depends, HTTPException, status, Request
@@ -8,10 +8,11 @@ from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError, jwt
 from pydantic import ValidationError
 from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.core import security
 from app.core.config import settings, AppSettings
-from app.core.db import engine
+from app.core.db import async_session_scope, engine
 from app.models import User
 from app.schemas import TokenPayload
 
@@ -70,6 +71,18 @@ def get_db() -> Generator[Session, None, None]:
         yield session
 
 SessionDep = Annotated[Session, Depends(get_db)]
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """Session on the async engine for read-heavy endpoints.
+
+    Pass ``session.sync_session`` to the sync query builders and run their
+    DB work through ``core.db.run_sync`` (``AssetQuery.run``).
+    """
+    async with async_session_scope() as session:
+        yield session
+
+AsyncSessionDep = Annotated[AsyncSession, Depends(get_async_db)]
 TokenDep = Annotated[Optional[str], Depends(reusable_oauth2)]
 
 # --- User Authentication Dependencies ---
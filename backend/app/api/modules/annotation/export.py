@@ -0,0 +1,463 @@
+"""Streaming run exports — CSV and Parquet with bounded memory.
+
+Backs ``GET /runs/{run_id}/export/{csv,parquet}``. The old export loaded
+every annotation of the run family into memory, looked each asset and
+schema up with a point query, and serialized the whole CSV into one
+buffer. Large runs (millions of annotations) blew worker memory and timed
+out.
+
+Pipeline:
+
+  1. **Column discovery** — one SQL statement walks every ``value`` JSONB
+     server-side and returns the distinct flattened paths (same semantics
+     as ``sharing.csv_writers.flatten_dict``). No values cross the wire.
+  2. **Row stream** — one server-side cursor over ``annotation LEFT JOIN
+     asset``, fetched in ``batch_size`` partitions. Schemas (a handful per
+     run) are loaded once up front.
+  3. **Encoding** — each partition becomes one CSV chunk or one Parquet
+     row group. Nothing larger than a partition is ever held.
+
+Parquet column types come from the schemas' ``output_contract`` (integer,
+number, boolean → typed columns; everything else → string). Requires
+``pyarrow``; the route checks ``parquet_available()`` before streaming.
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+from sqlalchemy import text as sa_text
+from sqlmodel import Session, select
+
+from app.api.modules.annotation.models import Annotation, AnnotationSchema
+from app.api.modules.content.models import Asset
+from app.api.modules.sharing.csv_writers import flatten_dict
+
+logger = logging.getLogger(__name__)
+
+EXPORT_BATCH_SIZE = 5_000
+
+BASE_COLUMNS = [
+    "annotation_id", "annotation_uuid", "asset_id", "schema_id", "run_id",
+    "status", "timestamp", "event_timestamp",
+]
+METADATA_COLUMNS = [
+    "asset_title", "asset_kind", "asset_uuid", "source_id", "asset_created_at",
+    "parent_asset_id", "part_index", "schema_name", "schema_version",
+]
+
+
+# ─── Column discovery ───────────────────────────────────────────────────────
+
+# Mirrors flatten_dict: objects recurse with ``.key``; arrays whose first
+# element is an object recurse with ``[i]``; everything else is a leaf
+# (primitive arrays are joined with ``|`` by flatten_dict). Empty objects
+# produce no column.
+_DISCOVER_VALUE_PATHS_SQL = """
+    WITH RECURSIVE walk(path, val) AS (
+        SELECT 'value.' || e.key, e.value
+        FROM annotation a, jsonb_each(a.value) e
+        WHERE a.run_id = ANY(:run_ids) AND jsonb_typeof(a.value) = 'object'
+        UNION ALL
+        SELECT w.path || c.suffix, c.val
+        FROM walk w
+        CROSS JOIN LATERAL (
+            SELECT '.' || o.key AS suffix, o.value AS val
+            FROM jsonb_each(
+                CASE WHEN jsonb_typeof(w.val) = 'object' THEN w.val ELSE '{}'::jsonb END
+            ) o
+            UNION ALL
+            SELECT '[' || (x.ord - 1) || ']', x.elem
+            FROM jsonb_array_elements(
+                CASE WHEN jsonb_typeof(w.val) = 'array' AND jsonb_typeof(w.val -> 0) = 'object'
+                     THEN w.val ELSE '[]'::jsonb END
+            ) WITH ORDINALITY x(elem, ord)
+        ) c
+    )
+    SELECT DISTINCT path FROM walk
+    WHERE jsonb_typeof(val) <> 'object'
+      -- val -> 0 is NULL for [], so the test must not go NULL with it
+      AND NOT COALESCE(jsonb_typeof(val) = 'array' AND jsonb_typeof(val -> 0) = 'object', false)
+"""
+
+_HAS_EMPTY_VALUE_SQL = """
+    SELECT EXISTS (
+        SELECT 1 FROM annotation
+        WHERE run_id = ANY(:run_ids) AND (value IS NULL OR value = '{}'::jsonb)
+    )
+"""
+
+
+def discover_value_columns(session: Session, run_ids: Sequence[int]) -> List[str]:
+    """Distinct flattened ``value.*`` paths across the run family, sorted."""
+    rows = session.execute(sa_text(_DISCOVER_VALUE_PATHS_SQL), {"run_ids": list(run_ids)}).fetchall()
+    return sorted(r[0] for r in rows)
+
+
+def export_columns(
+    value_columns: Sequence[str],
+    *,
+    flatten_json: bool,
+    include_metadata: bool,
+    include_justifications: bool,
+    has_empty_values: bool = False,
+) -> List[str]:
+    """Final column order: non-value columns sorted, then ``value.*`` sorted.
+
+    Same ordering as the previous in-memory export. ``value_json`` sorts with
+    the metadata columns; it appears when values are not flattened or when
+    some annotation has an empty value (flatten_dict would yield nothing).
+    """
+    meta = list(BASE_COLUMNS)
+    if include_metadata:
+        meta.extend(METADATA_COLUMNS)
+    if include_justifications:
+        meta.append("justifications")
+    if not flatten_json or has_empty_values:
+        meta.append("value_json")
+    values = sorted(value_columns) if flatten_json else []
+    return sorted(meta) + values
+
+
+def collect_inline_justifications(value: Optional[Dict[str, Any]]) -> list:
+    """Walk an annotation value JSONB and pull every inline justification reasoning string.
+
+    The structured-output pipeline injects:
+      * sibling ``{field}_justification`` blocks at the parent level for scalars,
+        objects, and primitive arrays;
+      * inline ``justification`` fields inside each item of an array<object> field;
+      * top-level ``_thinking_trace`` for provider thinking summaries.
+
+    Returns a list of ``"label:reasoning"`` strings for the ``justifications`` column.
+    """
+    if not isinstance(value, dict):
+        return []
+    out = []
+    for key, sub in value.items():
+        if not isinstance(sub, dict):
+            continue
+        if key.endswith("_justification") and sub.get("reasoning"):
+            label = key[: -len("_justification")]
+            out.append(f"{label}:{sub['reasoning']}")
+        elif key == "_thinking_trace" and sub.get("reasoning"):
+            out.append(f"_thinking_trace:{sub['reasoning']}")
+    for key, sub in value.items():
+        if isinstance(sub, list):
+            for i, item in enumerate(sub):
+                if isinstance(item, dict):
+                    j = item.get("justification")
+                    if isinstance(j, dict) and j.get("reasoning"):
+                        out.append(f"{key}[{i}]:{j['reasoning']}")
+    return out
+
+
+# ─── Row stream ─────────────────────────────────────────────────────────────
+
+
+@dataclass
+class RunExport:
+    """Configured export over one run family.
+
+    ``columns`` is fixed before the first row is produced so both encoders
+    can emit a header / schema up front.
+    """
+
+    session: Session
+    run_ids: List[int]
+    flatten_json: bool = True
+    include_metadata: bool = True
+    include_justifications: bool = False
+    batch_size: int = EXPORT_BATCH_SIZE
+    columns: List[str] = field(default_factory=list)
+    schemas: Dict[int, AnnotationSchema] = field(default_factory=dict)
+
+    @classmethod
+    def prepare(
+        cls,
+        session: Session,
+        run_ids: Sequence[int],
+        **options: Any,
+    ) -> "RunExport":
+        export = cls(session=session, run_ids=list(run_ids), **options)
+        schema_ids = session.exec(
+            select(Annotation.schema_id).where(Annotation.run_id.in_(export.run_ids)).distinct()
+        ).all()
+        if schema_ids:
+            export.schemas = {
+                s.id: s for s in session.exec(
+                    select(AnnotationSchema).where(AnnotationSchema.id.in_(schema_ids))
+                ).all()
+            }
+        value_columns: List[str] = []
+        has_empty = False
+        if export.flatten_json:
+            value_columns = discover_value_columns(session, export.run_ids)
+            has_empty = bool(session.execute(
+                sa_text(_HAS_EMPTY_VALUE_SQL), {"run_ids": export.run_ids}
+            ).scalar())
+        export.columns = export_columns(
+            value_columns,
+            flatten_json=export.flatten_json,
+            include_metadata=export.include_metadata,
+            include_justifications=export.include_justifications,
+            has_empty_values=has_empty,
+        )
+        return export
+
+    def _statement(self):
+        cols = [
+            Annotation.id, Annotation.uuid, Annotation.asset_id, Annotation.schema_id,
+            Annotation.run_id, Annotation.status, Annotation.timestamp,
+            Annotation.event_timestamp, Annotation.value,
+        ]
+        stmt = select(*cols)
+        if self.include_metadata:
+            stmt = select(
+                *cols,
+                Asset.title, Asset.kind, Asset.uuid, Asset.source_id,
+                Asset.created_at, Asset.parent_asset_id, Asset.part_index,
+            ).outerjoin(Asset, Asset.id == Annotation.asset_id)
+        return (
+            stmt.where(Annotation.run_id.in_(self.run_ids))
+            .order_by(Annotation.id)
+            .execution_options(yield_per=self.batch_size)
+        )
+
+    def iter_batches(self) -> Iterator[List[Dict[str, Any]]]:
+        """Yield lists of flat row dicts, one list per cursor partition."""
+        result = self.session.exec(self._statement())
+        for partition in result.partitions():
+            batch: List[Dict[str, Any]] = []
+            for r in partition:
+                row: Dict[str, Any] = {
+                    "annotation_id": r[0],
+                    "annotation_uuid": r[1],
+                    "asset_id": r[2],
+                    "schema_id": r[3],
+                    "run_id": r[4],
+                    "status": getattr(r[5], "value", r[5]),
+                    "timestamp": r[6],
+                    "event_timestamp": r[7],
+                }
+                value = r[8]
+                if self.include_metadata:
+                    if r[9] is not None:
+                        row["asset_title"] = r[9]
+                        row["asset_kind"] = getattr(r[10], "value", r[10])
+                        row["asset_uuid"] = r[11]
+                        row["source_id"] = r[12]
+                        row["asset_created_at"] = r[13]
+                        row["parent_asset_id"] = r[14]
+                        row["part_index"] = r[15]
+                    schema = self.schemas.get(r[3])
+                    if schema is not None:
+                        row["schema_name"] = schema.name
+                        row["schema_version"] = schema.version
+                if self.include_justifications:
+                    texts = collect_inline_justifications(value)
+                    if texts:
+                        row["justifications"] = " | ".join(texts)
+                if self.flatten_json and value:
+                    row.update(flatten_dict(value, parent_key="value"))
+                else:
+                    row["value_json"] = str(value)
+                batch.append(row)
+            yield batch
+
+    # ─── CSV ───
+
+    def iter_csv(self) -> Iterator[bytes]:
+        """Header, then one encoded chunk per partition."""
+        buf = io.StringIO()
+        writer = csv.DictWriter(buf, fieldnames=self.columns, extrasaction="ignore")
+        writer.writeheader()
+        total = 0
+        for batch in self.iter_batches():
+            for row in batch:
+                writer.writerow({k: _csv_cell(v) for k, v in row.items()})
+            total += len(batch)
+            yield buf.getvalue().encode("utf-8")
+            buf.seek(0)
+            buf.truncate(0)
+        if buf.tell():
+            yield buf.getvalue().encode("utf-8")
+        logger.info(f"Export: streamed {total} CSV rows for runs {self.run_ids}")
+
+    # ─── Parquet ───
+
+    def iter_parquet(self) -> Iterator[bytes]:
+        """One row group per partition; bytes are drained after each group."""
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        kinds = self.column_kinds()
+        schema = pa.schema([pa.field(col, _arrow_type(kind)) for col, kind in kinds.items()])
+        sink = _DrainableSink()
+        writer = pq.ParquetWriter(sink, schema, compression="zstd")
+        total = 0
+        try:
+            for batch in self.iter_batches():
+                columns = {
+                    col: [_coerce(row.get(col), kind) for row in batch]
+                    for col, kind in kinds.items()
+                }
+                writer.write_table(pa.Table.from_pydict(columns, schema=schema))
+                total += len(batch)
+                chunk = sink.drain()
+                if chunk:
+                    yield chunk
+        finally:
+            writer.close()
+        tail = sink.drain()
+        if tail:
+            yield tail
+        logger.info(f"Export: streamed {total} Parquet rows for runs {self.run_ids}")
+
+    def column_kinds(self) -> Dict[str, str]:
+        """Column → logical kind (``int``/``float``/``bool``/``timestamp``/``string``)."""
+        contract_kinds: Dict[str, str] = {}
+        for schema in self.schemas.values():
+            for path, kind in contract_value_kinds(schema.output_contract or {}).items():
+                prior = contract_kinds.get(path)
+                # Same path typed differently across schemas → fall back to string.
+                contract_kinds[path] = kind if prior in (None, kind) else "string"
+        return {
+            col: _FIXED_KINDS.get(col) or contract_kinds.get(col, "string")
+            for col in self.columns
+        }
+
+
+_FIXED_KINDS = {
+    "annotation_id": "int",
+    "asset_id": "int",
+    "schema_id": "int",
+    "run_id": "int",
+    "source_id": "int",
+    "parent_asset_id": "int",
+    "part_index": "int",
+    "timestamp": "timestamp",
+    "event_timestamp": "timestamp",
+    "asset_created_at": "timestamp",
+}
+
+_CONTRACT_KINDS = {"integer": "int", "number": "float", "boolean": "bool"}
+
+
+def _arrow_type(kind: str):
+    import pyarrow as pa
+
+    return {
+        "int": pa.int64(),
+        "float": pa.float64(),
+        "bool": pa.bool_(),
+        "timestamp": pa.timestamp("us", tz="UTC"),
+    }.get(kind, pa.string())
+
+
+def contract_value_kinds(contract: Dict[str, Any], prefix: str = "value") -> Dict[str, str]:
+    """Map flattened ``value.*`` paths to scalar kinds using a JSON-schema contract.
+
+    Only statically-addressable leaves are typed: nested objects recurse,
+    arrays of objects and primitive arrays are left to the string default
+    (their columns are indexed or ``|``-joined by flatten_dict).
+    """
+    out: Dict[str, str] = {}
+    for name, spec in (contract.get("properties") or {}).items():
+        if not isinstance(spec, dict):
+            continue
+        path = f"{prefix}.{name}"
+        typ = spec.get("type")
+        if isinstance(typ, list):
+            non_null = [t for t in typ if t != "null"]
+            typ = non_null[0] if len(non_null) == 1 else None
+        if typ == "object":
+            out.update(contract_value_kinds(spec, path))
+        elif typ in _CONTRACT_KINDS:
+            out[path] = _CONTRACT_KINDS[typ]
+    return out
+
+
+def _coerce(value: Any, kind: str) -> Any:
+    """Best-effort cast into the column's Arrow type; unparseable → null.
+
+    LLM output does not always honour the contract (``"7"`` for an integer);
+    a null cell is better than failing the whole export mid-stream.
+    """
+    if value is None or value == "":
+        return None
+    try:
+        if kind == "int":
+            if isinstance(value, bool):
+                return int(value)
+            return int(float(value)) if isinstance(value, str) else int(value)
+        if kind == "float":
+            return float(value)
+        if kind == "bool":
+            if isinstance(value, str):
+                lowered = value.strip().lower()
+                if lowered in ("true", "1", "yes"):
+                    return True
+                if lowered in ("false", "0", "no"):
+                    return False
+                return None
+            return bool(value)
+        if kind == "timestamp":
+            return value if isinstance(value, datetime) else datetime.fromisoformat(str(value))
+    except (TypeError, ValueError, OverflowError):
+        return None
+    return value if isinstance(value, str) else str(value)
+
+
+def _csv_cell(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+class _DrainableSink(io.RawIOBase):
+    """Write-only file object whose buffered bytes can be drained between row groups.
+
+    ParquetWriter records absolute column-chunk offsets via ``tell()``, so the
+    position keeps counting across drains even though the bytes are gone.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._chunks: List[bytes] = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, b) -> int:
+        data = bytes(b)
+        self._chunks.append(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def parquet_available() -> bool:
+    try:
+        import pyarrow  # noqa: F401
+        import pyarrow.parquet  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def export_filename(run_name: Optional[str], run_id: int, suffix: str) -> str:
+    safe_run_name = (run_name or "").replace(" ", "_").replace("/", "_")[:50]
+    return f"annotations_run_{run_id}_{safe_run_name}{suffix}"
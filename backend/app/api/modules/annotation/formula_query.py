@@ -185,17 +185,33 @@ class FormulaQuery:
         omitted (the graph engine's contract: first entity-shaped dim
         identifies the triplet array on the annotation).
 
-        Bridges the streaming source (``AnnotationGraphSource`` +
-        ``collect_graph``) to the JSON /view endpoint. The route runs
-        ``_build_view_phases`` in a worker thread via ``asyncio.to_thread``,
-        so spinning up a fresh event loop here with ``asyncio.run`` is
-        safe — we're not nested inside another loop.
+        Sync bridge over :meth:`graph_view_async` for callers outside an
+        event loop (it spins one up with ``asyncio.run``). Async callers —
+        the /view endpoint — await ``graph_view_async`` directly.
 
         Using ``collect_graph`` (not the deprecated ``AnnotationQuery.graph``)
         gives us the same path-aware triplet resolution as ``graph_stream``:
         dotted paths like ``document.triplets[*]`` and the ``[*]`` suffix
         are normalized; the deprecated method couldn't handle either.
         """
+        import asyncio
+
+        return asyncio.run(self.graph_view_async(
+            triplet_field=triplet_field,
+            dedup=dedup,
+            top_n_nodes=top_n_nodes,
+            top_n_edges=top_n_edges,
+        ))
+
+    async def graph_view_async(
+        self,
+        *,
+        triplet_field: str | None = None,
+        dedup: str = "exact",
+        top_n_nodes: int | None = None,
+        top_n_edges: int | None = None,
+    ) -> GraphResultData:
+        """:meth:`graph_view` for callers already inside an event loop."""
         tf = triplet_field
         if tf is None and self.formula.group:
             tf = self.formula.group[0].path
@@ -204,7 +220,6 @@ class FormulaQuery:
                 "graph view requires triplet_field or formula.group[0].path"
             )
 
-        import asyncio
         from app.api.modules.graph.stream import (
             AnnotationGraphSource,
             collect_graph,
@@ -215,14 +230,12 @@ class FormulaQuery:
             triplet_field=tf,
             dedup=dedup,
         )
-        return asyncio.run(
-            collect_graph(
-                self.aq._session,
-                self.aq._infospace_id,
-                source,
-                top_n_nodes=top_n_nodes,
-                top_n_edges=top_n_edges,
-            )
+        return await collect_graph(
+            self.aq._session,
+            self.aq._infospace_id,
+            source,
+            top_n_nodes=top_n_nodes,
+            top_n_edges=top_n_edges,
         )
 
 
@@ -168,3 +168,19 @@ class RunAggregate(SQLModel, table=True):
         Index("ix_runaggregate_payload", "payload", postgresql_using="gin", postgresql_ops={"payload": "jsonb_path_ops"}),
         Index("ix_runaggregate_run_field", "run_id", "field_path"),
     )
+
+
+class LLMResponseCache(SQLModel, table=True):
+    """Content-addressed provider responses for opt-in annotation reuse.
+
+    ``key`` is the SHA-256 built by ``annotation/response_cache.py``;
+    eviction is size-bounded LRU over ``last_hit_at``.
+    """
+    key: str = Field(primary_key=True, max_length=64)
+    infospace_id: int = Field(foreign_key="infospace.id", index=True)
+    source_run_id: Optional[int] = Field(default=None)
+    response: Dict[str, Any] = Field(default_factory=dict, sa_column=Column(JSONB))
+    size_bytes: int = Field(default=0)
+    hit_count: int = Field(default=0)
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    last_hit_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc), index=True)
@@ -904,7 +904,21 @@ class AnnotationQuery:
         author writes one formula and the engine does the right thing.
 
         See ``docs/intelligence/HOW_TO.md`` § "One SQL GROUP BY".
+
+        Results are cached in Redis keyed by the query state, the formula,
+        and the generations of its runs — see ``relation_cache``.
         """
+        from app.api.modules.annotation import relation_cache
+
+        key, cached = relation_cache.lookup(self, formula)
+        if cached is not None:
+            return cached
+        rel = self._relation_uncached(formula)
+        if key is not None:
+            relation_cache.store(key, rel)
+        return rel
+
+    def _relation_uncached(self, formula) -> OutputRelation:
         # Save state so multiple ``relation()`` calls on the same AQ don't
         # compound conditions / merge_maps. The body extends self in place
         # because every helper (_base_where, _apply_conditions, _find_merge_map)
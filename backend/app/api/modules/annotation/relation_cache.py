@@ -0,0 +1,284 @@
+"""Formula result cache for ``AnnotationQuery.relation()``.
+
+Dashboards re-request the same Formula over and over (every panel render,
+every SSE ``progress`` tick). Each request used to recompile and rerun the
+full LATERAL/JSONB aggregation even when no annotation had changed. This
+module keeps materialised :class:`OutputRelation` blobs in Redis.
+
+Key = SHA-256 over a canonical JSON of everything the engine reads:
+
+  - infospace, run ids, schema ids, asset ids, package-scope run ids
+  - filter conditions and merge maps (order kept — first match wins)
+  - relation pagination (``_limit`` / ``_cursor``)
+  - the Formula body and, when composition is attached, the dashboard's
+    ``formulas[]`` it can reference
+  - a per-run **generation** (Redis token replaced by ``invalidate_runs``
+    after every commit that wrote annotation rows of the run)
+
+Writers move the generation, the read path never touches Postgres: a
+cache hit costs one ``MGET`` and one ``GET``. ORM writes of ``annotation``
+rows record their run on ``session.info[PENDING]`` (``after_flush``) and
+invalidate after commit — the listeners are installed at app and worker
+startup by :func:`install_listeners`. Writers that bypass the ORM call
+:func:`mark` (Core DELETE by asset) or :func:`invalidate_runs` (the
+annotate write buffer) themselves.
+
+A generation is a random token, not a counter, so a generation key that
+expired and is set again can never recreate an old cache key. Generations
+outlive entries (``2 × TTL``), so an entry keyed on "no generation yet"
+is gone before its run's generation can lapse back to nothing.
+
+Stale entries are never read (their key is unreachable once the
+generation moves); they age out through the LRU index.
+
+Redis I/O is blocking. Async views run ``relation()`` through ``run_sync``,
+i.e. on the event-loop thread inside a greenlet; there :func:`lookup`,
+:func:`store` and the commit-time invalidation hand the Redis round trip to
+a worker thread and ``await_only`` it, so the loop keeps serving.
+
+Eviction is app-level LRU, not Redis ``maxmemory-policy``: the same Redis
+holds streams and locks, so ``allkeys-lru`` is not an option. Every entry
+is tracked in a sorted set scored by last access; inserts trim the set to
+``RELATION_CACHE_MAX_ENTRIES`` by popping the oldest members.
+
+Best-effort throughout — a Redis failure degrades to a recompute, never
+to an error. Hits and misses are counted under ``relcache:hit`` /
+``relcache:miss``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import time
+import uuid
+from itertools import chain
+from typing import TYPE_CHECKING, Any, Callable, Iterable, TypeVar
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from sqlalchemy.util.concurrency import await_only, in_greenlet
+
+from app.core.config import settings
+
+if TYPE_CHECKING:
+    from app.api.modules.annotation.query import AnnotationQuery, OutputRelation
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "relcache:v1:"
+LRU_INDEX_KEY = "relcache:lru"
+GENERATION_PREFIX = "relcache:gen:"
+
+# session.info key: run ids whose generation moves when the session commits
+PENDING = "relcache_runs"
+
+T = TypeVar("T")
+
+
+def _redis():
+    from app.core.redis import get_redis
+    return get_redis()
+
+
+def _count(counter: str) -> None:
+    try:
+        _redis().incr(counter)
+    except Exception:
+        pass
+
+
+def _off_loop(fn: Callable[..., T], *args: Any) -> T:
+    """Run blocking Redis I/O without stalling an event loop.
+
+    Inside a ``run_sync`` greenlet the call goes to a worker thread and is
+    awaited on the owning task; everywhere else it runs inline.
+    """
+    if in_greenlet():
+        return await_only(asyncio.to_thread(fn, *args))
+    return fn(*args)
+
+
+# ── Invalidation ─────────────────────────────────────────────────────────────
+
+
+def invalidate_runs(run_ids: Iterable[int | None]) -> None:
+    """Move the generation of each run so cached relations over it miss.
+
+    Called by writers after commit. Pass the run and its family root —
+    dashboards bind to the root and roll the family up underneath.
+    """
+    ids = sorted({rid for rid in run_ids if rid is not None})
+    if not ids or not settings.RELATION_CACHE_ENABLED:
+        return
+    try:
+        pipe = _redis().pipeline(transaction=False)
+        for rid in ids:
+            pipe.set(
+                f"{GENERATION_PREFIX}{rid}", uuid.uuid4().hex,
+                ex=settings.RELATION_CACHE_TTL_SECONDS * 2,
+            )
+        pipe.execute()
+    except Exception as exc:
+        logger.debug("relation cache invalidation failed for %s: %s", ids, exc)
+
+
+def mark(session, run_ids: Iterable[int | None]) -> None:
+    """Record annotation writes to ``run_ids``; invalidated when ``session`` commits."""
+    ids = {rid for rid in run_ids if rid is not None}
+    if ids:
+        session.info.setdefault(PENDING, set()).update(ids)
+
+
+def _collect_writes(session, flush_context):
+    # new/dirty/deleted still hold the pre-flush state here
+    for obj in chain(session.new, session.dirty, session.deleted):
+        if getattr(obj, "__tablename__", None) == "annotation":
+            mark(session, [getattr(obj, "run_id", None)])
+
+
+def _invalidate_after_commit(session):
+    if session.in_nested_transaction():
+        return  # savepoint release — wait for the real commit
+    ids = session.info.pop(PENDING, None)
+    if ids:
+        _off_loop(invalidate_runs, ids)
+
+
+def _discard_on_rollback(session):
+    if session.in_nested_transaction():
+        return
+    session.info.pop(PENDING, None)
+
+
+_LISTENERS = (
+    ("after_flush", _collect_writes),
+    ("after_commit", _invalidate_after_commit),
+    ("after_rollback", _discard_on_rollback),
+)
+
+
+def install_listeners() -> None:
+    """Register the Session listeners that invalidate on commit (idempotent).
+
+    Called once at app startup and on worker init.
+    """
+    for name, fn in _LISTENERS:
+        if not event.contains(Session, name, fn):
+            event.listen(Session, name, fn)
+
+
+# ── Key construction ─────────────────────────────────────────────────────────
+
+
+def _generations(run_ids: list[int]) -> list[str | None]:
+    return _redis().mget([f"{GENERATION_PREFIX}{rid}" for rid in run_ids])
+
+
+def canonical_state(aq: "AnnotationQuery", formula) -> dict[str, Any]:
+    """Everything the relation engine reads, as plain JSON-able data."""
+    scope = aq._package_scope
+    lookup = getattr(aq, "_formula_lookup", None)
+    dashboard = getattr(lookup, "dashboard_config", None) or {}
+    return {
+        "iid": aq._infospace_id,
+        "runs": sorted(aq._run_ids),
+        "schemas": sorted(aq._schema_ids),
+        "assets": sorted(aq._asset_ids),
+        "scope": None if scope is None else sorted(scope.run_ids or []),
+        "conditions": [c.model_dump(mode="json") for c in aq._conditions],
+        "merge_maps": [mm.model_dump(mode="json") for mm in aq._merge_maps],
+        "limit": aq._limit,
+        "cursor": aq._cursor,
+        "formula": formula.model_dump(mode="json"),
+        "composition": dashboard.get("formulas") if lookup is not None else None,
+    }
+
+
+def cache_key(state: dict[str, Any]) -> str | None:
+    """Cache key for a :func:`canonical_state`, or ``None`` when Redis is down.
+
+    Without generations a key could outlive the rows it describes, so a
+    failed ``MGET`` makes the query uncacheable rather than unversioned.
+    """
+    try:
+        generations = _generations(state["runs"])
+    except Exception as exc:
+        logger.debug("relation cache generation read failed: %s", exc)
+        return None
+    canonical = json.dumps(
+        {**state, "generations": generations},
+        sort_keys=True, separators=(",", ":"), default=str,
+    )
+    return KEY_PREFIX + hashlib.sha256(canonical.encode()).hexdigest()
+
+
+# ── Get / put ────────────────────────────────────────────────────────────────
+
+
+def _lookup(state: dict[str, Any]) -> "tuple[str | None, OutputRelation | None]":
+    key = cache_key(state)
+    return key, (get(key) if key is not None else None)
+
+
+def lookup(aq: "AnnotationQuery", formula) -> "tuple[str | None, OutputRelation | None]":
+    """``(key, cached relation)`` for ``aq.relation(formula)``.
+
+    ``key`` is ``None`` when the query is uncacheable. Infospace-wide
+    queries (no run ids) are not cached: no writer keeps a generation for
+    them.
+    """
+    if not settings.RELATION_CACHE_ENABLED or not aq._run_ids:
+        return None, None
+    try:
+        state = canonical_state(aq, formula)
+    except Exception as exc:
+        logger.debug("relation cache key construction failed: %s", exc)
+        return None, None
+    return _off_loop(_lookup, state)
+
+
+def store(key: str, rel: "OutputRelation") -> None:
+    """:func:`put`, off the event loop when called from an async view."""
+    _off_loop(put, key, rel)
+
+
+def get(key: str) -> "OutputRelation | None":
+    from app.api.modules.annotation.query import OutputRelation
+
+    try:
+        r = _redis()
+        raw = r.get(key)
+        if raw is None:
+            _count("relcache:miss")
+            return None
+        r.zadd(LRU_INDEX_KEY, {key: time.time()})
+        _count("relcache:hit")
+        return OutputRelation.model_validate_json(raw)
+    except Exception as exc:
+        logger.debug("relation cache read failed for %s: %s", key, exc)
+        return None
+
+
+def put(key: str, rel: "OutputRelation") -> None:
+    try:
+        payload = rel.model_dump_json()
+        if len(payload) > settings.RELATION_CACHE_MAX_ENTRY_BYTES:
+            _count("relcache:oversize")
+            return
+        r = _redis()
+        pipe = r.pipeline(transaction=False)
+        pipe.set(key, payload, ex=settings.RELATION_CACHE_TTL_SECONDS)
+        pipe.zadd(LRU_INDEX_KEY, {key: time.time()})
+        pipe.zcard(LRU_INDEX_KEY)
+        size = pipe.execute()[-1]
+        overflow = size - settings.RELATION_CACHE_MAX_ENTRIES
+        if overflow > 0:
+            evicted = [member for member, _score in r.zpopmin(LRU_INDEX_KEY, overflow)]
+            if evicted:
+                r.delete(*evicted)
+                r.incrby("relcache:evicted", len(evicted))
+    except Exception as exc:
+        logger.debug("relation cache write failed for %s: %s", key, exc)
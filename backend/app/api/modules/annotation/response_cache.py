@@ -0,0 +1,221 @@
+"""Content-addressed LLM response cache for annotation runs.
+
+Re-running a schema over assets it has already seen — schema iteration,
+extension runs over overlapping bundles, ``retry_failed_annotations``
+after a persistence failure — used to pay for the identical provider call
+again. Runs opt in with ``response_cache: true`` in their configuration;
+``process_single_asset_schema`` then looks the call up here before
+acquiring a concurrency slot, and a hit skips the provider entirely.
+
+Key = SHA-256 over everything the provider sees or is told:
+
+  - the assembled prompt text and every media input (bytes, MIME type,
+    UUID). This subsumes ``asset.content_hash`` — parent context and
+    media assembly also reach the prompt, and the hash must move with them;
+  - the structured-output JSON schema (derived from ``output_contract``
+    and the justification settings) and the final schema instructions;
+  - the extraction strategy, with its Phase A schema and list fields;
+  - provider, model, thinking flag and the generation settings in
+    ``GENERATION_KEYS``;
+  - the infospace — responses are never shared across tenants.
+
+Entries live in ``llmresponsecache`` (JSONB). Only successful, parseable
+responses are stored. :func:`trim` evicts least-recently-hit entries once
+the table holds more than ``ANNOTATION_RESPONSE_CACHE_MAX_BYTES``.
+
+Cache I/O uses its own short sessions so lookups never join the run's
+write-behind transaction. The functions here are blocking; async callers
+run them through ``asyncio.to_thread``. Best-effort throughout: a cache failure is a
+miss, never an annotation error.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import text
+from sqlmodel import Session
+
+from app.core.config import settings
+from app.core.db import engine
+
+logger = logging.getLogger(__name__)
+
+KEY_VERSION = "v1"
+
+# Run-config keys that change what the provider generates.
+GENERATION_KEYS = (
+    "temperature",
+    "top_p",
+    "top_k",
+    "seed",
+    "max_tokens",
+    "max_output_tokens",
+    "thinking_config",
+    "max_tool_iterations",
+)
+
+
+def enabled_for(run_config: Dict[str, Any]) -> bool:
+    return bool(settings.ANNOTATION_RESPONSE_CACHE_ENABLED and run_config.get("response_cache"))
+
+
+def _digest_media(media_inputs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    digests = []
+    for item in media_inputs or []:
+        content = item.get("content")
+        if isinstance(content, str):
+            content = content.encode("utf-8")
+        digests.append({
+            "uuid": item.get("uuid"),
+            "type": item.get("type"),
+            "mime_type": item.get("mime_type"),
+            "sha256": hashlib.sha256(content).hexdigest() if content else None,
+            "metadata": item.get("metadata"),
+        })
+    return digests
+
+
+def response_cache_key(
+    *,
+    infospace_id: int,
+    text_content: str,
+    media_inputs: List[Dict[str, Any]],
+    provider: Optional[str],
+    model: Optional[str],
+    strategy: str,
+    response_schema: Dict[str, Any],
+    instructions: str,
+    thinking_enabled: bool,
+    run_config: Dict[str, Any],
+    phase_a_schema: Optional[Dict[str, Any]] = None,
+    list_fields: Optional[List[Any]] = None,
+) -> str:
+    state = {
+        "v": KEY_VERSION,
+        "iid": infospace_id,
+        "text": hashlib.sha256((text_content or "").encode("utf-8")).hexdigest(),
+        "media": _digest_media(media_inputs),
+        "provider": provider,
+        "model": model,
+        "strategy": strategy,
+        "schema": response_schema,
+        "phase_a_schema": phase_a_schema,
+        "list_fields": list_fields or [],
+        "instructions": instructions or "",
+        "thinking": bool(thinking_enabled),
+        "generation": {k: run_config.get(k) for k in GENERATION_KEYS if k in run_config},
+    }
+    canonical = json.dumps(state, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def lookup(key: str) -> Optional[SimpleNamespace]:
+    """Return a provider-response stand-in for ``key``, or ``None`` on miss.
+
+    The stand-in carries ``content``, ``model_used`` and ``thinking_trace``
+    like a live response; ``usage`` is ``None`` because a hit spends no
+    tokens. ``cache`` holds the provenance stamped onto the annotation.
+    """
+    try:
+        with Session(engine) as session:
+            row = session.execute(
+                text(
+                    "UPDATE llmresponsecache "
+                    "SET hit_count = hit_count + 1, last_hit_at = :now "
+                    "WHERE key = :key "
+                    "RETURNING response, created_at, source_run_id"
+                ),
+                {"key": key, "now": datetime.now(timezone.utc)},
+            ).first()
+            session.commit()
+    except Exception as exc:
+        logger.debug("response cache lookup failed for %s: %s", key, exc)
+        return None
+    if row is None:
+        return None
+    response = row[0] or {}
+    return SimpleNamespace(
+        content=response.get("content"),
+        model_used=response.get("model_used"),
+        thinking_trace=response.get("thinking_trace"),
+        usage=None,
+        cache={
+            "hit": True,
+            "key": key,
+            "cached_at": row[1].isoformat() if row[1] else None,
+            "source_run_id": row[2],
+            "source_usage": response.get("usage"),
+        },
+    )
+
+
+def store(
+    key: str,
+    provider_response: Any,
+    *,
+    infospace_id: int,
+    run_id: Optional[int],
+    usage: Optional[Dict[str, Any]] = None,
+) -> bool:
+    """Insert a successful response. Returns ``False`` when skipped or failed."""
+    payload = {
+        "content": getattr(provider_response, "content", None),
+        "model_used": getattr(provider_response, "model_used", None),
+        "thinking_trace": getattr(provider_response, "thinking_trace", None),
+        "usage": usage,
+    }
+    encoded = json.dumps(payload, default=str)
+    if len(encoded) > settings.ANNOTATION_RESPONSE_CACHE_MAX_ENTRY_BYTES:
+        return False
+    now = datetime.now(timezone.utc)
+    try:
+        with Session(engine) as session:
+            session.execute(
+                text(
+                    "INSERT INTO llmresponsecache "
+                    "(key, infospace_id, source_run_id, response, size_bytes, hit_count, created_at, last_hit_at) "
+                    "VALUES (:key, :iid, :rid, CAST(:response AS jsonb), :size, 0, :now, :now) "
+                    "ON CONFLICT (key) DO NOTHING"
+                ),
+                {"key": key, "iid": infospace_id, "rid": run_id,
+                 "response": encoded, "size": len(encoded), "now": now},
+            )
+            session.commit()
+        return True
+    except Exception as exc:
+        logger.debug("response cache store failed for %s: %s", key, exc)
+        return False
+
+
+def trim(max_bytes: Optional[int] = None) -> int:
+    """Evict least-recently-hit entries until the cache fits ``max_bytes``.
+
+    Returns the number of evicted entries.
+    """
+    cap = settings.ANNOTATION_RESPONSE_CACHE_MAX_BYTES if max_bytes is None else max_bytes
+    try:
+        with Session(engine) as session:
+            evicted = session.execute(
+                text(
+                    "DELETE FROM llmresponsecache WHERE key IN ("
+                    "  SELECT key FROM ("
+                    "    SELECT key, sum(size_bytes) OVER (ORDER BY last_hit_at DESC, key) AS running "
+                    "    FROM llmresponsecache"
+                    "  ) ranked WHERE running > :cap"
+                    ")"
+                ),
+                {"cap": cap},
+            ).rowcount
+            session.commit()
+    except Exception as exc:
+        logger.debug("response cache trim failed: %s", exc)
+        return 0
+    if evicted:
+        logger.info("LLM response cache: evicted %d entries over %d bytes", evicted, cap)
+    return evicted or 0
@@ -0,0 +1,166 @@
+"""Adaptive concurrency for annotation LLM calls.
+
+``process_assets_parallel`` used to gate provider calls with a fixed
+``asyncio.Semaphore(concurrency_limit)``. A fixed limit is wrong in both
+directions: too high and the provider answers with 429s that turn into
+FAILED annotations; too low and fast models sit idle.
+
+:class:`AdaptiveLimiter` is a drop-in for that semaphore (same
+``acquire()`` / ``release()`` shape, so ``process_single_asset_schema``
+is unchanged) whose limit follows AIMD:
+
+  - **additive increase** — every successful call adds ``1 / limit``, so the
+    limit grows by about one per window of successful calls, up to the
+    configured ``concurrency_limit``;
+  - **multiplicative decrease** — a rate-limited call halves the limit
+    (never below 1). Calls that were already in flight when the limit was
+    cut report their 429s too; a cooldown of one smoothed latency keeps a
+    single burst from collapsing the limit to 1;
+  - **latency guard** — while the smoothed call latency is more than
+    ``latency_factor`` × its own best value the provider is queueing
+    requests, so increases are held. The baseline is the minimum of the
+    smoothed latency, not of single calls: document sizes are heavy-tailed
+    and one tiny asset must not make every large one look congested.
+
+Throttling is recognised by HTTP status only (429, and Anthropic's 529
+``overloaded``), never by message text: an unrelated error quoting "429"
+or "rate" must not halve the limit. Provider SDKs carry the status on
+their exceptions — ``status_code`` (OpenAI, Anthropic, Mistral), ``code``
+(google-genai ``APIError``), ``response.status_code`` (httpx, Ollama).
+Our providers wrap those in ``RuntimeError("... failed: ...")`` inside
+the ``except`` block, so :func:`is_rate_limit_error` walks the
+``__cause__`` / ``__context__`` chain back to the SDK error.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from typing import Optional
+
+RATE_LIMIT_STATUSES = frozenset({429, 529})
+
+
+def _status_code(exc: BaseException) -> Optional[int]:
+    for attr in ("status_code", "code"):
+        value = getattr(exc, attr, None)
+        if isinstance(value, int):
+            return value
+    value = getattr(getattr(exc, "response", None), "status_code", None)
+    return value if isinstance(value, int) else None
+
+
+def is_rate_limit_error(exc: Optional[BaseException]) -> bool:
+    """True when ``exc``, or the SDK error it wraps, is a throttling response."""
+    seen: set[int] = set()
+    while exc is not None and id(exc) not in seen:
+        seen.add(id(exc))
+        if _status_code(exc) in RATE_LIMIT_STATUSES:
+            return True
+        exc = exc.__cause__ or exc.__context__
+    return False
+
+
+class AdaptiveLimiter:
+    """Semaphore-compatible limiter with an AIMD-controlled limit."""
+
+    def __init__(
+        self,
+        max_limit: int,
+        *,
+        initial: Optional[int] = None,
+        min_limit: int = 1,
+        latency_factor: float = 2.0,
+        ewma_alpha: float = 0.2,
+        warmup: int = 5,
+    ) -> None:
+        self.max_limit = max(1, max_limit)
+        self.min_limit = max(1, min(min_limit, self.max_limit))
+        start = self.max_limit if initial is None else initial
+        self._limit = float(min(max(start, self.min_limit), self.max_limit))
+        self.latency_factor = latency_factor
+        self.ewma_alpha = ewma_alpha
+        self.warmup = warmup
+
+        self.in_flight = 0
+        self.latency_ewma: Optional[float] = None
+        self.latency_floor: Optional[float] = None
+        self.throttles = 0
+        self._samples = 0
+        self._started: dict[Optional[asyncio.Task], list[float]] = {}
+        self._last_decrease = 0.0
+        self._waiters: deque[asyncio.Future] = deque()
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    # ─── Semaphore interface ───
+
+    async def acquire(self) -> None:
+        while self.in_flight >= self.limit:
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            finally:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+        self.in_flight += 1
+        self._started.setdefault(asyncio.current_task(), []).append(time.monotonic())
+
+    def release(self) -> None:
+        task = asyncio.current_task()
+        stack = self._started.get(task)
+        if stack:
+            self._observe_latency(time.monotonic() - stack.pop())
+            if not stack:
+                del self._started[task]
+        self.in_flight = max(0, self.in_flight - 1)
+        self._wake()
+
+    def _wake(self) -> None:
+        free = self.limit - self.in_flight
+        while free > 0 and self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                free -= 1
+
+    # ─── Feedback ───
+
+    def _observe_latency(self, seconds: float) -> None:
+        if self.latency_ewma is None:
+            self.latency_ewma = seconds
+        else:
+            self.latency_ewma += self.ewma_alpha * (seconds - self.latency_ewma)
+        self._samples += 1
+        if self._samples >= self.warmup and (
+            self.latency_floor is None or self.latency_ewma < self.latency_floor
+        ):
+            self.latency_floor = self.latency_ewma
+
+    @property
+    def congested(self) -> bool:
+        if self.latency_ewma is None or not self.latency_floor:
+            return False
+        return self.latency_ewma > self.latency_factor * self.latency_floor
+
+    def record_success(self) -> None:
+        if self.congested:
+            return
+        self._limit = min(float(self.max_limit), self._limit + 1.0 / max(self._limit, 1.0))
+        self._wake()
+
+    def record_throttle(self) -> None:
+        self.throttles += 1
+        self._decrease(0.5)
+
+    def _decrease(self, factor: float) -> None:
+        now = time.monotonic()
+        cooldown = max(self.latency_ewma or 0.0, 1.0)
+        if now - self._last_decrease < cooldown:
+            return
+        self._last_decrease = now
+        self._limit = max(float(self.min_limit), self._limit * factor)
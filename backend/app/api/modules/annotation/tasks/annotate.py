@@ -1,7 +1,7 @@
 """Tasks for handling annotations."""
 import json
 import logging
-from typing import List, Dict, Any, Type, Optional, TYPE_CHECKING, Tuple
+from typing import Callable, List, Dict, Any, Type, Optional, TYPE_CHECKING, Tuple
 from datetime import datetime, timezone
 from sqlmodel import Session, select
 from sqlalchemy import func, or_, text
@@ -29,6 +29,8 @@ from app.core.task_utils import (
     split_schema_for_extraction,
 )
 from app.core.tasks import TaskContext, task
+from app.api.modules.annotation import response_cache
+from app.api.modules.annotation.scheduler import AdaptiveLimiter, is_rate_limit_error
 from app.core.config import settings
 from app.api.modules.content.types import get_content_type_registry
 
@@ -1181,12 +1183,12 @@ CHAINED_RUN_CURSOR_KEY = "_chained_asset_ids"
 def process_annotation_run(ctx: TaskContext, run_ids: list[int]) -> None:
     """
     Process annotation runs. Discovers PENDING runs via check query.
-    For large runs (> ANNOTATION_CHUNK_SIZE), processes one chunk per invocation
+    For large runs (> ANNOTATION_SLICE_ASSETS), processes one slice per invocation
     and self-chains to continue. Uses Redis lock per run.
     """
     from app.core.redis_lock import annotation_run_lock
 
-    chunk_size = settings.ANNOTATION_CHUNK_SIZE
+    chunk_size = settings.ANNOTATION_SLICE_ASSETS
 
     for run_id in run_ids:
         with annotation_run_lock(run_id) as acquired:
@@ -1904,7 +1906,9 @@ async def process_single_asset_schema(
         "asset_id": asset.id,
         "schema_id": schema.id,
         "annotations": [],
-        "error": None
+        "error": None,
+        "rate_limited": False,
+        "cache_hit": False,
     }
     
     try:
@@ -1999,15 +2003,46 @@ async def process_single_asset_schema(
             f"(list_fields={len(list_fields)} doc_tokens≈{doc_tokens} ctx={context_length})"
         )
 
+        # Opt-in response cache: a hit replays the stored provider response
+        # through the normal parse/demultiplex path without a provider call.
+        cache_key = None
+        cached_response = None
+        if response_cache.enabled_for(run_config):
+            cache_key = response_cache.response_cache_key(
+                infospace_id=run.infospace_id,
+                text_content=text_content_for_provider,
+                media_inputs=provider_specific_config.get("media_inputs", []) or [],
+                provider=run_config.get("provider") or run_config.get("ai_provider"),
+                model=model_name,
+                strategy=extraction_strategy,
+                response_schema=schema_to_use,
+                instructions=final_schema_instructions,
+                thinking_enabled=thinking_enabled,
+                run_config=run_config,
+                phase_a_schema=(
+                    phase_a_output_model_class.model_json_schema()
+                    if extraction_strategy == "two-phase" else None
+                ),
+                list_fields=list_fields if extraction_strategy == "two-phase" else None,
+            )
+            # Cache I/O is sync DB work; keep it off the event loop.
+            cached_response = await asyncio.to_thread(response_cache.lookup, cache_key)
+            if cached_response is not None:
+                result["cache_hit"] = True
+                logger.info(f"Task: Asset {asset.id} Schema {schema.id} response cache hit")
+
         # Acquire semaphore ONLY for the actual API call to limit concurrent external requests.
         # Critical optimization: We hold the semaphore ONLY during the API call, not during
         # pre-processing (context assembly) or post-processing (result parsing, DB operations).
         # This allows many tasks to prep/process simultaneously while rate-limiting actual API calls.
-        if semaphore:
+        hold_slot = semaphore is not None and cached_response is None
+        if hold_slot:
             await semaphore.acquire()
 
         try:
-            if extraction_strategy == "two-phase":
+            if cached_response is not None:
+                provider_response = cached_response
+            elif extraction_strategy == "two-phase":
                 # ── Phase A: bounded scalar pass with thinking ON ────────────
                 phase_a_schema_to_use = phase_a_output_model_class.model_json_schema()
                 _messages_a: List[Dict[str, Any]] = []
@@ -2152,7 +2187,7 @@ async def process_single_asset_schema(
                 )
         finally:
             # Release semaphore immediately after API call completes
-            if semaphore:
+            if hold_slot:
                 semaphore.release()
         
         # Convert to envelope format for compatibility (after semaphore is released)
@@ -2281,9 +2316,18 @@ async def process_single_asset_schema(
                     f"input={in_tok} cache_create={cache_create} cache_read={cache_read} "
                     f"({cached_pct}% cached) output={token_usage.get('output_tokens') or 0}"
                 )
+            if cached_response is not None:
+                value["_response_cache"] = cached_response.cache
             if value != (parent_doc_annotation.value or {}):
                 parent_doc_annotation.value = value
 
+        if cache_key and cached_response is None:
+            await asyncio.to_thread(
+                response_cache.store,
+                cache_key, provider_response,
+                infospace_id=run.infospace_id, run_id=run.id, usage=token_usage,
+            )
+
         result["success"] = True
         logger.debug(f"Task: Successfully processed Asset {asset.id} with Schema {schema.id} for Run {run.id}. Created {len(created_annotations_for_asset)} annotations.")
         
@@ -2304,6 +2348,7 @@ async def process_single_asset_schema(
         result["annotations"] = [failed_ann]
         result["error"] = error_msg
         result["success"] = False
+        result["rate_limited"] = is_rate_limit_error(e_classify)
     
     return result
 
@@ -2315,136 +2360,189 @@ async def process_assets_parallel(
     provider,
     storage_provider_instance,
     session: Session,
-    concurrency_limit: int = DEFAULT_ANNOTATION_CONCURRENCY
+    concurrency_limit: int = DEFAULT_ANNOTATION_CONCURRENCY,
+    limiter: Optional[AdaptiveLimiter] = None,
+    deadline: Optional[float] = None,
+    on_checkpoint: Optional[Callable[[int], None]] = None,
 ) -> Tuple[List[Annotation], List[str], bool]:
     """
-    Process assets and schemas in parallel with controlled concurrency.
-
-    Commits each annotation to the DB as soon as its LLM call returns (via
-    ``asyncio.as_completed``) and emits a ``progress`` presence event per
-    result. This lets the frontend see rows fill in live instead of waiting
-    for the chunk boundary.
+    Process assets and schemas through a sliding-window work queue.
+
+    (asset, schema) pairs are launched asset-major from ``assets_map`` order
+    and refilled as each one finishes, so provider calls stay saturated
+    across the whole slice instead of draining at chunk boundaries.
+    ``limiter`` (an :class:`AdaptiveLimiter`, built from ``concurrency_limit``
+    when omitted) bounds in-flight provider calls and adapts to 429s and
+    latency; the window keeps a few extra pairs in context assembly so a
+    freed slot never waits on prep.
+
+    Results are persisted write-behind through :class:`AnnotationWriteBuffer`:
+    a flush happens every ``ANNOTATION_FLUSH_ROWS`` annotations or
+    ``ANNOTATION_FLUSH_INTERVAL_MS`` after the first unflushed result,
+    whichever comes first. Each flush is one multi-row INSERT, one atomic
+    ``progress_current`` bump and one coalesced ``progress`` event, so rows
+    still fill in live without a commit per LLM call.
+
+    Once ``deadline`` (``time.monotonic()`` value) passes, no new asset is
+    started (an asset already started launches all its schemas); in-flight
+    pairs drain. After every flush ``on_checkpoint`` gets
+    the number of leading assets whose every schema has been persisted —
+    the caller's resumable cursor.
 
     Returns:
         Tuple of (all_annotations, errors, already_committed).
         ``already_committed=True`` signals the caller to skip the chunk-boundary
-        ``session.add_all`` + progress_current bump (we've done both inline).
+        ``session.add_all`` + progress_current bump (the buffer has done both).
         Justifications, when enabled, travel inline inside each annotation's
         ``value`` JSONB — no separate persistence path.
     """
     import asyncio
-    from app.core.stream import stream_key, StreamWriter
-
-    # Create semaphore for concurrency control
-    semaphore = asyncio.Semaphore(concurrency_limit)
+    import time
+    from app.core.stream import stream_key, FamilyStreamWriter
+    from app.api.modules.annotation.write_buffer import AnnotationWriteBuffer
 
-    # Create tasks for all asset-schema combinations
-    tasks = []
-    for schema_info in validated_schemas:
-        for asset_id, asset in assets_map.items():
-            task = process_single_asset_schema(
-                asset=asset,
-                schema_info=schema_info,
-                run=run,
-                run_config=run_config,
-                provider=provider,
-                storage_provider_instance=storage_provider_instance,
-                session=session,
-                semaphore=semaphore
-            )
-            tasks.append(task)
+    if limiter is None:
+        limiter = AdaptiveLimiter(concurrency_limit)
 
-    total_tasks = len(tasks)
-    logger.info(f"Task: Starting parallel processing of {total_tasks} asset-schema combinations with concurrency limit {concurrency_limit}")
+    assets_in_order = list(assets_map.values())
+    work = (
+        (index, asset, schema_info)
+        for index, asset in enumerate(assets_in_order)
+        for schema_info in validated_schemas
+    )
+    remaining_per_asset = [len(validated_schemas)] * len(assets_in_order)
+    total_tasks = len(assets_in_order) * len(validated_schemas)
+    logger.info(
+        f"Task: Starting sliding-window processing of {total_tasks} asset-schema combinations "
+        f"with concurrency limit {limiter.limit} (max {limiter.max_limit})"
+    )
 
-    from app.core.stream import FamilyStreamWriter
     parent_key = (
         stream_key(run.infospace_id, "annotation_run", run.parent_run_id)
         if run.parent_run_id else None
     )
+    # Buffered: progress snapshots coalesce and both streams share one
+    # pipeline per flush. Closed below before the caller's terminal events.
     writer = FamilyStreamWriter(
         stream_key(run.infospace_id, "annotation_run", run.id),
         parent_key,
+        buffered=True,
+    )
+    buffer = AnnotationWriteBuffer(
+        session, run, writer,
+        max_rows=settings.ANNOTATION_FLUSH_ROWS,
+        max_delay_ms=settings.ANNOTATION_FLUSH_INTERVAL_MS,
     )
-    base_progress = run.progress_current or 0
 
     # Collect results
     all_created_annotations = []
     errors_run_level = []
 
-    completed = 0
-    # as_completed yields tasks as they finish so we can emit per-row progress
-    # AND commit each annotation to the DB immediately. This lets the frontend
-    # poll/stream see rows fill in live instead of waiting for the chunk commit
-    # boundary (which could be 30-60s away for small-but-slow runs). We still
-    # return the accumulated lists so the caller's post-loop bookkeeping
-    # (errors, run.progress_current update) stays consistent.
-    for coro in asyncio.as_completed(tasks):
-        try:
-            result = await coro
-        except Exception as ex:
-            logger.error(f"Task: Parallel processing task failed with exception: {ex}", exc_info=True)
-            errors_run_level.append(f"Task failed: {ex}")
-            completed += 1
-            try:
-                writer.send("progress", {
-                    "run_id": run.id,
-                    "progress_current": base_progress + completed,
-                    "progress_total": run.progress_total,
-                    "status": run.status.value if hasattr(run.status, "value") else str(run.status),
-                })
-            except Exception:
-                logger.debug("progress emit failed", exc_info=True)
-            continue
-
-        if not isinstance(result, dict):
-            logger.error(f"Task: Unexpected result type from parallel task: {type(result)}")
-            errors_run_level.append("Task returned unexpected result type")
-            completed += 1
-            continue
-
-        result_annotations = result.get("annotations") or []
-
-        # Commit THIS result's annotations immediately so the frontend can
-        # fetch them via polling / render live. Errors here are logged but
-        # don't abort the rest of the parallel batch.
-        try:
-            if result_annotations:
-                session.add_all(result_annotations)
-                # Bump progress_current in DB so polling clients see the count
-                # tick without needing the SSE stream.
-                run.progress_current = (run.progress_current or 0) + len(result_annotations)
-                run.updated_at = datetime.now(timezone.utc)
-                session.add(run)
-                session.commit()
-                session.refresh(run)
-        except Exception as commit_exc:
-            logger.error(f"Task: Incremental commit failed for run {run.id}: {commit_exc}", exc_info=True)
-            try:
-                session.rollback()
-            except Exception:
-                pass
-            errors_run_level.append(f"Commit failed: {commit_exc}")
-
-        # Keep accumulators for the caller (they'll skip the re-commit since
-        # these rows already have PKs, but still used for error summary).
-        all_created_annotations.extend(result_annotations)
+    in_flight: Dict[asyncio.Future, int] = {}
+    exhausted = False
+    completed_prefix = 0
+    started_asset = -1
+
+    def _refill() -> None:
+        nonlocal exhausted, started_asset
+        # Headroom beyond the provider limit keeps context assembly ahead
+        # of the next free slot.
+        window = limiter.limit + max(2, limiter.limit // 2)
+        while not exhausted and len(in_flight) < window:
+            item = next(work, None)
+            if item is None:
+                exhausted = True
+                break
+            # The deadline only stops the slice at an asset boundary: an
+            # asset cut short would sit outside the checkpoint prefix and be
+            # re-run in full (duplicating its persisted schemas) next slice.
+            # The first asset always launches, so a slice makes progress
+            # however short its budget.
+            if item[0] != started_asset:
+                if deadline is not None and item[0] > 0 and time.monotonic() >= deadline:
+                    exhausted = True
+                    break
+                started_asset = item[0]
+            index, asset, schema_info = item
+            fut = asyncio.ensure_future(process_single_asset_schema(
+                asset=asset,
+                schema_info=schema_info,
+                run=run,
+                run_config=run_config,
+                provider=provider,
+                storage_provider_instance=storage_provider_instance,
+                session=session,
+                semaphore=limiter,
+            ))
+            in_flight[fut] = index
+
+    def _flush() -> None:
+        # Everything counted in completed_prefix was added before this
+        # flush, so once it returns the prefix is durable.
+        prefix = completed_prefix
+        buffer.flush()
+        if on_checkpoint is not None:
+            on_checkpoint(prefix)
 
-        if result.get("error"):
-            errors_run_level.append(result["error"])
+    try:
+        _refill()
+        while in_flight:
+            # Wait for the next result, but never past the buffer's deadline — a
+            # half-full buffer must still flush on time when results trickle in.
+            done, _ = await asyncio.wait(
+                set(in_flight),
+                timeout=buffer.seconds_until_due(),
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            for finished in done:
+                index = in_flight.pop(finished)
+                remaining_per_asset[index] -= 1
+                try:
+                    result = finished.result()
+                except Exception as ex:
+                    logger.error(f"Task: Parallel processing task failed with exception: {ex}", exc_info=True)
+                    errors_run_level.append(f"Task failed: {ex}")
+                    buffer.add([])
+                    continue
 
-        completed += 1
-        try:
-            writer.send("progress", {
-                "run_id": run.id,
-                "progress_current": run.progress_current or (base_progress + completed),
-                "progress_total": run.progress_total,
-                "status": run.status.value if hasattr(run.status, "value") else str(run.status),
-            })
-        except Exception:
-            logger.debug("progress emit failed", exc_info=True)
+                if not isinstance(result, dict):
+                    logger.error(f"Task: Unexpected result type from parallel task: {type(result)}")
+                    errors_run_level.append("Task returned unexpected result type")
+                    buffer.add([])
+                    continue
 
-    logger.info(f"Task: Parallel processing completed. Created {len(all_created_annotations)} annotations, {len(errors_run_level)} errors")
+                # Cache hits never reached the provider; they say nothing about it.
+                if result.get("rate_limited"):
+                    limiter.record_throttle()
+                elif result.get("success") and not result.get("cache_hit"):
+                    limiter.record_success()
+
+                result_annotations = result.get("annotations") or []
+                buffer.add(result_annotations)
+                # Keep accumulators for the caller (rows carry their PKs once
+                # flushed; still used for the error summary).
+                all_created_annotations.extend(result_annotations)
+
+                if result.get("error"):
+                    errors_run_level.append(result["error"])
+
+            while completed_prefix < len(remaining_per_asset) and remaining_per_asset[completed_prefix] == 0:
+                completed_prefix += 1
+
+            if buffer.due:
+                _flush()
+            _refill()
+
+        _flush()
+    finally:
+        writer.close()
+    errors_run_level.extend(buffer.errors)
+
+    logger.info(
+        f"Task: Parallel processing completed. Created {len(all_created_annotations)} annotations "
+        f"for {completed_prefix}/{len(assets_in_order)} assets in {buffer.flushes} flushes, "
+        f"{len(errors_run_level)} errors, {limiter.throttles} throttled calls, final limit {limiter.limit}"
+    )
 
     return all_created_annotations, errors_run_level, True
 
@@ -2497,13 +2595,8 @@ async def _process_annotation_run_async(
                     session.add(run)
                     session.commit()
                     return None
-                # Clear stored list on last chunk to free memory
-                if cursor + len(target_asset_ids_to_process) >= len(stored_ids):
-                    cfg = dict(run.configuration or {})
-                    cfg.pop(CHAINED_RUN_CURSOR_KEY, None)
-                    run.configuration = cfg
-                    session.add(run)
-                    session.commit()
+                # The stored list is dropped when the run finalises, not here:
+                # a time-bounded slice may stop short and chain again.
                 # Skip asset resolution - we have our chunk
                 # target_asset_ids_to_process already set above
             # Create providers (needed for both cursor=0 and cursor>0)
@@ -2925,79 +3018,93 @@ async def _process_annotation_run_async(
                 session.commit()
                 return
 
-            # OPTIMIZATION 4: Process schemas and assets with parallel or sequential processing
-            # Chunked dispatch: process in chunks with per-chunk commits for large runs
-            chunk_size = getattr(settings, 'ANNOTATION_CHUNK_SIZE', 50)
-            asset_ids_ordered = [aid for aid in target_asset_ids_to_process if aid in assets_map]
-            chunks = [asset_ids_ordered[i:i + chunk_size] for i in range(0, len(asset_ids_ordered), chunk_size)]
+            # OPTIMIZATION 4: One sliding-window pass over the whole slice.
+            # ``process_assets_parallel`` keeps ``limiter.limit`` provider calls
+            # in flight until the slice (or its time budget) is exhausted —
+            # no per-chunk barrier waiting on the slowest document.
+            asset_ids_ordered = list(dict.fromkeys(
+                aid for aid in target_asset_ids_to_process if aid in assets_map
+            ))
             processing_config = get_annotation_processing_config()
             concurrency_limit = run_config.get("annotation_concurrency", processing_config['default_concurrency'])
             concurrency_limit = min(concurrency_limit, processing_config['max_concurrency'])
             concurrency_limit = max(concurrency_limit, 1)
-
-            # All execution flows through ``process_assets_parallel``. The
-            # asyncio.Semaphore inside it gives us serial behaviour for
-            # ``concurrency_limit=1`` with the bonus of per-result commits
-            # and live progress emits — strictly better than the old
-            # sequential body that committed only at chunk boundaries.
-            for chunk_idx, chunk_asset_ids in enumerate(chunks):
-                chunk_assets_map = {aid: assets_map[aid] for aid in chunk_asset_ids if aid in assets_map}
-                if not chunk_assets_map:
-                    continue
-                chunk_annotations, chunk_errors, already_committed = await process_assets_parallel(
-                    assets_map=chunk_assets_map,
-                    validated_schemas=validated_schemas,
-                    run=run,
-                    run_config=run_config,
-                    provider=provider,
-                    storage_provider_instance=storage_provider_instance,
-                    session=session,
-                    concurrency_limit=concurrency_limit
-                )
-                errors_run_level.extend(chunk_errors)
-                if not already_committed:
-                    if chunk_annotations:
-                        session.add_all(chunk_annotations)
-                    # Update progress before commit so it's visible atomically with the new annotations
-                    run.progress_current = (run.progress_current or 0) + len(chunk_asset_ids)
-                    run.updated_at = datetime.now(timezone.utc)
-                    session.add(run)
+            limiter = AdaptiveLimiter(concurrency_limit)
+
+            # Chained runs get a time budget per invocation and a durable
+            # cursor; single-invocation runs have nothing to resume into.
+            is_chained = bool((run.configuration or {}).get(CHAINED_RUN_CURSOR_KEY))
+            first_position = {}
+            for pos, aid in enumerate(target_asset_ids_to_process):
+                first_position.setdefault(aid, pos)
+
+            def _slice_position(prefix: int) -> int:
+                """Offset into this slice after the first ``prefix`` finished assets."""
+                if prefix >= len(asset_ids_ordered):
+                    return len(target_asset_ids_to_process)
+                return first_position[asset_ids_ordered[prefix]]
+
+            checkpoint = {"prefix": 0, "saved": cursor}
+
+            def _checkpoint(prefix: int) -> None:
+                checkpoint["prefix"] = prefix
+                absolute = cursor + _slice_position(prefix)
+                if not is_chained or absolute <= checkpoint["saved"]:
+                    return
+                try:
+                    session.execute(
+                        text(
+                            "UPDATE annotationrun SET configuration = "
+                            "jsonb_set(COALESCE(configuration::jsonb, '{}'::jsonb), '{_cursor}', to_jsonb(:c))::json "
+                            "WHERE id = :rid"
+                        ),
+                        {"c": absolute, "rid": run_id},
+                    )
                     session.commit()
-                else:
-                    # parallel path already committed rows + bumped progress_current
-                    # per result. Just make sure we're seeing the latest values.
-                    session.refresh(run)
-                logger.info(f"Task: Run {run.id} chunk {chunk_idx + 1}/{len(chunks)} committed {len(chunk_annotations)} annotations (progress: {run.progress_current}/{run.progress_total})")
-                # Presence: push progress to watching browsers (and to the
-                # parent's stream when this is an extension run).
-                from app.core.stream import stream_key, FamilyStreamWriter
-                _parent_key = (
-                    stream_key(run.infospace_id, "annotation_run", run.parent_run_id)
-                    if run.parent_run_id else None
-                )
-                FamilyStreamWriter(
-                    stream_key(run.infospace_id, "annotation_run", run.id),
-                    _parent_key,
-                ).send("progress", {
-                    "run_id": run.id,
-                    "parent_run_id": run.parent_run_id,
-                    "progress_current": run.progress_current,
-                    "progress_total": run.progress_total,
-                    "status": run.status.value if hasattr(run.status, "value") else str(run.status),
-                })
-                all_created_annotations.extend(chunk_annotations)
-
-            # Chunk loop above handles add/commit per chunk; all_created_* accumulated
+                    checkpoint["saved"] = absolute
+                except Exception as e_ckpt:
+                    logger.warning(f"Task: Run {run_id} cursor checkpoint at {absolute} failed: {e_ckpt}")
+                    session.rollback()
+
+            slice_assets_map = {aid: assets_map[aid] for aid in asset_ids_ordered}
+            slice_annotations, slice_errors, _ = await process_assets_parallel(
+                assets_map=slice_assets_map,
+                validated_schemas=validated_schemas,
+                run=run,
+                run_config=run_config,
+                provider=provider,
+                storage_provider_instance=storage_provider_instance,
+                session=session,
+                limiter=limiter,
+                deadline=(
+                    time.monotonic() + settings.ANNOTATION_SLICE_SECONDS
+                    if is_chained else None
+                ),
+                on_checkpoint=_checkpoint,
+            )
+            errors_run_level.extend(slice_errors)
+            all_created_annotations.extend(slice_annotations)
+            if response_cache.enabled_for(run_config):
+                await asyncio.to_thread(response_cache.trim)
+            slice_done = _slice_position(checkpoint["prefix"])
 
             session.refresh(run)
+            logger.info(
+                f"Task: Run {run.id} slice finished {slice_done}/{len(target_asset_ids_to_process)} assets, "
+                f"{len(slice_annotations)} annotations (progress: {run.progress_current}/{run.progress_total})"
+            )
 
             # Self-chain: if more chunks remain, return next cursor instead of marking complete
             stored_ids = (run.configuration or {}).get(CHAINED_RUN_CURSOR_KEY)
             if stored_ids:
-                next_cursor = cursor + len(target_asset_ids_to_process)
+                next_cursor = cursor + slice_done
                 if next_cursor < len(stored_ids):
-                    logger.info(f"Task: Run {run.id} chunk done, {len(stored_ids) - next_cursor} assets remain. Returning next_cursor={next_cursor}")
+                    logger.info(f"Task: Run {run.id} slice done, {len(stored_ids) - next_cursor} assets remain. Returning next_cursor={next_cursor}")
                     return next_cursor
+                cfg = dict(run.configuration or {})
+                cfg.pop(CHAINED_RUN_CURSOR_KEY, None)
+                cfg.pop("_cursor", None)
+                run.configuration = cfg
 
             # Determine final run status
             has_failed_annotations = any(ann.status == ResultStatus.FAILED for ann in all_created_annotations)
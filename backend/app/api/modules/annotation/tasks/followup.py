@@ -37,6 +37,7 @@ logger = logging.getLogger(__name__)
           )
       ),
       schedule=300,
+      wakes_on=["asset", "annotation"],
       batch=10,
       tags=frozenset({"annotation"}))
 def version_gap(ctx: TaskContext, ids: list[int]):
@@ -0,0 +1,181 @@
+"""Write-behind persistence for annotation results.
+
+``process_assets_parallel`` used to ``add_all`` + ``commit`` + ``refresh``
+the run and XADD a ``progress`` event for every single LLM result — a
+50-asset × 5-schema chunk paid 250 commits, 250 run reloads and 250
+stream writes. Against fast models at high concurrency the commit
+overhead dominated.
+
+:class:`AnnotationWriteBuffer` collects results and flushes when it holds
+``max_rows`` annotations or ``max_delay_ms`` has passed since the first
+unflushed result, whichever comes first. One flush is:
+
+  1. one multi-row ``INSERT ... RETURNING id, uuid`` (ids are copied back
+     onto the in-memory objects so callers still see persisted rows);
+  2. one atomic ``progress_current = progress_current + k`` UPDATE —
+     no read-modify-write on the ORM ``run`` object, so concurrent
+     writers on the same run can't lose increments;
+  3. one commit (which publishes the infospace's "annotation" wakeup),
+     one relation-cache invalidation, and one coalesced ``progress`` event.
+
+The caller drives the clock: it asks :meth:`seconds_until_due` how long it
+may wait for the next result and calls :meth:`flush` when :attr:`due`.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from typing import Any, Optional
+
+from sqlalchemy import insert as sa_insert
+from sqlalchemy import text
+from sqlmodel import Session
+
+from app.api.modules.annotation.models import Annotation, AnnotationRun
+from app.api.modules.annotation.relation_cache import invalidate_runs
+from app.core import wakeups
+
+logger = logging.getLogger(__name__)
+
+# 14 columns × 2000 rows stays well below PostgreSQL's 65535 bind-parameter cap.
+_MAX_ROWS_PER_STATEMENT = 2000
+
+_ANNOTATION_COLUMNS = [c.name for c in Annotation.__table__.columns if c.name != "id"]
+
+
+def _annotation_row(ann: Annotation) -> dict[str, Any]:
+    return {name: getattr(ann, name) for name in _ANNOTATION_COLUMNS}
+
+
+class AnnotationWriteBuffer:
+    """Size/time-bounded buffer of annotation results for one run."""
+
+    def __init__(
+        self,
+        session: Session,
+        run: AnnotationRun,
+        writer=None,
+        *,
+        max_rows: int = 50,
+        max_delay_ms: int = 500,
+    ) -> None:
+        self._session = session
+        self._writer = writer
+        self.max_rows = max(1, max_rows)
+        self.max_delay = max(0, max_delay_ms) / 1000.0
+        # Snapshot run fields once: commits expire the ORM object, and
+        # touching it afterwards would reload the row on every flush.
+        self._run_id = run.id
+        self._parent_run_id = run.parent_run_id
+        self._progress_total = run.progress_total
+        self._status = run.status.value if hasattr(run.status, "value") else str(run.status)
+        self.progress_current = run.progress_current or 0
+
+        self._pending: list[Annotation] = []
+        self._pending_results = 0
+        self._first_pending_at: Optional[float] = None
+        self.errors: list[str] = []
+        self.flushes = 0
+        self.persisted = 0
+
+    # ─── Accumulation ───
+
+    def add(self, annotations: list[Annotation]) -> None:
+        """Buffer one result's annotations (possibly none, e.g. a failed task)."""
+        if self._first_pending_at is None:
+            self._first_pending_at = time.monotonic()
+        self._pending.extend(annotations)
+        self._pending_results += 1
+
+    @property
+    def due(self) -> bool:
+        if not self._pending_results:
+            return False
+        if len(self._pending) >= self.max_rows:
+            return True
+        return self.seconds_until_due() == 0.0
+
+    def seconds_until_due(self) -> Optional[float]:
+        """Time left before the oldest buffered result must be flushed.
+
+        ``None`` when the buffer is empty (wait indefinitely).
+        """
+        if self._first_pending_at is None:
+            return None
+        elapsed = time.monotonic() - self._first_pending_at
+        return max(0.0, self.max_delay - elapsed)
+
+    # ─── Flush ───
+
+    def flush(self) -> int:
+        """Persist everything buffered. Returns the number of rows written.
+
+        Failures roll back, are recorded in :attr:`errors`, and drop the
+        batch — the same contract as the old per-result commit.
+        """
+        if not self._pending_results:
+            return 0
+        batch, self._pending = self._pending, []
+        self._pending_results = 0
+        self._first_pending_at = None
+
+        written = 0
+        if batch:
+            try:
+                table = Annotation.__table__
+                ids_by_uuid: dict[str, int] = {}
+                # One statement per flush; sliced only to stay under the
+                # bind-parameter limit when a result fans out into many rows.
+                for i in range(0, len(batch), _MAX_ROWS_PER_STATEMENT):
+                    returned = self._session.execute(
+                        sa_insert(table)
+                        .values([_annotation_row(a) for a in batch[i:i + _MAX_ROWS_PER_STATEMENT]])
+                        .returning(table.c.id, table.c.uuid)
+                    ).all()
+                    ids_by_uuid.update({row.uuid: row.id for row in returned})
+                for ann in batch:
+                    ann.id = ids_by_uuid.get(ann.uuid)
+                wakeups.mark(self._session, "annotation", {a.infospace_id for a in batch})
+                new_progress = self._session.execute(
+                    text(
+                        "UPDATE annotationrun "
+                        "SET progress_current = COALESCE(progress_current, 0) + :k, "
+                        "    updated_at = now() "
+                        "WHERE id = :rid RETURNING progress_current"
+                    ),
+                    {"k": len(batch), "rid": self._run_id},
+                ).scalar()
+                self._session.commit()
+                written = len(batch)
+                self.persisted += written
+                if new_progress is not None:
+                    self.progress_current = new_progress
+                invalidate_runs([self._run_id, self._parent_run_id])
+            except Exception as exc:
+                logger.error(
+                    f"Task: Batched commit of {len(batch)} annotations failed for run {self._run_id}: {exc}",
+                    exc_info=True,
+                )
+                try:
+                    self._session.rollback()
+                except Exception:
+                    pass
+                self.errors.append(f"Commit failed: {exc}")
+
+        self.flushes += 1
+        self._emit_progress()
+        return written
+
+    def _emit_progress(self) -> None:
+        if self._writer is None:
+            return
+        try:
+            self._writer.send("progress", {
+                "run_id": self._run_id,
+                "progress_current": self.progress_current,
+                "progress_total": self._progress_total,
+                "status": self._status,
+            })
+        except Exception:
+            logger.debug("progress emit failed", exc_info=True)
@@ -28,6 +28,8 @@ from typing import Iterable, List, Literal, Optional
 from sqlalchemy import delete, update
 from sqlmodel import Session, select
 
+from app.api.modules.annotation import relation_cache
+from app.api.modules.content.counts import note_asset_writes
 from app.api.modules.content.services.asset_builder import AssetBuilder
 from app.api.modules.graph.models import FragmentCuration, GraphEdge
 from app.models import Annotation, Asset, AssetChunk
@@ -96,10 +98,17 @@ def cascade_delete(session: Session, asset_ids: Iterable[int]) -> int:
             delete(GraphEdge).where(GraphEdge.annotation_id.in_(annotation_ids))
         )
 
-    session.exec(delete(Annotation).where(Annotation.asset_id.in_(root_ids)))
-
-    result = session.exec(delete(Asset).where(Asset.id.in_(root_ids)))
-    deleted = getattr(result, "rowcount", None) or len(root_ids)
+    # Core DELETE skips session.deleted — record the runs for the relation cache.
+    relation_cache.mark(session, session.exec(
+        delete(Annotation).where(Annotation.asset_id.in_(root_ids)).returning(Annotation.run_id)
+    ).scalars().all())
+
+    # Core DELETE skips session.deleted — record the write for listing counts.
+    deleted_infospaces = session.exec(
+        delete(Asset).where(Asset.id.in_(root_ids)).returning(Asset.infospace_id)
+    ).scalars().all()
+    deleted = len(deleted_infospaces)
+    note_asset_writes(session, deleted_infospaces)
     session.flush()
     logger.info("cascade_delete: removed %d assets", deleted)
     return deleted
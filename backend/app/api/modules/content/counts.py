@@ -0,0 +1,297 @@
+"""Listing counts for tree / feed / search ``CountEvent``s.
+
+An exact ``count(*)`` over the full filter set often takes longer than the
+page it belongs to. ``resolve`` picks a strategy from
+``LISTING_COUNT_MODE``:
+
+  - **exact** — ``count(*)`` under a ``statement_timeout`` of
+    ``LISTING_COUNT_BUDGET_MS`` (inside a savepoint, so a cancel leaves the
+    request transaction usable). Over budget it falls back to the estimate.
+  - **estimate** — the planner's row estimate for the filtered select
+    (``EXPLAIN (FORMAT JSON)``), flagged ``approximate``.
+  - **cached** — exact, memoised in Redis per filter. Key = SHA-256 over
+    the compiled count statement and its parameters, the infospace's
+    bundle watermark (``count(*)``, ``max(updated_at)`` — tree operations
+    stamp every bundle whose membership changes) and a per-infospace
+    **generation**. The generation is bumped after commit whenever a
+    session inserts or deletes assets (ORM flushes, the COPY child path, the
+    PDF page bulk insert, ``core.tree`` deletes and
+    ``asset_ops.cascade_delete`` all record into
+    ``session.info[ASSET_WRITES]``).
+    Changes that move neither (status, tags, facets) are bounded by
+    ``LISTING_COUNT_CACHE_TTL_SECONDS``.
+
+    The Session listeners are registered by :func:`install_listeners` at
+    app and worker startup, not on import. ``after_flush`` only collects
+    infospace ids; after commit they are bumped in one pipeline on a
+    background thread, so a slow or failing Redis never delays or breaks
+    a commit. Bumping just after commit is safe: a count cached in between
+    is keyed on the old generation and becomes unreachable.
+
+An approximate count is followed by ``followup`` — an exact count with
+the larger ``LISTING_COUNT_FOLLOWUP_BUDGET_MS`` — when the estimate is at
+most ``LISTING_COUNT_FOLLOWUP_MAX_ROWS``. Streams emit it as a second
+``CountEvent`` after the page has gone out.
+
+Best-effort throughout — a Redis failure degrades to a recount, never to
+an error.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from itertools import chain
+from typing import Any, Iterable, List, Optional
+
+from sqlalchemy import and_, event, func, select as sa_select, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.expression import ClauseElement, Executable
+
+from app.api.modules.content.models import Asset
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+MODES = ("exact", "estimate", "cached")
+
+KEY_PREFIX = "listcount:v1:"
+GENERATION_PREFIX = "listcount:gen:"
+
+# session.info key: infospace ids whose asset rows this transaction inserted
+# or deleted. Writers that bypass the ORM add to it directly.
+ASSET_WRITES = "asset_writes"
+
+# SQLSTATE query_canceled — statement_timeout expired
+_QUERY_CANCELED = "57014"
+
+
+@dataclass(frozen=True)
+class Count:
+    total: int
+    approximate: bool = False
+    key: Optional[str] = field(default=None, compare=False)
+
+
+# ── Strategies ───────────────────────────────────────────────────────────────
+
+
+class _Explain(Executable, ClauseElement):
+    inherit_cache = False
+
+    def __init__(self, statement):
+        self.statement = statement
+
+
+@compiles(_Explain, "postgresql")
+def _compile_explain(element, compiler, **kw):
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+
+def estimate(session, conditions: List[Any]) -> int:
+    """Planner row estimate for the assets matching ``conditions``."""
+    plan = session.execute(_Explain(sa_select(Asset.id).where(and_(*conditions)))).scalar_one()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return max(0, int(plan[0]["Plan"]["Plan Rows"]))
+
+
+def exact_within(session, conditions: List[Any], budget_ms: int) -> Optional[int]:
+    """Exact count, or ``None`` if it does not finish within ``budget_ms``."""
+    stmt = sa_select(func.count(Asset.id)).where(and_(*conditions))
+    try:
+        with session.begin_nested():
+            previous = session.execute(
+                text("SELECT current_setting('statement_timeout')")
+            ).scalar_one()
+            session.execute(
+                text("SELECT set_config('statement_timeout', :ms, true)"),
+                {"ms": str(max(1, int(budget_ms)))},
+            )
+            total = session.execute(stmt).scalar_one()
+            session.execute(
+                text("SELECT set_config('statement_timeout', :ms, true)"),
+                {"ms": previous},
+            )
+    except OperationalError as exc:
+        if getattr(exc.orig, "sqlstate", None) != _QUERY_CANCELED:
+            raise
+        return None
+    return total or 0
+
+
+def resolve(session, infospace_id: int, conditions: List[Any]) -> Count:
+    """First count for a listing, per ``LISTING_COUNT_MODE``."""
+    mode = settings.LISTING_COUNT_MODE
+    if mode not in MODES:
+        mode = "exact"
+    if mode == "estimate":
+        return Count(estimate(session, conditions), approximate=True)
+
+    key = cache_key(session, infospace_id, conditions) if mode == "cached" else None
+    cached = _get(key)
+    if cached is not None:
+        return Count(cached, key=key)
+
+    total = exact_within(session, conditions, settings.LISTING_COUNT_BUDGET_MS)
+    if total is None:
+        return Count(estimate(session, conditions), approximate=True, key=key)
+    _put(key, total)
+    return Count(total, key=key)
+
+
+def followup(session, conditions: List[Any], first: Count) -> Optional[Count]:
+    """Exact count following an approximate ``first``, when cheap enough."""
+    if not first.approximate or first.total > settings.LISTING_COUNT_FOLLOWUP_MAX_ROWS:
+        return None
+    total = exact_within(session, conditions, settings.LISTING_COUNT_FOLLOWUP_BUDGET_MS)
+    if total is None:
+        return None
+    _put(first.key, total)
+    return Count(total, key=first.key)
+
+
+# ── Cache ────────────────────────────────────────────────────────────────────
+
+
+def _redis():
+    from app.core.redis import get_redis
+    return get_redis()
+
+
+def _generation(infospace_id: int) -> Optional[str]:
+    try:
+        return _redis().get(f"{GENERATION_PREFIX}{infospace_id}")
+    except Exception:
+        return None
+
+
+def cache_key(session, infospace_id: int, conditions: List[Any]) -> str:
+    compiled = sa_select(func.count(Asset.id)).where(and_(*conditions)).compile(
+        dialect=session.get_bind().dialect,
+    )
+    bundles = session.execute(
+        text("SELECT count(*), max(updated_at) FROM bundle WHERE infospace_id = :iid"),
+        {"iid": infospace_id},
+    ).one()
+    version = json.dumps(
+        [str(compiled), compiled.params, list(bundles), _generation(infospace_id)],
+        sort_keys=True, default=str,
+    )
+    digest = hashlib.sha256(version.encode()).hexdigest()[:32]
+    return f"{KEY_PREFIX}{infospace_id}:{digest}"
+
+
+def _get(key: Optional[str]) -> Optional[int]:
+    if key is None:
+        return None
+    try:
+        raw = _redis().get(key)
+    except Exception as exc:
+        logger.debug("listing count cache read failed for %s: %s", key, exc)
+        return None
+    return int(raw) if raw is not None else None
+
+
+def _put(key: Optional[str], total: int) -> None:
+    if key is None:
+        return
+    try:
+        _redis().set(key, total, ex=settings.LISTING_COUNT_CACHE_TTL_SECONDS)
+    except Exception as exc:
+        logger.debug("listing count cache write failed for %s: %s", key, exc)
+
+
+# ── Invalidation ─────────────────────────────────────────────────────────────
+
+
+def note_asset_writes(session, infospace_ids: Iterable[int]) -> None:
+    """Record asset inserts/deletes made outside the ORM; bumped on commit."""
+    session.info.setdefault(ASSET_WRITES, set()).update(i for i in infospace_ids if i is not None)
+
+
+def invalidate_infospaces(infospace_ids: Iterable[int]) -> None:
+    """Bump each infospace's generation so its cached counts miss."""
+    ids = sorted(set(infospace_ids))
+    if not ids:
+        return
+    try:
+        pipe = _redis().pipeline(transaction=False)
+        for iid in ids:
+            pipe.incr(f"{GENERATION_PREFIX}{iid}")
+            # Outlives every entry keyed under the previous generation
+            pipe.expire(f"{GENERATION_PREFIX}{iid}", settings.LISTING_COUNT_CACHE_TTL_SECONDS * 2)
+        pipe.execute()
+    except Exception as exc:
+        logger.debug("listing count invalidation failed for %s: %s", ids, exc)
+
+
+def _collect_asset_writes(session, flush_context):
+    # new/deleted still hold the pre-flush state here
+    written = [o.infospace_id for o in chain(session.new, session.deleted) if isinstance(o, Asset)]
+    if written:
+        note_asset_writes(session, written)
+
+
+def _bump_after_commit(session):
+    if session.in_nested_transaction():
+        return  # savepoint release — wait for the real commit
+    infospace_ids = session.info.pop(ASSET_WRITES, None)
+    if infospace_ids and settings.LISTING_COUNT_MODE == "cached":
+        _publish(invalidate_infospaces, infospace_ids)
+
+
+def _discard_on_rollback(session):
+    if session.in_nested_transaction():
+        return
+    session.info.pop(ASSET_WRITES, None)
+
+
+_LISTENERS = (
+    ("after_flush", _collect_asset_writes),
+    ("after_commit", _bump_after_commit),
+    ("after_rollback", _discard_on_rollback),
+)
+
+
+def install_listeners() -> None:
+    """Register the asset-write Session listeners (idempotent).
+
+    Called once at app startup and on worker init.
+    """
+    for name, fn in _LISTENERS:
+        if not event.contains(Session, name, fn):
+            event.listen(Session, name, fn)
+
+
+# One thread publishes invalidations in commit order; created on first use
+_publisher: Optional[ThreadPoolExecutor] = None
+_publisher_lock = threading.Lock()
+
+
+def _publish(fn, *args) -> None:
+    """Run ``fn(*args)`` off the committing thread."""
+    global _publisher
+    try:
+        with _publisher_lock:
+            if _publisher is None:
+                _publisher = ThreadPoolExecutor(max_workers=1, thread_name_prefix="listcount-publish")
+        _publisher.submit(fn, *args)
+    except RuntimeError as exc:  # interpreter shutting down
+        logger.debug("listing count invalidation dropped: %s", exc)
+
+
+def _reset_publisher() -> None:
+    # A forked child inherits the executor but not its thread
+    global _publisher, _publisher_lock
+    _publisher, _publisher_lock = None, threading.Lock()
+
+
+os.register_at_fork(after_in_child=_reset_publisher)
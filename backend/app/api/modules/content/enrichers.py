@@ -5,13 +5,16 @@ Enrichment system: @enricher decorator and enricher functions.
 - enrichment_resolved gate (GIN-indexed, prevents re-dispatch)
 - EnrichmentContext with done/fail/skip/provider
 - dispatch_filter checks ENABLED_ENRICHERS + enrichment_config + capability
+- wakes_on=["asset"]: asset writes wake the dispatcher (core/wakeups)
 
 Six enrichers: ocr, geocoding, hash, language_detection, quality_score, embedding.
 """
 
+import asyncio
 import hashlib
 import io
 import logging
+import threading
 import time
 from contextlib import contextmanager
 from datetime import datetime, timezone
@@ -148,6 +151,7 @@ def enricher(
     triggers = triggers or []
     defaults = dict(
         schedule=60,
+        wakes_on=["asset"],
         queue="processing",
         tags=frozenset({"enrichment"}),
     )
@@ -568,16 +572,18 @@ def enrich_quality_score(ctx: EnrichmentContext, asset_ids: list[int]):
               Asset.text_content.isnot(None),
           ),
           capability="embedding",
-          depends_on="ocr", batch=20, queue="embedding", timeout=1800,
-          max_concurrency=1, self_chain=True,
+          depends_on="ocr", batch=100, queue="embedding", timeout=1800,
+          max_concurrency=2, self_chain=True,
+          wakes_on=["asset", "chunk"],
           triggers=["asset.enriched"])
 def enrich_embedding(ctx: EnrichmentContext, asset_ids: list[int]):
     """Generate embeddings for assets with text_content and no chunks.
 
-    Preserves the three-phase pattern from the legacy embed task:
     Phase 1 — Load + Chunk (DB session open)
-    Phase 2 — Generate embeddings (no DB session)
-    Phase 3 — Store vectors + emit events (fresh DB session)
+    Phase 2 — Pipelined embedding (``embedding/pipeline.py``): token-sized
+              batches, several in flight per provider, each batch written
+              with one UPDATE in its own short session as it lands
+    Phase 3 — Mark assets whose chunks were all written as done
     """
     from app.api.modules.content.models import get_embedding_column_for_dimension
 
@@ -626,6 +632,7 @@ def enrich_embedding(ctx: EnrichmentContext, asset_ids: list[int]):
 
                 groups[iid] = {
                     "provider": provider_instance,
+                    "provider_key": sel.provider_key,
                     "model_name": sel.model_name,
                     "em_id": em.id,
                     "col_name": col_name,
@@ -634,6 +641,7 @@ def enrich_embedding(ctx: EnrichmentContext, asset_ids: list[int]):
                     "chunk_size": infospace.chunk_size or 512,
                     "chunk_overlap": infospace.chunk_overlap or 50,
                     "work": [],
+                    "chunk_asset": {},
                     "asset_ids": set(),
                 }
 
@@ -664,67 +672,57 @@ def enrich_embedding(ctx: EnrichmentContext, asset_ids: list[int]):
                 )
                 if not has_embedding:
                     grp["work"].append((chunk.id, chunk.text_content or ""))
+                    grp["chunk_asset"][chunk.id] = asset.id
                     grp["asset_ids"].add(asset.id)
 
         session.commit()
 
-    # Phase 2: Generate embeddings (no DB session)
-    results: dict[int, list] = {}
+    # Phase 2 + 3: pipelined embedding; each batch is written as it lands
+    from app.api.modules.embedding import pipeline
 
-    EMBED_BATCH = 64  # texts per HTTP call — keeps Ollama requests under timeout
+    pending: dict[int, int] = {}  # asset_id → chunks still to write
+    for grp in groups.values():
+        for aid in grp["chunk_asset"].values():
+            pending[aid] = pending.get(aid, 0) + 1
+    pending_lock = threading.Lock()
+
+    def _writer(grp: dict):
+        def _write(pairs):
+            with ctx.session() as session:
+                asset_ids_written = pipeline.write_vectors(
+                    session, grp["col_name"], grp["em_id"], pairs,
+                )
+                session.commit()
+            with pending_lock:
+                for aid in asset_ids_written:
+                    pending[aid] -= 1
+        return _write
 
     async def _embed():
+        semaphores: dict[str, asyncio.Semaphore] = {}
+        runs = []
         for iid, grp in groups.items():
             if not grp["work"]:
                 continue
-            chunk_ids = [w[0] for w in grp["work"]]
-            texts = [w[1] for w in grp["work"]]
-            target_dim = grp["dimension"]
-            all_vectors: list[list[float]] = []
-            try:
-                for start in range(0, len(texts), EMBED_BATCH):
-                    batch_texts = texts[start : start + EMBED_BATCH]
-                    batch_vecs = await grp["provider"].embed_texts(batch_texts, grp["model_name"])
-                    if len(batch_vecs) != len(batch_texts):
-                        logger.error("Vector count mismatch for infospace %d batch at %d", iid, start)
-                        raise RuntimeError("vector count mismatch")
-                    # Truncate for Matryoshka dimension override (native dim > target dim)
-                    if batch_vecs and len(batch_vecs[0]) > target_dim:
-                        batch_vecs = [v[:target_dim] for v in batch_vecs]
-                    elif batch_vecs and len(batch_vecs[0]) != target_dim:
-                        logger.error("Dimension mismatch for infospace %d: got %d, need %d",
-                                     iid, len(batch_vecs[0]), target_dim)
-                        raise RuntimeError("dimension mismatch")
-                    all_vectors.extend(batch_vecs)
-                    logger.info("Embedded batch %d–%d / %d for infospace %d",
-                                start, start + len(batch_texts), len(texts), iid)
-                results[iid] = list(zip(chunk_ids, all_vectors))
-            except Exception as e:
-                logger.error("Embedding failed for infospace %d: %s", iid, e, exc_info=True)
+            key = grp["provider_key"]
+            if key not in semaphores:
+                semaphores[key] = asyncio.Semaphore(pipeline.in_flight_limit(key))
+            runs.append(pipeline.embed_pipelined(
+                grp["provider"], grp["model_name"],
+                pipeline.token_batches(grp["work"]),
+                target_dim=grp["dimension"],
+                semaphore=semaphores[key],
+                on_batch=_writer(grp),
+                label=f"infospace {iid}",
+            ))
+        await asyncio.gather(*runs)
 
     from app.core.task_utils import run_async_in_celery
     run_async_in_celery(_embed)
 
-    # Phase 3: Store + mark done
+    # Mark assets done once every pending chunk of theirs is written
+    enriched_assets = [aid for aid, left in pending.items() if left <= 0]
     with ctx.session() as session:
-        for iid, pairs in results.items():
-            grp = groups[iid]
-            for chunk_id, vector in pairs:
-                chunk = session.get(AssetChunk, chunk_id)
-                if not chunk:
-                    continue
-                setattr(chunk, grp["col_name"], vector)
-                chunk.embedding_model_id = grp["em_id"]
-                session.add(chunk)
-
-        # Mark all enriched assets as done
-        enriched_assets: set[int] = set()
-        for iid, pairs in results.items():
-            for chunk_id, _ in pairs:
-                chunk = session.get(AssetChunk, chunk_id)
-                if chunk:
-                    enriched_assets.add(chunk.asset_id)
-
         for aid in enriched_assets:
             ctx.done(session, aid)
 
@@ -0,0 +1,137 @@
+"""
+Feed Fetch
+==========
+
+Conditional, host-bounded HTTP fetch for RSS/Atom feeds. Used by RSSHandler
+(one-shot ingestion, preview) and RSSPollHandler (scheduled polling).
+
+- One ``httpx.AsyncClient`` per event loop, so the feeds of a poll batch
+  share keep-alive connections.
+- A per-host semaphore keeps at most ``FEED_FETCH_PER_HOST_LIMIT`` requests
+  in flight to one host: a batch of feeds from one publisher queues politely
+  while feeds on other hosts proceed.
+- Conditional GET: ``If-None-Match`` / ``If-Modified-Since`` are sent from
+  the validators a previous fetch returned (stored by the poll handler in
+  ``Source.cursor_state``). A 304 comes back as ``FeedFetch(not_modified=True)``
+  with no body.
+
+Parsing (feedparser, CPU-bound, imported on first parse) runs off the event
+loop via ``parse_feed``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import weakref
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+from urllib.parse import urlsplit
+
+import httpx
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+USER_AGENT = "OpenPoliticsHQ/1.0 (feed poller)"
+ACCEPT = "application/rss+xml, application/atom+xml, application/xml;q=0.9, text/xml;q=0.9, */*;q=0.5"
+
+# Validator keys in Source.cursor_state
+ETAG_KEY = "etag"
+LAST_MODIFIED_KEY = "last_modified"
+
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
+_host_limits: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Semaphore]]" = weakref.WeakKeyDictionary()
+
+
+@dataclass
+class FeedFetch:
+    """Outcome of one feed request."""
+    url: str
+    not_modified: bool = False
+    content: bytes = b""
+    content_type: Optional[str] = None
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    def validators(self) -> Dict[str, str]:
+        """Cursor-state entries for the next conditional request."""
+        out: Dict[str, str] = {}
+        if self.etag:
+            out[ETAG_KEY] = self.etag
+        if self.last_modified:
+            out[LAST_MODIFIED_KEY] = self.last_modified
+        return out
+
+
+def _client() -> httpx.AsyncClient:
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            timeout=settings.FEED_FETCH_TIMEOUT_SECONDS,
+            follow_redirects=True,
+            headers={"User-Agent": USER_AGENT, "Accept": ACCEPT},
+        )
+        _clients[loop] = client
+    return client
+
+
+def _host_limit(host: str) -> asyncio.Semaphore:
+    limits = _host_limits.setdefault(asyncio.get_running_loop(), {})
+    sem = limits.get(host)
+    if sem is None:
+        sem = limits[host] = asyncio.Semaphore(max(1, settings.FEED_FETCH_PER_HOST_LIMIT))
+    return sem
+
+
+async def fetch_feed(
+    url: str,
+    *,
+    etag: Optional[str] = None,
+    last_modified: Optional[str] = None,
+) -> FeedFetch:
+    """GET ``url``, conditionally when validators are given. Raises on HTTP errors."""
+    headers: Dict[str, str] = {}
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+
+    async with _host_limit((urlsplit(url).hostname or "").lower()):
+        response = await _client().get(url, headers=headers)
+
+    if response.status_code == 304:
+        logger.debug("Feed not modified: %s", url)
+        return FeedFetch(url=url, not_modified=True, etag=etag, last_modified=last_modified)
+    response.raise_for_status()
+    return FeedFetch(
+        url=str(response.url),
+        content=response.content,
+        content_type=response.headers.get("content-type"),
+        etag=response.headers.get("etag"),
+        last_modified=response.headers.get("last-modified"),
+    )
+
+
+async def fetch_feed_for_cursor(url: str, cursor_state: Optional[Dict[str, Any]]) -> FeedFetch:
+    """``fetch_feed`` using the validators stored in a source's cursor_state."""
+    cursor_state = cursor_state or {}
+    return await fetch_feed(
+        url,
+        etag=cursor_state.get(ETAG_KEY),
+        last_modified=cursor_state.get(LAST_MODIFIED_KEY),
+    )
+
+
+async def parse_feed(fetched: FeedFetch) -> Any:
+    """feedparser result for a fetched body, parsed in a worker thread."""
+    import feedparser
+
+    response_headers = {"content-location": fetched.url}
+    if fetched.content_type:
+        response_headers["content-type"] = fetched.content_type
+    return await asyncio.to_thread(
+        feedparser.parse, fetched.content, response_headers=response_headers,
+    )
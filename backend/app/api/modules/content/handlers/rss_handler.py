@@ -9,6 +9,11 @@ setters directly.
 
 Instance methods (require IngestionContext):
 - handle(locator, title, options): Ingest RSS feed at URL, create article assets.
+- ingest_feed(feed, feed_url, options): Ingest an already fetched + parsed feed.
+  Dedups the whole feed with one identity query (see ``_existing_by_identity``).
+
+Fetching goes through ``feed_fetch`` (shared httpx client, per-host limits,
+conditional GET for pollers).
 
 Static/class methods (no context needed):
 - preview_rss_feed(feed_url, max_items): Parse feed, return feed_info + items (no DB).
@@ -19,15 +24,19 @@ Static/class methods (no context needed):
 import asyncio
 import logging
 import xml.etree.ElementTree as ET
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
 import dateutil.parser
-import feedparser
+from sqlalchemy import String, any_, bindparam
+from sqlalchemy.dialects.postgresql import ARRAY as PG_ARRAY
+from sqlmodel import select
 
 from app.models import Asset, AssetKind, ProcessingStatus
 from app.api.modules.content.services.asset_builder import AssetBuilder
 from .base import BaseHandler, IngestionContext
+from .feed_fetch import fetch_feed, parse_feed
 
 logger = logging.getLogger(__name__)
 
@@ -179,6 +188,15 @@ def _build_rss_image_children(
     return children
 
 
+@dataclass
+class FeedIngest:
+    """Result of ``RSSHandler.ingest_feed``."""
+    articles: List[Asset] = field(default_factory=list)
+    """One per entry, in feed order — existing rows for unchanged entries."""
+    created: List[Asset] = field(default_factory=list)
+    """Rows inserted by this ingest (new entries and content-changed supersedes)."""
+
+
 class RSSHandler(BaseHandler):
     """Handle RSS feed ingestion.
 
@@ -203,69 +221,113 @@ class RSSHandler(BaseHandler):
             List of created article assets
         """
         feed_url = locator if isinstance(locator, str) else str(locator)
-        options = options or {}
-        max_items = options.get("max_items", 50)
 
         try:
-            feed = feedparser.parse(feed_url)
+            feed = await parse_feed(await fetch_feed(feed_url))
+            return (await self.ingest_feed(feed, feed_url, options)).articles
 
-            feed_title = feed.feed.get("title", "RSS Feed")
-            feed_metadata = {
-                "feed_title": feed_title,
-                "feed_url": feed_url,
-                "feed_description": feed.feed.get("description", ""),
-                "feed_language": feed.feed.get("language", ""),
-                "feed_updated": feed.feed.get("updated", ""),
-                "feed_generator": feed.feed.get("generator", ""),
-            }
-
-            logger.info(
-                f"Processing RSS feed '{feed_title}' with "
-                f"{len(feed.entries[:max_items])} entries"
+        except ImportError:
+            raise ValueError(
+                "feedparser library not installed. "
+                "Install with: pip install feedparser"
             )
+        except Exception as e:
+            raise ValueError(f"RSS feed processing failed: {e}")
 
-            articles: List[Asset] = []
-            for i, entry in enumerate(feed.entries[:max_items]):
-                try:
-                    builder = AssetBuilder(
+    async def ingest_feed(
+        self,
+        feed: Any,
+        feed_url: str,
+        options: Optional[Dict[str, Any]] = None,
+    ) -> FeedIngest:
+        """Create article assets for a parsed feed. Commits.
+
+        Identity is resolved for the whole feed up front with one query, so
+        unchanged entries cost no per-entry round trip and no writes; changed
+        entries supersede their row, new ones insert.
+        """
+        options = options or {}
+        max_items = options.get("max_items", 50)
+
+        feed_title = feed.feed.get("title", "RSS Feed")
+        feed_metadata = {
+            "feed_title": feed_title,
+            "feed_url": feed_url,
+            "feed_description": feed.feed.get("description", ""),
+            "feed_language": feed.feed.get("language", ""),
+            "feed_updated": feed.feed.get("updated", ""),
+            "feed_generator": feed.feed.get("generator", ""),
+        }
+        entries = feed.entries[:max_items]
+
+        logger.info(f"Processing RSS feed '{feed_title}' with {len(entries)} entries")
+
+        builders: List[AssetBuilder] = []
+        for i, entry in enumerate(entries):
+            builder = AssetBuilder(self.session, self.user_id, self.infospace_id)
+            builder = _compose_rss_entry(builder, entry, feed_url, i)
+            builders.append(builder.with_metadata(**feed_metadata))
+        known = self._existing_by_identity(
+            [b.blueprint.dedup_source_identifier for b in builders]
+        )
+
+        result = FeedIngest()
+        for i, (entry, builder) in enumerate(zip(entries, builders)):
+            try:
+                identity = builder.blueprint.dedup_source_identifier
+                match = known.get(identity)
+                builder = builder.supersedes(match) if match is not None else builder.no_dedup()
+                article = await builder.build()
+                known[identity] = article
+                result.articles.append(article)
+                if article is match:
+                    continue  # same identity, same content
+
+                # Create child image assets (stub bookmarks)
+                image_urls = _extract_rss_images(entry)
+                if image_urls:
+                    children = _build_rss_image_children(
+                        self.session, self.user_id, self.infospace_id, image_urls,
+                    )
+                    child_builder = AssetBuilder(
                         self.session, self.user_id, self.infospace_id
                     )
-                    builder = _compose_rss_entry(builder, entry, feed_url, i)
-                    builder = builder.with_metadata(**feed_metadata)
-                    article = await builder.build()
-
-                    # Create child image assets (stub bookmarks)
-                    image_urls = _extract_rss_images(entry)
-                    if image_urls:
-                        children = _build_rss_image_children(
-                            self.session, self.user_id, self.infospace_id, image_urls,
-                        )
-                        child_builder = AssetBuilder(
-                            self.session, self.user_id, self.infospace_id
-                        )
-                        await child_builder.build_children(article.id, children)
+                    await child_builder.build_children(article.id, children)
 
-                    articles.append(article)
-                    logger.debug(f"Created article: {article.title}")
+                result.created.append(article)
+                logger.debug(f"Created article: {article.title}")
 
-                except Exception as e:
-                    logger.error(f"Failed to process RSS entry {i}: {e}")
-                    continue
+            except Exception as e:
+                logger.error(f"Failed to process RSS entry {i}: {e}")
+                continue
 
-            self.session.commit()
-            logger.info(
-                f"RSS feed processing completed: {len(articles)} articles "
-                f"created from '{feed_title}'"
-            )
-            return articles
+        self.session.commit()
+        logger.info(
+            f"RSS feed processing completed: {len(result.created)} articles "
+            f"created from '{feed_title}' ({len(result.articles) - len(result.created)} unchanged)"
+        )
+        return result
 
-        except ImportError:
-            raise ValueError(
-                "feedparser library not installed. "
-                "Install with: pip install feedparser"
+    def _existing_by_identity(self, identities: List[str]) -> Dict[str, Asset]:
+        """Current (non-superseded) rows for a feed's identity keys, one query.
+
+        Same key and same "most recent wins" rule as ``AssetBuilder.find_match``.
+        """
+        identities = sorted({i for i in identities if isinstance(i, str)})
+        if not identities:
+            return {}
+        rows = self.session.exec(
+            select(Asset)
+            .where(
+                Asset.infospace_id == self.infospace_id,
+                Asset.is_superseded == False,  # noqa: E712
+                Asset.source_identifier == any_(
+                    bindparam("identities", identities, type_=PG_ARRAY(String))
+                ),
             )
-        except Exception as e:
-            raise ValueError(f"RSS feed processing failed: {e}")
+            .order_by(Asset.created_at)
+        ).all()
+        return {row.source_identifier: row for row in rows}
 
     # ─────────────────────────────────────────────────────────────────
     # RSS discovery and preview (no ingestion context needed)
@@ -275,7 +337,7 @@ class RSSHandler(BaseHandler):
     async def preview_rss_feed(feed_url: str, max_items: int = 20) -> Dict[str, Any]:
         """Preview RSS feed without creating assets."""
         try:
-            feed = feedparser.parse(feed_url)
+            feed = await parse_feed(await fetch_feed(feed_url))
 
             if feed.bozo:
                 raise ValueError(f"Feed parsing error: {feed.bozo_exception}")
@@ -112,6 +112,32 @@ class BaseProcessor(ABC):
         return self.__class__.__name__
 
 
+class SummaryText:
+    """Line accumulator for a tabular parent's ``text_content``, capped at
+    ``max_chars``. Lines past the cap are counted, not kept, so a
+    multi-million-row file never holds its full text in memory."""
+
+    def __init__(self, max_chars: int):
+        self.max_chars = max_chars
+        self.truncated = False
+        self._parts: List[str] = []
+        self._chars = 0
+
+    def add(self, line: str) -> None:
+        if self.truncated:
+            return
+        cost = len(line) + (1 if self._parts else 0)
+        if self.max_chars > 0 and self._chars + cost > self.max_chars:
+            self.truncated = True
+            return
+        self._parts.append(line)
+        self._chars += cost
+
+    @property
+    def text(self) -> str:
+        return "\n".join(self._parts)
+
+
 class ProcessingError(Exception):
     """Raised when processing fails."""
     pass
@@ -3,7 +3,8 @@ CSV Processor
 =============
 
 Processes CSV files into row assets.
-Streams file reads to avoid loading entire file into memory.
+Streams file reads to avoid loading entire file into memory, and streams row
+children into the database with COPY (``AssetBuilder.build_children_stream``).
 """
 
 import asyncio
@@ -13,7 +14,7 @@ import logging
 from typing import Any, Dict, Iterator, List, Optional, Tuple
 from app.api.modules.content.models import Asset, AssetKind, ProcessingStatus
 from app.api.modules.content.services.asset_builder import AssetBuilder
-from .base import BaseProcessor, ProcessingError
+from .base import BaseProcessor, ProcessingError, SummaryText
 
 logger = logging.getLogger(__name__)
 
@@ -35,42 +36,64 @@ class CSVProcessor(BaseProcessor):
     
     async def process(self, asset: Asset) -> List[Asset]:
         """
-        Process CSV file and create row assets.
+        Process CSV file and stream row children into the database.
 
-        Parses the CSV, updates parent summary, and batch-inserts row children
-        through AssetBuilder.build_children (flush-only — caller owns commit).
+        Parses and inserts in one pass: rows go straight from the csv reader
+        into AssetBuilder.build_children_stream (COPY, flush-only — caller
+        owns commit). No row Asset objects are built, so none are returned;
+        the parent carries the row count and a capped text summary.
 
         Args:
             asset: Parent CSV asset
 
         Returns:
-            List of CSV_ROW child assets (flushed to session)
+            Empty list (row children are streamed, not materialized)
         """
         if not self.can_process(asset):
             raise ProcessingError(f"Cannot process asset {asset.id} as CSV")
 
-        child_assets, summary = await self._extract_child_assets(asset)
-        self._apply_summary_to_parent(asset, summary)
+        encoding = self.context.options.get('encoding', 'utf-8')
+        skip_rows = self.context.options.get('skip_rows', 0)
 
-        if child_assets:
-            builder = AssetBuilder(self.context.session, asset.user_id, asset.infospace_id)
-            await builder.build_children(asset.id, child_assets)
+        from app.api.modules.content.storage_access import read_to_path
+        file_path, is_temp = await read_to_path(self.context.storage_provider, asset.blob_path)
+        try:
+            text_stream, enc, header, delimiter, csv_reader = await asyncio.to_thread(
+                self._open_csv, file_path, encoding, self.context.options.get('delimiter'), skip_rows,
+            )
+            try:
+                summary_text = self._new_summary(header)
+                builder = AssetBuilder(self.context.session, asset.user_id, asset.infospace_id)
+                rows_processed = await builder.build_children_stream(
+                    asset.id,
+                    self._iter_row_children(csv_reader, header, skip_rows, self.context.max_rows, summary_text),
+                    kind=AssetKind.CSV_ROW,
+                )
+            finally:
+                text_stream.close()
+        finally:
+            if is_temp:
+                try: file_path.unlink()
+                except OSError: pass
 
-        logger.info(
-            f"Processed CSV: {summary['rows_processed']} rows, "
-            f"{len(summary['header'])} columns, created {len(child_assets)} child assets"
-        )
-        return child_assets
+        self._apply_summary_to_parent(asset, {
+            "summary_text": summary_text,
+            "header": header,
+            "delimiter": delimiter,
+            "encoding": enc,
+            "rows_processed": rows_processed,
+        })
+        logger.info(f"Processed CSV: streamed {rows_processed} rows, {len(header)} columns")
+        return []
 
     async def _extract_child_assets(
         self, asset: Asset,
     ) -> Tuple[List[Asset], Dict[str, Any]]:
         """Parse CSV → (child Asset blueprints, summary dict). Does NOT insert.
 
-        Used by `process()` (which then inserts via build_children) and by
-        `CsvMaterializer.reprocess_preserving_children` (which diffs against
-        existing rows instead of inserting). The CSV file is read via the
-        storage provider; the parse itself is off-thread.
+        Used by `CsvMaterializer.reprocess_preserving_children` (which diffs
+        against existing rows instead of inserting). The CSV file is read via
+        the storage provider; the parse itself is off-thread.
         """
         delimiter = self.context.options.get('delimiter')
         encoding = self.context.options.get('encoding', 'utf-8')
@@ -91,7 +114,7 @@ class CSVProcessor(BaseProcessor):
                 except OSError: pass
 
         summary = {
-            "full_text_parts": result["full_text_parts"],
+            "summary_text": result["summary_text"],
             "header": result["header"],
             "delimiter": result["delimiter"],
             "encoding": encoding,
@@ -101,7 +124,8 @@ class CSVProcessor(BaseProcessor):
 
     def _apply_summary_to_parent(self, asset: Asset, summary: Dict[str, Any]) -> None:
         """Write parse summary back onto the parent CSV asset (text + file_info)."""
-        asset.text_content = "\n".join(summary["full_text_parts"])
+        summary_text: SummaryText = summary["summary_text"]
+        asset.text_content = summary_text.text
         file_info = asset.file_info or {}
         file_info.update({
             'columns': summary["header"],
@@ -109,10 +133,30 @@ class CSVProcessor(BaseProcessor):
             'encoding_used': summary["encoding"],
             'rows_processed': summary["rows_processed"],
             'column_count': len(summary["header"]),
+            'text_truncated': summary_text.truncated,
             'processing_options': self.context.options,
         })
         asset.file_info = file_info
 
+    @staticmethod
+    def _new_summary(header: List[str]) -> SummaryText:
+        from app.core.config import settings
+        summary_text = SummaryText(settings.TABULAR_SUMMARY_MAX_CHARS)
+        summary_text.add(f"CSV Headers: {' | '.join(header)}")
+        return summary_text
+
+    def _open_csv(self, file_path, encoding: str, delimiter: Optional[str], skip_rows: int):
+        """Open the file and read through the header. Returns
+        (text_stream, encoding, header, delimiter, csv_reader); caller closes the stream."""
+        enc = self._resolve_encoding_for_path(file_path, encoding)
+        text_stream = open(file_path, "r", encoding=enc)
+        try:
+            header, delimiter, csv_reader = self._read_header(text_stream, delimiter, skip_rows)
+        except Exception:
+            text_stream.close()
+            raise
+        return text_stream, enc, header, delimiter, csv_reader
+
     def _process_csv_stream_from_path(
         self,
         file_path,
@@ -168,7 +212,29 @@ class CSVProcessor(BaseProcessor):
         skip_rows: int,
         max_rows: int,
     ) -> dict:
-        """Process CSV from text stream (iterator of lines)."""
+        """Process CSV from text stream (iterator of lines) into Asset blueprints."""
+        header, delimiter, csv_reader = self._read_header(text_stream, delimiter, skip_rows)
+        summary_text = self._new_summary(header)
+        child_assets = [
+            Asset(
+                kind=AssetKind.CSV_ROW,
+                user_id=asset.user_id,
+                infospace_id=asset.infospace_id,
+                **row,
+            )
+            for row in self._iter_row_children(csv_reader, header, skip_rows, max_rows, summary_text)
+        ]
+        return {
+            "child_assets": child_assets,
+            "summary_text": summary_text,
+            "header": header,
+            "delimiter": delimiter,
+            "rows_processed": len(child_assets),
+        }
+
+    def _read_header(self, text_stream, delimiter: Optional[str], skip_rows: int):
+        """Sniff the delimiter, skip ``skip_rows`` and read the header.
+        Returns (header, delimiter, csv_reader positioned at the first data row)."""
         lines = []
         for i in range(50):
             line = text_stream.readline()
@@ -200,11 +266,18 @@ class CSVProcessor(BaseProcessor):
             raise ProcessingError("CSV is empty or has no header row")
         if not header:
             raise ProcessingError("CSV header row is empty")
+        return header, delimiter, csv_reader
 
-        child_assets = []
-        full_text_parts = [f"CSV Headers: {' | '.join(header)}"]
+    def _iter_row_children(
+        self,
+        csv_reader,
+        header: List[str],
+        skip_rows: int,
+        max_rows: int,
+        summary_text: SummaryText,
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield one CSV_ROW field dict per non-empty data row, feeding ``summary_text``."""
         rows_processed = 0
-
         for row in csv_reader:
             if rows_processed >= max_rows:
                 logger.warning(f"CSV processing stopped at {max_rows} rows limit")
@@ -218,7 +291,7 @@ class CSVProcessor(BaseProcessor):
             cleaned_row = [cell.replace("\x00", "").strip() for cell in row]
             row_data = {header[j]: cleaned_row[j] for j in range(len(header))}
             row_text = " | ".join(cleaned_row)
-            full_text_parts.append(row_text)
+            summary_text.add(row_text)
             title_parts = [str(rows_processed + 1)]
             title_parts.extend(
                 v[:25] + ("..." if len(v) > 25 else "")
@@ -226,32 +299,19 @@ class CSVProcessor(BaseProcessor):
                 if v.strip()
             )
             row_title = " | ".join(title_parts) if len(title_parts) > 1 else f"Row {rows_processed + 1}"
-            child_assets.append(
-                Asset(
-                    title=row_title,
-                    kind=AssetKind.CSV_ROW,
-                    user_id=asset.user_id,
-                    infospace_id=asset.infospace_id,
-                    part_index=rows_processed,
-                    text_content=row_text,
-                    processing_status=ProcessingStatus.READY,
-                    file_info={
-                        "row_number": skip_rows + rows_processed + 2,
-                        "data_row_index": rows_processed,
-                        "original_row_data": row_data,
-                    },
-                )
-            )
+            yield {
+                "title": row_title,
+                "part_index": rows_processed,
+                "text_content": row_text,
+                "processing_status": ProcessingStatus.READY,
+                "file_info": {
+                    "row_number": skip_rows + rows_processed + 2,
+                    "data_row_index": rows_processed,
+                    "original_row_data": row_data,
+                },
+            }
             rows_processed += 1
 
-        return {
-            "child_assets": child_assets,
-            "full_text_parts": full_text_parts,
-            "header": header,
-            "delimiter": delimiter,
-            "rows_processed": rows_processed,
-        }
-
     def _decode_csv(self, file_bytes: bytes, encoding: str) -> str:
         """Decode CSV bytes with fallback encodings."""
         try:
@@ -5,19 +5,22 @@ Excel Processor
 Processes multi-sheet Excel files (XLSX/XLS) into hierarchical structure:
 - Parent: Excel file asset
 - Children: Sheet assets (CSV kind)
-- Grandchildren: Row assets (CSV_ROW kind)
+- Grandchildren: Row assets (CSV_ROW kind), COPY-streamed per sheet
 """
 
 import asyncio
-import csv
 import logging
-from typing import List, Dict, Any, Tuple, Optional
+from itertools import chain, islice
+from typing import List, Dict, Any, Iterable, Iterator, Tuple, Optional
 from app.api.modules.content.models import Asset, AssetKind, ProcessingStatus
 from app.api.modules.content.services.asset_builder import AssetBuilder
-from .base import BaseProcessor, ProcessingError
+from .base import BaseProcessor, ProcessingError, SummaryText
 
 logger = logging.getLogger(__name__)
 
+# Leading non-empty rows _detect_header_row scans for the header
+HEADER_SCAN_ROWS = 20
+
 
 class ExcelProcessor(BaseProcessor):
     """
@@ -38,6 +41,10 @@ class ExcelProcessor(BaseProcessor):
     async def process(self, asset: Asset) -> List[Asset]:
         """
         Process Excel file and create sheet and row assets.
+
+        The workbook is opened read-only and each sheet's rows go straight
+        from ``iter_rows`` into AssetBuilder.build_children_stream (COPY,
+        flush-only — caller owns commit); no row Asset objects are built.
         
         Args:
             asset: Parent Excel asset
@@ -50,200 +57,188 @@ class ExcelProcessor(BaseProcessor):
         
         skip_rows = self.context.options.get('skip_rows', 0)
         max_rows = self.context.max_rows
-        
-        # Read file
-        file_stream = await self.context.storage_provider.get_file(asset.blob_path)
-        file_bytes = await asyncio.to_thread(file_stream.read)
-        
-        # Parse Excel file
-        file_ext = asset.blob_path.split('.')[-1].lower()
-        sheets_data = await self._parse_excel(file_bytes, file_ext, skip_rows)
-        
-        if not sheets_data:
+
+        from app.api.modules.content.storage_access import read_to_path
+        file_path, is_temp = await read_to_path(self.context.storage_provider, asset.blob_path)
+        try:
+            wb = await asyncio.to_thread(self._open_workbook, file_path)
+            try:
+                sheet_assets: List[Asset] = []
+                sheet_row_counts: List[int] = []
+                for sheet_name in wb.sheetnames:
+                    result = await self._process_sheet(
+                        asset, wb[sheet_name], sheet_name, len(sheet_assets), skip_rows, max_rows
+                    )
+                    if result is not None:
+                        sheet_assets.append(result[0])
+                        sheet_row_counts.append(result[1])
+            finally:
+                wb.close()
+        finally:
+            if is_temp:
+                try: file_path.unlink()
+                except OSError: pass
+
+        if not sheet_assets:
             raise ProcessingError("Excel file contains no data")
         
         # Update parent asset summary
-        asset.text_content = f"Excel workbook with {len(sheets_data)} sheet(s)"
+        asset.text_content = f"Excel workbook with {len(sheet_assets)} sheet(s)"
         file_info = asset.file_info or {}
         file_info.update({
-            'sheet_count': len(sheets_data),
-            'sheet_names': [sheet['name'] for sheet in sheets_data],
-            'total_rows': sum(sheet['row_count'] for sheet in sheets_data),
+            'sheet_count': len(sheet_assets),
+            'sheet_names': [sheet.title for sheet in sheet_assets],
+            'total_rows': sum(sheet_row_counts),
             'is_multisheet_excel': True,
             'processing_options': self.context.options
         })
         asset.file_info = file_info
         
-        # Create sheet assets
-        sheet_assets = []
-        for sheet_index, sheet_data in enumerate(sheets_data):
-            sheet_asset = await self._process_sheet(
-                asset, sheet_data, sheet_index, max_rows
-            )
-            sheet_assets.append(sheet_asset)
-        
         logger.info(
-            f"Processed Excel file: {len(sheets_data)} sheets, "
-            f"total {sum(sheet['row_count'] for sheet in sheets_data)} rows"
+            f"Processed Excel file: {len(sheet_assets)} sheets, "
+            f"total {sum(sheet_row_counts)} rows"
         )
         
         return sheet_assets
-    
-    async def _parse_excel(
-        self, 
-        file_bytes: bytes, 
-        file_ext: str, 
-        skip_rows: int
-    ) -> List[Dict[str, Any]]:
-        """
-        Parse Excel file into structured sheet data.
-        
-        Returns:
-            List of dicts with keys: name, csv_text, row_count
-        """
+
+    def _open_workbook(self, file_path):
         try:
             import openpyxl
-            import io
-            
-            def parse_sync():
-                wb = openpyxl.load_workbook(
-                    io.BytesIO(file_bytes), 
-                    read_only=True, 
-                    data_only=True
-                )
-                
-                sheets_data = []
-                
-                for sheet_name in wb.sheetnames:
-                    sheet = wb[sheet_name]
-                    
-                    # Convert sheet to CSV format
-                    csv_lines = []
-                    row_count = 0
-                    
-                    for i, row in enumerate(sheet.iter_rows(values_only=True)):
-                        if i < skip_rows:
-                            continue
-                        
-                        # Convert values to strings
-                        row_values = [str(cell) if cell is not None else '' for cell in row]
-                        
-                        # Skip empty rows
-                        if any(val.strip() for val in row_values):
-                            # Properly escape CSV values
-                            escaped_values = []
-                            for val in row_values:
-                                # If value contains comma, newline, or quote, wrap in quotes and escape internal quotes
-                                if ',' in val or '\n' in val or '"' in val:
-                                    # Escape internal quotes by doubling them
-                                    escaped_val = val.replace('"', '""')
-                                    escaped_values.append(f'"{escaped_val}"')
-                                else:
-                                    escaped_values.append(val)
-                            csv_lines.append(','.join(escaped_values))
-                            row_count += 1
-                    
-                    if csv_lines:  # Only include non-empty sheets
-                        sheets_data.append({
-                            'name': sheet_name,
-                            'csv_text': '\n'.join(csv_lines),
-                            'row_count': row_count
-                        })
-                
-                wb.close()
-                return sheets_data
-            
-            sheets_data = await asyncio.to_thread(parse_sync)
-            logger.info(f"Converted Excel file: {len(sheets_data)} sheets")
-            return sheets_data
-            
         except ImportError:
             raise ProcessingError(
                 "openpyxl library not installed. Install with: pip install openpyxl"
             )
+        try:
+            return openpyxl.load_workbook(str(file_path), read_only=True, data_only=True)
         except Exception as e:
             raise ProcessingError(f"Failed to parse Excel file: {e}")
-    
+
+    @staticmethod
+    def _sheet_rows(worksheet, skip_rows: int) -> Iterator[List[str]]:
+        """Non-empty rows of a read-only worksheet as lists of strings."""
+        for i, row in enumerate(worksheet.iter_rows(values_only=True)):
+            if i < skip_rows:
+                continue
+            row_values = [str(cell) if cell is not None else '' for cell in row]
+            if any(val.strip() for val in row_values):
+                yield row_values
+
     async def _process_sheet(
         self,
         parent_asset: Asset,
-        sheet_data: Dict[str, Any],
+        worksheet,
+        sheet_name: str,
         sheet_index: int,
-        max_rows: int
-    ) -> Asset:
+        skip_rows: int,
+        max_rows: int,
+    ) -> Optional[Tuple[Asset, int]]:
         """
-        Process a single sheet and create row assets.
+        Process a single sheet and stream its row assets.
         
         Args:
             parent_asset: Parent Excel asset
-            sheet_data: Dict with 'name', 'csv_text', 'row_count'
-            sheet_index: Index of sheet in workbook
+            worksheet: Read-only openpyxl worksheet
+            sheet_name: Sheet title
+            sheet_index: Index of sheet among the workbook's non-empty sheets
+            skip_rows: Leading rows to ignore
             max_rows: Maximum rows to process
             
         Returns:
-            Sheet asset with row children
+            (sheet asset with row children, non-empty rows read), or None for an empty sheet
         """
-        sheet_name = sheet_data['name']
-        csv_text = sheet_data['csv_text']
         session = self.context.session
+        rows_read = 0
+
+        def counted(rows: Iterator[List[str]]) -> Iterator[List[str]]:
+            nonlocal rows_read
+            for row in rows:
+                rows_read += 1
+                yield row
 
-        def _build_sheet_asset(text_content: str = "", extra_info: Optional[Dict[str, Any]] = None) -> Asset:
-            info = {
+        rows = counted(self._sheet_rows(worksheet, skip_rows))
+        head = await asyncio.to_thread(lambda: list(islice(rows, HEADER_SCAN_ROWS + 1)))
+        if not head:
+            return None
+
+        sheet_asset = Asset(
+            title=sheet_name,
+            kind=AssetKind.CSV,
+            user_id=parent_asset.user_id,
+            infospace_id=parent_asset.infospace_id,
+            parent_asset_id=parent_asset.id,
+            part_index=sheet_index,
+            text_content="",
+            file_info={
                 'sheet_name': sheet_name,
                 'sheet_index': sheet_index,
                 'parent_excel_file': parent_asset.title,
-                'row_count': sheet_data['row_count'],
                 'is_excel_sheet': True,
-            }
-            if extra_info:
-                info.update(extra_info)
-            return Asset(
-                title=sheet_name,
-                kind=AssetKind.CSV,
-                user_id=parent_asset.user_id,
-                infospace_id=parent_asset.infospace_id,
-                parent_asset_id=parent_asset.id,
-                part_index=sheet_index,
-                text_content=text_content,
-                file_info=info,
-                processing_status=ProcessingStatus.READY,
-            )
-
-        # Parse CSV text
-        csv_lines = csv_text.split('\n')
-        all_rows = list(csv.reader(csv_lines, delimiter=','))
-
-        if not all_rows:
-            logger.warning(f"Sheet '{sheet_name}' has no rows")
-            sheet_asset = _build_sheet_asset()
-            session.add(sheet_asset)
-            session.flush()
-            return sheet_asset
+            },
+            processing_status=ProcessingStatus.READY,
+        )
+        session.add(sheet_asset)
+        session.flush()
 
         # Smart header detection: find the row with the most non-empty cells
-        header_row_idx, header = self._detect_header_row(all_rows, sheet_name)
+        header_row_idx, header = self._detect_header_row(head, sheet_name)
 
         if header_row_idx is None or not header:
             logger.warning(f"Sheet '{sheet_name}' has no valid header row")
-            sheet_asset = _build_sheet_asset()
-            session.add(sheet_asset)
-            session.flush()
-            return sheet_asset
+            sheet_asset.file_info = {**sheet_asset.file_info, 'row_count': rows_read}
+            return sheet_asset, rows_read
 
-        # Process rows (skip rows before and including header)
-        child_rows: List[Asset] = []
-        full_text_parts = [f"Sheet: {sheet_name}", f"Headers: {' | '.join(header)}"]
-        rows_processed = 0
+        from app.core.config import settings
+        summary_text = SummaryText(settings.TABULAR_SUMMARY_MAX_CHARS)
+        summary_text.add(f"Sheet: {sheet_name}")
+        summary_text.add(f"Headers: {' | '.join(header)}")
+
+        builder = AssetBuilder(session, parent_asset.user_id, parent_asset.infospace_id)
+        rows_processed = await builder.build_children_stream(
+            sheet_asset.id,
+            self._iter_row_children(
+                chain(head[header_row_idx + 1:], rows),
+                header, sheet_name, sheet_index, parent_asset.title, max_rows, summary_text,
+            ),
+            kind=AssetKind.CSV_ROW,
+        )
 
-        # Start processing from the row after the header
-        for idx, row in enumerate(all_rows[header_row_idx + 1:]):
+        # Sheet summary is known only once its rows have streamed
+        sheet_asset.text_content = summary_text.text
+        sheet_asset.file_info = {
+            **sheet_asset.file_info,
+            'row_count': rows_read,
+            'header_row_index': header_row_idx,
+            'data_starts_at_row': header_row_idx + 1,
+            'columns': header,
+            'column_count': len(header),
+            'rows_processed': rows_processed,
+            'text_truncated': summary_text.truncated,
+        }
+
+        logger.info(
+            f"Processed sheet '{sheet_name}': {rows_processed} rows, "
+            f"{len(header)} columns, streamed {rows_processed} row assets"
+        )
+
+        return sheet_asset, rows_read
+
+    def _iter_row_children(
+        self,
+        data_rows: Iterable[List[str]],
+        header: List[str],
+        sheet_name: str,
+        sheet_index: int,
+        excel_file: str,
+        max_rows: int,
+        summary_text: SummaryText,
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield one CSV_ROW field dict per data row, feeding ``summary_text``."""
+        rows_processed = 0
+        for row in data_rows:
             if rows_processed >= max_rows:
                 logger.warning(f"Sheet '{sheet_name}' processing stopped at {max_rows} rows limit")
                 break
 
-            if not any(cell.strip() for cell in row if cell):
-                continue
-
             # Normalize row length
             while len(row) < len(header):
                 row.append('')
@@ -258,7 +253,7 @@ class ExcelProcessor(BaseProcessor):
             if not row_text or len(row_text.strip('| ')) < 3:
                 logger.warning(f"Sheet '{sheet_name}' Row {rows_processed}: text_content is suspiciously empty: '{row_text}'")
 
-            full_text_parts.append(row_text)
+            summary_text.add(row_text)
 
             # Generate title: {sheet_name} | {index} | {first_cols}
             title_parts = [sheet_name, str(rows_processed + 1)]
@@ -271,53 +266,21 @@ class ExcelProcessor(BaseProcessor):
                 else f"{sheet_name} Row {rows_processed + 1}"
             )
 
-            child_rows.append(Asset(
-                title=row_title,
-                kind=AssetKind.CSV_ROW,
-                user_id=parent_asset.user_id,
-                infospace_id=parent_asset.infospace_id,
-                part_index=rows_processed,
-                text_content=row_text,
-                file_info={
+            yield {
+                'title': row_title,
+                'part_index': rows_processed,
+                'text_content': row_text,
+                'file_info': {
                     'sheet_name': sheet_name,
                     'sheet_index': sheet_index,
                     'row_number': rows_processed + 1,
                     'data_row_index': rows_processed,
                     'original_row_data': row_data,
-                    'excel_file': parent_asset.title,
+                    'excel_file': excel_file,
                 },
-                processing_status=ProcessingStatus.READY,
-            ))
+                'processing_status': ProcessingStatus.READY,
+            }
             rows_processed += 1
-
-            if rows_processed % 1000 == 0:
-                await asyncio.sleep(0.01)
-
-        # Persist the sheet asset (with content summary + detected header info)
-        sheet_asset = _build_sheet_asset(
-            text_content="\n".join(full_text_parts),
-            extra_info={
-                'header_row_index': header_row_idx,
-                'data_starts_at_row': header_row_idx + 1,
-                'columns': header,
-                'column_count': len(header),
-                'rows_processed': rows_processed,
-            },
-        )
-        session.add(sheet_asset)
-        session.flush()
-
-        # Batch-insert row children (flush every 500 internally)
-        if child_rows:
-            builder = AssetBuilder(session, parent_asset.user_id, parent_asset.infospace_id)
-            await builder.build_children(sheet_asset.id, child_rows)
-
-        logger.info(
-            f"Processed sheet '{sheet_name}': {rows_processed} rows, "
-            f"{len(header)} columns, created {len(child_rows)} row assets"
-        )
-
-        return sheet_asset
     
     def _detect_header_row(self, all_rows: List[List[str]], sheet_name: str) -> Tuple[Optional[int], List[str]]:
         """
@@ -340,7 +303,7 @@ class ExcelProcessor(BaseProcessor):
             return None, []
         
         # Scan first 20 rows to find the header
-        scan_limit = min(20, len(all_rows))
+        scan_limit = min(HEADER_SCAN_ROWS, len(all_rows))
         
         # Count non-empty cells in each row
         row_scores = []
@@ -3,20 +3,49 @@ PDF Processor
 =============
 
 Processes PDF files into page assets.
+
+Text extraction is page-parallel: documents of ``PDF_PARALLEL_MIN_PAGES`` or
+more are split into page ranges and fanned out over a process pool of
+``PDF_EXTRACT_WORKERS`` workers. Each worker opens the file by path (MuPDF
+reads it lazily; only the path and the range cross the process boundary)
+and returns ``(page_index, text, image_count)`` tuples. Shorter documents
+and in-memory bytes are extracted in-process with identical output.
+
+The pool is billiard's (Celery's multiprocessing fork), not
+``concurrent.futures``: Celery prefork children are daemonic, and the
+stdlib refuses to start processes from a daemonic one. If the pool still
+cannot start, that is recorded once and the process extracts in-process
+from then on, without retrying per document.
+
+PyMuPDF is imported on first use (``_open``), so importing the processor
+registry does not load it.
 """
 
 import asyncio
 import logging
-import fitz  # PyMuPDF
-from typing import Any, Dict, List, Optional
-from app.api.modules.content.models import Asset, AssetKind
+import math
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+from sqlalchemy import insert
+from app.api.modules.content.models import Asset, AssetKind, ProcessingStatus
+from app.api.modules.content.counts import note_asset_writes
 from app.api.modules.foundation_service_providers.base import StorageProvider
-from app.schemas import AssetCreate
 from .base import BaseProcessor, ProcessingError
 
 logger = logging.getLogger(__name__)
 
 
+def _open(*, file_path: str | None = None, pdf_bytes: bytes | None = None):
+    """Open a PDF with PyMuPDF by path (preferred) or from bytes."""
+    import fitz  # PyMuPDF
+
+    if file_path is not None:
+        return fitz.open(filename=file_path)
+    if pdf_bytes is not None:
+        return fitz.open(stream=pdf_bytes, filetype="pdf")
+    raise ProcessingError("Either pdf_bytes or file_path must be provided")
+
+
 class PdfMetadataExtractor:
     """Metadata extractor for PDF assets. Registered on ContentTypeDescriptor."""
 
@@ -50,12 +79,7 @@ def extract_pdf_metadata(
     Lightweight PDF metadata extraction for Phase 1 content detection.
     Samples first N pages to detect image-only PDFs without fully processing.
     """
-    if file_path is not None:
-        doc = fitz.open(filename=file_path)
-    elif pdf_bytes is not None:
-        doc = fitz.open(stream=pdf_bytes, filetype="pdf")
-    else:
-        raise ProcessingError("Either pdf_bytes or file_path must be provided")
+    doc = _open(file_path=file_path, pdf_bytes=pdf_bytes)
 
     with doc:
         page_count = doc.page_count
@@ -80,6 +104,126 @@ def extract_pdf_metadata(
         }
 
 
+# ── Page extraction engine ───────────────────────────────────────────────────
+
+# (page_index, text, image_count, error); error pages produce no child
+PageResult = Tuple[int, str, int, Optional[str]]
+
+# Ranges per worker: more than one so a slow range (scanned pages, huge
+# content streams) doesn't leave the other workers idle at the end.
+RANGES_PER_WORKER = 4
+MIN_RANGE_PAGES = 16
+
+_pool: Optional[Any] = None  # billiard Pool
+_pool_workers = 0
+_pool_unavailable = False
+_pool_lock = threading.Lock()
+
+
+def _extract_from_doc(doc, start: int, stop: int) -> List[PageResult]:
+    results: List[PageResult] = []
+    for page_num in range(start, stop):
+        try:
+            page = doc.load_page(page_num)
+            text = page.get_text("text").replace("\x00", "").strip()
+            results.append((page_num, text, len(page.get_images()), None))
+        except Exception as e:
+            results.append((page_num, "", 0, str(e)))
+    return results
+
+
+def _extract_page_range(file_path: str, start: int, stop: int) -> List[PageResult]:
+    """Pool worker entry point: open the file and extract ``[start, stop)``."""
+    with _open(file_path=file_path) as doc:
+        return _extract_from_doc(doc, start, stop)
+
+
+def page_ranges(page_count: int, workers: int) -> List[Tuple[int, int]]:
+    """Split ``[0, page_count)`` into contiguous ranges for ``workers`` processes."""
+    if page_count <= 0:
+        return []
+    parts = max(1, workers * RANGES_PER_WORKER)
+    size = max(MIN_RANGE_PAGES, math.ceil(page_count / parts))
+    return [(start, min(start + size, page_count)) for start in range(0, page_count, size)]
+
+
+def _page_pool(workers: int) -> Optional[Any]:
+    """Process-wide billiard pool, created on first use, or ``None`` once it
+    has failed to start in this process. ``spawn`` keeps MuPDF state and
+    the parent's DB/Redis connections out of the workers."""
+    global _pool, _pool_workers, _pool_unavailable
+    with _pool_lock:
+        if _pool_unavailable:
+            return None
+        if _pool is not None and _pool_workers != workers:
+            _pool.terminate()
+            _pool = None
+        if _pool is None:
+            try:
+                import billiard
+
+                _pool = billiard.get_context("spawn").Pool(processes=workers)
+            except Exception as e:
+                _pool_unavailable = True
+                logger.warning(f"PDF page pool cannot start ({e!r}); extracting in-process from now on")
+                return None
+            _pool_workers = workers
+        return _pool
+
+
+def _discard_pool() -> None:
+    """Drop a pool that lost a worker; the next document builds a new one."""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.terminate()
+            _pool = None
+
+
+def extract_pages(
+    page_count: int,
+    *,
+    file_path: str | None = None,
+    pdf_bytes: bytes | None = None,
+    workers: int | None = None,
+    min_parallel_pages: int | None = None,
+) -> List[PageResult]:
+    """Extract pages ``[0, page_count)`` in page order."""
+    from app.core.config import settings
+
+    workers = settings.PDF_EXTRACT_WORKERS if workers is None else workers
+    min_parallel_pages = (
+        settings.PDF_PARALLEL_MIN_PAGES if min_parallel_pages is None else min_parallel_pages
+    )
+
+    pool = (
+        _page_pool(workers)
+        if file_path is not None and workers > 0 and page_count >= min_parallel_pages
+        else None
+    )
+    if pool is not None:
+        pending = [
+            pool.apply_async(_extract_page_range, (file_path, a, b))
+            for a, b in page_ranges(page_count, workers)
+        ]
+        try:
+            results: List[PageResult] = []
+            for result in pending:
+                results.extend(result.get())
+            return results
+        except Exception as e:
+            # WorkerLostError, or the range could not be opened in the worker
+            logger.warning(f"PDF page pool failed ({e!r}); extracting in-process")
+            _discard_pool()
+
+    if file_path is not None:
+        return _extract_page_range(file_path, 0, page_count)
+    if pdf_bytes is not None:
+        with _open(pdf_bytes=pdf_bytes) as doc:
+            return _extract_from_doc(doc, 0, page_count)
+    raise ProcessingError("Either pdf_bytes or file_path must be provided")
+
+
 class PDFProcessor(BaseProcessor):
     """
     Process PDF files.
@@ -118,7 +262,7 @@ class PDFProcessor(BaseProcessor):
         storage = self.context.storage_provider
         file_path, is_temp = await read_to_path(storage, asset.blob_path)
         try:
-            full_text, child_assets, metadata = await asyncio.to_thread(
+            full_text, child_rows, metadata = await asyncio.to_thread(
                 self._process_pdf_sync, asset, max_pages, file_path=str(file_path)
             )
         finally:
@@ -139,15 +283,16 @@ class PDFProcessor(BaseProcessor):
         if metadata.get('extracted_title') and (not asset.title or not asset.title.startswith('Uploaded')):
             asset.title = metadata['extracted_title']
         
-        # Save child assets in batches (PDF_PAGE children, each with discovered_modalities in source_metadata)
-        saved_children = []
-        batch_size = 500
-        for i in range(0, len(child_assets), batch_size):
-            batch = child_assets[i : i + batch_size]
-            batch_assets = [Asset(**c.model_dump()) for c in batch]
-            saved_children.extend(batch_assets)
-            self.context.session.add_all(batch_assets)
-            self.context.session.flush()
+        # One executemany INSERT ... RETURNING for all PDF_PAGE children
+        # (batched into multi-row VALUES by the driver), returned as ORM rows.
+        saved_children: List[Asset] = []
+        if child_rows:
+            saved_children = list(self.context.session.scalars(
+                insert(Asset).returning(Asset, sort_by_parameter_order=True),
+                child_rows,
+            ))
+            # Core INSERT skips session.new — record it for listing counts.
+            note_asset_writes(self.context.session, [asset.infospace_id])
         self.context.session.commit()
         logger.info(f"Processed PDF: {metadata['processed_pages']} pages extracted, created {len(saved_children)} page assets")
         
@@ -160,105 +305,95 @@ class PDFProcessor(BaseProcessor):
         *,
         pdf_bytes: bytes | None = None,
         file_path: str | None = None,
-    ) -> tuple[str, List[AssetCreate], dict]:
+    ) -> tuple[str, List[Dict[str, Any]], dict]:
         """
-        Synchronous PDF processing (runs in thread).
+        Synchronous PDF processing (runs in thread; page text via ``extract_pages``).
         
         Detects image-only PDFs by checking if extractable text is minimal/absent.
         Uses file_path when available (zero-copy for local_fs), else pdf_bytes.
         
         Returns:
-            Tuple of (full_text, child_assets, metadata)
+            Tuple of (full_text, child_rows, metadata); child_rows are
+            insert-ready ``Asset`` column dicts in page order.
         """
-        if file_path is not None:
-            doc = fitz.open(filename=file_path)
-        elif pdf_bytes is not None:
-            doc = fitz.open(stream=pdf_bytes, filetype="pdf")
-        else:
-            raise ProcessingError("Either pdf_bytes or file_path must be provided")
-
-        full_text = ""
-        child_assets = []
-        total_chars_extracted = 0
-        all_modalities: set[str] = set()
+        doc = _open(file_path=file_path, pdf_bytes=pdf_bytes)
 
         with doc:
             page_count = doc.page_count
             pdf_title = None
-
             if doc.metadata and doc.metadata.get('title'):
                 pdf_title = doc.metadata['title'].strip()
 
-            pages_to_process = min(page_count, max_pages) if max_pages > 0 else page_count
-
-            # Sample first few pages to detect image-only PDFs
-            sample_pages = min(3, pages_to_process)  # Check first 3 pages
-
-            for page_num in range(pages_to_process):
-                try:
-                    page = doc.load_page(page_num)
-                    text = page.get_text("text").replace('\x00', '').strip()
-                    images = page.get_images()
-
-                    # Honest modality tagging: check both text layer and embedded images
-                    page_modalities = []
-                    if text:
-                        page_modalities.append('text')
-                        full_text += text + "\n\n"
-                        total_chars_extracted += len(text)
-                    if images:
-                        page_modalities.append('image')
-                    if not page_modalities:
-                        page_modalities = ['image']  # blank/vector-only page
-
-                    all_modalities.update(page_modalities)
-
-                    page_metadata = {
-                        'page_number': page_num + 1,
-                        'char_count': len(text),
-                        'image_count': len(images),
-                    }
-
-                    child_asset_create = AssetCreate(
-                        title=f"Page {page_num + 1}",
-                        kind=AssetKind.PDF_PAGE,
-                        user_id=asset.user_id,
-                        infospace_id=asset.infospace_id,
-                        parent_asset_id=asset.id,
-                        part_index=page_num,
-                        text_content=text if text else None,
-                        file_info=page_metadata,
-                        discovered_modalities=page_modalities,
-                    )
-                    child_assets.append(child_asset_create)
-
-                except Exception as e:
-                    logger.error(f"Error processing PDF page {page_num + 1}: {e}")
-                    continue
-
-            # Determine if this is an image-only PDF
-            # Heuristic: If we extracted very little text relative to page count,
-            # it's likely an image-only (scanned) document
-            avg_chars_per_page = total_chars_extracted / max(1, sample_pages)
-            is_image_only = avg_chars_per_page < 50  # Less than 50 chars per page avg
-
-            if is_image_only:
-                logger.info(
-                    f"Detected image-only PDF: {page_count} pages, "
-                    f"{total_chars_extracted} chars extracted, "
-                    f"{avg_chars_per_page:.1f} chars/page average"
-                )
+        pages_to_process = min(page_count, max_pages) if max_pages > 0 else page_count
+        pages = extract_pages(pages_to_process, file_path=file_path, pdf_bytes=pdf_bytes)
+
+        text_parts: List[str] = []
+        child_rows: List[Dict[str, Any]] = []
+        total_chars_extracted = 0
+        all_modalities: set[str] = set()
+
+        # Sample first few pages to detect image-only PDFs
+        sample_pages = min(3, pages_to_process)  # Check first 3 pages
+
+        for page_num, text, image_count, error in pages:
+            if error is not None:
+                logger.error(f"Error processing PDF page {page_num + 1}: {error}")
+                continue
 
-            metadata = {
-                'page_count': page_count,
-                'processed_pages': len(child_assets),
-                'extracted_title': pdf_title,
-                'total_chars_extracted': total_chars_extracted,
-                'avg_chars_per_page': avg_chars_per_page,
-                'is_image_only': is_image_only,
-                'modality_union': sorted(all_modalities),
-                'processing_options': self.context.options
-            }
+            # Honest modality tagging: check both text layer and embedded images
+            page_modalities = []
+            if text:
+                page_modalities.append('text')
+                text_parts.append(text)
+                total_chars_extracted += len(text)
+            if image_count:
+                page_modalities.append('image')
+            if not page_modalities:
+                page_modalities = ['image']  # blank/vector-only page
 
-        return full_text.strip(), child_assets, metadata
+            all_modalities.update(page_modalities)
+
+            child_rows.append({
+                'title': f"Page {page_num + 1}",
+                'kind': AssetKind.PDF_PAGE,
+                'user_id': asset.user_id,
+                'infospace_id': asset.infospace_id,
+                'parent_asset_id': asset.id,
+                'part_index': page_num,
+                'text_content': text if text else None,
+                'file_info': {
+                    'page_number': page_num + 1,
+                    'char_count': len(text),
+                    'image_count': image_count,
+                },
+                'discovered_modalities': page_modalities,
+                'fragments': {},
+                'tags': [],
+                'processing_status': ProcessingStatus.READY,
+            })
+
+        # Determine if this is an image-only PDF
+        # Heuristic: If we extracted very little text relative to page count,
+        # it's likely an image-only (scanned) document
+        avg_chars_per_page = total_chars_extracted / max(1, sample_pages)
+        is_image_only = avg_chars_per_page < 50  # Less than 50 chars per page avg
+
+        if is_image_only:
+            logger.info(
+                f"Detected image-only PDF: {page_count} pages, "
+                f"{total_chars_extracted} chars extracted, "
+                f"{avg_chars_per_page:.1f} chars/page average"
+            )
+
+        metadata = {
+            'page_count': page_count,
+            'processed_pages': len(child_rows),
+            'extracted_title': pdf_title,
+            'total_chars_extracted': total_chars_extracted,
+            'avg_chars_per_page': avg_chars_per_page,
+            'is_image_only': is_image_only,
+            'modality_union': sorted(all_modalities),
+            'processing_options': self.context.options
+        }
 
+        return "\n\n".join(text_parts), child_rows, metadata
@@ -5,11 +5,17 @@ Supports:
 - Full-text search (websearch_to_tsquery FTS with phrase/negation support)
 - Kind filters, facet filters (facets JSONB), fragments containment
 - Semantic search (pgvector via subquery)
+- Hybrid retrieval: FTS and ANN candidates fused (RRF or weighted) in one statement
 - Entity search (graph-first with text fallback)
 - Annotation value filters (JSONB pushdown with nested path support)
 - Date range, bundle scope
 - Relevance scoring (ts_rank) and highlights (ts_headline)
 - Cursor/offset pagination, composite sort
+- Column projection for listings (columns() / NODE_COLUMNS): heavy columns
+  stay deferred and load only when touched
+- Async-backed sessions: built on ``AsyncSession.sync_session``, sync work
+  goes through ``run()`` (embedding helpers through ``run_embedding()``)
+  and the ``*_async`` executors stay off the loop
 
 Also provides from_aql() to compile a ParsedQuery (from aql.py) into an AssetQuery.
 """
@@ -23,15 +29,32 @@ import re
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Tuple
 
-from sqlalchemy import and_, or_, column as sa_column, func, text
+from sqlalchemy import Float, and_, case, cast as sa_cast, exists, or_, column as sa_column, func, select as sa_select, text
+from sqlalchemy.orm import load_only
 from sqlmodel import Session, select
 
+from app.api.modules.content import counts
 from app.api.modules.content.facets import build_facet_filter
 from app.api.modules.content.models import Asset, AssetKind, Bundle
 from app.api.modules.content.utils.watcher_filters import non_superseded_filter
+from app.core.db import run_interleaved, run_sync
 
 logger = logging.getLogger(__name__)
 
+# Reciprocal-rank fusion constant (Cormack et al.): 1 / (k + rank).
+HYBRID_RRF_K = 60
+# Chunks fetched per wanted asset so best-chunk-per-asset still fills the ANN leg.
+HYBRID_CHUNKS_PER_ASSET = 4
+HYBRID_FUSIONS = ("rrf", "weighted")
+
+# What an AssetNode (tree / feed / search listings) and its cursor read.
+# text_content, fragments, file_info & co. stay deferred.
+NODE_COLUMNS = (
+    Asset.id, Asset.title, Asset.kind, Asset.stub, Asset.processing_status,
+    Asset.parent_asset_id, Asset.bundle_ids, Asset.part_index, Asset.tags,
+    Asset.facets, Asset.created_at, Asset.updated_at,
+)
+
 
 class AssetQuery:
     """
@@ -67,10 +90,18 @@ class AssetQuery:
         self._entity_semantic_query: Optional[str] = None
         self._entity_semantic_threshold: Optional[float] = None
         self._entity_semantic_threshold_op: Optional[str] = None
+        self._hybrid_query: Optional[str] = None
+        self._hybrid_top_k: int = 200
+        self._hybrid_fusion: str = "rrf"
+        self._hybrid_text_weight: float = 0.4
+        self._hybrid_total: Optional[int] = None
         self._sort: str = "created_at_desc"
         self._cursor: Optional[int] = None
+        self._cursor_field: Optional[str] = None
+        self._cursor_value: Any = None
         self._limit: int = 25
         self._offset: int = 0
+        self._load_only: Tuple[Any, ...] = ()
 
     # ─── Text search ───
 
@@ -177,6 +208,31 @@ class AssetQuery:
         self._semantic_threshold_op = threshold_op
         return self
 
+    def hybrid(
+        self,
+        query_text: str,
+        top_k: int = 200,
+        fusion: str = "rrf",
+        text_weight: float = 0.4,
+    ) -> AssetQuery:
+        """Rank by FTS and ANN candidates fused in a single statement.
+
+        Unlike ``text()`` + ``semantic()`` (which intersect), either leg can
+        contribute a hit. ``top_k`` bounds each leg's candidate list and
+        therefore how deep cursor pagination can go. ``fusion`` is ``'rrf'``
+        (reciprocal rank) or ``'weighted'`` (min-max normalised scores,
+        ``text_weight`` on FTS). Results are always ordered by fused score.
+        """
+        if not query_text or not query_text.strip():
+            return self
+        if fusion not in HYBRID_FUSIONS:
+            raise ValueError(f"Unknown fusion {fusion!r}; expected one of {HYBRID_FUSIONS}")
+        self._hybrid_query = query_text.strip()
+        self._hybrid_top_k = max(1, top_k)
+        self._hybrid_fusion = fusion
+        self._hybrid_text_weight = min(max(text_weight, 0.0), 1.0)
+        return self
+
     # ─── Date range ───
 
     def date_range(
@@ -450,6 +506,7 @@ class AssetQuery:
         ``int`` asset id (legacy), or ``None``. The primitive decodes
         internally; callers never parse.
         """
+        self._cursor_field = self._cursor_value = None
         if cursor is None:
             self._cursor = None
         elif isinstance(cursor, int):
@@ -457,8 +514,9 @@ class AssetQuery:
         else:
             try:
                 from app.core.cursor import decode_cursor
-                _, _, _, last_id = decode_cursor(cursor)
+                field, _, value, last_id = decode_cursor(cursor)
                 self._cursor = last_id
+                self._cursor_field, self._cursor_value = field, value
             except Exception:
                 try:
                     self._cursor = int(cursor)
@@ -479,6 +537,23 @@ class AssetQuery:
         self._offset = 0
         return self
 
+    # ─── Projection ───
+
+    def columns(self, *cols) -> AssetQuery:
+        """Load only these Asset columns; every other column is deferred.
+
+        Rows are still ``Asset`` instances — a deferred attribute loads on
+        first access. Listings pass ``NODE_COLUMNS``; detail and preview
+        paths use a plain query and get the full row.
+        """
+        self._load_only = tuple(cols)
+        return self
+
+    def _project(self, stmt):
+        if self._load_only:
+            stmt = stmt.options(load_only(*self._load_only))
+        return stmt
+
     # ─── Build & execute ───
 
     def _apply_sort_and_pagination(self, stmt):
@@ -516,14 +591,49 @@ class AssetQuery:
 
     def _build_base_select(self):
         """Build base select with all conditions."""
-        stmt = select(Asset).where(and_(*self._conditions))
+        stmt = self._project(select(Asset).where(and_(*self._conditions)))
         return self._apply_sort_and_pagination(stmt)
 
+    def _match_conditions(self) -> List[Any]:
+        """Conditions plus, in hybrid mode, the FTS match predicate.
+
+        Hybrid candidates are not expressible as a WHERE clause, so count
+        fallbacks and per-parent grouping use the lexical matches.
+        """
+        if not self._hybrid_query:
+            return self._conditions
+        return self._conditions + [self._fts_match(self._hybrid_query)]
+
+    @staticmethod
+    def _fts_match(q: str):
+        tsv = sa_column('text_search_vector')
+        tsq = func.websearch_to_tsquery('english', q)
+        return or_(tsv.op('@@')(tsq), Asset.title.ilike(f"%{_strip_fts_operators(q)}%"))
+
     def count(self) -> int:
-        """Return total count matching the current conditions (ignores limit/offset/cursor)."""
-        stmt = select(func.count(Asset.id)).where(and_(*self._conditions))
+        """Return total count matching the current conditions (ignores limit/offset/cursor).
+
+        In hybrid mode this is the fused candidate count once executed.
+        """
+        if self._hybrid_query and self._hybrid_total is not None:
+            return self._hybrid_total
+        stmt = select(func.count(Asset.id)).where(and_(*self._match_conditions()))
         return self.session.exec(stmt).one() or 0
 
+    def listing_count(self) -> counts.Count:
+        """Count for a listing's ``CountEvent`` — see ``content/counts.py``.
+
+        May be a planner estimate (``approximate``); pass it to
+        ``exact_followup`` once the page is out.
+        """
+        if self._hybrid_query and self._hybrid_total is not None:
+            return counts.Count(self._hybrid_total)
+        return counts.resolve(self.session, self.infospace_id, self._match_conditions())
+
+    def exact_followup(self, first: counts.Count) -> Optional[counts.Count]:
+        """Exact count replacing an approximate ``first``, or ``None``."""
+        return counts.followup(self.session, self._match_conditions(), first)
+
     def count_by_parent(self) -> dict[int, int]:
         """Return {parent_asset_id: count} for matching children.
 
@@ -532,11 +642,26 @@ class AssetQuery:
         """
         stmt = (
             select(Asset.parent_asset_id, func.count(Asset.id))
-            .where(and_(*self._conditions))
+            .where(and_(*self._match_conditions()))
             .group_by(Asset.parent_asset_id)
         )
         return {pid: cnt for pid, cnt in self.session.exec(stmt).all() if pid is not None}
 
+    async def run(self, fn, *args, **kwargs):
+        """Run sync DB work against this query's session (``core.db.run_sync``).
+
+        Inline for a sync Session; on the async connection when the query
+        was built on an ``AsyncSession.sync_session``.
+        """
+        return await run_sync(self.session, fn, *args, **kwargs)
+
+    async def run_embedding(self, fn, *args, **kwargs):
+        """Await an embedding helper ``fn(session, *args, **kwargs)`` that
+        interleaves sync reads with awaits (query embedding, chunk ANN),
+        through ``core.db.run_interleaved`` — on the async connection when
+        the query was built on an ``AsyncSession.sync_session``."""
+        return await run_interleaved(self.session, fn, *args, **kwargs)
+
     def execute(self) -> List[Asset]:
         """Execute and return list of Asset."""
         stmt = self._build_base_select()
@@ -559,7 +684,7 @@ class AssetQuery:
                 'MaxFragments=3,MaxWords=35,StartSel=<mark>,StopSel=</mark>',
             ).label('headline')
 
-            stmt = select(Asset, rank_col, headline_col).where(and_(*self._conditions))
+            stmt = self._project(select(Asset, rank_col, headline_col).where(and_(*self._conditions)))
             stmt = self._apply_sort_and_pagination(stmt)
             rows = list(self.session.exec(stmt).all())
             return [(row[0], float(row[1]), row[2]) for row in rows]
@@ -572,8 +697,8 @@ class AssetQuery:
             try:
                 from app.api.modules.embedding.similarity import search_by_text
 
-                hits = await search_by_text(
-                    self.session, self.infospace_id, self._semantic_query,
+                hits = await self.run_embedding(
+                    search_by_text, self.infospace_id, self._semantic_query,
                     limit=self._semantic_top_k,
                     asset_kinds=self._kinds if self._kinds else None,
                     bundle_id=self._bundle_id,
@@ -585,8 +710,7 @@ class AssetQuery:
             except Exception as e:
                 logger.warning("Semantic search failed: %s", e)
 
-        stmt = self._build_base_select()
-        return list(self.session.exec(stmt).all())
+        return await self.run(self.execute)
 
     async def execute_scored_async(self) -> List[Tuple[Asset, Optional[float], Optional[str]]]:
         """Execute with semantic/entity-semantic search support, returning (asset, rank, headline) tuples."""
@@ -599,6 +723,9 @@ class AssetQuery:
             except Exception as e:
                 logger.warning("Entity semantic search failed: %s", e)
 
+        if self._hybrid_query:
+            return await self._execute_hybrid()
+
         # ── Asset semantic: embed query → search AssetChunk via pgvector ──
         if self._semantic_query:
             try:
@@ -609,8 +736,8 @@ class AssetQuery:
                 if self._semantic_threshold is not None and self._semantic_threshold_op in ('>', '>='):
                     dist_threshold = 1.0 - self._semantic_threshold
 
-                hits = await search_by_text(
-                    self.session, self.infospace_id, self._semantic_query,
+                hits = await self.run_embedding(
+                    search_by_text, self.infospace_id, self._semantic_query,
                     limit=self._semantic_top_k,
                     asset_kinds=self._kinds if self._kinds else None,
                     bundle_id=self._bundle_id,
@@ -633,7 +760,7 @@ class AssetQuery:
             except Exception as e:
                 logger.warning("Semantic search failed: %s", e)
 
-        rows = self.execute_scored()
+        rows = await self.run(self.execute_scored)
 
         # Merge semantic similarity into scores
         if semantic_scores:
@@ -655,24 +782,157 @@ class AssetQuery:
 
         return rows
 
+    async def _execute_hybrid(self) -> List[Tuple[Asset, Optional[float], Optional[str]]]:
+        """Embed the query, then fuse FTS + ANN candidates in one round trip.
+
+        Falls back to FTS-only ranking when the infospace has no usable
+        embedding model.
+        """
+        from app.api.modules.embedding.embed import embed_query
+        from app.api.modules.embedding.similarity import query_vector_for_model
+
+        try:
+            vector, em = await self.run_embedding(embed_query, self.infospace_id, self._hybrid_query)
+            if vector is None:
+                raise ValueError("embedding provider returned no vector")
+            col_name, vector = query_vector_for_model(vector, em)
+        except Exception as e:
+            logger.warning("Hybrid search: semantic leg unavailable, using FTS only: %s", e)
+            query_text, self._hybrid_query = self._hybrid_query, None
+            self.text(query_text, mode="fts")
+            self._sort = "relevance"
+            return await self.run(self.execute_scored)
+
+        stmt = self._hybrid_statement(col_name, vector, em.id)
+        rows = await self.run(lambda: self.session.exec(stmt).all())
+        self._hybrid_total = int(rows[0][3]) if rows else 0
+        return [(row[0], float(row[1]), row[2]) for row in rows]
+
+    def _hybrid_statement(self, col_name: str, vector: List[float], embedding_model_id: int):
+        """Build the fused candidate query (no I/O).
+
+        ``fts`` and ``ann`` CTEs each rank up to ``top_k`` candidates under
+        the query's conditions; the ANN leg keeps each asset's best chunk.
+        A FULL OUTER JOIN fuses them, ``(score DESC, id DESC)`` makes the
+        order total, and the keyset cursor continues from ``(score, id)``.
+        Headlines are computed for the returned page only.
+        """
+        from app.api.modules.content.models import AssetChunk
+
+        q = self._hybrid_query
+        depth = self._hybrid_top_k
+        conds = and_(*self._conditions)
+        tsv = sa_column('text_search_vector')
+        tsq = func.websearch_to_tsquery('english', q)
+
+        fts_rank = func.ts_rank(tsv, tsq)
+        fts = (
+            sa_select(
+                Asset.id.label("id"),
+                fts_rank.label("score"),
+                func.row_number().over(order_by=(fts_rank.desc(), Asset.id.desc())).label("rnk"),
+            )
+            .where(conds, self._fts_match(q))
+            .order_by(fts_rank.desc(), Asset.id.desc())
+            .limit(depth)
+            .cte("fts")
+        )
+
+        # Chunk KNN stays index-ordered; conditions apply through a correlated
+        # EXISTS so unqualified asset columns in text() filters still resolve.
+        emb = getattr(AssetChunk, col_name)
+        distance = emb.cosine_distance(vector)
+        ann_chunks = (
+            sa_select(AssetChunk.asset_id.label("id"), distance.label("distance"))
+            .where(
+                AssetChunk.embedding_model_id == embedding_model_id,
+                emb.isnot(None),
+                exists().where(Asset.id == AssetChunk.asset_id, conds),
+            )
+            .order_by(distance)
+            .limit(depth * HYBRID_CHUNKS_PER_ASSET)
+            .cte("ann_chunks")
+        )
+        best = func.min(ann_chunks.c.distance)
+        ann = (
+            sa_select(
+                ann_chunks.c.id,
+                best.label("distance"),
+                func.row_number().over(order_by=(best.asc(), ann_chunks.c.id.desc())).label("rnk"),
+            )
+            .group_by(ann_chunks.c.id)
+            .order_by(best.asc(), ann_chunks.c.id.desc())
+            .limit(depth)
+            .cte("ann")
+        )
+
+        similarity = 1.0 - ann.c.distance
+        if self._hybrid_fusion == "rrf":
+            # float8 throughout so the keyset cursor round-trips exactly.
+            score = (
+                func.coalesce(1.0 / sa_cast(HYBRID_RRF_K + fts.c.rnk, Float), 0.0)
+                + func.coalesce(1.0 / sa_cast(HYBRID_RRF_K + ann.c.rnk, Float), 0.0)
+            )
+        else:
+            w = self._hybrid_text_weight
+            score = (
+                w * func.coalesce(_min_max(fts.c.score), 0.0)
+                + (1.0 - w) * func.coalesce(_min_max(similarity), 0.0)
+            )
+        fused = (
+            sa_select(
+                func.coalesce(fts.c.id, ann.c.id).label("id"),
+                score.label("score"),
+                fts.c.score.label("fts_score"),
+                func.count().over().label("total"),
+            )
+            .select_from(fts.join(ann, fts.c.id == ann.c.id, full=True))
+            .subquery("fused")
+        )
+
+        page = sa_select(fused).order_by(fused.c.score.desc(), fused.c.id.desc())
+        if self._cursor is not None and self._cursor_field == "hybrid" and self._cursor_value is not None:
+            last = float(self._cursor_value)
+            page = page.where(or_(
+                fused.c.score < last,
+                and_(fused.c.score == last, fused.c.id < self._cursor),
+            ))
+        if self._offset > 0:
+            page = page.offset(self._offset)
+        if self._limit is not None:
+            page = page.limit(self._limit)
+        page = page.subquery("page")
+
+        headline = case(
+            (page.c.fts_score.isnot(None), func.ts_headline(
+                'english',
+                func.coalesce(Asset.text_content, ''),
+                tsq,
+                'MaxFragments=3,MaxWords=35,StartSel=<mark>,StopSel=</mark>',
+            )),
+            else_=None,
+        )
+        return self._project(
+            select(Asset, page.c.score, headline.label("headline"), page.c.total)
+            .join(page, Asset.id == page.c.id)
+            .order_by(page.c.score.desc(), Asset.id.desc())
+        )
+
     async def _resolve_entity_semantic(self) -> None:
         """Embed entity query text, search Entity embeddings, filter assets via GraphEdge."""
         from app.api.modules.content.models import EMBEDDING_SUPPORTED_DIMS
-        from app.api.modules.embedding.embed import embed_texts
-        from app.api.modules.foundation_service_providers import get_selection
+        from app.api.modules.embedding.embed import embed_query
 
-        sel = get_selection(self.session, self.infospace_id, "embedding")
-        if not sel or not sel.model_name:
-            logger.debug("Entity semantic: no embedding configured for infospace %s", self.infospace_id)
+        try:
+            raw_embedding, em = await self.run_embedding(
+                embed_query, self.infospace_id, self._entity_semantic_query,
+            )
+        except ValueError as e:
+            logger.debug("Entity semantic: no embedding for infospace %s: %s", self.infospace_id, e)
             return
-
-        vectors, em = await embed_texts(
-            self.session, self.infospace_id, [self._entity_semantic_query],
-        )
-        if not vectors:
+        if raw_embedding is None:
             return
 
-        raw_embedding = vectors[0]
         dim = em.dimension
         if dim not in EMBEDDING_SUPPORTED_DIMS:
             return
@@ -693,11 +953,8 @@ class AssetQuery:
               AND ec.{col_name} IS NOT NULL
               AND (ec.{col_name} <=> CAST(:vec AS vector)) <= :dist_thresh
         """)
-        rows = self.session.execute(sql, {
-            "iid": self.infospace_id,
-            "vec": vec_str,
-            "dist_thresh": dist_threshold,
-        }).all()
+        params = {"iid": self.infospace_id, "vec": vec_str, "dist_thresh": dist_threshold}
+        rows = await self.run(lambda: self.session.execute(sql, params).all())
 
         asset_ids = [row[0] for row in rows]
         if asset_ids:
@@ -793,6 +1050,16 @@ class AssetQuery:
 
 # ─── Helpers ───
 
+def _min_max(col):
+    """Min-max normalise ``col`` over the fused candidates; ties map to 1."""
+    lo = func.min(col).over()
+    hi = func.max(col).over()
+    return case(
+        (col.is_(None), None),
+        else_=func.coalesce((col - lo) / func.nullif(hi - lo, 0), 1.0),
+    )
+
+
 def _strip_fts_operators(q: str) -> str:
     """Strip FTS operators (-, or, quotes) to get a plain string for ILIKE title matching."""
     return re.sub(r'["\-]', '', q).replace(' or ', ' ').strip()
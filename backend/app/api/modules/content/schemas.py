@@ -97,11 +97,13 @@ class ListingSection(BaseModel, Generic[T]):
 
     total=-1 during the first event of a progressive listing (count pending);
     >=0 once count resolves. Never None, never 0 as a sentinel.
+    ``approximate`` marks a planner estimate that no exact count replaced.
     """
 
     at_parent: str | None = None
     items: list[T]
     total: int
+    approximate: bool = False
     has_more: bool = False
     cursor_next: str | None = None
 
@@ -126,6 +128,7 @@ class AssetTreeMeta(BaseModel):
     bundles: int
     assets: int
     vfolders: int
+    assets_approximate: bool = False
 
 
 class AssetTree(BaseModel):
@@ -257,10 +260,15 @@ class GraphChunkEvent(BaseModel):
 
 
 class CountEvent(BaseModel):
-    """Resolves the -1 sentinel on a prior section."""
+    """Resolves the -1 sentinel on a prior section.
+
+    ``approximate=True`` carries a planner estimate; an exact ``count`` for
+    the same section may follow later in the stream and replaces it.
+    """
 
     name: Literal["count"] = "count"
     total: int
+    approximate: bool = False
     at_parent: str | None = None
 
 
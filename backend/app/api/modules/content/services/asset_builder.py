@@ -15,22 +15,29 @@ exposes only:
 
   • Policy (`on_match`, `supersedes`) — declare what happens on match.
 
-  • Terminals (`find_match`, `build`, `load`, `build_batch`, `build_children`)
-    — run the pipeline and flush. NEVER commit. Callers own the transaction.
+  • Terminals (`find_match`, `build`, `load`, `build_batch`, `build_children`,
+    `build_children_stream`) — run the pipeline and flush. NEVER commit.
+    Callers own the transaction.
 
 See docs/plans/hq-v2/PRIMITIVES.md §1 for the full contract. Composition
 examples in the v2 handlers (`content/handlers/*.py`).
 """
 
+import asyncio
 import hashlib
 import logging
+import uuid
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Literal, Optional
+from itertools import islice
+from typing import Any, Dict, Iterable, List, Literal, Optional
 
+from psycopg.types.json import Json, Jsonb
 from sqlalchemy import update
 from sqlmodel import Session, select
 
+from app.api.modules.content.counts import note_asset_writes
+from app.core import wakeups
 from app.models import Asset, AssetKind, ProcessingStatus
 from app.schemas import AssetCreate
 
@@ -43,6 +50,24 @@ _UNSET: Any = object()
 
 MatchPolicy = Literal["skip", "supersede", "update"]
 
+# Rows per COPY statement in build_children_stream.
+COPY_BATCH_ROWS = 5000
+
+# Row-dict keys build_children_stream accepts; everything else is fixed by
+# the builder (identity, hierarchy, defaults).
+STREAM_FIELDS = frozenset({
+    "title", "text_content", "source_identifier", "content_hash", "facets",
+    "file_info", "part_index", "event_timestamp", "processing_status",
+})
+
+_COPY_COLUMNS = (
+    "uuid", "title", "kind", "stub", "text_content", "source_identifier",
+    "content_hash", "metadata", "file_info", "fragments", "tags",
+    "processing_status", "infospace_id", "user_id", "parent_asset_id",
+    "part_index", "event_timestamp", "is_superseded", "parent_is_superseded",
+    "created_at", "updated_at",
+)
+
 
 @dataclass
 class AssetBlueprint:
@@ -443,10 +468,71 @@ class AssetBuilder:
                 child.part_index = idx
         return await self.build_batch(children)
 
+    async def build_children_stream(
+        self,
+        parent_id: int,
+        rows: Iterable[Dict[str, Any]],
+        *,
+        kind: AssetKind,
+        batch_size: int = COPY_BATCH_ROWS,
+    ) -> int:
+        """Stream structural children into the asset table with PostgreSQL COPY.
+
+        For row counts the ORM unit of work can't carry (multi-million-row
+        CSV/Excel). ``rows`` yields dicts of ``STREAM_FIELDS`` keys and is
+        consumed lazily in a worker thread — a generator parsing a file does
+        its I/O there too — and written in COPY batches of ``batch_size``.
+        No Asset objects are built, no dedup, no enrichers. ``part_index``
+        defaults to the row's position. Returns the number of rows written.
+
+        Flushes first (the parent must exist for the FK), then COPYs on the
+        session's own connection — same transaction, caller commits.
+        """
+        self.session.flush()
+        note_asset_writes(self.session, [self.blueprint.infospace_id])
+        wakeups.mark(self.session, "asset", [self.blueprint.infospace_id])
+        dbapi_conn = self.session.connection().connection.dbapi_connection
+        return await asyncio.to_thread(
+            self._copy_children, dbapi_conn, parent_id, rows, kind, batch_size,
+        )
+
     # ═══════════════════════════════════════════════════════════════
     # INTERNAL
     # ═══════════════════════════════════════════════════════════════
 
+    def _copy_children(
+        self,
+        dbapi_conn: Any,
+        parent_id: int,
+        rows: Iterable[Dict[str, Any]],
+        kind: AssetKind,
+        batch_size: int,
+    ) -> int:
+        sql = f"COPY asset ({', '.join(_COPY_COLUMNS)}) FROM STDIN"
+        now = datetime.now(timezone.utc)
+        remaining = iter(rows)
+        written = 0
+        with dbapi_conn.cursor() as cur:
+            while True:
+                batch_start = written
+                with cur.copy(sql) as copy:
+                    for row in islice(remaining, batch_size):
+                        copy.write_row(_copy_values(
+                            row,
+                            kind=kind,
+                            parent_id=parent_id,
+                            user_id=self.blueprint.user_id,
+                            infospace_id=self.blueprint.infospace_id,
+                            position=written,
+                            now=now,
+                        ))
+                        written += 1
+                if written - batch_start < batch_size:
+                    break
+                logger.debug("COPY children of asset %s: %d rows so far", parent_id, written)
+        logger.info("Streamed %d %s children of asset %s", written, kind.value, parent_id)
+        return written
+
     def _do_supersede(self, old_asset: Asset) -> None:
         """Mark old_asset superseded and cascade parent_is_superseded.
 
@@ -540,3 +626,47 @@ class AssetBuilder:
         if self.blueprint.text_content:
             parts.append(self.blueprint.text_content[:1000])
         return hashlib.md5("|".join(parts).encode("utf-8", errors="ignore")).hexdigest()
+
+
+def _copy_values(
+    row: Dict[str, Any],
+    *,
+    kind: AssetKind,
+    parent_id: int,
+    user_id: int,
+    infospace_id: int,
+    position: int,
+    now: datetime,
+) -> tuple:
+    """One COPY tuple in ``_COPY_COLUMNS`` order. Enum columns take member
+    names (that is what the Postgres enum types store)."""
+    unknown = row.keys() - STREAM_FIELDS
+    if unknown:
+        raise ValueError(f"build_children_stream row has unsupported fields: {sorted(unknown)}")
+    part_index = row.get("part_index")
+    facets = row.get("facets")
+    file_info = row.get("file_info")
+    status = row.get("processing_status") or ProcessingStatus.READY
+    return (
+        str(uuid.uuid4()),
+        row.get("title") or f"Row {position + 1}",
+        kind.name,
+        False,
+        row.get("text_content"),
+        row.get("source_identifier"),
+        row.get("content_hash"),
+        Jsonb(facets) if facets is not None else None,
+        Jsonb(file_info) if file_info is not None else None,
+        Jsonb({}),
+        Json([]),
+        status.name,
+        infospace_id,
+        user_id,
+        parent_id,
+        position if part_index is None else part_index,
+        row.get("event_timestamp"),
+        False,
+        False,
+        now,
+        now,
+    )
@@ -9,6 +9,12 @@ that knows how to poll that source type and return new assets.
 The registry replaces the elif chain in SourceService.execute_poll().
 New source kinds are added by defining a handler class and decorating it
 with @register_poll_handler("kind_name").
+
+Handlers may also define an optional ``prefetch(source) -> Prefetch``: a
+cheap change check (e.g. RSS conditional GET) that ``poll_sources`` runs
+concurrently across a batch before any DB work. A ``not_modified`` answer
+skips execute_poll for that source; otherwise the Prefetch is handed to
+``poll`` as ``runtime_options["prefetched"]`` so nothing is fetched twice.
 """
 
 from __future__ import annotations
@@ -33,6 +39,14 @@ class PollResult:
     """Callables to run after the DB commit succeeds (e.g. move files to _processed)."""
 
 
+@dataclass
+class Prefetch:
+    """Result of an optional ``PollHandler.prefetch`` change check."""
+    not_modified: bool = False
+    payload: Any = None
+    """Handler-specific data reused by poll() (e.g. the fetched feed body)."""
+
+
 @runtime_checkable
 class PollHandler(Protocol):
     """
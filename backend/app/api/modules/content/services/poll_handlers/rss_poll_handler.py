@@ -3,6 +3,11 @@ RSS Poll Handler
 ================
 
 Extracted from StreamSourceService.execute_poll() elif branch for source.kind == 'rss'.
+
+Polls are conditional: the feed's ETag / Last-Modified are kept in
+``cursor_state`` and sent back on the next fetch. ``prefetch`` lets
+``poll_sources`` do that fetch for a whole batch up front; a 304 never
+reaches ``poll``.
 """
 
 import logging
@@ -12,40 +17,69 @@ from typing import Any, Dict, List, Optional
 from app.models import Asset, Source
 from app.api.modules.content.handlers import RSSHandler
 from app.api.modules.content.handlers.base import IngestionContext
-from . import PollResult, register_poll_handler
+from app.api.modules.content.handlers.feed_fetch import (
+    ETAG_KEY,
+    LAST_MODIFIED_KEY,
+    FeedFetch,
+    fetch_feed_for_cursor,
+    parse_feed,
+)
+from . import PollResult, Prefetch, register_poll_handler
 
 logger = logging.getLogger(__name__)
 
 
 @register_poll_handler("rss")
 class RSSPollHandler:
+    async def prefetch(self, source: Source) -> Prefetch:
+        fetched = await fetch_feed_for_cursor(_feed_url(source), source.cursor_state)
+        return Prefetch(not_modified=fetched.not_modified, payload=fetched)
+
     async def poll(
         self,
         source: Source,
         context: IngestionContext,
         runtime_options: Optional[Dict[str, Any]] = None,
     ) -> PollResult:
-        feed_url = source.details.get("feed_url")
-        if not feed_url:
-            raise ValueError("RSS source missing feed_url")
+        feed_url = _feed_url(source)
 
         options = source.details.get("processing_options", {}).copy()
         options["cursor_state"] = source.cursor_state
 
+        prefetched = (runtime_options or {}).get("prefetched")
+        fetched: FeedFetch = (
+            prefetched.payload if prefetched is not None
+            else await fetch_feed_for_cursor(feed_url, source.cursor_state)
+        )
+
+        # A full response replaces both validators; one the feed no longer
+        # sends is cleared (None) so the next poll doesn't send it stale.
+        cursor_update: Dict[str, Any] = {ETAG_KEY: None, LAST_MODIFIED_KEY: None}
+        cursor_update.update(fetched.validators())
+        cursor_update["last_poll_timestamp"] = datetime.now(timezone.utc).isoformat()
+        if fetched.not_modified:
+            return PollResult(cursor_update=cursor_update, summary="RSS feed not modified")
+
         handler = RSSHandler(context)
-        assets: List[Asset] = await handler.handle(feed_url, None, options)
+        ingest = await handler.ingest_feed(await parse_feed(fetched), feed_url, options)
+        assets: List[Asset] = ingest.created
 
-        cursor_update: Dict[str, Any] = {}
-        if assets:
-            last_entry = assets[-1]
+        if ingest.articles:
+            last_entry = ingest.articles[-1]
             cursor_update["last_guid"] = (
                 (last_entry.file_info or {}).get("guid")
                 or last_entry.source_identifier
             )
-        cursor_update["last_poll_timestamp"] = datetime.now(timezone.utc).isoformat()
 
         return PollResult(
             assets=assets,
             cursor_update=cursor_update,
-            summary=f"Fetched {len(assets)} RSS entries",
+            summary=f"Fetched {len(ingest.articles)} RSS entries, {len(assets)} new or changed",
         )
+
+
+def _feed_url(source: Source) -> str:
+    feed_url = source.details.get("feed_url")
+    if not feed_url:
+        raise ValueError("RSS source missing feed_url")
+    return feed_url
@@ -34,6 +34,19 @@ from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+
+def _apply_cursor_update(source: Source, cursor_update: Dict[str, Any]) -> None:
+    """Merge a poll's ``cursor_update`` into ``source.cursor_state``.
+
+    ``cursor_state`` is a plain JSON column, so the merged dict is assigned
+    rather than mutated in place — otherwise the change is never flushed.
+    A ``None`` value removes the key (e.g. a feed that stopped sending an
+    ETag must not keep being asked ``If-None-Match`` for the old one).
+    """
+    merged = {**(source.cursor_state or {}), **cursor_update}
+    source.cursor_state = {k: v for k, v in merged.items() if v is not None}
+
+
 class SourceService:
     """
     Service for managing Source operations and integration with unified asset discovery.
@@ -604,13 +617,16 @@ class SourceService:
         self,
         source_id: int,
         user_id: Optional[int] = None,
-        runtime_api_keys: Optional[Dict[str, str]] = None
+        runtime_api_keys: Optional[Dict[str, str]] = None,
+        prefetched: Optional[Any] = None,
     ) -> Dict[str, Any]:
         """
         Execute a single poll of a source.
         
         Polling is dispatched via the PollHandler registry (poll_handlers/).
         This method is generic — it never branches on source.kind.
+        ``prefetched`` is the handler's own ``prefetch()`` result, when the
+        caller (poll_sources) already ran it; it is passed through to poll().
         """
         from app.models import (
             SourcePollHistory,
@@ -693,7 +709,10 @@ class SourceService:
             result: PollResult = await handler.poll(
                 source=source,
                 context=context,
-                runtime_options={"runtime_api_keys": runtime_api_keys or {}},
+                runtime_options={
+                    "runtime_api_keys": runtime_api_keys or {},
+                    "prefetched": prefetched,
+                },
             )
             ingested_count = 0
             for asset in result.assets:
@@ -705,7 +724,7 @@ class SourceService:
                     tree_copy(self.session, asset_ids=[asset.id], to=source.output_bundle_id)
                 ingested_count += 1
 
-            source.cursor_state.update(result.cursor_update)
+            _apply_cursor_update(source, result.cursor_update)
             source.items_last_poll = len(result.assets)
             source.total_items_ingested += ingested_count
             source.last_poll_at = datetime.now(timezone.utc)
@@ -14,6 +14,7 @@ Error handling convention:
   Wrapper sets backoff, optionally retries. Chain stops, kick/schedule recovers.
 """
 
+import asyncio
 import logging
 
 from sqlalchemy import update, func, text
@@ -22,6 +23,7 @@ from sqlmodel import Session, select
 from app.api.modules.content.models import Asset, ProcessingStatus
 from app.api.modules.content.services.processing_service import ProcessingService
 from app.api.modules.foundation_service_providers.base import StorageProvider, ScrapingProvider
+from app.core.config import settings
 from app.core.tasks import TaskContext, task
 from app.core.task_utils import run_async_in_celery
 
@@ -49,48 +51,68 @@ def _processing_service(ctx: TaskContext, session: Session) -> ProcessingService
       ),
       schedule=None,
       triggers=["asset.ingested"],
+      wakes_on=["asset"],
       self_chain=True,
       batch=50,
       queue="processing",
       tags=frozenset({"content"}))
 def process_pending(ctx: TaskContext, asset_ids: list[int]):
-    """Process PENDING assets. Atomic claim per asset, then ProcessingService."""
-    for asset_id in asset_ids:
-        # Phase 1: Atomic claim (separate session — survives processing failure)
-        with ctx.session() as session:
-            claimed = session.execute(
-                update(Asset)
-                .where(Asset.id == asset_id, Asset.processing_status == ProcessingStatus.PENDING)
-                .values(processing_status=ProcessingStatus.PROCESSING, updated_at=func.now())
-            )
-            session.commit()
-            if claimed.rowcount == 0:
-                continue  # Already claimed by another chain
-
-        # Phase 2: Process (fresh session — if this fails, claim is preserved)
-        try:
-            with ctx.session() as session:
-                svc = _processing_service(ctx, session)
-                asset = session.get(Asset, asset_id)
-                if not asset:
-                    continue
-                run_async_in_celery(svc.process_content, asset, {})
-            ctx.stat("done")
-        except Exception as e:
-            logger.error("process_pending failed for asset %d: %s", asset_id, e, exc_info=True)
-            with ctx.session() as session:
-                session.execute(
-                    update(Asset).where(Asset.id == asset_id)
-                    .values(processing_status=ProcessingStatus.FAILED)
-                )
-                session.commit()
-            ctx.item_failed(asset_id)
-            ctx.stat("failed")
+    """Process PENDING assets. Atomic claim per asset, then ProcessingService.
+
+    Up to ``PROCESSING_ASSET_CONCURRENCY`` claimed assets are in flight at
+    once on one event loop, so one asset's extraction (thread / PDF page
+    pool) overlaps another's storage reads and DB writes. Each asset keeps
+    its own sessions.
+    """
+    run_async_in_celery(_process_claimed, ctx, asset_ids)
 
     from app.core.events import emit
     emit("asset.processed", {"infospace_id": ctx.infospace_id})
 
 
+async def _process_claimed(ctx: TaskContext, asset_ids: list[int]) -> None:
+    limit = asyncio.Semaphore(max(1, settings.PROCESSING_ASSET_CONCURRENCY))
+
+    async def _bounded(asset_id: int) -> None:
+        async with limit:
+            await _process_one(ctx, asset_id)
+
+    await asyncio.gather(*(_bounded(asset_id) for asset_id in asset_ids))
+
+
+async def _process_one(ctx: TaskContext, asset_id: int) -> None:
+    # Phase 1: Atomic claim (separate session — survives processing failure)
+    with ctx.session() as session:
+        claimed = session.execute(
+            update(Asset)
+            .where(Asset.id == asset_id, Asset.processing_status == ProcessingStatus.PENDING)
+            .values(processing_status=ProcessingStatus.PROCESSING, updated_at=func.now())
+        )
+        session.commit()
+        if claimed.rowcount == 0:
+            return  # Already claimed by another chain
+
+    # Phase 2: Process (fresh session — if this fails, claim is preserved)
+    try:
+        with ctx.session() as session:
+            svc = _processing_service(ctx, session)
+            asset = session.get(Asset, asset_id)
+            if not asset:
+                return
+            await svc.process_content(asset, {})
+        ctx.stat("done")
+    except Exception as e:
+        logger.error("process_pending failed for asset %d: %s", asset_id, e, exc_info=True)
+        with ctx.session() as session:
+            session.execute(
+                update(Asset).where(Asset.id == asset_id)
+                .values(processing_status=ProcessingStatus.FAILED)
+            )
+            session.commit()
+        ctx.item_failed(asset_id)
+        ctx.stat("failed")
+
+
 @task("reset_stale_processing",
       check=lambda iid: (
           select(Asset.id)
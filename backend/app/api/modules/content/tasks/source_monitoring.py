@@ -3,15 +3,23 @@ Source monitoring @task: poll active sources for new content.
 
 Replaces legacy poll_active_sources + execute_source_poll + bulk_poll_sources.
 Single @task discovers sources due for polling, executes poll inline.
+
+A batch is polled concurrently on one event loop (SOURCE_POLL_CONCURRENCY
+sources at a time). Handlers with a ``prefetch`` hook (RSS conditional GET)
+are asked first; sources that report not-modified skip execute_poll — no
+job, history or asset writes — and only have their schedule advanced, in
+one UPDATE for the whole batch.
 """
 
+import asyncio
 import logging
 from datetime import datetime, timezone
 
-from sqlalchemy import or_, func
+from sqlalchemy import case, or_, func, update
 from sqlmodel import Session, select
 
 from app.api.modules.content.models import Source, SourceStatus
+from app.core.config import settings
 from app.core.tasks import TaskContext, task
 from app.core.task_utils import run_async_in_celery
 
@@ -41,38 +49,98 @@ POLL_CIRCUIT_BREAKER_THRESHOLD = 5
       timeout=600,
       tags=frozenset({"content", "source"}))
 def poll_sources(ctx: TaskContext, source_ids: list[int]):
-    """Poll sources that are due. One source per iteration with error isolation."""
-    from app.api.modules.content.services.source_service import SourceService
-
-    for source_id in source_ids:
-        try:
-            async def _poll(sid):
-                with ctx.session() as session:
-                    source = session.get(Source, sid)
-                    if not source or not source.is_active:
-                        return None
-                    svc = SourceService(session)
-                    return await svc.execute_poll(
-                        source_id=sid,
-                        user_id=source.user_id,
-                    )
-
-            result = run_async_in_celery(_poll, source_id)
-            ctx.stat("done")
-
-        except Exception as e:
-            logger.error("Poll failed for source %d: %s", source_id, e, exc_info=True)
-            with ctx.session() as session:
-                source = session.get(Source, source_id)
-                if source:
-                    source.status = SourceStatus.FAILED
-                    source.error_message = str(e)[:500]
-                    source.consecutive_failures = (source.consecutive_failures or 0) + 1
-                    source.last_error_at = datetime.now(timezone.utc)
-                    session.add(source)
-                    session.commit()
-            ctx.item_failed(source_id)
-            ctx.stat("failed")
+    """Poll sources that are due, concurrently, with per-source error isolation."""
+    not_modified = run_async_in_celery(_poll_batch, ctx, source_ids)
+    _advance_not_modified(ctx, not_modified)
 
     from app.core.events import emit
     emit("source.polled", {"infospace_id": ctx.infospace_id})
+
+
+async def _poll_batch(ctx: TaskContext, source_ids: list[int]) -> list[int]:
+    """Poll each source; return the ids whose prefetch reported not-modified."""
+    limit = asyncio.Semaphore(max(1, settings.SOURCE_POLL_CONCURRENCY))
+    not_modified: list[int] = []
+
+    async def _bounded(source_id: int) -> None:
+        async with limit:
+            try:
+                if await _poll_one(ctx, source_id):
+                    not_modified.append(source_id)
+                    ctx.stat("not_modified")
+                else:
+                    ctx.stat("done")
+            except Exception as e:
+                _record_failure(ctx, source_id, e)
+
+    await asyncio.gather(*(_bounded(source_id) for source_id in source_ids))
+    return not_modified
+
+
+async def _poll_one(ctx: TaskContext, source_id: int) -> bool:
+    """Poll one source. True when its prefetch said nothing changed."""
+    from app.api.modules.content.services.poll_handlers import get_poll_handler
+    from app.api.modules.content.services.source_service import SourceService
+
+    # Change check runs outside any session — no connection held during network I/O.
+    with ctx.session() as session:
+        source = session.get(Source, source_id)
+        if not source or not source.is_active:
+            return False
+        handler_cls = get_poll_handler(source.kind)
+    prefetched = None
+    if handler_cls is not None and hasattr(handler_cls, "prefetch"):
+        prefetched = await handler_cls().prefetch(source)
+        if prefetched.not_modified:
+            return True
+
+    with ctx.session() as session:
+        svc = SourceService(session)
+        await svc.execute_poll(
+            source_id=source_id,
+            user_id=source.user_id,
+            prefetched=prefetched,
+        )
+    return False
+
+
+def _advance_not_modified(ctx: TaskContext, source_ids: list[int]) -> None:
+    """Reschedule unchanged sources as a successful, empty poll — one statement."""
+    if not source_ids:
+        return
+    now = func.now()
+    with ctx.session() as session:
+        session.execute(
+            update(Source)
+            .where(Source.id.in_(source_ids))
+            .values(
+                last_poll_at=now,
+                next_poll_at=case(
+                    (
+                        Source.poll_interval_seconds > 0,
+                        now + func.make_interval(0, 0, 0, 0, 0, 0, Source.poll_interval_seconds),
+                    ),
+                    else_=Source.next_poll_at,
+                ),
+                items_last_poll=0,
+                consecutive_failures=0,
+                status=SourceStatus.PENDING,
+                updated_at=now,
+            )
+        )
+        session.commit()
+
+
+def _record_failure(ctx: TaskContext, source_id: int, e: Exception) -> None:
+    logger.error("Poll failed for source %d: %s", source_id, e, exc_info=True)
+    with ctx.session() as session:
+        source = session.get(Source, source_id)
+        if source:
+            source.status = SourceStatus.FAILED
+            source.error_message = str(e)[:500]
+            source.consecutive_failures = (source.consecutive_failures or 0) + 1
+            source.last_error_at = datetime.now(timezone.utc)
+            session.add(source)
+            session.commit()
+    ctx.item_failed(source_id)
+    ctx.stat("failed")
@@ -9,6 +9,16 @@ progressive ``StreamEvent`` stream (SSE) or a concrete envelope.
 
 Shapes live in ``content/schemas.py``. The wire protocol is unified across
 every content view and re-used by annotation views.
+
+Listings project ``NODE_COLUMNS`` only: text, fragments and file_info never
+leave Postgres for a tree/feed/search page.
+
+DB work goes through ``AssetQuery.run`` so a query built on an async
+session (``AsyncSessionDep``) never blocks the event loop.
+
+Counts come from ``AssetQuery.listing_count`` (``content/counts.py``). When
+the first ``count`` is an approximate estimate and an exact count is cheap
+enough, a second exact ``count`` follows just before ``done``.
 """
 
 from __future__ import annotations
@@ -20,8 +30,9 @@ from typing import AsyncIterator, Optional
 from sqlalchemy import and_, func, text
 from sqlmodel import select
 
+from app.api.modules.content import counts
 from app.api.modules.content.models import Asset, Bundle
-from app.api.modules.content.query import AssetQuery
+from app.api.modules.content.query import NODE_COLUMNS, AssetQuery
 from app.api.modules.content.schemas import (
     AssetFeed,
     AssetFeedMeta,
@@ -153,6 +164,17 @@ def _cursor_for_asset(asset: Asset, sort: str) -> str:
     )
 
 
+def _cursor_for_scored(query: AssetQuery, asset: Asset, score: Optional[float]) -> str:
+    """Next-page cursor for a scored listing; hybrid pages key on (score, id)."""
+
+    if query._hybrid_query and score is not None:
+        return encode_cursor(
+            sort_field="hybrid", direction="desc",
+            last_value=score, last_id=asset.id,
+        )
+    return _cursor_for_asset(asset, query._sort)
+
+
 # ─── render_tree ────────────────────────────────────────────────────────────
 
 
@@ -164,15 +186,15 @@ async def render_tree(
 ) -> AsyncIterator[StreamEvent]:
     """Progressive tree event stream.
 
-    Emits: skeleton → nav → section(role='level') → count → done.
+    Emits: skeleton → nav → section(role='level') → count → count? → done.
     """
 
     yield SkeletonEvent(family="tree")
 
-    nav = _build_nav(query.session, query.infospace_id, access_scope)
+    nav = await query.run(_build_nav, query.session, query.infospace_id, access_scope)
     yield NavEvent(nav=nav)
 
-    assets = query.execute()
+    assets = await query.run(query.columns(*NODE_COLUMNS).execute)
     nodes = [_asset_node(a) for a in assets]
     next_cursor = (
         _cursor_for_asset(assets[-1], query._sort)
@@ -188,8 +210,12 @@ async def render_tree(
     )
     yield SectionEvent(role="level", section=section)
 
-    total = query.count()
-    yield CountEvent(total=total)
+    count = await query.run(query.listing_count)
+    yield CountEvent(total=count.total, approximate=count.approximate)
+
+    exact = await query.run(query.exact_followup, count)
+    if exact is not None:
+        yield CountEvent(total=exact.total)
 
     yield DoneEvent()
 
@@ -207,13 +233,13 @@ async def render_search(
     """Progressive search event stream.
 
     Emits:
-        skeleton → section(role='primary') → count → section(role='grouped')* → done
+        skeleton → section(role='primary') → count → section(role='grouped')* → count? → done
     """
 
     start = time.perf_counter()
     yield SkeletonEvent(family="search")
 
-    scored = await query.execute_scored_async()
+    scored = await query.columns(*NODE_COLUMNS).execute_scored_async()
     primary_nodes: list[AssetNode] = []
     for asset, rank, headline in scored:
         matches: list[AssetMatch] = []
@@ -226,7 +252,7 @@ async def render_search(
         primary_nodes.append(_asset_node(asset, score=rank, matches=matches))
 
     next_cursor = (
-        _cursor_for_asset(scored[-1][0], query._sort)
+        _cursor_for_scored(query, scored[-1][0], scored[-1][1])
         if scored and len(scored) >= (query._limit or 0)
         else None
     )
@@ -238,15 +264,15 @@ async def render_search(
     )
     yield SectionEvent(role="primary", section=primary)
 
-    total = query.count()
+    count = await query.run(query.listing_count)
     elapsed_ms = int((time.perf_counter() - start) * 1000)
-    yield CountEvent(total=total)
+    yield CountEvent(total=count.total, approximate=count.approximate)
 
     # Grouped sections: one level-down listing per hit asset that has children
     # that also match the underlying conditions. This is cheap — count_by_parent
     # runs a single GROUP BY on the indexed parent_asset_id column.
     if scored and mode in ("text", "hybrid"):
-        group_counts = query.count_by_parent()
+        group_counts = await query.run(query.count_by_parent)
         for asset in [s[0] for s in scored]:
             if not asset.is_container:
                 continue
@@ -263,6 +289,10 @@ async def render_search(
                 ),
             )
 
+    exact = await query.run(query.exact_followup, count)
+    if exact is not None:
+        yield CountEvent(total=exact.total)
+
     # Attach meta on the primary via a final no-op wrapper? We stream
     # meta back by having the drain assemble an AssetSearchMeta when the
     # caller is collecting. Streaming consumers use the raw events.
@@ -275,12 +305,12 @@ async def render_search(
 async def render_feed(query: AssetQuery) -> AsyncIterator[StreamEvent]:
     """Progressive feed event stream.
 
-    Emits: skeleton → section(role='primary') → count → done.
+    Emits: skeleton → section(role='primary') → count → count? → done.
     """
 
     yield SkeletonEvent(family="feed")
 
-    assets = query.execute()
+    assets = await query.run(query.columns(*NODE_COLUMNS).execute)
     nodes = [_asset_node(a) for a in assets]
     next_cursor = (
         _cursor_for_asset(assets[-1], query._sort)
@@ -295,8 +325,12 @@ async def render_feed(query: AssetQuery) -> AsyncIterator[StreamEvent]:
     )
     yield SectionEvent(role="primary", section=section)
 
-    total = query.count()
-    yield CountEvent(total=total)
+    count = await query.run(query.listing_count)
+    yield CountEvent(total=count.total, approximate=count.approximate)
+
+    exact = await query.run(query.exact_followup, count)
+    if exact is not None:
+        yield CountEvent(total=exact.total)
 
     yield DoneEvent()
 
@@ -315,7 +349,7 @@ async def collect_tree(
     events = render_tree(query, level_parent=level_parent, access_scope=access_scope)
     envelope = await drain(events, AssetTree)
     # Pad in tree meta counts (cheap; run after drain completes).
-    envelope.meta = _compute_tree_meta(query.session, query.infospace_id, access_scope)
+    envelope.meta = await query.run(_compute_tree_meta, query.session, query.infospace_id, access_scope)
     return envelope
 
 
@@ -348,7 +382,11 @@ async def collect_feed(query: AssetQuery) -> AssetFeed:
 
 
 def _compute_tree_meta(session, infospace_id: int, access_scope) -> AssetTreeMeta:
-    """Compute tree-level counts (bundles, top-level assets, vfolder approx)."""
+    """Compute tree-level counts (bundles, top-level assets, vfolder approx).
+
+    The bundle count is exact (one row per bundle); the root asset count goes
+    through ``counts`` and is exact unless even the follow-up ran out of budget.
+    """
 
     bundle_count_stmt = select(func.count(Bundle.id)).where(Bundle.infospace_id == infospace_id)
     if access_scope is not None and access_scope.bundle_ids:
@@ -357,14 +395,20 @@ def _compute_tree_meta(session, infospace_id: int, access_scope) -> AssetTreeMet
         bundle_count_stmt = bundle_count_stmt.where(and_(False))
     bundle_count = session.exec(bundle_count_stmt).one() or 0
 
-    asset_count_stmt = (
-        select(func.count(Asset.id))
-        .where(Asset.infospace_id == infospace_id)
-        .where(Asset.parent_asset_id.is_(None))
+    root_conditions = [
+        Asset.infospace_id == infospace_id,
+        Asset.parent_asset_id.is_(None),
         # Only count assets that aren't in any real bundle — matches the
         # set that _root_query returns via .no_bundles().
-        .where(text("bundle_ids <@ ARRAY[0]::int[]"))
+        text("bundle_ids <@ ARRAY[0]::int[]"),
+    ]
+    asset_count = counts.resolve(session, infospace_id, root_conditions)
+    if asset_count.approximate:
+        asset_count = counts.followup(session, root_conditions, asset_count) or asset_count
+
+    return AssetTreeMeta(
+        bundles=bundle_count,
+        assets=asset_count.total,
+        vfolders=0,
+        assets_approximate=asset_count.approximate,
     )
-    asset_count = session.exec(asset_count_stmt).one() or 0
-
-    return AssetTreeMeta(bundles=bundle_count, assets=asset_count, vfolders=0)
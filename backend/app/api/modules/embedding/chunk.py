@@ -15,6 +15,7 @@ from typing import Any, Dict, List, Optional
 
 from sqlmodel import Session, select
 
+from app.core import wakeups
 from app.models import Asset, AssetChunk, AssetKind
 
 logger = logging.getLogger(__name__)
@@ -168,6 +169,7 @@ def chunk_asset(
         session.add(chunk)
         rows.append(chunk)
 
+    wakeups.mark(session, "chunk", [asset.infospace_id])
     session.commit()
     logger.info("Created %d chunks for asset %s", len(rows), asset.id)
     return rows
@@ -4,6 +4,10 @@ Flat embedding primitives.
 `embed_texts` is the single text-to-vector entrypoint. Provider resolution
 goes through the registry keyed by infospace owner; BYOK flows via runtime_key.
 
+`embed_query` is the cached single-string variant for search paths: vectors
+come from ``query_cache`` (local LRU, then Redis) and the infospace's
+EmbeddingModel resolution is reused for a short TTL.
+
 `ensure_embedding_model` registers (or finds) the EmbeddingModel row backing a
 given (provider, model_name, dimension) triple. Callers that already have an
 embedding_model_id can use `embed_texts(embedding_model_id=...)` to skip
@@ -16,6 +20,7 @@ aggregates — no provider calls.
 from __future__ import annotations
 
 import logging
+import time
 from typing import Any, Dict, List, Optional, Tuple
 
 from sqlalchemy import delete as sa_delete
@@ -29,6 +34,7 @@ from app.api.modules.content.models import (
     get_embedding_column_for_dimension,
 )
 from app.api.modules.identity_infospace_user.models import Infospace
+from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
@@ -206,6 +212,54 @@ async def embed_texts(
     return vectors, em
 
 
+# infospace_id -> (resolved_at, embedding_model_id)
+_model_for_infospace: Dict[int, Tuple[float, int]] = {}
+
+
+async def embed_query(
+    session: Session,
+    infospace_id: int,
+    query_text: str,
+    *,
+    runtime_key: Optional[str] = None,
+    embedding_model_id: Optional[int] = None,
+) -> Tuple[Optional[List[float]], EmbeddingModel]:
+    """Embed one search query, serving repeats from ``query_cache``.
+
+    Same resolution as ``embed_texts`` (explicit model, else the infospace's
+    configured one); the infospace → model mapping is remembered for
+    ``EMBEDDING_QUERY_CACHE_MODEL_TTL_SECONDS`` so a hit costs no config
+    reads and no provider call. Returns ``(vector, embedding_model)``.
+    """
+    from app.api.modules.embedding import query_cache
+
+    em: Optional[EmbeddingModel] = None
+    if embedding_model_id is not None:
+        em = session.get(EmbeddingModel, embedding_model_id)
+        if em is None:
+            raise ValueError(f"Embedding model {embedding_model_id} not found")
+    else:
+        cached = _model_for_infospace.get(infospace_id)
+        if cached and time.monotonic() - cached[0] < settings.EMBEDDING_QUERY_CACHE_MODEL_TTL_SECONDS:
+            em = session.get(EmbeddingModel, cached[1])
+    if em is None:
+        _, em = await embed_texts(session, infospace_id, [], runtime_key=runtime_key)
+        _model_for_infospace[infospace_id] = (time.monotonic(), em.id)
+
+    vector = query_cache.get(em.id, em.dimension, query_text)
+    if vector is not None:
+        return vector, em
+
+    vectors, em = await embed_texts(
+        session, infospace_id, [query_text],
+        runtime_key=runtime_key, embedding_model_id=em.id,
+    )
+    if not vectors:
+        return None, em
+    query_cache.put(em.id, em.dimension, query_text, vectors[0])
+    return vectors[0], em
+
+
 def embedding_stats(session: Session, infospace_id: int) -> Dict[str, Any]:
     """Aggregate coverage for an infospace. No provider calls."""
     asset_counts = session.exec(
@@ -0,0 +1,161 @@
+"""Pipelined chunk embedding for the ``embedding`` enricher.
+
+The enricher used to send fixed 64-text batches one after another and then
+write vectors back with two ``session.get`` per chunk. Here:
+
+  - **token-sized batches** — ``token_batches`` packs chunks up to
+    ``EMBEDDING_BATCH_MAX_TOKENS`` estimated tokens (and at most
+    ``EMBEDDING_BATCH_MAX_TEXTS`` texts), so short chunks share a request
+    and long ones don't blow provider limits or Ollama timeouts;
+  - **several batches in flight** — ``embed_pipelined`` keeps up to
+    ``in_flight_limit(provider_key)`` requests outstanding per provider
+    (``EMBEDDING_MAX_IN_FLIGHT``, overridable per provider via
+    ``EMBEDDING_PROVIDER_IN_FLIGHT``, e.g. ``"ollama=1,openai=8"``);
+  - **one UPDATE per batch** — ``write_vectors`` sets the vector column for a
+    whole batch through ``unnest`` and returns the touched asset ids. Writes
+    run off the event loop, inside the batch's slot, so other requests keep
+    draining while DB sessions stay bounded by the in-flight limit.
+
+A failed batch stops its group from scheduling more work; batches already
+written stay written, and the per-chunk skip in Phase 1 picks up the rest
+on the next dispatch.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import text
+from sqlmodel import Session
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Conservative across tokenizers; Ollama's provider uses the same figure.
+CHARS_PER_TOKEN = 3.2
+
+Work = Tuple[int, str]  # (chunk_id, text)
+
+
+def estimate_tokens(value: str) -> int:
+    return int(len(value) / CHARS_PER_TOKEN) + 1
+
+
+def token_batches(
+    work: Iterable[Work],
+    *,
+    max_tokens: Optional[int] = None,
+    max_texts: Optional[int] = None,
+) -> List[List[Work]]:
+    """Greedy in-order packing by estimated tokens; never returns an empty batch."""
+    max_tokens = max_tokens or settings.EMBEDDING_BATCH_MAX_TOKENS
+    max_texts = max_texts or settings.EMBEDDING_BATCH_MAX_TEXTS
+    batches: List[List[Work]] = []
+    current: List[Work] = []
+    budget = 0
+    for item in work:
+        cost = estimate_tokens(item[1])
+        if current and (budget + cost > max_tokens or len(current) >= max_texts):
+            batches.append(current)
+            current, budget = [], 0
+        current.append(item)
+        budget += cost
+    if current:
+        batches.append(current)
+    return batches
+
+
+def in_flight_limit(provider_key: str) -> int:
+    overrides: Dict[str, int] = {}
+    for part in (settings.EMBEDDING_PROVIDER_IN_FLIGHT or "").split(","):
+        key, _, value = part.partition("=")
+        if key.strip() and value.strip().isdigit():
+            overrides[key.strip().lower()] = int(value)
+    return max(1, overrides.get((provider_key or "").lower(), settings.EMBEDDING_MAX_IN_FLIGHT))
+
+
+def write_vectors(
+    session: Session,
+    col_name: str,
+    embedding_model_id: int,
+    pairs: Sequence[Tuple[int, List[float]]],
+) -> List[int]:
+    """Write a batch of chunk vectors in one statement. Returns asset ids (one per chunk)."""
+    if not pairs:
+        return []
+    rows = session.execute(
+        text(
+            f"UPDATE assetchunk AS c "
+            f"SET {col_name} = CAST(v.vec AS vector), embedding_model_id = :em_id "
+            f"FROM unnest(CAST(:ids AS int[]), CAST(:vecs AS text[])) AS v(id, vec) "
+            f"WHERE c.id = v.id "
+            f"RETURNING c.asset_id"
+        ),
+        {
+            "em_id": embedding_model_id,
+            "ids": [chunk_id for chunk_id, _ in pairs],
+            "vecs": ["[" + ",".join(repr(float(x)) for x in vec) + "]" for _, vec in pairs],
+        },
+    ).all()
+    return [row[0] for row in rows]
+
+
+async def embed_pipelined(
+    provider: Any,
+    model_name: str,
+    batches: List[List[Work]],
+    *,
+    target_dim: int,
+    semaphore: asyncio.Semaphore,
+    on_batch: Callable[[List[Tuple[int, List[float]]]], Any],
+    label: str = "",
+) -> Tuple[int, int]:
+    """Embed ``batches`` with bounded concurrency, handing each result to ``on_batch``.
+
+    ``on_batch`` is synchronous (DB I/O) and runs in a worker thread.
+    Returns ``(chunks_written, batches_failed)``.
+    """
+    failed = asyncio.Event()
+    written = 0
+    failures = 0
+    total = sum(len(b) for b in batches)
+
+    async def _run(batch: List[Work]) -> None:
+        nonlocal written, failures
+        async with semaphore:
+            if failed.is_set():
+                return
+            texts = [t for _, t in batch]
+            try:
+                vectors = await provider.embed_texts(texts, model_name)
+                if len(vectors) != len(texts):
+                    raise RuntimeError(
+                        f"vector count mismatch: {len(vectors)} vectors for {len(texts)} texts"
+                    )
+                # Truncate for Matryoshka dimension override (native dim > target dim)
+                if vectors and len(vectors[0]) > target_dim:
+                    vectors = [v[:target_dim] for v in vectors]
+                elif vectors and len(vectors[0]) != target_dim:
+                    raise RuntimeError(f"dimension mismatch: got {len(vectors[0])}, need {target_dim}")
+            except Exception as e:
+                failures += 1
+                failed.set()
+                logger.error("Embedding batch failed for %s: %s", label, e, exc_info=True)
+                return
+            # Write inside the slot: bounds concurrent DB sessions to in-flight.
+            pairs = [(chunk_id, vec) for (chunk_id, _), vec in zip(batch, vectors)]
+            try:
+                await asyncio.to_thread(on_batch, pairs)
+            except Exception as e:
+                failures += 1
+                failed.set()
+                logger.error("Writing embedding batch failed for %s: %s", label, e, exc_info=True)
+                return
+        written += len(pairs)
+        logger.info("Embedded %d / %d chunks for %s", written, total, label)
+
+    await asyncio.gather(*(_run(b) for b in batches))
+    return written, failures
@@ -0,0 +1,234 @@
+"""Two-tier cache of query embeddings.
+
+Search-as-you-type, hybrid search, entity-semantic filters and agent tools
+(chat ``search_assets``, MCP ``workspace_hub(mode='semantic')``) embed the
+same short query strings over and over. Each miss is a provider round trip;
+a hit is a dict lookup or one Redis GET.
+
+Key = (``embedding_model_id``, normalised text). Normalisation is NFKC,
+casefold and whitespace collapse — search queries differing only in case or
+spacing share a vector. The model id pins provider, model and dimension, so
+vectors never cross models.
+
+Tiers:
+
+  - **local** — per-process LRU bounded by
+    ``EMBEDDING_QUERY_CACHE_LOCAL_MAX_BYTES`` of packed vectors.
+  - **redis** — shared across API and worker processes. Values are packed
+    little-endian float32 (4 bytes/dim, not JSON). Keys carry the
+    dimension so eviction knows each entry's size without reading it; a
+    sorted set scored by last access plus a counter of its members' bytes
+    enforce ``EMBEDDING_QUERY_CACHE_REDIS_MAX_BYTES``.
+
+Both tiers expire entries after ``EMBEDDING_QUERY_CACHE_TTL_SECONDS``.
+Best-effort: a Redis failure is a miss, never a search error.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import re
+import sys
+import threading
+import time
+import unicodedata
+from array import array
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "qemb:v1:"
+LRU_INDEX_KEY = "qemb:lru"
+BYTES_KEY = "qemb:bytes"
+EVICT_BATCH = 128
+
+_WS = re.compile(r"\s+")
+
+
+def normalize_query(text: str) -> str:
+    return _WS.sub(" ", unicodedata.normalize("NFKC", text or "")).strip().casefold()
+
+
+def pack(vector: List[float]) -> bytes:
+    packed = array("f", vector)
+    if sys.byteorder != "little":
+        packed.byteswap()
+    return packed.tobytes()
+
+
+def unpack(raw: bytes) -> List[float]:
+    packed = array("f")
+    packed.frombytes(raw)
+    if sys.byteorder != "little":
+        packed.byteswap()
+    return packed.tolist()
+
+
+def redis_key(embedding_model_id: int, dimension: int, text: str) -> str:
+    digest = hashlib.sha256(normalize_query(text).encode("utf-8")).hexdigest()
+    return f"{KEY_PREFIX}{embedding_model_id}:{dimension}:{digest}"
+
+
+def _entry_bytes(key: str) -> int:
+    try:
+        return 4 * int(key.split(":")[3])
+    except (IndexError, ValueError):
+        return 0
+
+
+# ── Local tier ───────────────────────────────────────────────────────────────
+
+
+class LocalLRU:
+    """Thread-safe LRU of packed vectors bounded by total bytes."""
+
+    def __init__(self, max_bytes: int, ttl_seconds: float):
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[Tuple[int, str], Tuple[float, bytes]] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple[int, str]) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            stored_at, raw = entry
+            if time.monotonic() - stored_at > self.ttl_seconds:
+                del self._entries[key]
+                self._bytes -= len(raw)
+                return None
+            self._entries.move_to_end(key)
+            return raw
+
+    def put(self, key: Tuple[int, str], raw: bytes) -> None:
+        if len(raw) > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= len(old[1])
+            self._entries[key] = (time.monotonic(), raw)
+            self._bytes += len(raw)
+            while self._bytes > self.max_bytes and self._entries:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self._bytes -= len(evicted)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    @property
+    def size_bytes(self) -> int:
+        return self._bytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_local = LocalLRU(
+    settings.EMBEDDING_QUERY_CACHE_LOCAL_MAX_BYTES,
+    settings.EMBEDDING_QUERY_CACHE_TTL_SECONDS,
+)
+
+
+# ── Redis tier ───────────────────────────────────────────────────────────────
+
+
+def _redis():
+    from app.core.redis import get_binary_redis
+    return get_binary_redis()
+
+
+def _redis_get(key: str) -> Optional[bytes]:
+    try:
+        r = _redis()
+        raw = r.get(key)
+        if raw is not None:
+            # XX: only refresh; a member trimmed meanwhile must not come
+            # back into the index without its bytes counted.
+            r.zadd(LRU_INDEX_KEY, {key: time.time()}, xx=True)
+        return raw
+    except Exception as exc:
+        logger.debug("query embedding cache read failed for %s: %s", key, exc)
+        return None
+
+
+def _redis_put(key: str, raw: bytes) -> None:
+    try:
+        r = _redis()
+        now = time.time()
+        pipe = r.pipeline(transaction=False)
+        pipe.set(key, raw, ex=settings.EMBEDDING_QUERY_CACHE_TTL_SECONDS, nx=True)
+        pipe.zadd(LRU_INDEX_KEY, {key: now}, nx=True)
+        pipe.zadd(LRU_INDEX_KEY, {key: now}, xx=True)
+        indexed = pipe.execute()[1]
+        # The counter tracks index members, so only a new member adds bytes.
+        # A member whose value expired is still indexed (and counted);
+        # re-putting it refreshes the value without counting it twice.
+        if not indexed:
+            return
+        total = r.incrby(BYTES_KEY, _entry_bytes(key))
+        if total > settings.EMBEDDING_QUERY_CACHE_REDIS_MAX_BYTES:
+            _trim(r, total)
+    except Exception as exc:
+        logger.debug("query embedding cache write failed for %s: %s", key, exc)
+
+
+def _trim(r, total: int) -> None:
+    """Pop least-recently-used keys until the byte counter fits the cap.
+
+    The counter is the size of the index, not of live values: members
+    whose value key already expired were counted when added and are
+    uncounted here when popped, whether or not ``DELETE`` found a value.
+    An empty index resets the counter, and it is never left negative, so
+    drift from concurrent writers heals on the next trim.
+    """
+    cap = settings.EMBEDDING_QUERY_CACHE_REDIS_MAX_BYTES
+    while total > cap:
+        popped = r.zpopmin(LRU_INDEX_KEY, EVICT_BATCH)
+        if not popped:
+            r.set(BYTES_KEY, 0)
+            return
+        keys = [member.decode() if isinstance(member, bytes) else member for member, _ in popped]
+        freed = sum(_entry_bytes(k) for k in keys)
+        pipe = r.pipeline(transaction=False)
+        pipe.delete(*keys)
+        pipe.decrby(BYTES_KEY, freed)
+        total = pipe.execute()[-1]
+        if total < 0:
+            r.set(BYTES_KEY, 0)
+            return
+
+
+# ── Public API ───────────────────────────────────────────────────────────────
+
+
+def get(embedding_model_id: int, dimension: int, text: str) -> Optional[List[float]]:
+    """Cached vector for ``text`` under ``embedding_model_id``, or ``None``."""
+    if not settings.EMBEDDING_QUERY_CACHE_ENABLED:
+        return None
+    local_key = (embedding_model_id, normalize_query(text))
+    raw = _local.get(local_key)
+    if raw is None:
+        raw = _redis_get(redis_key(embedding_model_id, dimension, text))
+        if raw is None:
+            return None
+        _local.put(local_key, raw)
+    if len(raw) != 4 * dimension:
+        return None
+    return unpack(raw)
+
+
+def put(embedding_model_id: int, dimension: int, text: str, vector: List[float]) -> None:
+    if not settings.EMBEDDING_QUERY_CACHE_ENABLED or len(vector) != dimension:
+        return
+    raw = pack(vector)
+    _local.put((embedding_model_id, normalize_query(text)), raw)
+    _redis_put(redis_key(embedding_model_id, dimension, text), raw)
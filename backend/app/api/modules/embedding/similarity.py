@@ -7,9 +7,13 @@ Flat semantic-search primitives over AssetChunk.
   upstream).
 
 - ``search_by_text(query_text)`` — convenience: embed the query via
-  ``embed.embed_texts`` using the infospace's configured model (or an explicit
+  ``embed.embed_query`` (cached) using the infospace's configured model (or an explicit
   ``embedding_model_id``), then call ``similarity_search``.
 
+- ``query_vector_for_model(query_vector, em)`` — validate/truncate a query
+  vector for a model's dimension and name the chunk column it searches.
+  Shared with ``AssetQuery.hybrid``.
+
 ``ChunkHit`` is the result shape — same attribute surface as the old
 ``SearchResult``, so MCP/RAG consumers don't need restructuring.
 """
@@ -18,17 +22,17 @@ from __future__ import annotations
 
 import logging
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from sqlalchemy import text as sa_text
 from sqlmodel import Session
 
-from app.models import Asset, AssetChunk, AssetKind, Infospace
+from app.models import AssetKind
 from app.api.modules.content.models import (
     EMBEDDING_SUPPORTED_DIMS,
     get_embedding_column_for_dimension,
 )
-from app.api.modules.embedding.embed import embed_texts
+from app.api.modules.embedding.embed import embed_query
 from app.api.modules.identity_infospace_user.access import PackageScope
 
 logger = logging.getLogger(__name__)
@@ -43,17 +47,18 @@ class ChunkHit:
         "parent_asset_id", "similarity", "distance",
     )
 
-    def __init__(self, chunk: AssetChunk, asset: Asset, similarity: float, distance: float):
-        self.chunk_id = chunk.id
-        self.chunk_index = chunk.chunk_index
-        self.chunk_text = chunk.text_content
-        self.chunk_metadata = chunk.chunk_metadata
-        self.asset_id = asset.id
-        self.asset_uuid = asset.uuid
-        self.asset_title = asset.title
-        self.asset_kind = asset.kind
-        self.asset_created_at = asset.created_at
-        self.parent_asset_id = asset.parent_asset_id
+    def __init__(self, row: Any, similarity: float, distance: float):
+        """Build from a ``similarity_search`` result row (projected columns)."""
+        self.chunk_id = row.chunk_id
+        self.chunk_index = row.chunk_index
+        self.chunk_text = row.chunk_text
+        self.chunk_metadata = row.chunk_metadata
+        self.asset_id = row.asset_id
+        self.asset_uuid = row.asset_uuid
+        self.asset_title = row.asset_title
+        self.asset_kind = _asset_kind(row.asset_kind)
+        self.asset_created_at = row.asset_created_at
+        self.parent_asset_id = row.parent_asset_id
         self.similarity = similarity
         self.distance = distance
 
@@ -74,6 +79,38 @@ class ChunkHit:
         }
 
 
+def _asset_kind(value: Any) -> Any:
+    # Raw SQL returns the Postgres enum label (member name), not the value.
+    if isinstance(value, str) and value in AssetKind.__members__:
+        return AssetKind[value]
+    try:
+        return AssetKind(value)
+    except ValueError:
+        return value
+
+
+def query_vector_for_model(query_vector: List[float], em: Any) -> Tuple[str, List[float]]:
+    """Return ``(chunk column, vector)`` for searching ``em``'s chunks.
+
+    Applies Matryoshka truncation and raises ``ValueError`` when the model's
+    dimension has no vector column or the vector is too short.
+    """
+    dim = em.dimension
+    col_name = get_embedding_column_for_dimension(dim)
+    if not col_name:
+        raise ValueError(
+            f"Embedding dimension {dim} not supported for search. "
+            f"Supported: {', '.join(str(d) for d in EMBEDDING_SUPPORTED_DIMS)}."
+        )
+    if len(query_vector) > dim:
+        query_vector = query_vector[:dim]
+    if len(query_vector) != dim:
+        raise ValueError(
+            f"query_vector has {len(query_vector)} dims but model expects {dim}"
+        )
+    return col_name, list(query_vector)
+
+
 async def similarity_search(
     session: Session,
     infospace_id: int,
@@ -93,27 +130,15 @@ async def similarity_search(
     """Pure pgvector-backed similarity search.
 
     ``query_vector`` must already be sized to the ``embedding_model_id``'s
-    dimension. Use ``embed.embed_texts`` to produce one.
+    dimension. Use ``embed.embed_texts`` to produce one. Chunk and asset
+    columns come back with the KNN rows — one round trip per search.
     """
     from app.models import EmbeddingModel
 
     em = session.get(EmbeddingModel, embedding_model_id)
     if em is None:
         raise ValueError(f"Embedding model {embedding_model_id} not found")
-    dim = em.dimension
-    col_name = get_embedding_column_for_dimension(dim)
-    if not col_name:
-        raise ValueError(
-            f"Embedding dimension {dim} not supported for search. "
-            f"Supported: {', '.join(str(d) for d in EMBEDDING_SUPPORTED_DIMS)}."
-        )
-
-    if len(query_vector) > dim:
-        query_vector = query_vector[:dim]
-    if len(query_vector) != dim:
-        raise ValueError(
-            f"query_vector has {len(query_vector)} dims but model expects {dim}"
-        )
+    col_name, query_vector = query_vector_for_model(query_vector, em)
     vec_str = "[" + ",".join(str(x) for x in query_vector) + "]"
 
     extra_where: List[str] = []
@@ -159,7 +184,10 @@ async def similarity_search(
 
     extra_sql = " AND " + " AND ".join(extra_where) if extra_where else ""
     sql = sa_text(f"""
-        SELECT c.id as chunk_id, c.asset_id, a.id as asset_id,
+        SELECT c.id AS chunk_id, c.chunk_index, c.text_content AS chunk_text,
+               c.chunk_metadata, a.id AS asset_id, a.uuid AS asset_uuid,
+               a.title AS asset_title, a.kind AS asset_kind,
+               a.created_at AS asset_created_at, a.parent_asset_id,
                (c.{col_name} <=> CAST(:query_vec AS vector)) as distance
         FROM assetchunk c
         JOIN asset a ON c.asset_id = a.id
@@ -180,10 +208,7 @@ async def similarity_search(
         if distance_threshold is not None and distance > distance_threshold:
             continue
         similarity = 1.0 - distance if distance_function == "cosine" else distance
-        chunk = session.get(AssetChunk, row.chunk_id)
-        asset = session.get(Asset, row.asset_id)
-        if chunk and asset:
-            hits.append(ChunkHit(chunk, asset, similarity, distance))
+        hits.append(ChunkHit(row, similarity, distance))
 
     logger.info(
         "Similarity search in infospace %d: %d results (pgvector indexed)",
@@ -209,16 +234,19 @@ async def search_by_text(
     parent_asset_id: Optional[int] = None,
     scope: Optional[PackageScope] = None,
 ) -> List[ChunkHit]:
-    """Embed ``query_text`` via the infospace's configured model, then search."""
-    vectors, em = await embed_texts(
-        session, infospace_id, [query_text],
+    """Embed ``query_text`` via the infospace's configured model, then search.
+
+    Repeated queries are served from the query-embedding cache.
+    """
+    vector, em = await embed_query(
+        session, infospace_id, query_text,
         runtime_key=runtime_key,
         embedding_model_id=embedding_model_id,
     )
-    if not vectors:
+    if vector is None:
         return []
     return await similarity_search(
-        session, infospace_id, vectors[0], em.id,
+        session, infospace_id, vector, em.id,
         limit=limit,
         distance_threshold=distance_threshold,
         distance_function=distance_function,
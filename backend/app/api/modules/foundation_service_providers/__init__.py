@@ -13,6 +13,7 @@ Public API — everything else is internal:
 - ``is_capability_available()`` → cheap deployment-level probe (circuit breakers)
 - ``list_providers(capability)`` → discovery UI helper
 - ``probe_providers()``         → startup status summary
+- ``invalidate_provider_pool()`` → drop pooled instances after credential/selection saves
 """
 
 from .base import (
@@ -44,6 +45,7 @@ from .registry import (
     list_providers,
     get_model_spec,
     get_selection,
+    invalidate_provider_pool,
     probe_providers,
     CAPABILITIES,
 )
@@ -78,6 +80,7 @@ __all__ = [
     "list_providers",
     "get_model_spec",
     "get_selection",
+    "invalidate_provider_pool",
     "probe_providers",
     "CAPABILITIES",
 ]
@@ -16,12 +16,28 @@ Three public exports:
 
 Nothing else is public. Callers never see credentials, descriptors, or config
 dicts. If you need to construct a provider, you call ``resolve``.
+
+Instances are pooled process-wide, keyed by (capability, provider_key,
+credential fingerprint, base_url, event loop), so repeat resolves reuse the
+SDK client and its keep-alive connection pool instead of re-decrypting
+credentials and re-handshaking TLS. The fingerprint hashes the *encrypted*
+blob (or the BYOK runtime key), so a pool hit needs no decrypt, and a
+credential change can never serve a stale client. The per-infospace
+selection/credential context is cached for ``PROVIDER_CONTEXT_TTL_SECONDS``;
+``invalidate_provider_pool`` drops both when credentials or selections are
+saved.
 """
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import logging
 import os
+import threading
+import time
+import weakref
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from typing import Any, Callable, Dict, List, Optional, Set, Type
 
@@ -283,6 +299,7 @@ class _Context:
     selection: Optional[ProviderSelection]   # from enrichment_config or provider_defaults
     encrypted_credentials: Optional[str]     # owner's stored keys (or None if no infospace)
     owner_is_superuser: bool                 # for PROVIDER_ACCESS=superuser gating
+    owner_id: Optional[int] = None           # pool invalidation tag
 
 
 def _load_from_session(
@@ -329,6 +346,7 @@ def _load_from_session(
         selection=selection,
         encrypted_credentials=owner.encrypted_credentials,
         owner_is_superuser=bool(getattr(owner, "is_superuser", False)),
+        owner_id=owner.id,
     )
 
 
@@ -347,12 +365,125 @@ def _load_context(
     if infospace_id is None:
         return _Context(selection=None, encrypted_credentials=None, owner_is_superuser=False)
 
+    key = (capability, infospace_id, context)
+    cached = _context_cache.get(key)
+    if cached is not None and cached[0] > time.monotonic():
+        return cached[1]
+
     if session is not None:
-        return _load_from_session(session, capability, infospace_id, context)
+        loaded = _load_from_session(session, capability, infospace_id, context)
+    else:
+        from app.core.db import engine
+        with Session(engine) as s:
+            loaded = _load_from_session(s, capability, infospace_id, context)
+
+    from app.core.config import settings
+    if settings.PROVIDER_CONTEXT_TTL_SECONDS > 0:
+        _context_cache[key] = (time.monotonic() + settings.PROVIDER_CONTEXT_TTL_SECONDS, loaded)
+    return loaded
+
+
+# ── Instance pool ────────────────────────────────────────────────────────────
+
+
+@dataclass
+class _PoolEntry:
+    instance: Any
+    expires_at: float
+    owner_id: Optional[int]
+    loop: Optional[weakref.ref]
+
+
+# (capability, infospace_id, context) → (expires_at, _Context)
+_context_cache: Dict[tuple, tuple[float, _Context]] = {}
+_pool: "OrderedDict[tuple, _PoolEntry]" = OrderedDict()
+_pool_lock = threading.Lock()
+
+
+def _running_loop() -> Optional[asyncio.AbstractEventLoop]:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+def _credential_fingerprint(
+    desc: ProviderDescriptor,
+    ctx: _Context,
+    runtime_key: Optional[str],
+) -> str:
+    """Identify the credential source without decrypting it."""
+    if not desc.requires_api_key:
+        return "-"
+    if runtime_key:
+        return "rt:" + hashlib.sha256(runtime_key.encode()).hexdigest()
+    blob = hashlib.sha256((ctx.encrypted_credentials or "").encode()).hexdigest()
+    return f"st:{blob}:{desc.credential_key}:{int(ctx.owner_is_superuser)}"
+
+
+def _configured_base_url(desc: ProviderDescriptor, settings: AppSettings) -> Optional[str]:
+    if desc.base_url_setting:
+        return getattr(settings, desc.base_url_setting, None) or desc.base_url_default
+    return desc.base_url_default
+
+
+def _pool_get(key: tuple) -> Any:
+    with _pool_lock:
+        entry = _pool.get(key)
+        if entry is None:
+            return None
+        loop = entry.loop() if entry.loop is not None else None
+        stale_loop = entry.loop is not None and (loop is None or loop.is_closed())
+        if stale_loop or entry.expires_at <= time.monotonic():
+            del _pool[key]
+            return None
+        _pool.move_to_end(key)
+        return entry.instance
+
+
+def _pool_put(key: tuple, instance: Any, owner_id: Optional[int]) -> None:
+    from app.core.config import settings
+
+    if settings.PROVIDER_POOL_TTL_SECONDS <= 0:
+        return
+    loop = _running_loop()
+    with _pool_lock:
+        _pool[key] = _PoolEntry(
+            instance=instance,
+            expires_at=time.monotonic() + settings.PROVIDER_POOL_TTL_SECONDS,
+            owner_id=owner_id,
+            loop=weakref.ref(loop) if loop is not None else None,
+        )
+        _pool.move_to_end(key)
+        while len(_pool) > settings.PROVIDER_POOL_MAX_ENTRIES:
+            _pool.popitem(last=False)
 
-    from app.core.db import engine
-    with Session(engine) as s:
-        return _load_from_session(s, capability, infospace_id, context)
+
+def invalidate_provider_pool(
+    *,
+    owner_id: Optional[int] = None,
+    infospace_id: Optional[int] = None,
+) -> None:
+    """Drop pooled instances and cached contexts after a credential/selection save.
+
+    ``owner_id`` drops everything built from that user's credentials or
+    defaults; ``infospace_id`` drops that infospace's cached selection.
+    Neither clears the whole pool. Other processes converge through the
+    credential fingerprint and the context TTL.
+    """
+    with _pool_lock:
+        for key, (_, cached) in list(_context_cache.items()):
+            if owner_id is None and infospace_id is None:
+                del _context_cache[key]
+            elif (owner_id is not None and cached.owner_id == owner_id) or (
+                infospace_id is not None and key[1] == infospace_id
+            ):
+                del _context_cache[key]
+        for key, entry in list(_pool.items()):
+            if (owner_id is None and infospace_id is None) or (
+                owner_id is not None and entry.owner_id == owner_id
+            ):
+                del _pool[key]
 
 
 # ── Effective-selection lookup (for preconditions, not construction) ────────
@@ -440,6 +571,33 @@ def _construct(desc: ProviderDescriptor, config: dict) -> Any:
     return impl_class(**config)
 
 
+def preload_implementations(capability: str, settings: Optional[AppSettings] = None) -> List[str]:
+    """Import the implementation modules (and their SDKs) for a capability.
+
+    Implementations are otherwise imported by the first ``resolve()`` that
+    needs them. Workers call this at process start for the queues they
+    consume, so that first task does not pay the SDK import. Providers
+    blocked by PROVIDER_ACCESS are skipped; so is any whose SDK is missing.
+    Returns the modules imported.
+    """
+    if settings is None:
+        from app.core.config import settings as _settings
+        settings = _settings
+
+    loaded: List[str] = []
+    for pk, desc in list_providers(capability):
+        if _is_access_blocked(settings, desc):
+            continue
+        module_name = f"{_IMPL_PREFIX}.{desc.impl.rsplit('.', 1)[0]}"
+        try:
+            __import__(module_name)
+        except ImportError as e:
+            logger.info("[PROVIDERS] preload skipped %s/%s: %s", capability, pk, e)
+            continue
+        loaded.append(module_name)
+    return loaded
+
+
 # ── Resolution: the one public function ──────────────────────────────────────
 
 
@@ -525,6 +683,17 @@ def resolve(
                 f"Model '{model}' not available on {provider_key}. Available: {available}"
             )
 
+    # ── Pool: same credentials + endpoint on this loop → reuse the instance ──
+    pool_key = (
+        capability, provider_key,
+        _credential_fingerprint(desc, ctx, runtime_key),
+        _configured_base_url(desc, settings),
+        id(_running_loop()),
+    )
+    instance = _pool_get(pool_key)
+    if instance is not None:
+        return Resolved(instance, model=model, provider_key=provider_key)
+
     # ── Credential chain (keyed providers only) ──
     api_key: Optional[str] = None
     if desc.requires_api_key:
@@ -554,6 +723,7 @@ def resolve(
 
     config = _build_config(desc, settings, api_key, ctx.owner_is_superuser)
     instance = _construct(desc, config)
+    _pool_put(pool_key, instance, ctx.owner_id)
     return Resolved(instance, model=model, provider_key=provider_key)
 
 
@@ -72,39 +72,81 @@ def find_by_alias(
     return None
 
 
-def _find_by_embedding_sql(
+def _match_by_alias_sql(
+    session: Session,
+    canon_id: int,
+    keys: List[Tuple[str, str]],
+) -> Dict[Tuple[str, str], int]:
+    """Set-based ``find_by_alias`` for many ``(entity_type, normalized_name)``
+    keys: one ``unnest`` + LATERAL query instead of a round trip per key.
+    """
+    if not keys:
+        return {}
+    sql = text("""
+        SELECT q.etype, q.name, m.id
+        FROM unnest(CAST(:etypes AS text[]), CAST(:names AS text[])) AS q(etype, name)
+        CROSS JOIN LATERAL (
+            SELECT id FROM entity
+            WHERE canon_id = :cid AND entity_type = q.etype
+            AND (
+                LOWER(TRIM(canonical_name)) = q.name
+                OR EXISTS (
+                    SELECT 1 FROM jsonb_array_elements_text(COALESCE(aliases::jsonb, '[]'::jsonb)) AS elem
+                    WHERE LOWER(TRIM(elem::text)) = q.name
+                )
+            )
+            LIMIT 1
+        ) m
+    """)
+    rows = session.execute(sql, {
+        "cid": canon_id,
+        "etypes": [etype for etype, _ in keys],
+        "names": [name for _, name in keys],
+    }).all()
+    return {(etype, name): entity_id for etype, name, entity_id in rows}
+
+
+def _match_by_embedding_sql(
     session: Session,
     canon_id: int,
     entity_type: str,
-    vec: List[float],
+    vecs: List[List[float]],
     similarity_threshold: float = 0.85,
-) -> Optional[Entity]:
-    """Find Entity by pgvector SQL (no embedding generation). Used by resolve_entities_batch."""
+) -> Dict[int, int]:
+    """Nearest canon Entity for each vector in one KNN query.
+
+    All vectors must share one supported dimension. Returns
+    ``{index into vecs: entity_id}`` for matches within the threshold.
+    """
     from app.api.modules.content.models import EMBEDDING_SUPPORTED_DIMS
 
-    dim = len(vec)
+    if not vecs:
+        return {}
+    dim = len(vecs[0])
     if dim not in EMBEDDING_SUPPORTED_DIMS:
-        return None
+        return {}
     col_name = f"embedding_{dim}"
-    vec_str = "[" + ",".join(str(x) for x in vec) + "]"
-    params: Dict[str, Any] = {
+    sql = text(f"""
+        SELECT q.ord, m.id
+        FROM unnest(CAST(:vecs AS text[])) WITH ORDINALITY AS q(vec, ord)
+        CROSS JOIN LATERAL (
+            SELECT id, ({col_name} <=> CAST(q.vec AS vector)) AS dist
+            FROM entity
+            WHERE canon_id = :cid AND entity_type = :etype
+              AND {col_name} IS NOT NULL
+            ORDER BY {col_name} <=> CAST(q.vec AS vector)
+            LIMIT 1
+        ) m
+        WHERE m.dist <= :thresh
+    """)
+    rows = session.execute(sql, {
         "cid": canon_id,
         "etype": entity_type,
-        "vec": vec_str,
+        "vecs": ["[" + ",".join(str(x) for x in vec) + "]" for vec in vecs],
         "thresh": 1.0 - similarity_threshold,
-    }
-    sql = text(f"""
-        SELECT id, ({col_name} <=> CAST(:vec AS vector)) AS dist
-        FROM entity
-        WHERE canon_id = :cid AND entity_type = :etype
-          AND {col_name} IS NOT NULL
-        ORDER BY {col_name} <=> CAST(:vec AS vector)
-        LIMIT 1
-    """)
-    row = session.execute(sql, params).fetchone()
-    if row and row[1] is not None and row[1] <= (1.0 - similarity_threshold):
-        return session.get(Entity, row[0])
-    return None
+    }).all()
+    # WITH ORDINALITY is 1-based.
+    return {int(ord_) - 1: entity_id for ord_, entity_id in rows}
 
 
 async def find_by_embedding(
@@ -230,15 +272,30 @@ async def resolve_entities_batch(
 
     Returns a map of ``(raw_name, entity_type) → Entity``. Missing entries
     are created in ``canon_id``. Caller owns the transaction boundary.
+
+    Set-based: raw pairs collapse to ``(entity_type, normalized_name)``
+    keys, so ``"EU"`` and ``"eu "`` share one Entity. Keys are resolved by
+    the in-memory alias map, then one ``unnest`` alias query for the
+    misses, then (with ``use_embeddings``) one KNN query per
+    ``(entity_type, dimension)`` over all still-unresolved vectors. Matched
+    rows are hydrated in one SELECT and new ones created in one
+    ``INSERT ... RETURNING`` — round trips no longer grow with the batch.
     """
-    from app.api.modules.content.models import EMBEDDING_SUPPORTED_DIMS
+    from sqlalchemy import insert as sa_insert
     from sqlalchemy import select as sa_select
 
     result: Dict[Tuple[str, str], Entity] = {}
     if not entities:
         return result
 
-    entity_types = list({et for _, et in entities})
+    # (entity_type, normalized_name) → raw names in first-seen order. The
+    # first raw name is embedded and becomes canonical_name on creation.
+    raw_by_key: Dict[Tuple[str, str], List[str]] = {}
+    for raw_name, entity_type in dict.fromkeys(entities):
+        key = (entity_type, (raw_name or "").strip().lower())
+        raw_by_key.setdefault(key, []).append(raw_name)
+
+    entity_types = list({et for et, _ in raw_by_key})
     # Lightweight projection: only columns needed for alias lookup (no embeddings).
     alias_stmt = sa_select(
         Entity.id,
@@ -263,59 +320,104 @@ async def resolve_entities_batch(
             if alias_norm:
                 alias_lookup[(row_entity_type, alias_norm)] = entity_id
 
-    raw_names = [e[0] for e in entities]
-    raw_embeddings: Optional[List[List[float]]] = None
-    if use_embeddings and raw_names:
+    resolved_ids: Dict[Tuple[str, str], int] = {}
+    for key in raw_by_key:
+        if key[1] and key in alias_lookup:
+            resolved_ids[key] = alias_lookup[key]
+
+    # SQL fallback catches rows the projection missed: Postgres LOWER()
+    # differs from str.lower() on some scripts, and concurrent curation
+    # may have inserted since the projection was read.
+    resolved_ids.update(_match_by_alias_sql(
+        session, canon_id, [k for k in raw_by_key if k[1] and k not in resolved_ids],
+    ))
+
+    # Embedding similarity for what's still unresolved, one KNN per
+    # (entity_type, dimension).
+    alias_additions: Dict[int, List[str]] = {}
+    unresolved = [k for k in raw_by_key if k[1] and k not in resolved_ids]
+    if use_embeddings and unresolved:
+        vectors: Optional[List[List[float]]] = None
         try:
             from app.api.modules.embedding.embed import embed_texts
             from app.api.modules.foundation_service_providers import get_selection
             sel = get_selection(session, infospace_id, "embedding")
             if sel and sel.model_name:
-                vectors, _em = await embed_texts(session, infospace_id, raw_names)
-                if vectors:
-                    raw_embeddings = vectors
+                vectors, _em = await embed_texts(
+                    session, infospace_id, [raw_by_key[k][0] for k in unresolved],
+                )
         except Exception as e:
             logger.warning(f"Batch embedding failed: {e}")
+        if vectors:
+            groups: Dict[Tuple[str, int], List[Tuple[Tuple[str, str], List[float]]]] = {}
+            for key, vec in zip(unresolved, vectors):
+                if vec:
+                    groups.setdefault((key[0], len(vec)), []).append((key, vec))
+            for (entity_type, _dim), members in groups.items():
+                matches = _match_by_embedding_sql(
+                    session,
+                    canon_id=canon_id,
+                    entity_type=entity_type,
+                    vecs=[vec for _, vec in members],
+                    similarity_threshold=similarity_threshold,
+                )
+                for idx, entity_id in matches.items():
+                    key = members[idx][0]
+                    resolved_ids[key] = entity_id
+                    # Embedding matches learn the raw names as aliases so the
+                    # next batch resolves them exactly.
+                    alias_additions.setdefault(entity_id, []).extend(raw_by_key[key])
+
+    entities_by_id: Dict[int, Entity] = {}
+    if resolved_ids:
+        entities_by_id = {
+            ent.id: ent
+            for ent in session.scalars(
+                sa_select(Entity).where(Entity.id.in_(set(resolved_ids.values())))
+            )
+        }
+    for entity_id, names in alias_additions.items():
+        ent = entities_by_id.get(entity_id)
+        if ent is None:
+            continue
+        new_aliases = [n for n in dict.fromkeys(names) if n not in (ent.aliases or [])]
+        if new_aliases:
+            # Reassign (not append) so the JSON column is marked dirty.
+            ent.aliases = list(ent.aliases or []) + new_aliases
+            session.add(ent)
+
+    to_create = [k for k in raw_by_key if resolved_ids.get(k) not in entities_by_id]
+    created: Dict[Tuple[str, str], Entity] = {}
+    if to_create:
+        # Build through the model so default_factory fields (uuid,
+        # timestamps) are populated, then insert every row in one statement.
+        new_rows = []
+        for key in to_create:
+            raw_name = raw_by_key[key][0]
+            ent = Entity(
+                infospace_id=infospace_id,
+                canon_id=canon_id,
+                canonical_name=raw_name,
+                entity_type=key[0],
+                aliases=list(dict.fromkeys(raw_by_key[key])),
+            )
+            new_rows.append({
+                c.name: getattr(ent, c.name)
+                for c in Entity.__table__.columns if c.name != "id"
+            })
+        inserted = session.scalars(
+            sa_insert(Entity).returning(Entity), new_rows,
+        ).all()
+        by_uuid = {ent.uuid: ent for ent in inserted}
+        for key, row in zip(to_create, new_rows):
+            created[key] = by_uuid[row["uuid"]]
+        logger.info(f"Created {len(created)} new Entities in canon {canon_id}")
 
     for raw_name, entity_type in entities:
-        norm = (raw_name or "").strip().lower()
-        if norm and (entity_type, norm) in alias_lookup:
-            matched_id = alias_lookup[(entity_type, norm)]
-            result[(raw_name, entity_type)] = session.get(Entity, matched_id)
-            continue
-        existing = find_by_alias(session, canon_id, raw_name, entity_type)
-        if existing:
-            result[(raw_name, entity_type)] = existing
-            continue
-        if raw_embeddings:
-            idx = next((i for i, e in enumerate(entities) if e == (raw_name, entity_type)), -1)
-            if idx >= 0 and idx < len(raw_embeddings) and raw_embeddings[idx]:
-                vec = raw_embeddings[idx]
-                dim = len(vec)
-                if dim in EMBEDDING_SUPPORTED_DIMS:
-                    best_match = _find_by_embedding_sql(
-                        session,
-                        canon_id=canon_id,
-                        entity_type=entity_type,
-                        vec=vec,
-                        similarity_threshold=similarity_threshold,
-                    )
-                    if best_match:
-                        if raw_name not in best_match.aliases:
-                            best_match.aliases.append(raw_name)
-                            session.add(best_match)
-                        result[(raw_name, entity_type)] = best_match
-                        continue
-        entity = Entity(
-            infospace_id=infospace_id,
-            canon_id=canon_id,
-            canonical_name=raw_name,
-            entity_type=entity_type,
-            aliases=[raw_name],
-        )
-        session.add(entity)
-        session.flush()
-        result[(raw_name, entity_type)] = entity
+        key = (entity_type, (raw_name or "").strip().lower())
+        ent = created.get(key) or entities_by_id.get(resolved_ids.get(key))
+        if ent is not None:
+            result[(raw_name, entity_type)] = ent
 
     # No commit — caller owns the transaction boundary.
     return result
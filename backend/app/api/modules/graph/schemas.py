@@ -406,6 +406,7 @@ class ResolutionProposal(BaseModel):
 class FindDuplicatesRequest(BaseModel):
     items: List[str]
     threshold: float = 0.85
+    max_pairs: int = Field(default=1000, ge=1, le=100_000)
 
 
 class SimilarPairRead(BaseModel):
@@ -14,6 +14,9 @@ Used by:
 
 Collection is a drain: ``collect_graph`` assembles a ``GraphResult`` from the
 chunk iterator (bounded by the same caps).
+
+Window reads go through ``core.db.run_sync``: inline on a sync session, on
+the async connection when the query was built on an async session facade.
 """
 
 from __future__ import annotations
@@ -35,6 +38,7 @@ from app.api.modules.graph.schemas import (
     GraphNodeData as GraphNode,
     GraphResultData as GraphResult,
 )
+from app.core.db import run_sync
 from app.core.filters import jsonb_accessor, jsonb_value_accessor, parse_explosion, safe_array_elements
 
 logger = logging.getLogger(__name__)
@@ -277,7 +281,7 @@ class AnnotationGraphSource:
                 LIMIT :stream_lim
             """).bindparams(**params, stream_lim=chunk_size)
 
-            rows = session.exec(sql).all()
+            rows = await run_sync(session, lambda: session.exec(sql).all())
             if not rows:
                 return
 
@@ -503,7 +507,7 @@ class PersistentGraphSource:
                 LIMIT :stream_lim
             """).bindparams(**params)
 
-            rows = self.session.exec(sql).all()
+            rows = await run_sync(self.session, lambda: self.session.exec(sql).all())
             if not rows:
                 return
 
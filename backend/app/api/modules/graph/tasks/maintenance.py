@@ -25,6 +25,7 @@ from app.core.tasks import TaskContext, task
           .where(Asset.is_superseded == True)
       ),
       schedule=21600,
+      wakes_on=["asset"],
       batch=50, tags=frozenset({"graph"}))
 def retire_superseded(ctx: TaskContext, ids: list[int]):
     """Flag FragmentCuration entries whose source asset is superseded.
@@ -57,17 +57,65 @@ def _embed_strings(session, infospace_id: int, strings: list[str]) -> Optional[l
         return None
 
 
-def _cosine(a: list[float], b: list[float]) -> float:
-    """Quick cosine — bounded inputs already have similar magnitudes from
-    embedding providers, so we don't normalize aggressively here.
+# Above this many embedded entities of one type, candidate pairs come from
+# pgvector ANN (k nearest per entity) instead of the exhaustive matrix scan.
+ANN_PREFILTER_MIN_ENTITIES = 50_000
+ANN_NEIGHBORS = 10
+
+_EMBEDDING_DIMS = (384, 512, 768, 1024, 1536, 2048)
+
+
+def _embedded_counts(session, canon_id: int, entity_type_filter: Optional[list[str]]) -> dict[str, list[int]]:
+    """``entity_type → [non-null count per dim in _EMBEDDING_DIMS]`` in one query."""
+    counts = ", ".join(f"count(embedding_{d})" for d in _EMBEDDING_DIMS)
+    type_clause = "AND entity_type = ANY(:types)" if entity_type_filter else ""
+    params: dict = {"cid": canon_id}
+    if entity_type_filter:
+        params["types"] = list(entity_type_filter)
+    rows = session.execute(text(f"""
+        SELECT entity_type, {counts}
+          FROM entity
+         WHERE canon_id = :cid {type_clause}
+         GROUP BY entity_type
+    """), params).all()
+    return {row[0]: list(row[1:]) for row in rows}
+
+
+def _ann_candidate_pairs(
+    session, canon_id: int, entity_type: str, dim: int, threshold: float,
+) -> list[tuple[int, int, float]]:
+    """Candidate ``(id_a, id_b, similarity)`` pairs from pgvector KNN.
+
+    One LATERAL query: each entity's ``ANN_NEIGHBORS`` nearest same-type
+    neighbours within the threshold, via the HNSW index. Pairs are
+    deduplicated regardless of direction.
     """
-    import math
-    dot = sum(x * y for x, y in zip(a, b))
-    na = math.sqrt(sum(x * x for x in a))
-    nb = math.sqrt(sum(y * y for y in b))
-    if na == 0 or nb == 0:
-        return 0.0
-    return dot / (na * nb)
+    col = f"embedding_{dim}"
+    rows = session.execute(text(f"""
+        SELECT e.id, n.id, 1 - n.dist
+          FROM entity e
+          CROSS JOIN LATERAL (
+              SELECT o.id, (o.{col} <=> e.{col}) AS dist
+                FROM entity o
+               WHERE o.canon_id = :cid AND o.entity_type = :etype
+                 AND o.{col} IS NOT NULL AND o.id <> e.id
+               ORDER BY o.{col} <=> e.{col}
+               LIMIT :k
+          ) n
+         WHERE e.canon_id = :cid AND e.entity_type = :etype
+           AND e.{col} IS NOT NULL
+           AND n.dist <= :max_dist
+    """), {
+        "cid": canon_id, "etype": entity_type,
+        "k": ANN_NEIGHBORS, "max_dist": 1.0 - threshold,
+    }).all()
+    best: dict[tuple[int, int], float] = {}
+    for a_id, b_id, sim in rows:
+        key = (min(a_id, b_id), max(a_id, b_id))
+        best[key] = max(best.get(key, -1.0), float(sim))
+    pairs = [(a, b, sim) for (a, b), sim in best.items()]
+    pairs.sort(key=lambda p: p[2], reverse=True)
+    return pairs
 
 
 def _propose_entity_pairs(
@@ -83,52 +131,66 @@ def _propose_entity_pairs(
     The "keep" entity is the one with the longer canonical_name (more specific
     label tends to be the better canonical). Caller can override via the
     confirm step.
+
+    Per type, the first embedding dim with at least two populated rows is
+    scanned. Vectors go through the blockwise matrix engine
+    (``core.similarity.similar_pairs``); types larger than
+    ``ANN_PREFILTER_MIN_ENTITIES`` take candidates from pgvector ANN
+    instead. Proposals are the ``max_proposals`` most similar pairs.
     """
-    stmt = select(Entity).where(Entity.canon_id == canon_id)
-    if entity_type_filter:
-        stmt = stmt.where(Entity.entity_type.in_(entity_type_filter))
-    entities = session.exec(stmt).all()
-    if len(entities) < 2:
-        return []
+    from app.core.similarity import similar_pairs
 
-    # Group by entity_type — only same-type pairs are merge candidates.
-    by_type: dict[str, list[Entity]] = {}
-    for e in entities:
-        by_type.setdefault(e.entity_type, []).append(e)
+    counts_by_type = _embedded_counts(session, canon_id, entity_type_filter)
 
-    proposals: list[ResolutionProposal] = []
-    for etype, group in by_type.items():
-        if len(group) < 2:
+    scored: list[tuple[float, str, int, int]] = []
+    names: dict[int, str] = {}
+    for etype, counts in counts_by_type.items():
+        dim_and_count = next(
+            ((d, c) for d, c in zip(_EMBEDDING_DIMS, counts) if c >= 2), None,
+        )
+        if dim_and_count is None:
+            continue
+        dim, count = dim_and_count
+        col = getattr(Entity, f"embedding_{dim}")
+
+        if count >= ANN_PREFILTER_MIN_ENTITIES:
+            type_pairs = _ann_candidate_pairs(session, canon_id, etype, dim, threshold)
+            scored.extend((sim, etype, a, b) for a, b, sim in type_pairs[:max_proposals])
             continue
 
-        # Use whichever embedding dim the entities have populated. We pick the
-        # first non-null dim and only compare entities sharing that dim.
-        dims = [384, 512, 768, 1024, 1536, 2048]
-        for dim in dims:
-            col = f"embedding_{dim}"
-            with_emb = [e for e in group if getattr(e, col) is not None]
-            if len(with_emb) < 2:
-                continue
-            for i in range(len(with_emb)):
-                if len(proposals) >= max_proposals:
-                    return proposals
-                for j in range(i + 1, len(with_emb)):
-                    a = with_emb[i]
-                    b = with_emb[j]
-                    sim = _cosine(getattr(a, col), getattr(b, col))
-                    if sim < threshold:
-                        continue
-                    keep, cand = (a, b) if len(a.canonical_name) >= len(b.canonical_name) else (b, a)
-                    proposals.append(ResolutionProposal(
-                        kind="entity",
-                        keep=keep.canonical_name,
-                        keep_id=keep.id,
-                        candidates=[cand.canonical_name],
-                        candidate_ids=[cand.id],
-                        similarity=round(sim, 4),
-                        type=etype,
-                    ))
-            break  # processed the first available dim — don't double-emit
+        # Project only what the scan needs — not the other five vector columns.
+        rows = session.execute(
+            select(Entity.id, Entity.canonical_name, col)
+            .where(Entity.canon_id == canon_id, Entity.entity_type == etype, col.is_not(None))
+            .order_by(Entity.id)
+        ).all()
+        ids = [r[0] for r in rows]
+        names.update((r[0], r[1]) for r in rows)
+        for i, j, sim in similar_pairs([r[2] for r in rows], threshold, limit=max_proposals):
+            scored.append((sim, etype, ids[i], ids[j]))
+
+    scored.sort(key=lambda t: t[0], reverse=True)
+    scored = scored[:max_proposals]
+
+    missing = {eid for _, _, a, b in scored for eid in (a, b) if eid not in names}
+    if missing:
+        names.update(session.execute(
+            select(Entity.id, Entity.canonical_name).where(Entity.id.in_(missing))
+        ).all())
+
+    proposals: list[ResolutionProposal] = []
+    for sim, etype, a_id, b_id in scored:
+        a_name, b_name = names[a_id], names[b_id]
+        keep, cand = ((a_id, a_name), (b_id, b_name)) if len(a_name) >= len(b_name) else ((b_id, b_name), (a_id, a_name))
+        proposals.append(ResolutionProposal(
+            kind="entity",
+            keep=keep[1],
+            keep_id=keep[0],
+            candidates=[cand[1]],
+            candidate_ids=[cand[0]],
+            similarity=round(min(sim, 1.0), 4),
+            type=etype,
+        ))
     return proposals
 
 
@@ -170,29 +232,23 @@ def _propose_predicate_pairs(
     if not embeddings:
         return []
 
+    from app.core.similarity import similar_pairs
+
     proposals: list[ResolutionProposal] = []
-    for i in range(len(predicates)):
-        if len(proposals) >= max_proposals:
-            break
-        for j in range(i + 1, len(predicates)):
-            sim = _cosine(embeddings[i], embeddings[j])
-            if sim < threshold:
-                continue
-            a_pred, a_cnt = predicates[i]
-            b_pred, b_cnt = predicates[j]
-            # Keep = higher count; tiebreak by shorter string.
-            if a_cnt > b_cnt or (a_cnt == b_cnt and len(a_pred) <= len(b_pred)):
-                keep, cand = a_pred, b_pred
-            else:
-                keep, cand = b_pred, a_pred
-            proposals.append(ResolutionProposal(
-                kind="predicate",
-                keep=keep,
-                candidates=[cand],
-                similarity=round(sim, 4),
-            ))
-            if len(proposals) >= max_proposals:
-                break
+    for i, j, sim in similar_pairs(embeddings, threshold, limit=max_proposals):
+        a_pred, a_cnt = predicates[i]
+        b_pred, b_cnt = predicates[j]
+        # Keep = higher count; tiebreak by shorter string.
+        if a_cnt > b_cnt or (a_cnt == b_cnt and len(a_pred) <= len(b_pred)):
+            keep, cand = a_pred, b_pred
+        else:
+            keep, cand = b_pred, a_pred
+        proposals.append(ResolutionProposal(
+            kind="predicate",
+            keep=keep,
+            candidates=[cand],
+            similarity=round(min(sim, 1.0), 4),
+        ))
     return proposals
 
 
@@ -11,7 +11,8 @@ from __future__ import annotations
 
 import enum
 import logging
-from dataclasses import dataclass
+from bisect import bisect_left
+from dataclasses import dataclass, fields
 from datetime import datetime, timezone
 from typing import FrozenSet, Optional, Tuple
 
@@ -69,6 +70,9 @@ class PackageScope:
     Precomputed at token resolution — always compact.  Bundle recursive expansion,
     graph→run derivation, run→schema derivation, and ancestor asset chain are all
     resolved once and frozen here.
+
+    Every field is a sorted, de-duplicated tuple; use ``contains()`` for point
+    membership (binary search, not a linear tuple scan).
     """
     bundle_ids: Tuple[int, ...] = ()               # explicit bundles (recursive expansion done)
     asset_ids: Tuple[int, ...] = ()                 # explicit assets + ancestor chain from run-derived children
@@ -80,6 +84,21 @@ class PackageScope:
     downloadable_asset_ids: Tuple[int, ...] = ()    # subset of visible assets where download is allowed
     copyable_asset_ids: Tuple[int, ...] = ()        # subset of visible assets where copy is allowed
 
+    def __post_init__(self):
+        for f in fields(self):
+            ids = getattr(self, f.name)
+            if not _is_sorted_ids(ids):
+                object.__setattr__(self, f.name, tuple(sorted(set(ids or ()))))
+
+    def contains(self, scope_field: str, entity_id: int) -> bool:
+        ids = getattr(self, scope_field)
+        i = bisect_left(ids, entity_id)
+        return i < len(ids) and ids[i] == entity_id
+
+
+def _is_sorted_ids(ids) -> bool:
+    return isinstance(ids, tuple) and all(a < b for a, b in zip(ids, ids[1:]))
+
 
 # ─── Access context ───
 
@@ -126,13 +145,13 @@ class Access:
         """Check if an asset can be downloaded through the current access context."""
         if self.scope is None:
             return True  # owner/collaborator = full access
-        return asset_id in self.scope.downloadable_asset_ids
+        return self.scope.contains("downloadable_asset_ids", asset_id)
 
     def can_copy(self, asset_id: int) -> bool:
         """Check if an asset can be copied/imported through the current access context."""
         if self.scope is None:
             return True
-        return asset_id in self.scope.copyable_asset_ids
+        return self.scope.contains("copyable_asset_ids", asset_id)
 
     def require_in_scope(self, scope_field: str, entity_id: int) -> None:
         """Point check — raises 404 if entity_id is outside the active scope.
@@ -145,8 +164,7 @@ class Access:
         """
         if self.scope is None:
             return
-        ids = getattr(self.scope, scope_field)
-        if entity_id not in ids:
+        if not self.scope.contains(scope_field, entity_id):
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not found")
 
 
@@ -255,23 +273,53 @@ def _resolve_package_token(
     """Resolve a package token into a fully-derived PackageScope.
 
     Precomputes all bounded derivations so that query-time predicates are
-    simple ``ANY()`` / ``&&`` checks against compact tuples.
+    simple ``ANY()`` / ``&&`` checks against compact tuples. The derived
+    scope is cached (see ``scope_cache``); a hit costs one query — the
+    package row plus its item and bundle watermarks.
     """
-    from sqlalchemy import text as sa_text
+    from sqlalchemy import func
+    from app.api.modules.content.models import Bundle
+    from app.api.modules.identity_infospace_user import scope_cache
     from app.api.modules.sharing.models import Package, PackageItem
 
-    pkg = session.exec(
-        select(Package).where(
+    item_watermark = (
+        select(func.concat_ws(":", func.count(PackageItem.id), func.max(PackageItem.id)))
+        .where(PackageItem.package_id == Package.id)
+        .scalar_subquery()
+    )
+    bundle_watermark = (
+        select(func.concat_ws(
+            ":", func.count(Bundle.id), func.max(Bundle.id), func.max(Bundle.updated_at),
+        ))
+        .where(Bundle.infospace_id == Package.infospace_id)
+        .scalar_subquery()
+    )
+    row = session.exec(
+        select(Package, item_watermark, bundle_watermark).where(
             Package.token == token,
             Package.infospace_id == infospace_id,
             Package.is_active == True,
         )
     ).first()
-    if not pkg:
+    if not row:
         return None
+    pkg = row[0]
     if pkg.expires_at and datetime.now(timezone.utc) > pkg.expires_at:
         return None
 
+    key = scope_cache.cache_key(pkg, row[1], row[2])
+    scope = scope_cache.get(key)
+    if scope is None:
+        scope = _derive_package_scope(session, pkg)
+        scope_cache.put(key, scope)
+    return scope
+
+
+def _derive_package_scope(session: Session, pkg) -> PackageScope:
+    """Run every derivation for ``pkg``'s items. Uncached — see _resolve_package_token."""
+    from sqlalchemy import text as sa_text
+    from app.api.modules.sharing.models import PackageItem
+
     # ── Collect explicit grants from typed FK columns ──
     items = session.exec(
         select(PackageItem).where(PackageItem.package_id == pkg.id)
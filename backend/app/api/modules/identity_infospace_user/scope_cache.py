@@ -0,0 +1,236 @@
+"""Versioned cache of resolved package-token scopes.
+
+``_resolve_package_token`` derives a :class:`PackageScope` with a dozen
+queries (items, bundle subtree, graph→run joins, canon entities, run
+schemas, the ancestor CTE, per-item asset expansion). Public dashboards hit
+it on every request and every stream reconnect, so the derived scope is
+cached and only the package row itself is read per request.
+
+Version key (everything a derivation can be invalidated by cheaply):
+
+  - package id and its ``default_allow_download`` / ``default_allow_copy``
+  - an **item watermark** — ``count(*)`` and ``max(id)`` of its items
+  - a **bundle watermark** for the infospace — ``count(*)``, ``max(id)``,
+    ``max(updated_at)``. Tree operations stamp ``updated_at`` on every
+    bundle whose membership or parent changes.
+  - a per-package **generation** (Redis counter bumped by
+    ``invalidate_package`` from the package routes after commit)
+
+Derivations without a cheap watermark (annotations of shared runs, graph
+edges, canon entities) are bounded by ``PACKAGE_SCOPE_CACHE_TTL_SECONDS``.
+Validity (``is_active``, ``expires_at``) is never cached.
+
+Tiers:
+
+  - **local** — per-process LRU of decoded scopes, bounded by the total
+    number of ids held (``PACKAGE_SCOPE_CACHE_LOCAL_MAX_IDS``).
+  - **redis** — shared across API processes. Each id field is stored as a
+    sorted, delta-encoded uint32 array; the whole entry is zlib-compressed.
+    Dense asset ranges compress to a few bytes per thousand ids.
+
+Best-effort throughout — a Redis failure degrades to a recompute, never to
+an error.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import logging
+import struct
+import sys
+import threading
+import time
+import zlib
+from array import array
+from collections import OrderedDict
+from itertools import accumulate
+from typing import Any, Optional, Tuple
+
+from app.api.modules.identity_infospace_user.access import PackageScope
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "pkgscope:v1:"
+GENERATION_PREFIX = "pkgscope:gen:"
+
+FIELDS: Tuple[str, ...] = tuple(f.name for f in dataclasses.fields(PackageScope))
+_HEADER = struct.Struct(f"<{len(FIELDS)}I")
+
+
+# ── Encoding ─────────────────────────────────────────────────────────────────
+
+
+def encode(scope: PackageScope) -> bytes:
+    """Pack a scope as per-field delta arrays behind a length header, zlib'd."""
+    counts = []
+    body = array("I")
+    for name in FIELDS:
+        ids = getattr(scope, name)
+        counts.append(len(ids))
+        body.extend(b - a for a, b in zip((0,) + ids, ids))
+    if sys.byteorder != "little":
+        body.byteswap()
+    return zlib.compress(_HEADER.pack(*counts) + body.tobytes(), 1)
+
+
+def decode(raw: bytes) -> PackageScope:
+    payload = zlib.decompress(raw)
+    counts = _HEADER.unpack_from(payload)
+    body = array("I")
+    body.frombytes(payload[_HEADER.size:])
+    if sys.byteorder != "little":
+        body.byteswap()
+    values = {}
+    offset = 0
+    for name, count in zip(FIELDS, counts):
+        values[name] = tuple(accumulate(body[offset:offset + count]))
+        offset += count
+    return PackageScope(**values)
+
+
+def _id_count(scope: PackageScope) -> int:
+    return sum(len(getattr(scope, name)) for name in FIELDS)
+
+
+# ── Local tier ───────────────────────────────────────────────────────────────
+
+
+class LocalScopes:
+    """Thread-safe LRU of decoded scopes bounded by total ids held."""
+
+    def __init__(self, max_ids: int, ttl_seconds: float):
+        self.max_ids = max_ids
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, Tuple[float, int, PackageScope]] = OrderedDict()
+        self._ids = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[PackageScope]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            stored_at, size, scope = entry
+            if time.monotonic() - stored_at > self.ttl_seconds:
+                del self._entries[key]
+                self._ids -= size
+                return None
+            self._entries.move_to_end(key)
+            return scope
+
+    def put(self, key: str, scope: PackageScope) -> None:
+        size = _id_count(scope)
+        if size > self.max_ids:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._ids -= old[1]
+            self._entries[key] = (time.monotonic(), size, scope)
+            self._ids += size
+            while self._ids > self.max_ids and self._entries:
+                _, (_, evicted, _) = self._entries.popitem(last=False)
+                self._ids -= evicted
+
+    def discard_package(self, package_id: int) -> None:
+        prefix = f"{KEY_PREFIX}{package_id}:"
+        with self._lock:
+            for key in [k for k in self._entries if k.startswith(prefix)]:
+                self._ids -= self._entries.pop(key)[1]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._ids = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_local = LocalScopes(
+    settings.PACKAGE_SCOPE_CACHE_LOCAL_MAX_IDS,
+    settings.PACKAGE_SCOPE_CACHE_TTL_SECONDS,
+)
+
+
+# ── Redis tier ───────────────────────────────────────────────────────────────
+
+
+def _redis():
+    from app.core.redis import get_binary_redis
+    return get_binary_redis()
+
+
+def _generation(package_id: int) -> Optional[bytes]:
+    try:
+        return _redis().get(f"{GENERATION_PREFIX}{package_id}")
+    except Exception:
+        # Without the generation the watermarks still keep keys correct.
+        return None
+
+
+# ── Public API ───────────────────────────────────────────────────────────────
+
+
+def cache_key(package: Any, item_watermark: Any, bundle_watermark: Any) -> Optional[str]:
+    """Versioned key for ``package``'s derived scope, or ``None`` when disabled."""
+    if not settings.PACKAGE_SCOPE_CACHE_ENABLED:
+        return None
+    version = repr((
+        package.default_allow_download,
+        package.default_allow_copy,
+        item_watermark,
+        bundle_watermark,
+        _generation(package.id),
+    ))
+    digest = hashlib.sha256(version.encode()).hexdigest()[:32]
+    return f"{KEY_PREFIX}{package.id}:{digest}"
+
+
+def get(key: Optional[str]) -> Optional[PackageScope]:
+    if key is None:
+        return None
+    scope = _local.get(key)
+    if scope is not None:
+        return scope
+    try:
+        raw = _redis().get(key)
+    except Exception as exc:
+        logger.debug("package scope cache read failed for %s: %s", key, exc)
+        return None
+    if raw is None:
+        return None
+    try:
+        scope = decode(raw)
+    except Exception as exc:
+        logger.warning("discarding undecodable package scope %s: %s", key, exc)
+        return None
+    _local.put(key, scope)
+    return scope
+
+
+def put(key: Optional[str], scope: PackageScope) -> None:
+    if key is None:
+        return
+    _local.put(key, scope)
+    try:
+        _redis().set(key, encode(scope), ex=settings.PACKAGE_SCOPE_CACHE_TTL_SECONDS)
+    except Exception as exc:
+        logger.debug("package scope cache write failed for %s: %s", key, exc)
+
+
+def invalidate_package(package_id: Optional[int]) -> None:
+    """Make every cached scope of ``package_id`` unreachable. Call after commit."""
+    if package_id is None:
+        return
+    _local.discard_package(package_id)
+    try:
+        r = _redis()
+        pipe = r.pipeline(transaction=False)
+        pipe.incr(f"{GENERATION_PREFIX}{package_id}")
+        pipe.expire(f"{GENERATION_PREFIX}{package_id}", settings.PACKAGE_SCOPE_CACHE_TTL_SECONDS * 2)
+        pipe.execute()
+    except Exception as exc:
+        logger.debug("package scope invalidation failed for %s: %s", package_id, exc)
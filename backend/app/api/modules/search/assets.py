@@ -42,7 +42,8 @@ def _build_search_query(
     Mode dispatch:
       * ``text``   — FTS + title ILIKE via ``AssetQuery.text``
       * ``vector`` — ``AssetQuery.semantic`` (pgvector)
-      * ``hybrid`` — both; ``execute_scored_async`` merges scores
+      * ``hybrid`` — ``AssetQuery.hybrid``: FTS and ANN candidates fused by
+        reciprocal rank in one statement; either leg can contribute a hit
       * ``filter`` — no textual ranking; pure structured filters
     """
 
@@ -54,10 +55,12 @@ def _build_search_query(
         .exclude_superseded()
     )
 
-    if body.mode in ("text", "hybrid"):
+    if body.mode == "text":
         q.text(body.q, mode="fts")
-    if body.mode in ("vector", "hybrid"):
+    elif body.mode == "vector":
         q.semantic(body.q, top_k=max(body.limit, 50))
+    elif body.mode == "hybrid":
+        q.hybrid(body.q, top_k=max(body.limit, 200))
 
     if hints.kinds:
         q.kinds(hints.kinds)
@@ -932,12 +932,12 @@ class PackageBuilder:
         asset_registry: dict[str, Asset] = {}
 
         for item in package.items:
-            if item.schema_id and item.schema_id in (scope.schema_ids or ()):
+            if item.schema_id and scope.contains("schema_ids", item.schema_id):
                 schema = self.session.get(AnnotationSchema, item.schema_id)
                 if schema:
                     schema_registry.setdefault(str(schema.uuid), schema)
 
-            if item.run_id and item.run_id in (scope.run_ids or ()):
+            if item.run_id and scope.contains("run_ids", item.run_id):
                 run = self.session.get(AnnotationRun, item.run_id)
                 if run:
                     run_registry.setdefault(str(run.uuid), run)
@@ -945,12 +945,12 @@ class PackageBuilder:
                     for s in (run.target_schemas or []):
                         schema_registry.setdefault(str(s.uuid), s)
 
-            if item.bundle_id and item.bundle_id in (scope.bundle_ids or ()):
+            if item.bundle_id and scope.contains("bundle_ids", item.bundle_id):
                 bundle = self.session.get(Bundle, item.bundle_id)
                 if bundle:
                     bundle_registry.setdefault(str(bundle.uuid), bundle)
 
-            if item.asset_id and item.asset_id in (scope.asset_ids or ()):
+            if item.asset_id and scope.contains("asset_ids", item.asset_id):
                 asset = self.session.get(Asset, item.asset_id)
                 if asset:
                     asset_registry.setdefault(str(asset.uuid), asset)
@@ -8,6 +8,7 @@ from app.core.db import engine
 from sqlmodel import Session
 from app.api.modules.foundation_service_providers import resolve
 from app.core.config import settings
+from app.core.task_utils import run_async_in_celery
 
 logger = logging.getLogger(__name__)
 
@@ -34,30 +35,22 @@ def process_user_backup(self, backup_id: int, backup_options: Dict[str, Any]) ->
             user_backup_service = UserBackupService(session, storage_provider, settings)
 
             # Execute backup
-            import asyncio
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            
-            try:
-                success = loop.run_until_complete(
-                    user_backup_service.execute_user_backup(backup_id, backup_options)
-                )
-                
-                result = {
-                    "success": success,
-                    "backup_id": backup_id,
-                    "completed_at": datetime.now(timezone.utc).isoformat()
-                }
-                
-                if success:
-                    logger.info(f"User backup {backup_id} completed successfully")
-                else:
-                    logger.error(f"User backup {backup_id} failed")
-                
-                return result
-                
-            finally:
-                loop.close()
+            success = run_async_in_celery(
+                user_backup_service.execute_user_backup, backup_id, backup_options
+            )
+
+            result = {
+                "success": success,
+                "backup_id": backup_id,
+                "completed_at": datetime.now(timezone.utc).isoformat()
+            }
+
+            if success:
+                logger.info(f"User backup {backup_id} completed successfully")
+            else:
+                logger.error(f"User backup {backup_id} failed")
+
+            return result
                 
     except Exception as e:
         logger.error(f"User backup task {backup_id} failed: {e}", exc_info=True)
@@ -102,24 +95,14 @@ def cleanup_expired_user_backups(self) -> Dict[str, Any]:
             user_backup_service = UserBackupService(session, storage_provider, settings)
 
             # Execute cleanup
-            import asyncio
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            
-            try:
-                cleanup_result = loop.run_until_complete(
-                    user_backup_service.cleanup_expired_user_backups()
-                )
-                
-                logger.info(f"User backup cleanup completed: {cleanup_result}")
-                return {
-                    "success": True,
-                    "cleanup_result": cleanup_result,
-                    "completed_at": datetime.now(timezone.utc).isoformat()
-                }
-                
-            finally:
-                loop.close()
+            cleanup_result = run_async_in_celery(user_backup_service.cleanup_expired_user_backups)
+
+            logger.info(f"User backup cleanup completed: {cleanup_result}")
+            return {
+                "success": True,
+                "cleanup_result": cleanup_result,
+                "completed_at": datetime.now(timezone.utc).isoformat()
+            }
                 
     except Exception as e:
         logger.error(f"User backup cleanup failed: {e}", exc_info=True)
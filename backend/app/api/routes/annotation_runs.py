@@ -7,15 +7,11 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from fastapi.responses import StreamingResponse
 from fastapi.sse import EventSourceResponse, ServerSentEvent
 from pydantic import BaseModel, Field
-import csv
-import io
 
 from app.models import (
     AnnotationRun,
     RunStatus,
     Annotation,
-    Asset,
-    AnnotationSchema,
 )
 from app.schemas import (
     AnnotationRunRead,
@@ -28,6 +24,7 @@ from app.schemas import (
     SSEError,
 )
 from app.api.dependency_injection import (
+    AsyncSessionDep,
     SessionDep,
     get_annotation_service,
     get_package_service
@@ -38,6 +35,7 @@ from app.api.modules.identity_infospace_user.access import (
     Access, Capability, Requires,
 )
 from sqlmodel import select, func
+from app.core.db import run_sync
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 logger = logging.getLogger(__name__)
@@ -598,39 +596,50 @@ async def create_package_from_run_endpoint(
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Internal server error while creating package from run")
 
 
-from app.api.modules.sharing.csv_writers import flatten_dict as _flatten_dict
-
-
-def _collect_inline_justifications(value: Optional[Dict[str, Any]]) -> list:
-    """Walk an annotation value JSONB and pull every inline justification reasoning string.
+from app.api.modules.annotation.export import (
+    RunExport,
+    export_filename,
+    parquet_available,
+)
 
-    The structured-output pipeline injects:
-      * sibling ``{field}_justification`` blocks at the parent level for scalars,
-        objects, and primitive arrays;
-      * inline ``justification`` fields inside each item of an array<object> field;
-      * top-level ``_thinking_trace`` for provider thinking summaries.
 
-    Returns a list of ``"label:reasoning"`` strings for the CSV ``justifications`` column.
+def _prepare_run_export(
+    session,
+    access: Access,
+    run_id: int,
+    *,
+    include_descendants: bool,
+    flatten_json: bool,
+    include_metadata: bool,
+    include_justifications: bool,
+) -> tuple[AnnotationRun, RunExport]:
+    """Validate the run and fix the export's columns before streaming starts.
+
+    Everything that can fail with a proper status code (missing run, empty
+    run) happens here; once the response starts, rows are only streamed.
     """
-    if not isinstance(value, dict):
-        return []
-    out = []
-    for key, sub in value.items():
-        if not isinstance(sub, dict):
-            continue
-        if key.endswith("_justification") and sub.get("reasoning"):
-            label = key[: -len("_justification")]
-            out.append(f"{label}:{sub['reasoning']}")
-        elif key == "_thinking_trace" and sub.get("reasoning"):
-            out.append(f"_thinking_trace:{sub['reasoning']}")
-    for key, sub in value.items():
-        if isinstance(sub, list):
-            for i, item in enumerate(sub):
-                if isinstance(item, dict):
-                    j = item.get("justification")
-                    if isinstance(j, dict) and j.get("reasoning"):
-                        out.append(f"{key}[{i}]:{j['reasoning']}")
-    return out
+    access.require_in_scope("run_ids", run_id)
+    run = session.get(AnnotationRun, run_id)
+    if not run:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Run not found")
+    if run.infospace_id != access.infospace_id:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Run not found in this infospace")
+
+    run_ids = _resolve_family(session, access.infospace_id, run_id) if include_descendants else [run_id]
+    has_rows = session.exec(
+        select(Annotation.id).where(Annotation.run_id.in_(run_ids)).limit(1)
+    ).first()
+    if has_rows is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="No annotations found for this run")
+
+    export = RunExport.prepare(
+        session,
+        run_ids,
+        flatten_json=flatten_json,
+        include_metadata=include_metadata,
+        include_justifications=include_justifications,
+    )
+    return run, export
 
 
 @router.get("/{run_id}/export/csv")
@@ -639,7 +648,6 @@ def export_run_annotations_csv(
     access: Access = Requires(scope=None),
     run_id: int,
     session: SessionDep,
-    annotation_service: AnnotationService = Depends(get_annotation_service),
     flatten_json: bool = Query(True, description="Flatten nested JSON fields into dot-notation columns"),
     include_metadata: bool = Query(True, description="Include asset and schema metadata"),
     include_justifications: bool = Query(False, description="Include justification text (adds columns)"),
@@ -661,140 +669,25 @@ def export_run_annotations_csv(
     - value.items[0].property
 
     Perfect for loading into pandas, Excel, or ML tools like lazypredict.
+    Rows are streamed from a server-side cursor as they are encoded, so
+    memory stays bounded regardless of run size (no Content-Length).
     """
     logger.info(f"Route: Exporting run {run_id} annotations as CSV (flatten={flatten_json}, include_metadata={include_metadata})")
-    access.require_in_scope("run_ids", run_id)
-
     try:
-        infospace_id = access.infospace_id
-        # Get the run
-        run = session.get(AnnotationRun, run_id)
-        if not run:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Run not found"
-            )
-        
-        # Verify run belongs to infospace
-        if run.infospace_id != infospace_id:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Run not found in this infospace"
-            )
-        
-        # Get all annotations for this run (no pagination)
-        annotations = annotation_service.get_annotations_for_run(
-            run_id=run_id,
-            user_id=access.user_id,
-            infospace_id=infospace_id,
-            skip=0,
-            limit=1_000_000,  # Get all annotations
+        run, export = _prepare_run_export(
+            session, access, run_id,
             include_descendants=include_descendants,
+            flatten_json=flatten_json,
+            include_metadata=include_metadata,
+            include_justifications=include_justifications,
         )
-        
-        if not annotations:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="No annotations found for this run"
-            )
-        
-        logger.info(f"Route: Found {len(annotations)} annotations to export")
-        
-        # Build CSV rows
-        rows = []
-        for ann in annotations:
-            row = {
-                'annotation_id': ann.id,
-                'annotation_uuid': ann.uuid,
-                'asset_id': ann.asset_id,
-                'schema_id': ann.schema_id,
-                'run_id': ann.run_id,
-                'status': ann.status.value,
-                'timestamp': ann.timestamp.isoformat() if ann.timestamp else None,
-                'event_timestamp': ann.event_timestamp.isoformat() if ann.event_timestamp else None,
-            }
-            
-            # Add metadata if requested
-            if include_metadata:
-                # Get asset info
-                asset = session.get(Asset, ann.asset_id)
-                if asset:
-                    row['asset_title'] = asset.title
-                    row['asset_kind'] = asset.kind.value
-                    row['asset_uuid'] = asset.uuid
-                    row['source_id'] = asset.source_id
-                    row['asset_created_at'] = asset.created_at.isoformat() if asset.created_at else None
-                    
-                    # Add parent info if available
-                    if asset.parent_asset_id:
-                        row['parent_asset_id'] = asset.parent_asset_id
-                        row['part_index'] = asset.part_index
-                
-                # Get schema info
-                schema = session.get(AnnotationSchema, ann.schema_id)
-                if schema:
-                    row['schema_name'] = schema.name
-                    row['schema_version'] = schema.version
-            
-            # Add justifications if requested — read inline from the value JSONB.
-            if include_justifications:
-                texts = _collect_inline_justifications(ann.value)
-                if texts:
-                    row['justifications'] = " | ".join(texts)
-            
-            # Handle annotation value
-            if flatten_json and ann.value:
-                # Flatten nested JSON into dot-notation columns
-                flattened = _flatten_dict(ann.value, parent_key='value')
-                row.update(flattened)
-            else:
-                # Just stringify the JSON
-                row['value_json'] = str(ann.value)
-            
-            rows.append(row)
-        
-        if not rows:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="No data to export"
-            )
-        
-        # Collect all unique fieldnames from all rows (annotations may have different fields)
-        all_fieldnames = set()
-        for row in rows:
-            all_fieldnames.update(row.keys())
-        
-        # Sort fieldnames for consistent output (metadata first, then value fields)
-        metadata_fields = [f for f in all_fieldnames if not f.startswith('value.')]
-        value_fields = sorted([f for f in all_fieldnames if f.startswith('value.')])
-        fieldnames = sorted(metadata_fields) + value_fields
-        
-        # Create CSV in memory
-        output = io.StringIO()
-        writer = csv.DictWriter(output, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(rows)
-        
-        # Get CSV content as bytes
-        output.seek(0)
-        csv_content = output.getvalue().encode('utf-8')
-        
-        # Generate filename
-        safe_run_name = run.name.replace(' ', '_').replace('/', '_')[:50]
-        filename = f"annotations_run_{run_id}_{safe_run_name}.csv"
-        
-        logger.info(f"Route: Exporting {len(rows)} rows to {filename}")
-        
-        # Return as downloadable file
+        filename = export_filename(run.name, run_id, ".csv")
+        logger.info(f"Route: Streaming {len(export.columns)} columns to {filename}")
         return StreamingResponse(
-            io.BytesIO(csv_content),
+            export.iter_csv(),
             media_type="text/csv",
-            headers={
-                "Content-Disposition": f"attachment; filename={filename}",
-                "Content-Length": str(len(csv_content))
-            }
+            headers={"Content-Disposition": f"attachment; filename={filename}"},
         )
-    
     except HTTPException as he:
         raise he
     except Exception as e:
@@ -805,6 +698,54 @@ def export_run_annotations_csv(
         )
 
 
+@router.get("/{run_id}/export/parquet")
+def export_run_annotations_parquet(
+    *,
+    access: Access = Requires(scope=None),
+    run_id: int,
+    session: SessionDep,
+    include_metadata: bool = Query(True, description="Include asset and schema metadata"),
+    include_justifications: bool = Query(False, description="Include justification text (adds columns)"),
+    include_descendants: bool = Query(True, description="Include annotations from extension (child) runs"),
+) -> StreamingResponse:
+    """
+    Export annotation run results as Parquet.
+
+    Same columns as the flattened CSV export, but typed: ids and timestamps
+    are native, and ``value.*`` leaves declared ``integer`` / ``number`` /
+    ``boolean`` in the schema's output contract become typed columns. One
+    row group is written and streamed per cursor batch.
+    """
+    logger.info(f"Route: Exporting run {run_id} annotations as Parquet")
+    if not parquet_available():
+        raise HTTPException(
+            status_code=status.HTTP_501_NOT_IMPLEMENTED,
+            detail="Parquet export requires pyarrow on the server",
+        )
+    try:
+        run, export = _prepare_run_export(
+            session, access, run_id,
+            include_descendants=include_descendants,
+            flatten_json=True,
+            include_metadata=include_metadata,
+            include_justifications=include_justifications,
+        )
+        filename = export_filename(run.name, run_id, ".parquet")
+        return StreamingResponse(
+            export.iter_parquet(),
+            media_type="application/vnd.apache.parquet",
+            headers={"Content-Disposition": f"attachment; filename={filename}"},
+        )
+    except HTTPException as he:
+        raise he
+    except Exception as e:
+        logger.exception(f"Route: Error exporting run {run_id} to Parquet: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error generating Parquet export: {str(e)}"
+        )
+
+
 # ─── Composable /view endpoint ───
 # One endpoint, multiple materializations. The caller declares what it
 # needs (rows, aggregate, graph — any combination) and the backend
@@ -960,30 +901,31 @@ def _build_formula_query(
     )
 
 
-def _build_view_phases(session, access, run_id: int, body: "ViewRequest") -> dict:
-    """Synchronous materialization of every requested view phase.
+async def _build_view_phases(session, access, run_id: int, body: "ViewRequest") -> dict:
+    """Materialization of every requested view phase.
 
     Shape: one :class:`FormulaQuery` is constructed per request; each
     phase packer method reuses the same configured engine state. No
     Formula handling duplicated per phase, no body-level filter
-    plumbing.
+    plumbing. Sync engine work runs through ``run_sync``.
     """
-    fq = _build_formula_query(session, access, run_id, body)
+    fq = await run_sync(session, _build_formula_query, session, access, run_id, body)
     result: dict[str, BaseModel] = {}
 
     if body.rows is not None:
-        result["rows"] = fq.rows_view(
+        result["rows"] = await run_sync(
+            session, fq.rows_view,
             fields=body.fields,
             cursor=body.rows.cursor,
             limit=body.rows.limit,
         )
 
     if body.aggregate is not None:
-        result["aggregate"] = fq.aggregate_view()
+        result["aggregate"] = await run_sync(session, fq.aggregate_view)
 
     if body.graph is not None:
         gp = body.graph
-        gr = fq.graph_view(
+        gr = await fq.graph_view_async(
             triplet_field=gp.triplet_field,
             dedup=gp.dedup,
             top_n_nodes=gp.top_n_nodes,
@@ -1017,7 +959,7 @@ async def view_run(
     *,
     run_id: int,
     access: Access = Requires(scope=None),
-    session: SessionDep,
+    db: AsyncSessionDep,
     body: ViewRequest = Depends(_validated_view_body),
 ):
     """Composable analysis view for a run (JSON).
@@ -1026,7 +968,7 @@ async def view_run(
     in the request body. Returns all requested phases as a single JSON
     object. For a progressive SSE feed call ``POST /view/stream``.
     """
-    result = await asyncio.to_thread(_build_view_phases, session, access, run_id, body)
+    result = await _build_view_phases(db.sync_session, access, run_id, body)
     return {k: v.model_dump() for k, v in result.items()}
 
 
@@ -1035,7 +977,7 @@ async def view_run_stream(
     *,
     run_id: int,
     access: Access = Requires(scope=None),
-    session: SessionDep,
+    db: AsyncSessionDep,
     body: ViewRequest = Depends(_validated_view_body),
 ):
     """Progressive SSE stream of the composable analysis view.
@@ -1049,19 +991,19 @@ async def view_run_stream(
     - ``graph`` — final single event carrying the full (bounded) graph, so
       clients that only listen for ``graph`` still get a correct answer
 
-    Rows and aggregate run inside ``to_thread`` because the underlying
-    ``AnnotationQuery`` methods do sync DB I/O. Graph iterates in pure
-    async over ``graph_stream`` — its sync session reads happen inline but
-    ``async for`` yields control on each chunk, so keepalives and peer
-    backpressure work correctly.
+    The session is on the async engine. Rows and aggregate are sync
+    ``AnnotationQuery`` work run through ``run_sync``; graph iterates
+    ``graph_stream``, whose window reads do the same, so neither holds a
+    thread or blocks the loop while Postgres works.
     """
+    session = db.sync_session
     try:
-        fq = _build_formula_query(session, access, run_id, body)
+        fq = await run_sync(session, _build_formula_query, session, access, run_id, body)
 
         # rows — sync, one event
         if body.rows is not None:
-            rows_payload = await asyncio.to_thread(
-                fq.rows_view,
+            rows_payload = await run_sync(
+                session, fq.rows_view,
                 fields=body.fields,
                 cursor=body.rows.cursor,
                 limit=body.rows.limit,
@@ -1070,7 +1012,7 @@ async def view_run_stream(
 
         # aggregate — sync, one event (OutputRelation wire shape)
         if body.aggregate is not None:
-            rel = await asyncio.to_thread(fq.aggregate_view)
+            rel = await run_sync(session, fq.aggregate_view)
             yield ServerSentEvent(data=rel.model_dump(), event="aggregate")
 
         # graph — progressive chunks via graph_stream, then a final full payload.
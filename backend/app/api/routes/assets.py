@@ -33,6 +33,7 @@ from app.core.config import settings
 from sqlalchemy import func
 from sqlmodel import select, delete
 from app.core.celery_app import celery
+from app.api.modules.annotation import relation_cache
 from app.api.modules.content.services import BundleService
 from app.api.modules.content.ingest import ingest
 from app.core.db import engine
@@ -1148,7 +1149,9 @@ def delete_asset(
             break
         for child in batch:
             session.exec(delete(AssetChunk).where(AssetChunk.asset_id == child.id))
-            session.exec(delete(Annotation).where(Annotation.asset_id == child.id))
+            relation_cache.mark(session, session.exec(
+                delete(Annotation).where(Annotation.asset_id == child.id).returning(Annotation.run_id)
+            ).scalars().all())
             session.delete(child)
             num_children += 1
         session.flush()
@@ -1158,9 +1161,9 @@ def delete_asset(
     session.exec(
         delete(AssetChunk).where(AssetChunk.asset_id == asset_id)
     )
-    session.exec(
-        delete(Annotation).where(Annotation.asset_id == asset_id)
-    )
+    relation_cache.mark(session, session.exec(
+        delete(Annotation).where(Annotation.asset_id == asset_id).returning(Annotation.run_id)
+    ).scalars().all())
     
     # Finally delete the parent asset
     session.delete(asset)
@@ -463,7 +463,9 @@ async def find_entity_duplicates(
         return await provider.embed_texts(texts, sel.model_name)
 
     try:
-        pairs = await find_duplicates(request.items, embed, request.threshold)
+        pairs = await find_duplicates(
+            request.items, embed, request.threshold, max_pairs=request.max_pairs,
+        )
     except ValueError as exc:
         raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(exc))
 
@@ -156,6 +156,8 @@ def update_infospace(
     # Diff enrichment_config at per-enricher granularity and clear only those blocks.
     new_config = _config_dict(infospace.enrichment_config)
     if old_config != new_config:
+        from app.api.modules.foundation_service_providers import invalidate_provider_pool
+        invalidate_provider_pool(infospace_id=access.infospace_id)
         from app.core.tasks import clear_structural_blocks
         changed_enrichers = _changed_enrichers(old_config, new_config)
         if changed_enrichers:
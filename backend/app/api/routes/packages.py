@@ -28,6 +28,7 @@ from app.api import dependency_injection
 from app.api.modules.identity_infospace_user.access import (
     Access, Capability, Requires, _resolve_package_token,
 )
+from app.api.modules.identity_infospace_user.scope_cache import invalidate_package
 from app.api.modules.sharing.models import Package, PackageItem, PackageVisibility
 
 logger = logging.getLogger(__name__)
@@ -359,6 +360,7 @@ def update_package(
 
     db.add(pkg)
     db.commit()
+    invalidate_package(pkg.id)
     db.refresh(pkg)
     return _enrich_package(db, pkg)
 
@@ -381,6 +383,7 @@ def delete_package(
 
     db.delete(pkg)  # Cascade deletes PackageItems
     db.commit()
+    invalidate_package(package_id)
 
 
 # ─── Package items ───
@@ -421,6 +424,7 @@ def add_package_item(
     db.flush()
     _expand_derived_items(db, item)
     db.commit()
+    invalidate_package(package_id)
     db.refresh(item)
     return item
 
@@ -449,6 +453,7 @@ def remove_package_item(
 
     db.delete(item)
     db.commit()
+    invalidate_package(package_id)
 
 
 # ─── Discovery (no infospace_id required) ───
@@ -654,7 +659,7 @@ async def stream_package_asset(
         raise HTTPException(status_code=404, detail="Not found")
 
     # Visibility check
-    if asset_id not in scope.asset_ids:
+    if not scope.contains("asset_ids", asset_id):
         # Also check bundle-derived assets
         bundle_asset = db.execute(
             text("SELECT 1 FROM asset WHERE id = :aid AND bundle_ids && CAST(:bids AS int[])"),
@@ -664,7 +669,7 @@ async def stream_package_asset(
             raise HTTPException(status_code=404, detail="Not found")
 
     # Permission check
-    if asset_id not in scope.downloadable_asset_ids:
+    if not scope.contains("downloadable_asset_ids", asset_id):
         raise HTTPException(status_code=403, detail="Download not allowed for this item")
 
     asset = db.get(Asset, asset_id)
@@ -704,7 +709,7 @@ async def download_package_asset(
         raise HTTPException(status_code=404, detail="Not found")
 
     # Visibility check — asset must be in scope (direct, bundle, or run-derived)
-    if asset_id not in scope.asset_ids:
+    if not scope.contains("asset_ids", asset_id):
         bundle_asset = db.execute(
             text("SELECT 1 FROM asset WHERE id = :aid AND bundle_ids && CAST(:bids AS int[])"),
             {"aid": asset_id, "bids": list(scope.bundle_ids) if scope.bundle_ids else []},
@@ -713,7 +718,7 @@ async def download_package_asset(
             raise HTTPException(status_code=404, detail="Not found")
 
     # Permission check
-    if asset_id not in scope.downloadable_asset_ids:
+    if not scope.contains("downloadable_asset_ids", asset_id):
         raise HTTPException(status_code=403, detail="Download not allowed for this item")
 
     asset = db.get(Asset, asset_id)
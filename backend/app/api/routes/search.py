@@ -14,8 +14,9 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.sse import EventSourceResponse, ServerSentEvent
 from pydantic import BaseModel
 from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-from app.api.dependency_injection import get_current_user, get_db, IngestionContextFactoryDep
+from app.api.dependency_injection import get_async_db, get_current_user, get_db, IngestionContextFactoryDep
 from app.api.modules.content.schemas import AssetSearch, AssetSearchRequest
 from app.api.modules.identity_infospace_user.access import (
     Access, Capability, Requires, resolve_access,
@@ -256,14 +257,14 @@ async def asset_search(
     infospace_id: int,
     body: AssetSearchRequest,
     access: Access = Requires(scope=None),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """Asset search — JSON envelope. Returns a full ``AssetSearch``.
 
     For a progressive ``StreamEvent`` feed, call
     ``POST /search/infospaces/{iid}/assets/stream`` with the same body.
     """
-    return await search_assets(db, infospace_id, body, access=access)
+    return await search_assets(db.sync_session, infospace_id, body, access=access)
 
 
 @router.post(
@@ -275,7 +276,7 @@ async def asset_search_stream(
     infospace_id: int,
     body: AssetSearchRequest,
     access: Access = Requires(scope=None),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """Asset search — native SSE generator.
 
@@ -283,5 +284,5 @@ async def asset_search_stream(
     section(role='grouped')* → done``. Each event name matches the discriminator
     in ``StreamEvent``.
     """
-    async for ev in stream_search_assets(db, infospace_id, body, access=access):
+    async for ev in stream_search_assets(db.sync_session, infospace_id, body, access=access):
         yield ServerSentEvent(data=ev, event=ev.name)
@@ -76,16 +76,15 @@ async def subscribe_stream(
     SSE frames into bulk delivery and defeats streaming.
     """
     key = stream_key(access.infospace_id, topic, resource_id, param_dict)
+    hub = get_hub()
 
     if last_event_id and last_event_id != "0":
-        from app.core.stream import _incr
-        _incr("stream:reconnects")
+        hub.incr("stream:reconnects")
 
     start_id = last_event_id or "$"
     if start_id == "0":
         start_id = "0"
 
-    hub = get_hub()
     q = await hub.subscribe(key, last_id=start_id)
     loop = asyncio.get_running_loop()
     deadline = loop.time() + MAX_CONNECTION_SECONDS
@@ -9,7 +9,8 @@ Three families:
 * ``POST /tree/delete(-preview)`` — cascaded deletion.
 
 Each surface answers JSON by default and SSE when the client advertises
-``Accept: text/event-stream``. Shapes come from ``modules/content/schemas``;
+``Accept: text/event-stream``. Listing routes read on the async engine
+(``get_async_db``); DB work runs through ``core.db.run_sync``. Shapes come from ``modules/content/schemas``;
 event generation comes from ``modules/content/views``. The route is thin.
 """
 
@@ -24,6 +25,7 @@ from fastapi.sse import EventSourceResponse, ServerSentEvent
 from pydantic import BaseModel, Field
 from sqlalchemy import func, text
 from sqlmodel import Session, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.api import dependency_injection
 from app.api.modules.content.models import Asset, AssetKind, Bundle
@@ -50,6 +52,7 @@ from app.api.modules.identity_infospace_user.access import (
     Access, Capability, DeleteAccess, Requires, ViewAccess,
 )
 from app.api.tree_renderer import parse_tree_node_id, parse_vfolder_node_id
+from app.core.db import run_sync
 from app.core.tree import ROOT, delete as tree_delete
 from app.schemas import AssetRead, Message
 
@@ -80,7 +83,7 @@ async def get_infospace_tree(
     limit: int = Query(100, ge=1, le=500),
     cursor: Optional[str] = Query(None),
     access: Access = ViewAccess,
-    db: Session = dependency_injection.Depends(dependency_injection.get_db),
+    db: AsyncSession = dependency_injection.Depends(dependency_injection.get_async_db),
 ):
     """Root-level tree: flat bundle nav + top-level assets (JSON envelope).
 
@@ -89,7 +92,7 @@ async def get_infospace_tree(
     rebuilds hierarchy from ``parent_id`` in one O(n) pass.
     """
     scope = access.scope
-    query = _root_query(db, infospace_id, scope, limit=limit, cursor=cursor)
+    query = _root_query(db.sync_session, infospace_id, scope, limit=limit, cursor=cursor)
     return await collect_tree(query, access_scope=scope)
 
 
@@ -100,11 +103,11 @@ async def get_infospace_tree_stream(
     limit: int = Query(100, ge=1, le=500),
     cursor: Optional[str] = Query(None),
     access: Access = ViewAccess,
-    db: Session = dependency_injection.Depends(dependency_injection.get_db),
+    db: AsyncSession = dependency_injection.Depends(dependency_injection.get_async_db),
 ):
     """Native SSE stream of the root tree."""
     scope = access.scope
-    query = _root_query(db, infospace_id, scope, limit=limit, cursor=cursor)
+    query = _root_query(db.sync_session, infospace_id, scope, limit=limit, cursor=cursor)
     async for ev in render_tree(query, access_scope=scope):
         yield ServerSentEvent(data=ev, event=ev.name)
 
@@ -131,7 +134,7 @@ def _children_query(
         bundle = db.get(Bundle, parent_numeric_id)
         if not bundle or bundle.infospace_id != infospace_id:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Bundle not found")
-        if scope and scope.bundle_ids and bundle.id not in scope.bundle_ids:
+        if scope and scope.bundle_ids and not scope.contains("bundle_ids", bundle.id):
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not found")
         query = (
             AssetQuery(db, infospace_id)
@@ -168,7 +171,7 @@ def _children_query(
         bundle = db.get(Bundle, bundle_id)
         if not bundle or bundle.infospace_id != infospace_id:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Bundle not found")
-        if scope and scope.bundle_ids and bundle.id not in scope.bundle_ids:
+        if scope and scope.bundle_ids and not scope.contains("bundle_ids", bundle.id):
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not found")
         return ("vfolder", None, bundle, path_prefix)
 
@@ -183,7 +186,7 @@ async def get_tree_children(
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=500),
     access: Access = ViewAccess,
-    db: Session = dependency_injection.Depends(dependency_injection.get_db),
+    db: AsyncSession = dependency_injection.Depends(dependency_injection.get_async_db),
 ):
     """Lazy children for a tree node (JSON envelope).
 
@@ -195,7 +198,10 @@ async def get_tree_children(
     For a progressive SSE stream, call ``GET /tree/children/stream``.
     """
     scope = access.scope
-    parent_type, query, bundle, path_prefix = _children_query(db, infospace_id, parent_id, skip, limit, access)
+    session = db.sync_session
+    parent_type, query, bundle, path_prefix = await run_sync(
+        session, _children_query, session, infospace_id, parent_id, skip, limit, access,
+    )
 
     if parent_type in ("bundle", "asset"):
         assert query is not None
@@ -203,8 +209,8 @@ async def get_tree_children(
 
     # vfolder: manually assemble envelope (mixed folder + asset nodes)
     assert bundle is not None and path_prefix is not None
-    nav = _build_nav(db, infospace_id, scope)
-    nodes, total = _vfolder_children_nodes(db, bundle, path_prefix, skip, limit)
+    nav = await run_sync(session, _build_nav, session, infospace_id, scope)
+    nodes, total = await run_sync(session, _vfolder_children_nodes, session, bundle, path_prefix, skip, limit)
     section = ListingSection[AssetNode](
         at_parent=parent_id,
         items=nodes,
@@ -222,11 +228,14 @@ async def get_tree_children_stream(
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=500),
     access: Access = ViewAccess,
-    db: Session = dependency_injection.Depends(dependency_injection.get_db),
+    db: AsyncSession = dependency_injection.Depends(dependency_injection.get_async_db),
 ):
     """Native SSE stream of tree children."""
     scope = access.scope
-    parent_type, query, bundle, path_prefix = _children_query(db, infospace_id, parent_id, skip, limit, access)
+    session = db.sync_session
+    parent_type, query, bundle, path_prefix = await run_sync(
+        session, _children_query, session, infospace_id, parent_id, skip, limit, access,
+    )
 
     if parent_type in ("bundle", "asset"):
         assert query is not None
@@ -239,8 +248,8 @@ async def get_tree_children_stream(
         CountEvent, DoneEvent, NavEvent, SectionEvent, SkeletonEvent,
     )
     assert bundle is not None and path_prefix is not None
-    nav = _build_nav(db, infospace_id, scope)
-    nodes, total = _vfolder_children_nodes(db, bundle, path_prefix, skip, limit)
+    nav = await run_sync(session, _build_nav, session, infospace_id, scope)
+    nodes, total = await run_sync(session, _vfolder_children_nodes, session, bundle, path_prefix, skip, limit)
     section = ListingSection[AssetNode](
         at_parent=parent_id,
         items=nodes,
@@ -375,7 +384,7 @@ def _feed_query(
         bundle = db.get(Bundle, bundle_id)
         if not bundle or bundle.infospace_id != infospace_id:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Bundle not found")
-        if scope and scope.bundle_ids and bundle_id not in scope.bundle_ids:
+        if scope and scope.bundle_ids and not scope.contains("bundle_ids", bundle_id):
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not found")
         query.bundle(bundle_id)
     if path_filter:
@@ -409,11 +418,12 @@ async def get_feed_assets(
     path_filter: Optional[str] = Query(None),
     cursor: Optional[str] = Query(None),
     access: Access = ViewAccess,
-    db: Session = dependency_injection.Depends(dependency_injection.get_db),
+    db: AsyncSession = dependency_injection.Depends(dependency_injection.get_async_db),
 ):
     """Flat feed of recent assets (JSON envelope)."""
-    query = _feed_query(
-        db, infospace_id, access,
+    query = await run_sync(
+        db.sync_session, _feed_query,
+        db.sync_session, infospace_id, access,
         skip=skip, limit=limit, kinds=kinds, sort_by=sort_by,
         sort_order=sort_order, bundle_id=bundle_id, path_filter=path_filter,
         cursor=cursor,
@@ -434,11 +444,12 @@ async def get_feed_assets_stream(
     path_filter: Optional[str] = Query(None),
     cursor: Optional[str] = Query(None),
     access: Access = ViewAccess,
-    db: Session = dependency_injection.Depends(dependency_injection.get_db),
+    db: AsyncSession = dependency_injection.Depends(dependency_injection.get_async_db),
 ):
     """Native SSE stream of the recent-assets feed."""
-    query = _feed_query(
-        db, infospace_id, access,
+    query = await run_sync(
+        db.sync_session, _feed_query,
+        db.sync_session, infospace_id, access,
         skip=skip, limit=limit, kinds=kinds, sort_by=sort_by,
         sort_order=sort_order, bundle_id=bundle_id, path_filter=path_filter,
         cursor=cursor,
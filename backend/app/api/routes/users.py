@@ -149,6 +149,8 @@ def update_user_me(
     session.refresh(current_user)
 
     if "provider_defaults" in user_data:
+        from app.api.modules.foundation_service_providers import invalidate_provider_pool
+        invalidate_provider_pool(owner_id=current_user.id)
         new_defaults = _defaults_dict(current_user.provider_defaults)
         changed_caps = _diff_default_capabilities(old_defaults, new_defaults)
         if changed_caps:
@@ -266,6 +268,9 @@ def save_credentials(
     session.add(current_user)
     session.commit()
 
+    from app.api.modules.foundation_service_providers import invalidate_provider_pool
+    invalidate_provider_pool(owner_id=current_user.id)
+
     if added_providers:
         from app.core.tasks import capabilities_served_by_provider
         caps: set[str] = set()
@@ -320,6 +325,9 @@ def delete_credential(
     current_user.encrypted_credentials = encrypt_credentials(stored)
     session.add(current_user)
     session.commit()
+
+    from app.api.modules.foundation_service_providers import invalidate_provider_pool
+    invalidate_provider_pool(owner_id=current_user.id)
     
     return Message(message=f"Credential for {provider_id} deleted")
 
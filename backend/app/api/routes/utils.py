@@ -1,6 +1,5 @@
 from fastapi import APIRouter, Depends, UploadFile, File, HTTPException, status
 from pydantic.networks import EmailStr
-import fitz
 from io import BytesIO
 from typing import Dict, Any, Optional, List
 import requests
@@ -107,6 +106,8 @@ async def extract_pdf_text(
         return {"error": "Only PDF files are supported"}
     
     try:
+        import fitz
+
         contents = await file.read()
         text = ""
         with fitz.open(stream=contents, filetype="pdf") as doc:
@@ -125,6 +126,8 @@ async def extract_pdf_metadata(
         raise HTTPException(status_code=400, detail="Only PDF files are supported")
     
     try:
+        import fitz
+
         contents = await file.read()
         with fitz.open(stream=contents, filetype="pdf") as doc:
             # Extract metadata
@@ -35,6 +35,29 @@ CELERY_TASK_QUEUES = (
     Queue('external_api'),
 )
 
+# Per-queue import profile. Every worker imports the full task module list
+# below (the dispatcher and in-process event fan-out need every descriptor
+# and subscriber registered), but those modules keep heavy dependencies
+# lazy: provider SDKs load on first resolve(), PyMuPDF / feedparser on first
+# use. At process start a worker preloads only the stacks for the queues it
+# consumes (-Q), so an `embedding` worker never loads PDF or LLM SDK code.
+# A worker without -Q consumes every queue and preloads everything.
+WORKER_PRELOAD_MODULES = {
+    'processing': (
+        'fitz',
+        'feedparser',
+    ),
+    'external_api': (
+        'fitz',  # OCR renders PDF pages
+    ),
+}
+WORKER_PRELOAD_CAPABILITIES = {
+    'processing': ('storage', 'scraping'),
+    'llm': ('language',),
+    'embedding': ('embedding',),
+    'external_api': ('ocr', 'geocoding'),
+}
+
 # Celery configuration
 celery.conf.update(
     broker_url=redis_url,
@@ -82,13 +105,17 @@ celery.conf.update(
         'app.api.modules.content.services.poll_handlers.search_poll_handler',
         'app.api.modules.content.services.poll_handlers.inbox_poll_handler',
     ),
-    # Beat schedule — only dispatch_tasks + user_backup entries.
+    # Beat schedule — dispatch_tasks, dispatch_wakeups + user_backup entries.
     # All @task schedule params are handled by dispatch_tasks internally.
     beat_schedule={
         'dispatch-tasks': {
             'task': 'dispatch_tasks',
             'schedule': settings.DISPATCH_REACTIVE_WORK_INTERVAL_SECONDS,
         },
+        'dispatch-wakeups': {
+            'task': 'dispatch_wakeups',
+            'schedule': settings.DISPATCH_WAKEUP_INTERVAL_SECONDS,
+        },
         'cleanup-expired-user-backups': {
             'task': 'cleanup_expired_user_backups',
             'schedule': 86400.0,
@@ -101,6 +128,20 @@ celery.conf.update(
     }
 )
 
+# Session listeners that publish cache invalidations on commit. worker_init
+# runs in the parent before the pool forks, so every pool type inherits them.
+from celery.signals import worker_init
+
+
+@worker_init.connect
+def install_session_listeners(**kwargs):
+    from app.api.modules.annotation import relation_cache
+    from app.api.modules.content import counts
+
+    relation_cache.install_listeners()
+    counts.install_listeners()
+
+
 # Fork safety: prefork workers inherit parent's connection pool; dispose in each child
 from celery.signals import worker_process_init
 
@@ -143,6 +184,58 @@ def reset_db_pool_on_fork(**kwargs):
         logger.warning("Could not log registered tasks: %s", e)
 
 
+def _consumed_queues() -> list[str]:
+    """Queues this worker consumes (-Q), or all declared queues."""
+    try:
+        return sorted(celery.amqp.queues.consume_from)
+    except Exception:
+        return [q.name for q in CELERY_TASK_QUEUES]
+
+
+@worker_process_init.connect
+def preload_queue_stacks(**kwargs):
+    import importlib
+
+    from app.api.modules.foundation_service_providers.registry import preload_implementations
+
+    queues = _consumed_queues()
+    modules = sorted({m for q in queues for m in WORKER_PRELOAD_MODULES.get(q, ())})
+    capabilities = sorted({c for q in queues for c in WORKER_PRELOAD_CAPABILITIES.get(q, ())})
+
+    started = time.perf_counter()
+    for name in modules:
+        try:
+            importlib.import_module(name)
+        except ImportError as e:
+            logger.warning("Worker preload skipped %s: %s", name, e)
+    for capability in capabilities:
+        modules.extend(preload_implementations(capability))
+    logger.info(
+        "Worker preload for queues %s: %d modules in %.0f ms",
+        ",".join(queues), len(modules), (time.perf_counter() - started) * 1000,
+    )
+
+
+# One event loop per worker process for async task bodies (core/worker_loop):
+# async clients and pooled providers outlive individual tasks.
+from celery.signals import worker_process_shutdown, worker_shutdown
+
+
+@worker_process_init.connect
+def start_worker_loop(**kwargs):
+    from app.core import worker_loop
+
+    worker_loop.start()
+
+
+@worker_process_shutdown.connect
+@worker_shutdown.connect
+def stop_worker_loop(**kwargs):
+    from app.core import worker_loop
+
+    worker_loop.stop()
+
+
 # Task duration logging for observability
 _task_start_times: dict[str, float] = {}
 
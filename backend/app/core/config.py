@@ -157,11 +157,22 @@ class AppSettings(BaseSettings):
     DB_POOL_SIZE: int = Field(default=10, env="DB_POOL_SIZE")
     DB_MAX_OVERFLOW: int = Field(default=20, env="DB_MAX_OVERFLOW")
     DB_POOL_PRE_PING: bool = Field(default=True, env="DB_POOL_PRE_PING")
+    # Async engine (core.db.async_engine) for read endpoints; its own pool, sized separately
+    DB_ASYNC_POOL_SIZE: int = Field(default=20, env="DB_ASYNC_POOL_SIZE")
+    DB_ASYNC_MAX_OVERFLOW: int = Field(default=20, env="DB_ASYNC_MAX_OVERFLOW")
 
     # --- Upload / content limits (security) ---
     MAX_UPLOAD_SIZE_BYTES: int = Field(default=1024 * 1024 * 1024, env="MAX_UPLOAD_SIZE_BYTES")  # 1GB default
     # PDF processing: max pages per document (0 = no limit, for 400GB+ bulk deployments)
     PDF_MAX_PAGES: int = Field(default=0, env="PDF_MAX_PAGES", description="Max pages to process per PDF; 0 = no limit")
+    # Page-range extraction processes per worker process; 0 = extract in-process
+    PDF_EXTRACT_WORKERS: int = Field(default=2, env="PDF_EXTRACT_WORKERS")
+    # PDFs shorter than this are extracted in-process (pool round trips cost more than they save)
+    PDF_PARALLEL_MIN_PAGES: int = Field(default=64, env="PDF_PARALLEL_MIN_PAGES")
+    # CSV/Excel parent text_content (header + row lines) is capped at this many chars; 0 = no cap
+    TABULAR_SUMMARY_MAX_CHARS: int = Field(default=1_000_000, env="TABULAR_SUMMARY_MAX_CHARS")
+    # Claimed assets process_pending works on at once
+    PROCESSING_ASSET_CONCURRENCY: int = Field(default=4, env="PROCESSING_ASSET_CONCURRENCY")
     # process_content Celery rate limit (e.g. "10/s", "100/m"); empty = no limit (prevents Redis queue flooding at import scale)
     PROCESS_CONTENT_RATE_LIMIT: str = Field(default="10/s", env="PROCESS_CONTENT_RATE_LIMIT")
     # Enrichers to dispatch: comma-separated names, "*" for all, empty = none.
@@ -169,6 +180,10 @@ class AppSettings(BaseSettings):
     ENABLED_ENRICHERS: str = Field(default="", env="ENABLED_ENRICHERS")
     # Beat interval (seconds) for dispatch_tasks. Default 120 (2 min).
     DISPATCH_REACTIVE_WORK_INTERVAL_SECONDS: int = Field(default=120, env="DISPATCH_REACTIVE_WORK_INTERVAL_SECONDS")
+    # Beat interval (seconds) for dispatch_wakeups: checks only (task, infospace) pairs writers marked dirty
+    DISPATCH_WAKEUP_INTERVAL_SECONDS: int = Field(default=5, env="DISPATCH_WAKEUP_INTERVAL_SECONDS")
+    # Tasks with wakes_on are full-swept at most this often (safety net for writes that bypass markers)
+    DISPATCH_WAKEUP_SWEEP_SECONDS: int = Field(default=900, env="DISPATCH_WAKEUP_SWEEP_SECONDS")
 
     # Deployment capability ceiling: comma-separated capability names, "*" for all, empty = readonly.
     # Intersected with per-user capabilities in Requires(). An owner on a readonly deployment gets no capabilities.
@@ -343,8 +358,82 @@ class AppSettings(BaseSettings):
     DEFAULT_ANNOTATION_CONCURRENCY: int = Field(default=5, env="DEFAULT_ANNOTATION_CONCURRENCY")
     # Maximum allowed concurrency to prevent overwhelming external APIs
     MAX_ANNOTATION_CONCURRENCY: int = Field(default=20, env="MAX_ANNOTATION_CONCURRENCY")
-    # Chunk size for per-chunk commits in large runs (50K-asset run avoids single tx)
-    ANNOTATION_CHUNK_SIZE: int = Field(default=50, env="ANNOTATION_CHUNK_SIZE")
+    # Assets per self-chain invocation of process_annotation_run. Within a
+    # slice the scheduler keeps provider calls saturated; slices end early
+    # after ANNOTATION_SLICE_SECONDS and resume from the checkpointed cursor
+    # (replaces ANNOTATION_CHUNK_SIZE, which also set the commit batch — that
+    # is now ANNOTATION_FLUSH_ROWS)
+    ANNOTATION_SLICE_ASSETS: int = Field(default=500, env="ANNOTATION_SLICE_ASSETS")
+    ANNOTATION_SLICE_SECONDS: int = Field(default=900, env="ANNOTATION_SLICE_SECONDS")
+    # Write-behind flush thresholds for annotation results: flush at N rows or
+    # T ms after the first unflushed result, whichever comes first
+    ANNOTATION_FLUSH_ROWS: int = Field(default=50, env="ANNOTATION_FLUSH_ROWS")
+    ANNOTATION_FLUSH_INTERVAL_MS: int = Field(default=500, env="ANNOTATION_FLUSH_INTERVAL_MS")
+
+    # --- Formula result cache (AnnotationQuery.relation) ---
+    RELATION_CACHE_ENABLED: bool = Field(default=True, env="RELATION_CACHE_ENABLED")
+    RELATION_CACHE_TTL_SECONDS: int = Field(default=3600, env="RELATION_CACHE_TTL_SECONDS")
+    # LRU bound on cached relations; oldest-accessed entries are evicted past this
+    RELATION_CACHE_MAX_ENTRIES: int = Field(default=5000, env="RELATION_CACHE_MAX_ENTRIES")
+    # Relations larger than this (serialized) are not cached
+    RELATION_CACHE_MAX_ENTRY_BYTES: int = Field(default=2 * 1024 * 1024, env="RELATION_CACHE_MAX_ENTRY_BYTES")
+
+    # --- LLM response cache (annotation runs opt in with ``response_cache: true``) ---
+    ANNOTATION_RESPONSE_CACHE_ENABLED: bool = Field(default=True, env="ANNOTATION_RESPONSE_CACHE_ENABLED")
+    # Total stored response bytes; least-recently-hit entries are evicted past this
+    ANNOTATION_RESPONSE_CACHE_MAX_BYTES: int = Field(default=1024 * 1024 * 1024, env="ANNOTATION_RESPONSE_CACHE_MAX_BYTES")
+    # Responses larger than this are not cached
+    ANNOTATION_RESPONSE_CACHE_MAX_ENTRY_BYTES: int = Field(default=4 * 1024 * 1024, env="ANNOTATION_RESPONSE_CACHE_MAX_ENTRY_BYTES")
+
+    # --- Source polling (poll_sources, RSS feed fetch) ---
+    # Sources of one poll batch polled at once
+    SOURCE_POLL_CONCURRENCY: int = Field(default=8, env="SOURCE_POLL_CONCURRENCY")
+    # Feed requests in flight to a single host
+    FEED_FETCH_PER_HOST_LIMIT: int = Field(default=2, env="FEED_FETCH_PER_HOST_LIMIT")
+    FEED_FETCH_TIMEOUT_SECONDS: float = Field(default=20.0, env="FEED_FETCH_TIMEOUT_SECONDS")
+
+    # --- Provider instance pool (registry.resolve) ---
+    # Pooled SDK clients are reused for this long; 0 disables pooling
+    PROVIDER_POOL_TTL_SECONDS: int = Field(default=900, env="PROVIDER_POOL_TTL_SECONDS")
+    PROVIDER_POOL_MAX_ENTRIES: int = Field(default=256, env="PROVIDER_POOL_MAX_ENTRIES")
+    # Infospace selection + owner credential blob reused without a DB read; 0 disables
+    PROVIDER_CONTEXT_TTL_SECONDS: int = Field(default=30, env="PROVIDER_CONTEXT_TTL_SECONDS")
+
+    # --- Embedding enricher pipeline ---
+    # Batches are packed up to this many estimated tokens / texts per provider call
+    EMBEDDING_BATCH_MAX_TOKENS: int = Field(default=16000, env="EMBEDDING_BATCH_MAX_TOKENS")
+    EMBEDDING_BATCH_MAX_TEXTS: int = Field(default=128, env="EMBEDDING_BATCH_MAX_TEXTS")
+    # Provider calls kept in flight per provider; per-provider overrides as "ollama=1,openai=8"
+    EMBEDDING_MAX_IN_FLIGHT: int = Field(default=4, env="EMBEDDING_MAX_IN_FLIGHT")
+    EMBEDDING_PROVIDER_IN_FLIGHT: str = Field(default="ollama=1", env="EMBEDDING_PROVIDER_IN_FLIGHT")
+
+    # --- Query-embedding cache (search_by_text, hybrid, entity-semantic) ---
+    EMBEDDING_QUERY_CACHE_ENABLED: bool = Field(default=True, env="EMBEDDING_QUERY_CACHE_ENABLED")
+    EMBEDDING_QUERY_CACHE_TTL_SECONDS: int = Field(default=24 * 3600, env="EMBEDDING_QUERY_CACHE_TTL_SECONDS")
+    # Per-process LRU tier, in packed float32 bytes
+    EMBEDDING_QUERY_CACHE_LOCAL_MAX_BYTES: int = Field(default=32 * 1024 * 1024, env="EMBEDDING_QUERY_CACHE_LOCAL_MAX_BYTES")
+    # Shared Redis tier; least-recently-used vectors are evicted past this
+    EMBEDDING_QUERY_CACHE_REDIS_MAX_BYTES: int = Field(default=256 * 1024 * 1024, env="EMBEDDING_QUERY_CACHE_REDIS_MAX_BYTES")
+    # How long an infospace's resolved embedding model is reused without re-reading config
+    EMBEDDING_QUERY_CACHE_MODEL_TTL_SECONDS: int = Field(default=60, env="EMBEDDING_QUERY_CACHE_MODEL_TTL_SECONDS")
+
+    # --- Package-token scope cache (access._resolve_package_token) ---
+    PACKAGE_SCOPE_CACHE_ENABLED: bool = Field(default=True, env="PACKAGE_SCOPE_CACHE_ENABLED")
+    # Staleness bound for derivations without a watermark (annotations, graph edges, canon entities)
+    PACKAGE_SCOPE_CACHE_TTL_SECONDS: int = Field(default=120, env="PACKAGE_SCOPE_CACHE_TTL_SECONDS")
+    # Per-process tier, bounded by total ids held across cached scopes
+    PACKAGE_SCOPE_CACHE_LOCAL_MAX_IDS: int = Field(default=5_000_000, env="PACKAGE_SCOPE_CACHE_LOCAL_MAX_IDS")
+
+    # --- Listing counts (tree / feed / search CountEvent) ---
+    # "exact" (time-budgeted), "estimate" (planner rows), "cached" (exact, memoised per filter)
+    LISTING_COUNT_MODE: str = Field(default="cached", env="LISTING_COUNT_MODE")
+    # Exact counts slower than this fall back to the planner estimate
+    LISTING_COUNT_BUDGET_MS: int = Field(default=200, env="LISTING_COUNT_BUDGET_MS")
+    # An approximate count is followed by an exact one when the estimate is at most this
+    LISTING_COUNT_FOLLOWUP_MAX_ROWS: int = Field(default=1_000_000, env="LISTING_COUNT_FOLLOWUP_MAX_ROWS")
+    LISTING_COUNT_FOLLOWUP_BUDGET_MS: int = Field(default=3000, env="LISTING_COUNT_FOLLOWUP_BUDGET_MS")
+    # Staleness bound for changes that do not bump the infospace generation (status, tags)
+    LISTING_COUNT_CACHE_TTL_SECONDS: int = Field(default=300, env="LISTING_COUNT_CACHE_TTL_SECONDS")
     
 
     def _check_default_secret(self, var_name: str, value: str | None) -> None:
@@ -1,7 +1,35 @@
+"""Database engines.
+
+``engine`` — sync, used by ``SessionDep``, services and Celery tasks.
+
+``async_engine`` — psycopg async, used by ``AsyncSessionDep`` on read-heavy
+endpoints (tree / feed / search, run views, graph stream). Its pool is
+sized separately (``DB_ASYNC_POOL_SIZE`` / ``DB_ASYNC_MAX_OVERFLOW``), so
+streaming reads never starve the sync pool and vice versa.
+
+The query builders (``AssetQuery``, ``AnnotationQuery``, graph sources)
+stay sync. An async endpoint hands them ``AsyncSession.sync_session`` and
+runs each piece of DB work through :func:`run_sync`, which executes it on
+the async connection via greenlet — no threadpool thread is held and the
+event loop is free while Postgres works. Coroutines that interleave sync
+reads with awaits (query embedding) go through :func:`run_interleaved`.
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, Coroutine, Optional, TypeVar
+
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlmodel import create_engine
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.core.config import settings
 
+T = TypeVar("T")
+
+# Session.info key on an AsyncSession's sync facade pointing back at it
+ASYNC_OWNER = "async_owner"
+
 engine = create_engine(
     str(settings.SQLALCHEMY_DATABASE_URI),
     pool_size=settings.DB_POOL_SIZE,
@@ -10,3 +38,90 @@ engine = create_engine(
     pool_reset_on_return="rollback",
 )
 
+async_engine = create_async_engine(
+    str(settings.SQLALCHEMY_DATABASE_URI),
+    pool_size=settings.DB_ASYNC_POOL_SIZE,
+    max_overflow=settings.DB_ASYNC_MAX_OVERFLOW,
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
+    pool_reset_on_return="rollback",
+)
+
+async_session_factory = async_sessionmaker(
+    async_engine, class_=AsyncSession, expire_on_commit=False,
+)
+
+
+@asynccontextmanager
+async def async_session_scope() -> AsyncIterator[AsyncSession]:
+    """Yield an AsyncSession whose ``sync_session`` can be passed to sync query code."""
+    async with async_session_factory() as session:
+        session.sync_session.info[ASYNC_OWNER] = session
+        try:
+            yield session
+        finally:
+            session.sync_session.info.pop(ASYNC_OWNER, None)
+
+
+async def run_sync(session: Any, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run sync ORM work ``fn(*args, **kwargs)`` that reads through ``session``.
+
+    ``session`` is a plain sync Session (``fn`` runs inline, as before) or
+    the ``sync_session`` of an AsyncSession from :func:`async_session_scope`
+    (``fn`` runs on the async connection without blocking the loop).
+    """
+    owner = session.info.get(ASYNC_OWNER) if session is not None else None
+    if owner is None:
+        return fn(*args, **kwargs)
+    return await owner.run_sync(lambda _sync_session: fn(*args, **kwargs))
+
+
+async def run_interleaved(
+    session: Any, fn: Callable[..., Awaitable[T]], *args: Any, **kwargs: Any,
+) -> T:
+    """Await ``fn(session, *args, **kwargs)``, a coroutine function that does
+    sync ORM reads through ``session`` between its own awaits (query
+    embedding: config reads, then a provider call, then an ANN query).
+
+    For a sync Session it is simply awaited. For an async-backed facade the
+    coroutine is stepped inside the owner's ``run_sync`` greenlet: its sync
+    reads run on the async connection like any :func:`run_sync` work, and
+    each thing it awaits is handed back to the calling task via
+    ``await_only``. The loop is never blocked and no sync-engine connection
+    is opened.
+    """
+    owner = session.info.get(ASYNC_OWNER) if session is not None else None
+    if owner is None:
+        return await fn(session, *args, **kwargs)
+    return await owner.run_sync(lambda sync_session: _step(fn(sync_session, *args, **kwargs)))
+
+
+async def _resume(awaited: Any) -> None:
+    # A bare ``yield`` (asyncio.sleep(0)) hands back None
+    if awaited is None:
+        await asyncio.sleep(0)
+        return
+    # What a Task does with a yielded future before waiting on it
+    awaited._asyncio_future_blocking = False
+    await awaited
+
+
+def _step(coro: Coroutine[Any, Any, T]) -> T:
+    """Drive ``coro`` from inside a greenlet, awaiting what it yields on the
+    parent task. Runs the coroutine the way a Task would."""
+    from sqlalchemy.util import await_only
+
+    value: Any = None
+    error: Optional[BaseException] = None
+    while True:
+        try:
+            awaited = coro.send(value) if error is None else coro.throw(error)
+        except StopIteration as stop:
+            return stop.value
+        value, error = None, None
+        try:
+            await_only(_resume(awaited))
+        except BaseException as exc:
+            # A finished future re-raises its own result on resume; anything
+            # else (the calling task was cancelled) is thrown in.
+            if not (isinstance(awaited, asyncio.Future) and awaited.done()):
+                error = exc
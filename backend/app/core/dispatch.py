@@ -4,10 +4,17 @@ Dispatch infrastructure.
 Three dispatch mechanisms:
 - Schedule: beat task polls registered @tasks per their declared schedule
 - Kick: on-demand full dispatch for an infospace (after import, admin, deploy)
+- Wakeups: dispatch_wakeups checks only (task, infospace) pairs writers marked
+  dirty (core/wakeups.py); for those tasks the schedule becomes a slow
+  safety-net sweep (DISPATCH_WAKEUP_SWEEP_SECONDS)
 - Events: handled by core/events.py, not in this file
 
-The dispatcher iterates @task registry × infospaces. Per-task schedule controls
-poll frequency. kick_tasks bypasses schedule for immediate dispatch.
+The dispatcher iterates the @task registry; each task's check query runs
+set-based over all infospaces (LATERAL per infospace, so per-infospace
+ORDER BY / LIMIT still hold). Dispatch filters, blocks, backoff, slot quotas
+and the cycle budget are applied in Python around that one query. Per-task
+schedule controls poll frequency. kick_tasks bypasses schedule for
+immediate dispatch.
 """
 
 from __future__ import annotations
@@ -16,12 +23,15 @@ import logging
 import time
 from typing import Any
 
+from sqlalchemy import Integer, bindparam, func, literal_column, select as sa_select, true
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlmodel import Session
 
 logger = logging.getLogger(__name__)
 
 MAX_DISPATCH_PER_CYCLE = 2000
 MAX_PER_TASK_PER_CYCLE = 500
+DISPATCH_CHECK_CHUNK = 1000  # infospaces per set-based check query
 
 
 def _get_enabled_enrichers() -> set[str] | None:
@@ -56,9 +66,18 @@ def _is_capability_configured(capability_name: str) -> bool:
     return is_capability_available(capability_name, settings)
 
 
+def _sweep_interval(descriptor) -> int | None:
+    """Seconds between full sweeps. Tasks woken by dirty markers sweep rarely."""
+    if descriptor.schedule is None or not descriptor.wakes_on:
+        return descriptor.schedule
+    from app.core.config import settings
+    return max(descriptor.schedule, settings.DISPATCH_WAKEUP_SWEEP_SECONDS)
+
+
 def _is_due(descriptor) -> bool:
     """Check if enough time has passed since last dispatch for this task."""
-    if descriptor.schedule is None:
+    interval = _sweep_interval(descriptor)
+    if interval is None:
         return False
     r = _get_redis()
     if not r:
@@ -67,7 +86,7 @@ def _is_due(descriptor) -> bool:
     if not last:
         return True
     try:
-        return (time.time() - float(last)) >= descriptor.schedule
+        return (time.time() - float(last)) >= interval
     except (ValueError, TypeError):
         return True
 
@@ -78,133 +97,220 @@ def _chunk(lst, n):
         yield lst[i : i + n]
 
 
-def _dispatch_task_for_infospace(desc, infospace_id: int, budget: int = MAX_PER_TASK_PER_CYCLE) -> int:
-    """Core dispatch logic for one task × one infospace. Used by both beat and kick.
+def _load_infospaces(infospace_ids: list[int] | None = None) -> list:
+    """Detached Infospace rows — all of them, or the given ids. One query."""
+    from app.core.db import engine
+    from app.api.modules.identity_infospace_user.models import Infospace
+    from sqlmodel import select as _select
+
+    stmt = _select(Infospace).order_by(Infospace.id)
+    if infospace_ids is not None:
+        stmt = stmt.where(Infospace.id.in_(infospace_ids))
+    with Session(engine) as session:
+        infospaces = session.exec(stmt).all()
+        for isp in infospaces:
+            session.expunge(isp)
+    return infospaces
+
+
+def _filtered_ids(desc, infospaces: list, verdicts: dict) -> list[int]:
+    """Infospace ids passing ``desc.dispatch_filter``.
 
-    Runs the task's check query, filters failed items, chunks by batch size,
-    sends Celery tasks. Returns count of items dispatched.
+    ``verdicts`` memoises (filter, infospace) results for the cycle; filters
+    run against the cycle's one infospace load, never a per-pair reload.
     """
-    from app.core.db import engine
-    from app.core.celery_app import celery_app
-    from app.core.tasks import filter_failed_items, is_structurally_blocked
+    if not desc.dispatch_filter:
+        return [isp.id for isp in infospaces]
+    allowed = []
+    for isp in infospaces:
+        key = (desc.dispatch_filter, isp.id)
+        if key not in verdicts:
+            try:
+                verdicts[key] = bool(desc.dispatch_filter(isp))
+            except Exception as e:
+                logger.warning("Dispatch filter failed for %s: %s", desc.name, e)
+                verdicts[key] = False
+        if verdicts[key]:
+            allowed.append(isp.id)
+    return allowed
+
+
+def _unblocked_ids(desc, infospace_ids: list[int]) -> list[int]:
+    """Drop infospaces with a structural block or backoff. One pipelined round trip."""
+    from app.core.tasks import _block_key
 
-    # Check capability availability
-    if desc.capability and not _is_capability_configured(desc.capability):
-        return 0
+    r = _get_redis()
+    if not r or not infospace_ids:
+        return infospace_ids
+    try:
+        pipe = r.pipeline(transaction=False)
+        for iid in infospace_ids:
+            # Structural block — set by previous ProviderError, cleared on config save
+            pipe.get(_block_key(desc.name, iid))
+            pipe.get(f"task:{desc.name}:{iid}:backoff")
+        flags = pipe.execute()
+    except Exception:
+        return infospace_ids
+    return [
+        iid for i, iid in enumerate(infospace_ids)
+        if not flags[2 * i] and not flags[2 * i + 1]
+    ]
 
-    # Structural block — set by previous ProviderError, cleared on config save.
-    # Cheap Redis lookup, no DB hit.
-    if is_structurally_blocked(desc.name, infospace_id):
-        return 0
 
-    # Apply dispatch_filter (enrichment config + ENABLED_ENRICHERS)
-    if desc.dispatch_filter:
-        try:
-            # dispatch_filter receives infospace object, but we have only the id.
-            # Load infospace if needed.
-            from app.api.modules.identity_infospace_user.models import Infospace
-            with Session(engine) as session:
-                infospace = session.get(Infospace, infospace_id)
-                if not infospace:
-                    return 0
-                session.expunge(infospace)
-            if not desc.dispatch_filter(infospace):
-                return 0
-        except Exception as e:
-            logger.warning("Dispatch filter failed for %s: %s", desc.name, e)
-            return 0
-
-    # Check backoff
+def _available_slots(desc, infospace_ids: list[int]) -> dict[int, int]:
+    """Free concurrency slots per infospace. One pipelined round trip."""
+    slots = {iid: desc.max_concurrency for iid in infospace_ids}
     r = _get_redis()
-    if r:
-        try:
-            if r.get(f"task:{desc.name}:{infospace_id}:backoff"):
-                return 0
-        except Exception:
-            pass
+    if not r or not infospace_ids:
+        return slots
+    try:
+        from app.core.tasks import count_occupied_slots_many
+        occupied = count_occupied_slots_many(r, desc.name, infospace_ids, desc.max_concurrency)
+        for iid, n in zip(infospace_ids, occupied):
+            slots[iid] = desc.max_concurrency - n
+    except Exception:
+        pass  # degrade to max_concurrency if count fails
+    return slots
 
-    # Check available concurrency slots
-    available_slots = desc.max_concurrency
-    if r:
+
+def check_statement(desc, infospace_ids: list[int], per_infospace: int):
+    """The task's check query for many infospaces at once.
+
+    ``desc.check`` is called with ``isp.iid`` — a bare column reference, not
+    an id — and joined LATERAL against ``unnest(:infospace_ids) AS isp(iid)``,
+    so each infospace keeps its own ORDER BY / LIMIT and nested subqueries
+    can reference it at any depth. Selects ``(infospace_id, item_id)``;
+    ``None`` for tasks whose check is a stub.
+    """
+    check = desc.check(literal_column("isp.iid", Integer))
+    if check is None:
+        return None
+    isp = (
+        func.unnest(bindparam("infospace_ids", infospace_ids, type_=ARRAY(Integer)))
+        .table_valued("iid")
+        .render_derived(name="isp")
+    )
+    hits = check.limit(per_infospace).lateral("hits")
+    return (
+        sa_select(isp.c.iid, literal_column("hits.*"))
+        .select_from(isp)
+        .join(hits, true())
+    )
+
+
+def _pending(desc, infospace_ids: list[int], per_infospace: int) -> dict[int, list[int]]:
+    """Pending item ids per infospace — one query for all of ``infospace_ids``."""
+    from app.core.db import engine
+
+    stmt = check_statement(desc, infospace_ids, per_infospace)
+    if stmt is None:
+        return {}
+    with engine.connect() as conn:
         try:
-            from app.core.tasks import count_occupied_slots
-            occupied = count_occupied_slots(r, desc.name, infospace_id, desc.max_concurrency)
-            available_slots = desc.max_concurrency - occupied
-            if available_slots <= 0:
-                return 0
+            rows = conn.execute(stmt).all()
         except Exception:
-            pass  # degrade to max_concurrency if count fails
-
-    try:
-        with engine.connect() as conn:
-            with Session(bind=conn) as session:
-                try:
-                    query = desc.check(infospace_id).limit(min(budget, MAX_PER_TASK_PER_CYCLE))
-                    rows = session.exec(query).all()
-                    ids = [
-                        row[0] if hasattr(row, "__getitem__") and not isinstance(row, (int, str))
-                        else row
-                        for row in (rows or [])
-                    ]
-                except Exception:
-                    conn.invalidate()
-                    raise
+            conn.invalidate()
+            raise
+    found: dict[int, list[int]] = {}
+    for iid, item_id, *_ in rows:
+        found.setdefault(iid, []).append(item_id)
+    return found
+
+
+def _dispatch_task(
+    desc,
+    infospaces: list,
+    budget: int,
+    verdicts: dict | None = None,
+    settled: set | None = None,
+) -> int:
+    """Core dispatch logic for one task across infospaces. Used by beat, wakeups and kick.
+
+    Filters infospaces (capability, dispatch_filter, structural block,
+    backoff), then per ``DISPATCH_CHECK_CHUNK`` infospaces: runs the check
+    query once, filters failed items, applies per-infospace slot quotas and
+    the budget in Python and sends Celery tasks. Returns count of items
+    dispatched.
+
+    ``settled`` collects the infospaces left with nothing to dispatch for
+    this task — filtered out, no pending items, or all of them sent.
+    Blocked and backed-off infospaces are never settled.
+    """
+    from app.core.celery_app import celery_app
+    from app.core.tasks import filter_failed_items
 
-        if not ids:
-            return 0
+    settled = set() if settled is None else settled
+    if desc.capability and not _is_capability_configured(desc.capability):
+        settled.update(isp.id for isp in infospaces)
+        return 0
 
-        # Filter failed items
-        ids = filter_failed_items(desc.name, ids, desc.max_item_failures)
-        if not ids:
-            return 0
+    ids = _filtered_ids(desc, infospaces, {} if verdicts is None else verdicts)
+    settled.update({isp.id for isp in infospaces} - set(ids))
+    # Blocked / backed-off infospaces stay unsettled: the block is temporary
+    ids = _unblocked_ids(desc, ids)
+    if not ids:
+        return 0
 
-        dispatched = 0
-        total_items = 0
-        for batch in _chunk(ids, desc.batch):
-            if dispatched >= available_slots:
-                break
+    per_infospace = min(budget, MAX_PER_TASK_PER_CYCLE, desc.max_concurrency * desc.batch)
+    total_items = 0
+    try:
+        for chunk in _chunk(ids, DISPATCH_CHECK_CHUNK):
             if total_items >= budget:
                 break
-            celery_app.send_task(
-                desc.celery_task_name,
-                args=[batch, infospace_id],
-                queue=desc.queue,
-            )
-            dispatched += 1
-            total_items += len(batch)
-
-        return total_items
+            found = _pending(desc, chunk, per_infospace)
+            settled.update(iid for iid in chunk if iid not in found)
+            if not found:
+                continue
+
+            # Failure counters are keyed by item, not infospace — one pipeline for all
+            keep = set(filter_failed_items(
+                desc.name, [i for items in found.values() for i in items], desc.max_item_failures,
+            ))
+            slots = _available_slots(desc, list(found))
+
+            for iid, items in found.items():
+                batches = list(_chunk([i for i in items if i in keep], desc.batch))
+                dispatched = 0
+                for batch in batches:
+                    if dispatched >= slots[iid] or total_items >= budget:
+                        break
+                    celery_app.send_task(
+                        desc.celery_task_name,
+                        args=[batch, iid],
+                        queue=desc.queue,
+                    )
+                    dispatched += 1
+                    total_items += len(batch)
+                # A full page may hide more pending items behind the LIMIT
+                if dispatched == len(batches) and len(items) < per_infospace:
+                    settled.add(iid)
+                if total_items >= budget:
+                    break
 
     except Exception as e:
-        logger.error("Dispatch failed for %s infospace %d: %s",
-                     desc.name, infospace_id, e, exc_info=True)
-        return 0
+        logger.error("Dispatch failed for %s: %s", desc.name, e, exc_info=True)
+
+    return total_items
 
 
 def _dispatch_tasks_impl() -> dict[str, Any]:
     """
-    Beat task: iterate scheduled @tasks × infospaces, dispatch work.
+    Beat task: dispatch scheduled @tasks across all infospaces.
 
-    For each task in topological order:
+    Infospaces are loaded once per cycle. For each task in topological order:
     1. Skip if schedule is None
     2. Skip if not due (Redis last_dispatched check)
-    3. For each infospace: _dispatch_task_for_infospace()
+    3. _dispatch_task() — one set-based check query per chunk of infospaces
     4. Update last_dispatched timestamp in Redis
     """
-    from app.core.db import engine
     from app.core.tasks import get_task_registry, topological_sort
 
     task_registry = get_task_registry()
     if not task_registry:
         return {"total_dispatched": 0, "tasks": {}}
 
-    # Get all infospaces (one DB query, cached for cycle)
-    from app.api.modules.identity_infospace_user.models import Infospace
-    from sqlmodel import select as _select
-    with Session(engine) as session:
-        infospaces = session.exec(_select(Infospace)).all()
-        for isp in infospaces:
-            session.expunge(isp)
+    infospaces = _load_infospaces()
+    verdicts: dict = {}
 
     total_dispatched = 0
     task_results: dict[str, int] = {}
@@ -220,14 +326,8 @@ def _dispatch_tasks_impl() -> dict[str, Any]:
         if not _is_due(descriptor):
             continue
 
-        task_dispatched = 0
-
-        for infospace in infospaces:
-            if budget <= 0:
-                break
-            count = _dispatch_task_for_infospace(descriptor, infospace.id, budget)
-            task_dispatched += count
-            budget -= count
+        task_dispatched = _dispatch_task(descriptor, infospaces, budget, verdicts)
+        budget -= task_dispatched
 
         # Update last_dispatched
         if descriptor.schedule is not None:
@@ -246,6 +346,56 @@ def _dispatch_tasks_impl() -> dict[str, Any]:
     return {"total_dispatched": total_dispatched, "tasks": task_results}
 
 
+def _dispatch_wakeups_impl() -> dict[str, Any]:
+    """
+    Beat task: dispatch only the (task, infospace) pairs writers marked dirty.
+
+    Moves kind markers onto task sets (``wakeups.fan_out``), then for each
+    task with ``wakes_on`` in topological order dispatches over its dirty
+    infospaces and clears the pairs it settled. Pairs with more work than
+    one cycle's quota stay dirty for the next tick.
+    """
+    from app.core import wakeups
+    from app.core.tasks import get_task_registry, topological_sort
+
+    woken = [d for d in topological_sort(list(get_task_registry().values())) if d.wakes_on]
+    if not woken:
+        return {"total_dispatched": 0, "tasks": {}}
+    wakeups.fan_out(woken)
+
+    dirty = {d.name: wakeups.dirty_infospaces(d.name) for d in woken}
+    all_dirty = sorted({iid for ids in dirty.values() for iid in ids})
+    if not all_dirty:
+        return {"total_dispatched": 0, "tasks": {}}
+    by_id = {isp.id: isp for isp in _load_infospaces(all_dirty)}
+    verdicts: dict = {}
+
+    total_dispatched = 0
+    task_results: dict[str, int] = {}
+    budget = MAX_DISPATCH_PER_CYCLE
+
+    for descriptor in woken:
+        if budget <= 0:
+            break
+        ids = dirty[descriptor.name]
+        if not ids:
+            continue
+        # Deleted infospaces settle without a check
+        settled = {iid for iid in ids if iid not in by_id}
+        task_dispatched = _dispatch_task(
+            descriptor, [by_id[iid] for iid in ids if iid in by_id], budget, verdicts, settled,
+        )
+        wakeups.settle(descriptor.name, settled)
+        budget -= task_dispatched
+
+        task_results[descriptor.name] = task_dispatched
+        total_dispatched += task_dispatched
+        if task_dispatched:
+            logger.info("Dispatched %s (wakeup): %d items", descriptor.name, task_dispatched)
+
+    return {"total_dispatched": total_dispatched, "tasks": task_results}
+
+
 def kick_tasks(infospace_id: int, tags: frozenset[str] | None = None):
     """On-demand dispatch. Runs full check→fan-out logic, bypasses schedule.
 
@@ -255,10 +405,14 @@ def kick_tasks(infospace_id: int, tags: frozenset[str] | None = None):
     """
     from app.core.tasks import get_task_registry
 
+    infospaces = _load_infospaces([infospace_id])
+    if not infospaces:
+        return
+    verdicts: dict = {}
     for name, desc in get_task_registry().items():
         if tags and not (desc.tags & tags):
             continue
-        count = _dispatch_task_for_infospace(desc, infospace_id)
+        count = _dispatch_task(desc, infospaces, MAX_PER_TASK_PER_CYCLE, verdicts)
         if count:
             logger.info("kick_tasks: dispatched %s for infospace %d: %d items", name, infospace_id, count)
 
@@ -274,5 +428,17 @@ def _create_dispatch_task():
     return dispatch_tasks
 
 
-# Create task instance for Beat schedule
+def _create_wakeup_task():
+    from app.core.celery_app import celery_app
+
+    @celery_app.task(name="dispatch_wakeups")
+    def dispatch_wakeups() -> dict[str, Any]:
+        """Beat task: dispatch (task, infospace) pairs marked dirty by writers."""
+        return _dispatch_wakeups_impl()
+
+    return dispatch_wakeups
+
+
+# Create task instances for Beat schedule
 dispatch_tasks = _create_dispatch_task()
+dispatch_wakeups = _create_wakeup_task()
@@ -19,3 +19,16 @@ def get_redis() -> _redis.Redis:
             settings.redis_url, decode_responses=True, max_connections=20
         )
     return _redis.Redis(connection_pool=_pool)
+
+
+_binary_pool: _redis.ConnectionPool | None = None
+
+
+def get_binary_redis() -> _redis.Redis:
+    """Redis client that returns raw ``bytes`` — for packed binary payloads."""
+    global _binary_pool
+    if _binary_pool is None:
+        _binary_pool = _redis.ConnectionPool.from_url(
+            settings.redis_url, decode_responses=False, max_connections=10
+        )
+    return _redis.Redis(connection_pool=_binary_pool)
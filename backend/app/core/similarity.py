@@ -13,14 +13,23 @@ Usage:
         embed=provider.embed_texts,   # or any async (list[str]) -> list[list[float]]
         threshold=0.85,
     )
+
+The pairwise engine is :func:`similar_pairs`: vectors are stacked into a
+row-normalised float32 matrix and compared tile by tile with matrix
+products, so memory stays at ``block_rows × block_cols`` floats no matter
+how many vectors go in. Canon proposal scans share it.
 """
 from __future__ import annotations
 
 import math
 from dataclasses import dataclass
-from typing import Awaitable, Callable, List
+from typing import Awaitable, Callable, List, Optional, Sequence
+
+MAX_ITEMS = 100_000  # blockwise matrix products — bounded by memory, not O(n²) Python
 
-MAX_ITEMS = 500  # O(n²) pairwise — keep bounded
+# Similarity tile: 1024 × 8192 float32 ≈ 32 MB.
+BLOCK_ROWS = 1024
+BLOCK_COLS = 8192
 
 
 @dataclass(frozen=True, slots=True)
@@ -47,18 +56,118 @@ def cosine(a: List[float], b: List[float]) -> float:
     return dot / (na * nb)
 
 
+def normalized_matrix(vectors: Sequence[Sequence[float]]):
+    """Stack vectors into a row-normalised float32 matrix.
+
+    Zero-norm rows stay zero, so they never meet a positive threshold.
+    """
+    import numpy as np
+
+    mat = np.asarray(vectors, dtype=np.float32)
+    if mat.ndim != 2:
+        raise ValueError("vectors must share one dimension")
+    norms = np.linalg.norm(mat, axis=1, keepdims=True)
+    np.divide(mat, norms, out=mat, where=norms > 0)
+    return mat
+
+
+def _best(ii, jj, ss, limit: int):
+    """The ``limit`` highest-similarity entries of parallel index arrays."""
+    import numpy as np
+
+    if ss.size <= limit:
+        return ii, jj, ss
+    keep = np.argpartition(-ss, limit - 1)[:limit]
+    return ii[keep], jj[keep], ss[keep]
+
+
+def similar_pairs(
+    vectors: Sequence[Sequence[float]],
+    threshold: float,
+    *,
+    top_k: Optional[int] = None,
+    limit: Optional[int] = None,
+    block_rows: int = BLOCK_ROWS,
+    block_cols: int = BLOCK_COLS,
+) -> list[tuple[int, int, float]]:
+    """All index pairs ``(i, j)``, ``i < j``, with cosine ≥ ``threshold``.
+
+    Computes only the upper triangle, one ``block_rows × block_cols`` tile
+    at a time. ``top_k`` keeps at most that many best partners per row
+    (the row being the lower index), which bounds output on dense clusters.
+    ``limit`` keeps only the ``limit`` most similar pairs overall: the
+    running best set is pruned as tiles come in and its weakest similarity
+    raises the cut-off for later tiles, so memory stays at ``limit`` plus
+    one row block of hits instead of every pair above ``threshold``.
+    Returns pairs sorted by similarity descending.
+    """
+    import numpy as np
+
+    n = len(vectors)
+    if n < 2 or limit == 0:
+        return []
+    mat = normalized_matrix(vectors)
+
+    gi = np.empty(0, dtype=np.intp)
+    gj = np.empty(0, dtype=np.intp)
+    gs = np.empty(0, dtype=np.float32)
+    floor = threshold
+    for r0 in range(0, n, block_rows):
+        r1 = min(r0 + block_rows, n)
+        rows = mat[r0:r1]
+        bi: list = []
+        bj: list = []
+        bs: list = []
+        # Upper triangle only: columns start at this row block.
+        for c0 in range(r0, n, block_cols):
+            c1 = min(c0 + block_cols, n)
+            sims = rows @ mat[c0:c1].T
+            if c0 == r0:
+                # Diagonal tile: drop self-pairs and the lower triangle.
+                sims[np.tril_indices(r1 - r0, k=0, m=c1 - c0)] = -np.inf
+            ii, jj = np.nonzero(sims >= floor)
+            if ii.size:
+                bi.append(ii + r0)
+                bj.append(jj + c0)
+                bs.append(sims[ii, jj])
+        if not bi:
+            continue
+        ii = np.concatenate(bi)
+        jj = np.concatenate(bj)
+        ss = np.concatenate(bs)
+        if top_k is not None:
+            # Per row, best first; keep the first top_k of each run.
+            order = np.lexsort((-ss, ii))
+            ii, jj, ss = ii[order], jj[order], ss[order]
+            starts = np.r_[0, np.flatnonzero(np.diff(ii)) + 1]
+            rank = np.arange(ii.size) - np.repeat(starts, np.diff(np.r_[starts, ii.size]))
+            keep = rank < top_k
+            ii, jj, ss = ii[keep], jj[keep], ss[keep]
+        gi = np.concatenate((gi, ii))
+        gj = np.concatenate((gj, jj))
+        gs = np.concatenate((gs, ss))
+        if limit is not None and gs.size >= limit:
+            gi, gj, gs = _best(gi, gj, gs, limit)
+            # Nothing weaker than the current limit-th best can make the cut.
+            floor = max(floor, float(gs.min()))
+
+    order = np.argsort(-gs, kind="stable")
+    return [(int(gi[k]), int(gj[k]), float(gs[k])) for k in order]
+
+
 async def find_duplicates(
     items: list[str],
     embed: Callable[[list[str]], Awaitable[list[list[float]]]],
     threshold: float = 0.85,
     max_items: int = MAX_ITEMS,
+    max_pairs: Optional[int] = None,
 ) -> list[SimilarPair]:
     """
     Embed items, compute pairwise cosine similarity, return pairs above threshold.
 
     Handles exact (case-insensitive) duplicates without embedding.
     Deduplicates identical strings before calling embed to save tokens.
-    Pre-computes norms so each vector is normalized once, not n-1 times.
+    Pairwise similarity runs through :func:`similar_pairs`.
     Returns pairs sorted by similarity descending.
 
     Args:
@@ -66,7 +175,9 @@ async def find_duplicates(
         embed: Async callable: list[str] -> list[list[float]].
                Works with any EmbeddingProvider.embed_texts.
         threshold: Minimum cosine similarity to report (0.0–1.0).
-        max_items: Hard cap on input size. O(n²) pairwise — default 500.
+        max_items: Hard cap on input size (default ``MAX_ITEMS``).
+        max_pairs: Return at most this many pairs (the most similar);
+               bounds the pairwise scan's output on dense clusters.
 
     Raises:
         ValueError: If len(items) exceeds max_items.
@@ -95,7 +206,7 @@ async def find_duplicates(
     # ── Embedding similarity (one representative per normalized string) ──
     unique_keys = list(norm_to_indices.keys())
     if len(unique_keys) < 2:
-        return sorted(pairs, key=lambda p: p.similarity, reverse=True)
+        return sorted(pairs, key=lambda p: p.similarity, reverse=True)[:max_pairs]
 
     # Use the original-cased representative for embedding (preserves semantics)
     representatives = [items[norm_to_indices[k][0]] for k in unique_keys]
@@ -103,24 +214,13 @@ async def find_duplicates(
 
     vectors = await embed(representatives)
     if len(vectors) != len(representatives):
-        return sorted(pairs, key=lambda p: p.similarity, reverse=True)
-
-    # Pre-compute norms once (each vector's norm used n-1 times in pairwise)
-    norms = [_norm(v) for v in vectors]
+        return sorted(pairs, key=lambda p: p.similarity, reverse=True)[:max_pairs]
 
-    for i in range(len(representatives)):
-        if norms[i] == 0.0:
-            continue
-        for j in range(i + 1, len(representatives)):
-            if norms[j] == 0.0:
-                continue
-            dot = sum(a * b for a, b in zip(vectors[i], vectors[j]))
-            sim = dot / (norms[i] * norms[j])
-            if sim >= threshold:
-                pairs.append(SimilarPair(
-                    a_index=rep_indices[i], b_index=rep_indices[j],
-                    a_item=items[rep_indices[i]], b_item=items[rep_indices[j]],
-                    similarity=round(sim, 4),
-                ))
+    for i, j, sim in similar_pairs(vectors, threshold, limit=max_pairs):
+        pairs.append(SimilarPair(
+            a_index=rep_indices[i], b_index=rep_indices[j],
+            a_item=items[rep_indices[i]], b_item=items[rep_indices[j]],
+            similarity=round(min(sim, 1.0), 4),
+        ))
 
-    return sorted(pairs, key=lambda p: p.similarity, reverse=True)
+    return sorted(pairs, key=lambda p: p.similarity, reverse=True)[:max_pairs]
@@ -121,11 +121,13 @@ async def drain(events: AsyncIterator[Any], envelope_type: type[T]) -> T:
             if ev.at_parent is None:
                 if primary is not None:
                     primary.total = ev.total
+                    primary.approximate = ev.approximate
                     primary.has_more = bool(primary.cursor_next)
             else:
                 for section in grouped:
                     if section.at_parent == ev.at_parent:
                         section.total = ev.total
+                        section.approximate = ev.approximate
                         section.has_more = bool(section.cursor_next)
                         break
         elif isinstance(ev, AggregateSectionEvent):
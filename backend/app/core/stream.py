@@ -3,8 +3,10 @@ Presence infrastructure: backend-to-frontend event delivery via Redis Streams.
 
 Three components:
 - stream_key()    — canonical key construction
-- StreamWriter    — sync XADD, fire-and-forget (used by tasks and routes)
-- StreamHub       — async fan-out singleton (used by SSE subscription endpoint)
+- StreamWriter    — sync XADD, fire-and-forget (used by tasks and routes);
+                    ``buffered=True`` pipelines and coalesces high-rate events
+- StreamHub       — async fan-out singleton (used by SSE subscription endpoint);
+                    a few multi-key XREAD readers serve every subscribed key
 
 ctx.send() on TaskContext delegates to StreamWriter. The SSE endpoint in
 routes/stream.py subscribes via StreamHub. If nobody's listening, events
@@ -20,7 +22,11 @@ import asyncio
 import hashlib
 import json
 import logging
+import threading
 import time
+import uuid
+import zlib
+from collections import Counter
 from dataclasses import dataclass, field
 from typing import Any, Optional
 
@@ -54,41 +60,139 @@ def stream_key(
 
 # ── Observability ────────────────────────────────────────────────────────────
 
-def _incr(counter_key: str) -> None:
+def _incr(counter_key: str, amount: int = 1) -> None:
     """Increment a Redis counter. Best-effort, never raises."""
     try:
         from app.core.redis import get_redis
-        get_redis().incr(counter_key)
+        get_redis().incr(counter_key, amount)
     except Exception:
         pass
 
 
 # ── StreamWriter (sync, for tasks and routes) ────────────────────────────────
 
+def _payload(event: str, data: Any) -> dict:
+    return {
+        "type": event,
+        "data": json.dumps(data, default=str),
+        "ts": str(int(time.time() * 1000)),
+    }
+
+
+class _EventBuffer:
+    """Pending events for one or more stream keys, written in one pipeline.
+
+    Flushes when ``flush_events`` events are pending or ``flush_interval_ms``
+    after the first one arrived (a timer thread covers writers that go
+    quiet). An event whose type is in ``COALESCE`` replaces the pending one
+    of the same type and moves to the end, so every key still sees events
+    in send order — just without the superseded snapshots. Counters are
+    added to the same pipeline.
+    """
+
+    COALESCE = frozenset({"progress"})
+
+    def __init__(self, keys: tuple[str, ...], flush_events: int, flush_interval_ms: int):
+        self._keys = keys
+        self._flush_events = max(1, flush_events)
+        self._interval = max(0, flush_interval_ms) / 1000.0
+        self._pending: list[tuple[str, dict]] = []
+        self._coalesced = 0
+        self._timer: Optional[threading.Timer] = None
+        self._lock = threading.Lock()
+
+    def add(self, event: str, data: Any) -> bool:
+        with self._lock:
+            if event in self.COALESCE:
+                before = len(self._pending)
+                self._pending = [p for p in self._pending if p[0] != event]
+                self._coalesced += before - len(self._pending)
+            self._pending.append((event, _payload(event, data)))
+            if len(self._pending) >= self._flush_events:
+                return self._flush_locked()
+            if self._timer is None:
+                self._timer = threading.Timer(self._interval, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+            return True
+
+    def flush(self) -> bool:
+        with self._lock:
+            return self._flush_locked()
+
+    def _flush_locked(self) -> bool:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        pending, self._pending = self._pending, []
+        coalesced, self._coalesced = self._coalesced, 0
+        if not pending:
+            return True
+        writes = len(pending) * len(self._keys)
+        try:
+            from app.core.redis import get_redis
+            r = get_redis()
+            pipe = r.pipeline(transaction=False)
+            for key in self._keys:
+                for _, payload in pending:
+                    pipe.xadd(key, payload, maxlen=StreamWriter.MAXLEN, approximate=True)
+            # Counters ride the same round trip; corrected below on failures
+            pipe.incrby("stream:sent", writes)
+            if coalesced:
+                pipe.incrby("stream:coalesced", coalesced)
+            results = pipe.execute(raise_on_error=False)[:writes]
+        except Exception as exc:
+            logger.warning("stream flush failed for %s: %s", self._keys[0], exc)
+            _incr("stream:dropped", writes)
+            return False
+
+        failed = sum(1 for res in results if isinstance(res, Exception))
+        if failed:
+            logger.warning("stream flush for %s: %d of %d writes failed", self._keys[0], failed, writes)
+            _incr("stream:sent", -failed)
+            _incr("stream:dropped", failed)
+        # Primary key's writes come first and decide the result
+        return not any(isinstance(res, Exception) for res in results[:len(pending)])
+
+
 class StreamWriter:
     """Fire-and-forget XADD to a Redis Stream.
 
     Used from Celery workers (ctx.send) and sync route handlers. Never raises.
     Failures are counted, not propagated.
+
+    ``buffered=True`` is for high-rate emitters (annotation runs): events
+    are queued and written in one pipeline per ``FLUSH_EVENTS`` events or
+    ``FLUSH_INTERVAL_MS``, superseded ``progress`` events are dropped, and
+    counters are batched (see ``_EventBuffer``). Call ``close()`` (or use
+    the writer as a context manager) before anything else writes to the
+    same stream, so the final events land in order.
     """
 
     MAXLEN: int = 1000  # approximate XADD MAXLEN
     IDLE_TTL: int = 3600  # 1 hour
+    FLUSH_EVENTS: int = 100
+    FLUSH_INTERVAL_MS: int = 250
 
-    def __init__(self, key: str):
+    def __init__(self, key: str, *, buffered: bool = False):
         self._key = key
+        self._buffer = (
+            _EventBuffer((key,), self.FLUSH_EVENTS, self.FLUSH_INTERVAL_MS) if buffered else None
+        )
 
     def send(self, event: str, data: Any) -> bool:
-        """Append an event to the stream. Returns True on success."""
+        """Append an event to the stream. Returns True on success (or once queued)."""
+        if self._buffer is not None:
+            try:
+                return self._buffer.add(event, data)
+            except Exception as exc:
+                logger.warning("stream.send failed for %s: %s", self._key, exc)
+                _incr("stream:dropped")
+                return False
         try:
             from app.core.redis import get_redis
             r = get_redis()
-            payload = {
-                "type": event,
-                "data": json.dumps(data, default=str),
-                "ts": str(int(time.time() * 1000)),
-            }
-            r.xadd(self._key, payload, maxlen=self.MAXLEN, approximate=True)
+            r.xadd(self._key, _payload(event, data), maxlen=self.MAXLEN, approximate=True)
             _incr("stream:sent")
             return True
         except Exception as exc:
@@ -96,8 +200,23 @@ class StreamWriter:
             _incr("stream:dropped")
             return False
 
+    def flush(self) -> bool:
+        """Write pending events now (buffered mode). Returns True on success."""
+        return self._buffer.flush() if self._buffer is not None else True
+
+    def close(self) -> bool:
+        """Final flush. Call before anything else writes to the same stream."""
+        return self.flush()
+
+    def __enter__(self) -> "StreamWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
     def expire(self, ttl: int | None = None) -> None:
         """Set TTL on the stream key. Call after terminal events."""
+        self.flush()
         try:
             from app.core.redis import get_redis
             get_redis().expire(self._key, ttl or self.IDLE_TTL)
@@ -117,19 +236,45 @@ class FamilyStreamWriter:
 
     Construct with the primary key and an optional mirror key. ``send`` and
     ``expire`` fan out to both. Mirror failures don't affect the primary.
+    With ``buffered=True`` both keys share one buffer, so a flush writes
+    primary and mirror in a single pipeline.
     """
 
-    def __init__(self, primary_key: str, mirror_key: str | None = None):
+    def __init__(self, primary_key: str, mirror_key: str | None = None, *, buffered: bool = False):
         self._primary = StreamWriter(primary_key)
         self._mirror = StreamWriter(mirror_key) if mirror_key else None
+        keys = (primary_key, mirror_key) if mirror_key else (primary_key,)
+        self._buffer = (
+            _EventBuffer(keys, StreamWriter.FLUSH_EVENTS, StreamWriter.FLUSH_INTERVAL_MS)
+            if buffered else None
+        )
 
     def send(self, event: str, data: Any) -> bool:
+        if self._buffer is not None:
+            try:
+                return self._buffer.add(event, data)
+            except Exception as exc:
+                logger.warning("stream.send failed for %s: %s", self._primary._key, exc)
+                return False
         ok = self._primary.send(event, data)
         if self._mirror:
             self._mirror.send(event, data)
         return ok
 
+    def flush(self) -> bool:
+        return self._buffer.flush() if self._buffer is not None else True
+
+    def close(self) -> bool:
+        return self.flush()
+
+    def __enter__(self) -> "FamilyStreamWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
     def expire(self, ttl: int | None = None) -> None:
+        self.flush()
         self._primary.expire(ttl)
         if self._mirror:
             self._mirror.expire(ttl)
@@ -159,18 +304,33 @@ def _get_async_redis():
 class _HubEntry:
     """One entry per unique stream key in the hub."""
     subscribers: set  # set of asyncio.Queue
-    reader_task: Optional[asyncio.Task] = None
+    cursor: Optional[str] = None  # last id read; None until resolved
     last_activity: float = field(default_factory=time.time)
 
 
 class StreamHub:
     """Process-singleton fan-out hub.
 
-    For each unique stream key with active subscribers, runs exactly one
-    background asyncio.Task that calls XREAD with BLOCK. When entries arrive,
-    fans out to all subscriber Queues.
+    Stream keys with active subscribers are spread over ``READERS`` shards.
+    Each shard runs one background asyncio.Task that issues a single
+    multi-key XREAD BLOCK over all its keys, each from its own cursor, and
+    fans entries out to the subscriber Queues. A replica holding thousands
+    of SSE connections therefore holds ``READERS`` blocking Redis
+    connections, not one per key.
+
+    A new key joins its shard's next XREAD. The shard's reader is woken
+    through a per-process wake stream so it picks the key up immediately
+    instead of after ``XREAD_BLOCK_MS``. A ``"$"`` subscription is pinned
+    to the stream's current last id (or, if that lookup keeps failing, a
+    time-based id just before now) before the key is read, so events
+    written in between are not lost.
+
+    Last subscriber of a key leaves: key dropped from its shard, stream TTL
+    set; an empty shard's reader is cancelled.
 
-    Subscriber count → 0: reader cancelled, key cleaned up, stream TTL set.
+    Counters (active connections, queue overflow, reconnects) are kept in
+    memory and flushed to Redis every ``STATS_FLUSH_SECONDS`` — nothing on
+    the event loop makes a synchronous Redis call.
 
     Memory bounds:
     - Per-stream entries bounded by XADD MAXLEN (in StreamWriter)
@@ -181,10 +341,27 @@ class StreamHub:
     XREAD_BLOCK_MS: int = 5000
     XREAD_COUNT: int = 50
     MAX_QUEUE_SIZE: int = 200
+    READERS: int = 4
+    IO_CONCURRENCY: int = 16  # one-shot hub commands in flight (shared pool of 50)
+    STATS_FLUSH_SECONDS: float = 10.0
+    WAKE_TTL: int = 3600
+    TAIL_RETRIES: int = 3
+    TAIL_RETRY_DELAY: float = 0.05
+    TAIL_CLOCK_SKEW_MS: int = 5000  # replica vs Redis clock margin for a pinned tail
 
     def __init__(self):
         self._entries: dict[str, _HubEntry] = {}
+        self._shards: list[set[str]] = [set() for _ in range(self.READERS)]
+        self._readers: dict[int, asyncio.Task] = {}
+        self._wake_keys = [f"stream:hub:{uuid.uuid4().hex}:{i}" for i in range(self.READERS)]
+        self._stats: Counter = Counter()
+        self._stats_task: Optional[asyncio.Task] = None
         self._lock = asyncio.Lock()
+        # Bounds the tail/wake/catch-up/expire commands of a reconnect storm
+        self._io = asyncio.Semaphore(self.IO_CONCURRENCY)
+
+    def _shard(self, key: str) -> int:
+        return zlib.crc32(key.encode()) % self.READERS
 
     async def subscribe(self, key: str, last_id: str = "$") -> asyncio.Queue:
         """Register a new SSE connection for this stream key.
@@ -194,36 +371,47 @@ class StreamHub:
 
         Returns a Queue that receives dicts: {"id": str, "type": str, "data": str}.
 
-        Reconnection contract: if a reader is already running (serving other
-        subscribers), the reconnecting subscriber gets a one-time XRANGE
-        catch-up from last_id to current. Duplicates between XRANGE and
-        fan-out are possible — clients must handle idempotently.
+        Reconnection contract: if the key is already being read (serving
+        other subscribers), the reconnecting subscriber gets a one-time
+        XRANGE catch-up from last_id to current. Duplicates between XRANGE
+        and fan-out are possible — clients must handle idempotently.
         """
         q: asyncio.Queue = asyncio.Queue(maxsize=self.MAX_QUEUE_SIZE)
         needs_catchup = False
+        new_entry: Optional[_HubEntry] = None
         async with self._lock:
-            if key not in self._entries:
-                # First subscriber — reader starts from their position
-                entry = _HubEntry(subscribers=set())
-                self._entries[key] = entry
-                entry.reader_task = asyncio.create_task(
-                    self._reader_loop(key, last_id),
-                    name=f"stream-reader:{key}",
+            entry = self._entries.get(key)
+            if entry is None:
+                # First subscriber — the key is read from their position
+                entry = new_entry = _HubEntry(
+                    subscribers=set(), cursor=None if last_id == "$" else last_id,
                 )
+                self._entries[key] = entry
+                shard = self._shard(key)
+                self._shards[shard].add(key)
+                self._ensure_reader(shard)
             else:
-                # Joining an existing reader — may need catch-up
+                # Joining a key already being read — may need catch-up
                 needs_catchup = last_id not in ("$", "0-0")
-            self._entries[key].subscribers.add(q)
-            self._entries[key].last_activity = time.time()
+            entry.subscribers.add(q)
+            entry.last_activity = time.time()
+        self.incr("stream:active_connections")
+        self._ensure_stats_flusher()
+
+        if new_entry is not None:
+            if new_entry.cursor is None:
+                new_entry.cursor = await self._tail_id(key)
+            await self._wake(self._shard(key))
 
         # Catch-up: replay events from last_id for reconnecting subscribers
-        # joining an existing reader that's already ahead. Some events may
-        # also arrive via fan-out (duplicates), which is documented as the
-        # client's responsibility to handle idempotently.
+        # joining a key that's already ahead. Some events may also arrive
+        # via fan-out (duplicates), which is documented as the client's
+        # responsibility to handle idempotently.
         if needs_catchup:
             try:
                 r = _get_async_redis()
-                entries = await r.xrange(key, min=last_id, count=self.MAX_QUEUE_SIZE)
+                async with self._io:
+                    entries = await r.xrange(key, min=last_id, count=self.MAX_QUEUE_SIZE)
                 for entry_id, fields in entries:
                     if entry_id == last_id:
                         continue  # skip the event they already saw
@@ -234,60 +422,143 @@ class StreamHub:
                             "data": fields.get("data", "{}"),
                         })
                     except asyncio.QueueFull:
-                        _incr("stream:queue_full")
+                        self.incr("stream:queue_full")
                         break
             except Exception as exc:
                 logger.warning("stream catchup failed for %s: %s", key, exc)
 
-        _incr("stream:active_connections")
         return q
 
     async def unsubscribe(self, key: str, q: asyncio.Queue) -> None:
-        """Remove a subscriber. If last one, cancel reader and clean up."""
+        """Remove a subscriber. If last one, stop reading the key and clean up."""
         async with self._lock:
             entry = self._entries.get(key)
             if not entry:
                 return
             entry.subscribers.discard(q)
-            if not entry.subscribers:
-                if entry.reader_task and not entry.reader_task.done():
-                    entry.reader_task.cancel()
+            idle = not entry.subscribers
+            if idle:
                 del self._entries[key]
-                # Set TTL on idle stream so Redis cleans it up
-                try:
-                    r = _get_async_redis()
+                shard = self._shard(key)
+                self._shards[shard].discard(key)
+                if not self._shards[shard]:
+                    reader = self._readers.pop(shard, None)
+                    if reader and not reader.done():
+                        reader.cancel()
+        self.incr("stream:active_connections", -1)
+        if idle:
+            # Set TTL on idle stream so Redis cleans it up
+            try:
+                r = _get_async_redis()
+                async with self._io:
                     await r.expire(key, StreamWriter.IDLE_TTL)
-                except Exception:
-                    pass
-        _incr_neg("stream:active_connections")
+            except Exception:
+                pass
+
+    def incr(self, counter_key: str, amount: int = 1) -> None:
+        """Count in memory; flushed to Redis every STATS_FLUSH_SECONDS."""
+        self._stats[counter_key] += amount
+
+    async def aclose(self) -> None:
+        """Stop all readers and flush counters. For app shutdown."""
+        tasks = list(self._readers.values())
+        if self._stats_task:
+            tasks.append(self._stats_task)
+        self._readers.clear()
+        self._stats_task = None
+        for t in tasks:
+            t.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await self._flush_stats()
+
+    # ── internals ──
+
+    def _ensure_reader(self, shard: int) -> None:
+        reader = self._readers.get(shard)
+        if reader is None or reader.done():
+            self._readers[shard] = asyncio.create_task(
+                self._reader_loop(shard), name=f"stream-reader:{shard}",
+            )
+
+    def _ensure_stats_flusher(self) -> None:
+        if self._stats_task is None or self._stats_task.done():
+            self._stats_task = asyncio.create_task(self._stats_loop(), name="stream-hub-stats")
+
+    async def _tail_id(self, key: str) -> str:
+        """Current last id of ``key`` ("0-0" if it doesn't exist yet).
+
+        Retried with backoff. If Redis stays unreachable the cursor is pinned
+        to a time-based id ``TAIL_CLOCK_SKEW_MS`` in the past. Never ``"$"``:
+        in the multi-key XREAD it would be re-resolved every round, and
+        anything written between rounds would be skipped. Starting a little
+        early may replay events, which clients already handle (catch-up
+        does the same).
+        """
+        error: Optional[Exception] = None
+        for attempt in range(self.TAIL_RETRIES):
+            if attempt:
+                await asyncio.sleep(self.TAIL_RETRY_DELAY * 2 ** (attempt - 1))
+            try:
+                r = _get_async_redis()
+                async with self._io:
+                    last = await r.xrevrange(key, count=1)
+                return last[0][0] if last else "0-0"
+            except Exception as exc:
+                error = exc
+        pinned = f"{max(int(time.time() * 1000) - self.TAIL_CLOCK_SKEW_MS, 0)}-0"
+        logger.warning("stream tail lookup failed for %s: %s; reading from %s", key, error, pinned)
+        self.incr("stream:tail_fallback")
+        return pinned
+
+    async def _wake(self, shard: int) -> None:
+        """Interrupt the shard's blocking XREAD so it re-reads its key set."""
+        try:
+            r = _get_async_redis()
+            async with self._io, r.pipeline(transaction=False) as pipe:
+                pipe.xadd(self._wake_keys[shard], {"w": "1"}, maxlen=1, approximate=False)
+                pipe.expire(self._wake_keys[shard], self.WAKE_TTL)
+                await pipe.execute()
+        except Exception as exc:
+            logger.debug("stream hub wake failed for shard %d: %s", shard, exc)
 
-    async def _reader_loop(self, key: str, start_id: str) -> None:
-        """Background task: XREAD from Redis, fan out to subscribers."""
+    async def _reader_loop(self, shard: int) -> None:
+        """Background task: one multi-key XREAD per round, fan out to subscribers."""
         r = _get_async_redis()
-        cursor = start_id
+        wake_key = self._wake_keys[shard]
+        wake_cursor = "0-0"
         retry_delay = 1
 
         while True:
             try:
+                streams = {}
+                for key in self._shards[shard]:
+                    entry = self._entries.get(key)
+                    if entry is not None and entry.cursor is not None:
+                        streams[key] = entry.cursor
+                streams[wake_key] = wake_cursor
                 result = await r.xread(
-                    {key: cursor},
+                    streams,
                     count=self.XREAD_COUNT,
                     block=self.XREAD_BLOCK_MS,
                 )
-                if result:
-                    for _stream_key, entries in result:
-                        for entry_id, fields in entries:
-                            cursor = entry_id
-                            self._fan_out(key, {
-                                "id": entry_id,
-                                "type": fields.get("type", "message"),
-                                "data": fields.get("data", "{}"),
-                            })
+                for key, entries in result or ():
+                    if key == wake_key:
+                        wake_cursor = entries[-1][0]
+                        continue
+                    entry = self._entries.get(key)
+                    for entry_id, fields in entries:
+                        if entry is not None:
+                            entry.cursor = entry_id
+                        self._fan_out(key, {
+                            "id": entry_id,
+                            "type": fields.get("type", "message"),
+                            "data": fields.get("data", "{}"),
+                        })
                 retry_delay = 1  # reset on success
             except asyncio.CancelledError:
                 return
             except Exception as exc:
-                logger.warning("stream reader error for %s: %s", key, exc)
+                logger.warning("stream reader error for shard %d: %s", shard, exc)
                 await asyncio.sleep(min(retry_delay, 30))
                 retry_delay = min(retry_delay * 2, 30)
 
@@ -300,17 +571,29 @@ class StreamHub:
             try:
                 q.put_nowait(message)
             except asyncio.QueueFull:
-                _incr("stream:queue_full")
+                self.incr("stream:queue_full")
         entry.last_activity = time.time()
 
+    async def _stats_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.STATS_FLUSH_SECONDS)
+            await self._flush_stats()
 
-def _incr_neg(counter_key: str) -> None:
-    """Decrement a Redis counter. Best-effort."""
-    try:
-        from app.core.redis import get_redis
-        get_redis().decr(counter_key)
-    except Exception:
-        pass
+    async def _flush_stats(self) -> None:
+        deltas = {k: v for k, v in self._stats.items() if v}
+        if not deltas:
+            return
+        self._stats.clear()
+        try:
+            r = _get_async_redis()
+            async with r.pipeline(transaction=False) as pipe:
+                for counter_key, amount in deltas.items():
+                    pipe.incrby(counter_key, amount)
+                await pipe.execute()
+        except Exception as exc:
+            # Keep the deltas for the next flush
+            self._stats.update(deltas)
+            logger.debug("stream hub stats flush failed: %s", exc)
 
 
 # ── Hub singleton ────────────────────────────────────────────────────────────
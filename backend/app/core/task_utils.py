@@ -340,41 +340,35 @@ def create_pydantic_model_from_json_schema(
     return DynamicModel
 
 
+def _remaining_time_limit() -> Optional[float]:
+    """Seconds left of the current Celery task's soft time limit, or None outside a task."""
+    import time
+    from celery import current_task
+    request = getattr(current_task, "request", None)
+    if not request or not request.id:
+        return None
+    soft = (request.timelimit or (None, None))[1] or current_task.soft_time_limit \
+        or current_task.app.conf.task_soft_time_limit
+    if not soft:
+        return None
+    from app.core.celery_app import _task_start_times
+    started = _task_start_times.get(request.id)
+    elapsed = time.perf_counter() - started if started is not None else 0.0
+    return max(soft - elapsed, 0.0)
+
+
 def run_async_in_celery(async_func, *args, **kwargs):
     """
-    Safely run an async function in a Celery task context.
-    Manages the event loop to avoid "Event loop is closed" errors.
-    """
-    import asyncio
-    loop = None
-    try:
-        current_loop = asyncio.get_event_loop()
-        if current_loop and not current_loop.is_closed() and not current_loop.is_running():
-            loop = current_loop
-        else:
-            raise RuntimeError("Current loop is not usable")
-    except RuntimeError:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-
-    if not loop:
-        raise RuntimeError("Could not obtain a usable event loop")
+    Run an async function from a sync Celery task on the worker's event loop.
 
+    The loop lives for the whole worker process (core/worker_loop), so async
+    clients and pooled providers are reused across tasks. The coroutine is
+    bounded by what is left of the task's soft time limit and is cancelled
+    if the task is interrupted.
+    """
+    from app.core import worker_loop
     try:
-        return loop.run_until_complete(async_func(*args, **kwargs))
+        return worker_loop.run(async_func(*args, **kwargs), timeout=_remaining_time_limit())
     except Exception as e:
         logger.error(f"Error in async function {async_func.__name__}: {e}", exc_info=True)
         raise
-    finally:
-        try:
-            pending_tasks = [t for t in asyncio.all_tasks(loop) if not t.done()]
-            if pending_tasks:
-                for t in pending_tasks:
-                    if not t.done():
-                        t.cancel()
-                try:
-                    loop.run_until_complete(asyncio.wait_for(asyncio.gather(*pending_tasks, return_exceptions=True), timeout=5.0))
-                except (asyncio.TimeoutError, Exception):
-                    pass
-        except Exception:
-            pass
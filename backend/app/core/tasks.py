@@ -26,6 +26,8 @@ from typing import Any, Callable, Generator, Optional, Type
 from pydantic import BaseModel
 from sqlmodel import Session
 
+from app.core import wakeups  # noqa: F401 — registers the session listeners
+
 logger = logging.getLogger(__name__)
 
 MAX_CHAIN_DEPTH = 50
@@ -37,7 +39,7 @@ MAX_CHAIN_DEPTH = 50
 class TaskDescriptor:
     """Runtime metadata for a registered task."""
     name: str
-    check: Callable[[int], Any]  # infospace_id -> Select
+    check: Callable[[int], Any]  # infospace_id -> Select; the dispatcher passes a column (set-based)
     celery_task_name: str
     batch: int = 50
     queue: str = "default"
@@ -50,6 +52,8 @@ class TaskDescriptor:
     depends_on: Optional[str] = None
     self_chain: bool = False
     triggers: list[str] = field(default_factory=list)
+    # Write kinds (core/wakeups) that make this task's check worth re-running
+    wakes_on: frozenset[str] = field(default_factory=frozenset)
     tags: frozenset[str] = field(default_factory=frozenset)
     context_cls: Type[TaskContext] = None  # set after TaskContext is defined
     dispatch_filter: Optional[Callable] = None
@@ -488,6 +492,14 @@ def count_occupied_slots(r, task_name: str, infospace_id: int, max_concurrency:
     return r.eval(_COUNT_SLOTS_LUA, 1, prefix, max_concurrency)
 
 
+def count_occupied_slots_many(r, task_name: str, infospace_ids: list[int], max_concurrency: int) -> list[int]:
+    """``count_occupied_slots`` for many infospaces in one pipelined round trip."""
+    pipe = r.pipeline(transaction=False)
+    for infospace_id in infospace_ids:
+        pipe.eval(_COUNT_SLOTS_LUA, 1, _slot_prefix(task_name, infospace_id), max_concurrency)
+    return [int(n) for n in pipe.execute()]
+
+
 def filter_failed_items(task_name: str, ids: list[int], max_failures: int) -> list[int]:
     """Remove items that have exceeded max_item_failures."""
     r = _get_redis()
@@ -536,6 +548,7 @@ def task(
     depends_on: str | None = None,
     self_chain: bool = False,
     triggers: list[str] | None = None,
+    wakes_on: list[str] | None = None,
     tags: frozenset[str] = frozenset(),
     # Internal extension API (for @enricher and other wrappers)
     context_cls: Type[TaskContext] = TaskContext,
@@ -549,6 +562,16 @@ def task(
 
     The decorated function signature: fn(ctx: TaskContext, entity_ids: list[int])
 
+    ``check(infospace_id)`` returns a Select of pending item ids. Use the
+    argument only inside SQL expressions: the dispatcher calls it once with
+    a column reference and evaluates it for all infospaces in one query.
+
+    ``wakes_on`` names the write kinds (core/wakeups: "asset", "chunk",
+    "annotation") the check depends on. Writes of those kinds mark the
+    (task, infospace) pair dirty and ``dispatch_wakeups`` checks it within
+    seconds; the scheduled sweep then only runs every
+    ``DISPATCH_WAKEUP_SWEEP_SECONDS`` as a safety net.
+
     When ``params_model`` is set: the function becomes direct-invocation-only
     (no triggers, no schedule). The signature gains a third argument:
     ``fn(ctx, entity_ids, params: params_model)``. Invoke via
@@ -597,6 +620,7 @@ def task(
             depends_on=depends_on,
             self_chain=self_chain,
             triggers=triggers,
+            wakes_on=frozenset(wakes_on or ()),
             tags=tags,
             context_cls=context_cls,
             dispatch_filter=dispatch_filter,
@@ -62,28 +62,21 @@ def copy(
 
     total_assets = 0
     total_bundles = 0
-    new_bundle_ids: set[int] = set()
 
-    # Fork bundles
+    # Fork bundles; assets in forked bundles gain membership in their new containers
     for bid in bundle_ids:
         _assert_bundle_exists(session, bid)
         mapping = _fork_subtree(session, bid, to, exclude=set())
         total_bundles += len(mapping)
-        new_bundle_ids.update(mapping.values())
-        # Assets in forked bundles gain membership in their new containers
-        for old_bid, new_bid in mapping.items():
-            count = _array_append_from_bundle(session, old_bid, new_bid)
-            total_assets += count
+        total_assets += _array_append_mapped(session, mapping)
+    if bundle_ids and to != ROOT:
+        _bump_child_counts(session, {to: len(bundle_ids)})
 
-    # Copy assets directly
+    # Copy assets directly (delta-counted on `to`)
     if asset_ids:
         added = _array_append(session, asset_ids, to)
         total_assets += added
 
-    # Recount: destination + all newly created bundles
-    recount_ids = {to} | new_bundle_ids
-    _recount(session, recount_ids)
-
     dest_name = _node_name(session, to, is_bundle=True)
     return TreeResult(
         message=f"Copied {total_assets} assets, {total_bundles} bundles into '{dest_name}'.",
@@ -141,7 +134,7 @@ def move(
             raise ValueError(f"Moving bundle {bid} under {to} would create a cycle.")
 
         session.execute(
-            text("UPDATE bundle SET parent_bundle_id = :to WHERE id = :bid"),
+            text("UPDATE bundle SET parent_bundle_id = :to, updated_at = now() WHERE id = :bid"),
             {"to": to, "bid": bid},
         )
         total_bundles += 1
@@ -320,10 +313,9 @@ def delete(
             else:
                 direct_survived.add(aid)
 
-    # Unlink shared assets from subtree bundles
+    # Unlink shared assets from subtree bundles (bundles are destroyed — no recount)
     if unlinked_assets and all_bundle_ids:
-        for bid in all_bundle_ids:
-            _array_remove(session, list(unlinked_assets), bid)
+        _array_remove_many(session, list(unlinked_assets), all_bundle_ids)
 
     # Unlink survived direct assets
     if direct_survived:
@@ -443,7 +435,10 @@ def _assert_not_sealed(session: Session, bundle_id: int, verb: str) -> None:
 
 
 def _array_append(session: Session, asset_ids: list[int], bundle_id: int) -> int:
-    """Add bundle_id to bundle_ids for given assets. Idempotent. Returns rows changed."""
+    """Add bundle_id to bundle_ids for given assets. Idempotent. Returns rows changed.
+
+    asset_count of bundle_id moves by the rows changed (delta, no recount).
+    """
     if not asset_ids:
         return 0
     result = session.execute(
@@ -454,24 +449,57 @@ def _array_append(session: Session, asset_ids: list[int], bundle_id: int) -> int
         ),
         {"bid": bundle_id, "ids": asset_ids},
     )
+    _bump_counts(session, {bundle_id: result.rowcount})
     return result.rowcount
 
 
-def _array_append_from_bundle(session: Session, source_bundle_id: int, target_bundle_id: int) -> int:
-    """Add target_bundle_id to all assets that are in source_bundle_id. Returns rows changed."""
-    result = session.execute(
-        text(
-            "UPDATE asset SET bundle_ids = array_append(bundle_ids, :to_bid) "
-            "WHERE bundle_ids @> ARRAY[:from_bid]::int[] "
-            "AND NOT (bundle_ids @> ARRAY[:to_bid]::int[])"
-        ),
-        {"from_bid": source_bundle_id, "to_bid": target_bundle_id},
-    )
-    return result.rowcount
+def _array_append_mapped(session: Session, mapping: dict[int, int]) -> int:
+    """Give every asset in an old bundle membership in its mapped new bundle.
+
+    One statement for the whole mapping: assets are matched through the GIN
+    index on bundle_ids, new ids appended per asset, and the new bundles'
+    asset_count set from the appended memberships. New bundles start empty,
+    so the count is exact. Returns memberships added.
+    """
+    if not mapping:
+        return 0
+    olds, news = list(mapping), list(mapping.values())
+    rows = session.execute(
+        text("""
+            WITH m AS (
+                SELECT * FROM unnest(CAST(:olds AS int[]), CAST(:news AS int[])) AS m(old_id, new_id)
+            ),
+            adds AS (
+                SELECT a.id, array_agg(DISTINCT m.new_id) AS new_ids
+                FROM asset a
+                CROSS JOIN LATERAL unnest(a.bundle_ids) AS b(old_id)
+                JOIN m ON m.old_id = b.old_id
+                WHERE a.bundle_ids && CAST(:olds AS int[])
+                GROUP BY a.id
+            ),
+            upd AS (
+                UPDATE asset a SET bundle_ids = a.bundle_ids || adds.new_ids
+                FROM adds WHERE a.id = adds.id
+                RETURNING adds.new_ids
+            ),
+            counts AS (
+                SELECT n.bid, count(*) AS n FROM upd CROSS JOIN LATERAL unnest(upd.new_ids) AS n(bid)
+                GROUP BY n.bid
+            )
+            UPDATE bundle SET asset_count = counts.n, updated_at = now()
+            FROM counts WHERE bundle.id = counts.bid
+            RETURNING counts.n
+        """),
+        {"olds": olds, "news": news},
+    ).fetchall()
+    return sum(r[0] for r in rows)
 
 
 def _array_remove(session: Session, asset_ids: list[int], bundle_id: int) -> int:
-    """Remove bundle_id from bundle_ids. Normalizes empty to {ROOT}. Returns rows changed."""
+    """Remove bundle_id from bundle_ids. Normalizes empty to {ROOT}. Returns rows changed.
+
+    asset_count of bundle_id moves by the rows changed (delta, no recount).
+    """
     if not asset_ids:
         return 0
     result = session.execute(
@@ -486,9 +514,64 @@ def _array_remove(session: Session, asset_ids: list[int], bundle_id: int) -> int
         ),
         {"bid": bundle_id, "ids": asset_ids},
     )
+    _bump_counts(session, {bundle_id: -result.rowcount})
+    return result.rowcount
+
+
+def _array_remove_many(session: Session, asset_ids: list[int], bundle_ids: set[int]) -> int:
+    """Remove every id in bundle_ids from the given assets in one statement.
+
+    Normalizes empty to {ROOT}. Counts are not touched — callers use this for
+    bundles about to be destroyed. Returns rows changed.
+    """
+    if not asset_ids or not bundle_ids:
+        return 0
+    result = session.execute(
+        text(
+            "UPDATE asset SET bundle_ids = COALESCE("
+            "  (SELECT array_agg(b ORDER BY o) FROM unnest(bundle_ids) WITH ORDINALITY AS u(b, o) "
+            "   WHERE b <> ALL(CAST(:bids AS int[]))), "
+            "  ARRAY[0]::int[]) "
+            "WHERE id = ANY(:ids) "
+            "AND bundle_ids && CAST(:bids AS int[])"
+        ),
+        {"bids": list(bundle_ids), "ids": asset_ids},
+    )
     return result.rowcount
 
 
+def _bump_counts(session: Session, deltas: dict[int, int]) -> None:
+    """Apply asset_count deltas in one statement. ROOT has no row."""
+    deltas = {bid: n for bid, n in deltas.items() if bid != ROOT and n}
+    if not deltas:
+        return
+    session.execute(
+        text(
+            "UPDATE bundle SET asset_count = GREATEST(0, COALESCE(asset_count, 0) + d.n), "
+            "updated_at = now() "
+            "FROM unnest(CAST(:bids AS int[]), CAST(:ns AS int[])) AS d(bid, n) "
+            "WHERE bundle.id = d.bid"
+        ),
+        {"bids": list(deltas), "ns": list(deltas.values())},
+    )
+
+
+def _bump_child_counts(session: Session, deltas: dict[int, int]) -> None:
+    """Apply child_bundle_count deltas in one statement. ROOT has no row."""
+    deltas = {bid: n for bid, n in deltas.items() if bid != ROOT and n}
+    if not deltas:
+        return
+    session.execute(
+        text(
+            "UPDATE bundle SET child_bundle_count = "
+            "GREATEST(0, COALESCE(child_bundle_count, 0) + d.n) "
+            "FROM unnest(CAST(:bids AS int[]), CAST(:ns AS int[])) AS d(bid, n) "
+            "WHERE bundle.id = d.bid"
+        ),
+        {"bids": list(deltas), "ns": list(deltas.values())},
+    )
+
+
 def _fork_subtree(
     session: Session,
     bundle_id: int,
@@ -499,7 +582,9 @@ def _fork_subtree(
     Recursively create new bundles mirroring the subtree.
     Returns {old_id: new_id} mapping.
 
-    Batch path: one CTE collects structure, bulk insert, batch asset membership.
+    Batch path: one CTE collects structure, one nextval batch allocates ids,
+    one INSERT creates the subtree with child_bundle_count already set.
+    Asset membership is the caller's (``_array_append_mapped``).
     """
     # Collect entire subtree structure in one query
     rows = session.execute(
@@ -521,62 +606,61 @@ def _fork_subtree(
     if not rows:
         return {}
 
-    mapping: dict[int, int] = {}  # old_id → new_id
-
+    # Plan the fork in memory: root goes to new_parent, descendants follow mapping
+    plan: list[tuple[int, int]] = []  # (old_id, old_parent) in depth order
+    kept: set[int] = set()
     for row in rows:
-        old_id = row[0]
+        old_id, old_parent = row[0], row[1]
         if old_id in exclude:
             continue
+        if old_id != bundle_id and old_parent not in kept:
+            continue  # parent was excluded, skip this branch
+        kept.add(old_id)
+        plan.append((old_id, old_parent))
+    if not plan:
+        return {}
 
-        old_parent = row[1]
-
-        # Determine new parent: root of fork goes to new_parent, descendants follow mapping
-        if old_id == bundle_id:
-            fork_parent = new_parent
-        else:
-            if old_parent in exclude or old_parent not in mapping:
-                continue  # parent was excluded, skip this branch
-            fork_parent = mapping[old_parent]
-
-        # Deduplicate name at the target parent
-        fork_name = _unique_name(session, row[2], row[8], fork_parent, row[6])
-
-        # Insert new bundle
-        result = session.execute(
-            text(
-                "INSERT INTO bundle (name, description, purpose, bundle_metadata, version, "
-                "tags, infospace_id, user_id, parent_bundle_id, asset_count, child_bundle_count, "
-                "uuid, created_at, updated_at) "
-                "VALUES (:name, :desc, :purpose, :meta, :version, :tags, :iid, :uid, "
-                ":parent, 0, 0, gen_random_uuid()::text, now(), now()) "
-                "RETURNING id"
-            ),
-            {
-                "name": fork_name,
-                "desc": row[3],
-                "purpose": row[4],
-                "meta": row[5],
-                "version": row[6],
-                "tags": row[7],
-                "iid": row[8],
-                "uid": row[9],
-                "parent": fork_parent,
-            },
-        )
-        new_id = result.scalar()
-        mapping[old_id] = new_id
+    # Allocate every new id up front, then insert the whole subtree in one
+    # statement (depth order, so each parent row exists before its children)
+    new_ids = [
+        r[0] for r in session.execute(
+            text("SELECT nextval(pg_get_serial_sequence('bundle', 'id')) FROM generate_series(1, :n)"),
+            {"n": len(plan)},
+        ).fetchall()
+    ]
+    mapping: dict[int, int] = {old_id: new_id for (old_id, _), new_id in zip(plan, new_ids)}
+    parents = [new_parent if old_id == bundle_id else mapping[old_parent] for old_id, old_parent in plan]
+    child_counts: dict[int, int] = {}
+    for parent in parents[1:]:
+        child_counts[parent] = child_counts.get(parent, 0) + 1
 
-    # Recount child_bundle_count for new bundles
-    for new_id in mapping.values():
-        session.execute(
-            text(
-                "UPDATE bundle SET child_bundle_count = "
-                "(SELECT count(*) FROM bundle WHERE parent_bundle_id = :bid) "
-                "WHERE id = :bid"
-            ),
-            {"bid": new_id},
-        )
+    # Only the fork root can collide: descendants land under fresh bundles
+    root = rows[0]
+    root_name = _unique_name(session, root[2], root[8], new_parent, root[6])
 
+    session.execute(
+        text("""
+            INSERT INTO bundle (id, name, description, purpose, bundle_metadata, version,
+                                tags, infospace_id, user_id, parent_bundle_id, asset_count,
+                                child_bundle_count, uuid, created_at, updated_at)
+            SELECT v.new_id, CASE WHEN v.ord = 1 THEN :root_name ELSE b.name END,
+                   b.description, b.purpose, b.bundle_metadata, b.version, b.tags,
+                   b.infospace_id, b.user_id, v.parent, 0, v.children,
+                   gen_random_uuid()::text, now(), now()
+            FROM unnest(CAST(:olds AS int[]), CAST(:news AS int[]),
+                        CAST(:parents AS int[]), CAST(:children AS int[]))
+                 WITH ORDINALITY AS v(old_id, new_id, parent, children, ord)
+            JOIN bundle b ON b.id = v.old_id
+            ORDER BY v.ord
+        """),
+        {
+            "root_name": root_name,
+            "olds": [old_id for old_id, _ in plan],
+            "news": new_ids,
+            "parents": parents,
+            "children": [child_counts.get(new_id, 0) for new_id in new_ids],
+        },
+    )
     return mapping
 
 
@@ -686,11 +770,13 @@ def _destroy_assets(session: Session, asset_ids: set[int]) -> int:
             text("DELETE FROM asset WHERE id = ANY(:ids)"),
             {"ids": all_child_ids},
         )
-    result = session.execute(
-        text("DELETE FROM asset WHERE id = ANY(:ids)"),
+    deleted = session.execute(
+        text("DELETE FROM asset WHERE id = ANY(:ids) RETURNING infospace_id"),
         {"ids": ids_list},
-    )
-    return result.rowcount + len(all_child_ids)
+    ).fetchall()
+    # Cached listing counts (content/counts.py) are invalidated on commit
+    session.info.setdefault("asset_writes", set()).update(r[0] for r in deleted)
+    return len(deleted) + len(all_child_ids)
 
 
 def _destroy_bundles(session: Session, bundle_ids: set[int]) -> int:
@@ -725,67 +811,61 @@ def _destroy_bundles(session: Session, bundle_ids: set[int]) -> int:
 
 
 def _recount(session: Session, bundle_ids: set[int]) -> None:
-    """Recount asset_count for given bundles from DB truth."""
-    for bid in bundle_ids:
-        session.execute(
-            text(
-                "UPDATE bundle SET asset_count = "
-                "(SELECT count(*) FROM asset WHERE bundle_ids @> ARRAY[:bid]::int[]), "
-                "updated_at = now() "
-                "WHERE id = :bid"
-            ),
-            {"bid": bid},
-        )
+    """Recount asset_count for given bundles from DB truth — one grouped statement.
+
+    Memberships are counted with a single ``unnest(bundle_ids)`` pass over the
+    assets that overlap the set (GIN-indexed), not one scan per bundle.
+    """
+    bids = [bid for bid in bundle_ids if bid != ROOT]
+    if not bids:
+        return
+    session.execute(
+        text("""
+            UPDATE bundle SET asset_count = COALESCE(c.n, 0), updated_at = now()
+            FROM unnest(CAST(:bids AS int[])) AS t(id)
+            LEFT JOIN (
+                SELECT m.bid, count(DISTINCT a.id) AS n
+                FROM asset a CROSS JOIN LATERAL unnest(a.bundle_ids) AS m(bid)
+                WHERE a.bundle_ids && CAST(:bids AS int[])
+                  AND m.bid = ANY(CAST(:bids AS int[]))
+                GROUP BY m.bid
+            ) c ON c.bid = t.id
+            WHERE bundle.id = t.id
+        """),
+        {"bids": bids},
+    )
 
 
 def _recount_children(session: Session, moved_bundle_ids: list[int], old_parent: int, new_parent: int) -> None:
     """Update child_bundle_count after bundle moves."""
-    if not moved_bundle_ids:
+    if not moved_bundle_ids or old_parent == new_parent:
         return
     count = len(moved_bundle_ids)
+    _bump_child_counts(session, {old_parent: -count, new_parent: count})
 
-    if old_parent != ROOT:
-        session.execute(
-            text(
-                "UPDATE bundle SET child_bundle_count = "
-                "GREATEST(0, COALESCE(child_bundle_count, 0) - :n) "
-                "WHERE id = :bid"
-            ),
-            {"n": count, "bid": old_parent},
-        )
 
-    if new_parent != ROOT:
-        session.execute(
+def _unique_name(session: Session, name: str, infospace_id: int, parent_id: int, version: str) -> str:
+    """Generate a unique bundle name at the target parent, appending ' (copy N)' if needed.
+
+    One query fetches every taken ``name`` / ``name (copy…)`` sibling.
+    """
+    taken = {
+        r[0] for r in session.execute(
             text(
-                "UPDATE bundle SET child_bundle_count = "
-                "COALESCE(child_bundle_count, 0) + :n "
-                "WHERE id = :bid"
+                "SELECT name FROM bundle WHERE infospace_id = :iid AND parent_bundle_id = :pid "
+                "AND version = :ver AND (name = :name OR left(name, :plen) = :prefix)"
             ),
-            {"n": count, "bid": new_parent},
-        )
-
-
-def _unique_name(session: Session, name: str, infospace_id: int, parent_id: int, version: str) -> str:
-    """Generate a unique bundle name at the target parent, appending ' (copy N)' if needed."""
-    exists = session.execute(
-        text(
-            "SELECT 1 FROM bundle WHERE infospace_id = :iid AND parent_bundle_id = :pid "
-            "AND name = :name AND version = :ver"
-        ),
-        {"iid": infospace_id, "pid": parent_id, "name": name, "ver": version},
-    ).first()
-    if not exists:
+            {
+                "iid": infospace_id, "pid": parent_id, "ver": version, "name": name,
+                "prefix": f"{name} (copy", "plen": len(name) + len(" (copy"),
+            },
+        ).fetchall()
+    }
+    if name not in taken:
         return name
     for i in range(1, 100):
         candidate = f"{name} (copy {i})" if i > 1 else f"{name} (copy)"
-        exists = session.execute(
-            text(
-                "SELECT 1 FROM bundle WHERE infospace_id = :iid AND parent_bundle_id = :pid "
-                "AND name = :name AND version = :ver"
-            ),
-            {"iid": infospace_id, "pid": parent_id, "name": candidate, "ver": version},
-        ).first()
-        if not exists:
+        if candidate not in taken:
             return candidate
     raise ValueError(f"Cannot generate unique name for '{name}'")
 
@@ -804,20 +884,24 @@ def _node_name(session: Session, node_id: int, is_bundle: bool) -> str:
 
 
 def _would_cycle(session: Session, child_id: int, new_parent_id: int) -> bool:
-    """Check if making new_parent_id the parent of child_id would create a cycle."""
+    """Check if making new_parent_id the parent of child_id would create a cycle.
+
+    One recursive CTE walks new_parent_id's ancestor chain (UNION stops on an
+    existing cycle).
+    """
     if new_parent_id == ROOT:
         return False
-    current_id = new_parent_id
-    visited: set[int] = set()
-    while current_id != ROOT and current_id not in visited:
-        if current_id == child_id:
-            return True
-        visited.add(current_id)
-        row = session.execute(
-            text("SELECT parent_bundle_id FROM bundle WHERE id = :bid"),
-            {"bid": current_id},
-        ).first()
-        if not row:
-            break
-        current_id = row[0]
-    return False
+    if new_parent_id == child_id:
+        return True
+    return bool(session.execute(
+        text("""
+            WITH RECURSIVE up AS (
+                SELECT id, parent_bundle_id FROM bundle WHERE id = :pid
+                UNION
+                SELECT b.id, b.parent_bundle_id FROM bundle b JOIN up ON b.id = up.parent_bundle_id
+                WHERE up.parent_bundle_id <> 0
+            )
+            SELECT EXISTS (SELECT 1 FROM up WHERE id = :cid)
+        """),
+        {"pid": new_parent_id, "cid": child_id},
+    ).scalar())
@@ -0,0 +1,160 @@
+"""
+Dirty markers that wake the dispatcher for (task, infospace) pairs.
+
+Layer 0 infrastructure, like core/events.py — never imports from domain
+modules.
+
+Writers record what they changed as a **kind** ("asset", "chunk",
+"annotation") for an infospace. @tasks declare the kinds their check query
+depends on (``wakes_on=[...]``). Two Redis set layers connect them:
+
+  - ``wakeup:kind:{kind}``  — infospace ids, written by writers (SADD)
+  - ``wakeup:task:{task}``  — infospace ids still to check for one task
+
+``dispatch_wakeups`` (beat, every ``DISPATCH_WAKEUP_INTERVAL_SECONDS``)
+drains the kind sets into the task sets (``fan_out``), dispatches each task
+over its dirty infospaces only, and removes the pairs it settled. A pair
+stays dirty while it has more pending work than one cycle's quota. The
+scheduled full sweep in ``dispatch_tasks`` remains as the safety net for
+writes that bypass markers (raw SQL, other services).
+
+Writes inside a session are recorded on ``session.info[PENDING]`` and
+published after commit — a marker must never be visible before the rows
+it announces. ORM flushes of the tables in ``WATCHED_TABLES`` record
+themselves; writers that bypass the ORM (COPY, bulk SQL) call ``mark``.
+
+Best-effort throughout: a Redis failure only delays work to the next sweep.
+"""
+
+from __future__ import annotations
+
+import logging
+from itertools import chain
+from typing import Iterable
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+KIND_PREFIX = "wakeup:kind:"
+TASK_PREFIX = "wakeup:task:"
+
+# session.info key: {kind: {infospace_id, ...}} to publish on commit
+PENDING = "wakeups"
+
+# Table name → kind, for rows that carry infospace_id
+WATCHED_TABLES = {
+    "asset": "asset",
+    "annotation": "annotation",
+}
+
+
+def _get_redis():
+    try:
+        from app.core.redis import get_redis
+        return get_redis()
+    except Exception:
+        return None
+
+
+# ── Writers ──────────────────────────────────────────────────────────────────
+
+
+def mark(session, kind: str, infospace_ids: Iterable[int]) -> None:
+    """Record a write of ``kind``; published when ``session`` commits."""
+    ids = {i for i in infospace_ids if i is not None}
+    if ids:
+        session.info.setdefault(PENDING, {}).setdefault(kind, set()).update(ids)
+
+
+def publish(kind: str, infospace_ids: Iterable[int]) -> None:
+    """Publish markers now. For writers outside a session transaction."""
+    ids = sorted({i for i in infospace_ids if i is not None})
+    r = _get_redis()
+    if not ids or not r:
+        return
+    try:
+        r.sadd(f"{KIND_PREFIX}{kind}", *ids)
+    except Exception as e:
+        logger.debug("wakeup publish failed for %s %s: %s", kind, ids, e)
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_writes(session, flush_context):
+    # new/dirty/deleted still hold the pre-flush state here
+    for obj in chain(session.new, session.dirty, session.deleted):
+        kind = WATCHED_TABLES.get(getattr(obj, "__tablename__", None))
+        if kind is not None:
+            mark(session, kind, [getattr(obj, "infospace_id", None)])
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_after_commit(session):
+    if session.in_nested_transaction():
+        return  # savepoint release — wait for the real commit
+    for kind, ids in session.info.pop(PENDING, {}).items():
+        publish(kind, ids)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_on_rollback(session):
+    if session.in_nested_transaction():
+        return
+    session.info.pop(PENDING, None)
+
+
+# ── Dispatcher side ──────────────────────────────────────────────────────────
+
+
+def fan_out(descriptors: Iterable) -> None:
+    """Move kind markers onto the task sets of every task waking on that kind."""
+    r = _get_redis()
+    if not r:
+        return
+    by_kind: dict[str, list[str]] = {}
+    for desc in descriptors:
+        for kind in desc.wakes_on:
+            by_kind.setdefault(kind, []).append(desc.name)
+    if not by_kind:
+        return
+    try:
+        pipe = r.pipeline(transaction=True)
+        for kind in by_kind:
+            pipe.smembers(f"{KIND_PREFIX}{kind}")
+            pipe.delete(f"{KIND_PREFIX}{kind}")
+        drained = pipe.execute()[::2]
+
+        pipe = r.pipeline(transaction=False)
+        for kind, ids in zip(by_kind, drained):
+            if not ids:
+                continue
+            for name in by_kind[kind]:
+                pipe.sadd(f"{TASK_PREFIX}{name}", *ids)
+        pipe.execute()
+    except Exception as e:
+        logger.warning("wakeup fan-out failed: %s", e)
+
+
+def dirty_infospaces(task_name: str) -> list[int]:
+    """Infospace ids marked dirty for ``task_name``."""
+    r = _get_redis()
+    if not r:
+        return []
+    try:
+        return sorted(int(i) for i in r.smembers(f"{TASK_PREFIX}{task_name}"))
+    except Exception as e:
+        logger.debug("wakeup read failed for %s: %s", task_name, e)
+        return []
+
+
+def settle(task_name: str, infospace_ids: Iterable[int]) -> None:
+    """Clear markers for pairs whose pending work has all been dispatched."""
+    ids = list(infospace_ids)
+    r = _get_redis()
+    if not ids or not r:
+        return
+    try:
+        r.srem(f"{TASK_PREFIX}{task_name}", *ids)
+    except Exception as e:
+        logger.debug("wakeup settle failed for %s: %s", task_name, e)
@@ -0,0 +1,177 @@
+"""
+Long-lived asyncio event loop per worker process.
+
+Layer 0 infrastructure — never imports from domain modules.
+
+Sync Celery tasks submit coroutines with ``run(coro)``; they execute on one
+loop that runs for the life of the process on a daemon thread. Anything
+bound to a loop — pooled provider instances (registry keys them by loop),
+httpx/aiohttp connection pools, per-loop feed clients — therefore survives
+from one task to the next instead of being rebuilt (and re-handshaked) per
+task.
+
+Lifecycle: ``start()`` from ``worker_process_init`` (after fork — a thread
+never survives fork, so a loop inherited from the parent is discarded and
+rebuilt), ``stop()`` from ``worker_process_shutdown``. ``run()`` starts the
+loop lazily for callers outside a worker.
+
+Per call:
+  - the coroutine runs in a copy of the caller's context;
+  - ``timeout`` is applied on the loop (``asyncio.timeout``), so the
+    coroutine sees ``CancelledError`` and the caller gets ``TimeoutError``;
+  - if the caller is interrupted while waiting (Celery soft time limit,
+    shutdown signal), the coroutine is cancelled and given
+    ``CANCEL_GRACE_SECONDS`` to unwind before the exception propagates;
+  - tasks the coroutine spawned and left running are cancelled when it
+    returns, as the per-call loop used to do on teardown.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import logging
+import os
+import threading
+from concurrent.futures import Future
+from typing import Any, Coroutine, Optional
+
+logger = logging.getLogger(__name__)
+
+CANCEL_GRACE_SECONDS = 5.0
+SHUTDOWN_TIMEOUT_SECONDS = 10.0
+
+_lock = threading.Lock()
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_thread: Optional[threading.Thread] = None
+_pid: Optional[int] = None
+
+# Which run() call created the current task; tasks register under it
+_owner: contextvars.ContextVar[Optional[object]] = contextvars.ContextVar("worker_loop_owner", default=None)
+_owned: dict[object, set[asyncio.Task]] = {}
+
+
+def _task_factory(loop, coro, **kwargs):
+    task = asyncio.Task(coro, loop=loop, **kwargs)
+    owner = _owner.get()
+    if owner is not None and owner in _owned:
+        _owned[owner].add(task)
+        task.add_done_callback(_owned[owner].discard)
+    return task
+
+
+def _serve(loop: asyncio.AbstractEventLoop, ready: threading.Event) -> None:
+    asyncio.set_event_loop(loop)
+    loop.call_soon(ready.set)
+    try:
+        loop.run_forever()
+    finally:
+        asyncio.set_event_loop(None)
+
+
+def start() -> asyncio.AbstractEventLoop:
+    """Start this process's loop thread (idempotent, fork-aware)."""
+    global _loop, _thread, _pid
+    with _lock:
+        if _loop is not None and _pid == os.getpid() and _thread.is_alive():
+            return _loop
+        # Inherited across fork: the thread is gone, the loop is unusable
+        loop = asyncio.new_event_loop()
+        loop.set_task_factory(_task_factory)
+        ready = threading.Event()
+        thread = threading.Thread(target=_serve, args=(loop, ready), name="worker-loop", daemon=True)
+        thread.start()
+        ready.wait()
+        _loop, _thread, _pid = loop, thread, os.getpid()
+        _owned.clear()
+        logger.info("Worker event loop started (pid %d)", _pid)
+        return loop
+
+
+def stop(timeout: float = SHUTDOWN_TIMEOUT_SECONDS) -> None:
+    """Cancel outstanding work, shut down async generators and the executor, close the loop."""
+    global _loop, _thread, _pid
+    with _lock:
+        loop, thread = _loop, _thread
+        if loop is None or _pid != os.getpid():
+            _loop = _thread = _pid = None
+            return
+        _loop = _thread = _pid = None
+
+    async def _drain():
+        current = asyncio.current_task()
+        tasks = [t for t in asyncio.all_tasks() if t is not current]
+        for t in tasks:
+            t.cancel()
+        if tasks:
+            await asyncio.wait(tasks, timeout=timeout)
+        await loop.shutdown_asyncgens()
+        await loop.shutdown_default_executor(timeout)
+
+    try:
+        asyncio.run_coroutine_threadsafe(_drain(), loop).result(timeout * 2)
+    except Exception as e:
+        logger.warning("Worker event loop did not drain cleanly: %s", e)
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join(timeout)
+    if not loop.is_running():
+        loop.close()
+    _owned.clear()
+    logger.info("Worker event loop stopped")
+
+
+async def _supervise(coro, owner, timeout: Optional[float], finished: threading.Event):
+    try:
+        async with asyncio.timeout(timeout):
+            return await coro
+    finally:
+        leftovers = [t for t in _owned.pop(owner, ()) if not t.done()]
+        for t in leftovers:
+            t.cancel()
+        if leftovers:
+            await asyncio.wait(leftovers, timeout=CANCEL_GRACE_SECONDS)
+        finished.set()
+
+
+def run(coro: Coroutine[Any, Any, Any], timeout: Optional[float] = None) -> Any:
+    """Run ``coro`` on the worker loop and block until it finishes.
+
+    Must not be called from the loop thread itself (it would deadlock).
+    """
+    loop = start()
+    if threading.current_thread() is _thread:
+        coro.close()
+        raise RuntimeError("worker_loop.run() called from the worker loop thread; await instead")
+
+    owner = object()
+    finished = threading.Event()
+    result: Future = Future()
+    context = contextvars.copy_context()
+    context.run(_owner.set, owner)
+
+    def _submit():
+        _owned[owner] = set()
+        task = loop.create_task(_supervise(coro, owner, timeout, finished), context=context)
+
+        def _relay(t: asyncio.Task):
+            if result.done():
+                return  # caller already gave up
+            if t.cancelled():
+                result.cancel()
+            elif t.exception() is not None:
+                result.set_exception(t.exception())
+            else:
+                result.set_result(t.result())
+
+        task.add_done_callback(_relay)
+        result.add_done_callback(lambda f: f.cancelled() and loop.call_soon_threadsafe(task.cancel))
+
+    loop.call_soon_threadsafe(_submit)
+    try:
+        return result.result()
+    except BaseException:
+        # Interrupted while waiting (soft time limit, signal): cancel on the loop
+        if not result.done():
+            result.cancel()
+            finished.wait(CANCEL_GRACE_SECONDS)
+        raise
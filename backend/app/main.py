@@ -11,8 +11,11 @@ fastapi.sse._PING_INTERVAL = 3.0
 # Import celery app early to initialize Redis connection for task queueing
 from app.core.celery_app import celery  # noqa: F401
 from app.core.config import settings
+from app.core.stream import get_hub
 
 from app.api.api_router_global import api_router
+from app.api.modules.annotation import relation_cache
+from app.api.modules.content import counts
 from app.api.modules.conversational_intelligence.mcp_server.server import mcp as intelligence_mcp_server
 
 
@@ -29,11 +32,14 @@ mcp_asgi_app = intelligence_mcp_server.http_app(stateless_http=True)
 # As per FastMCP documentation for combining lifespans
 @asynccontextmanager
 async def combined_lifespan(app: FastAPI):
-
-    
+    relation_cache.install_listeners()
+    counts.install_listeners()
     # Run the lifespans together
     async with mcp_asgi_app.lifespan(app):
-        yield
+        try:
+            yield
+        finally:
+            await get_hub().aclose()
 
 
 app = FastAPI(
@@ -102,8 +102,8 @@ def infospace_factory(client, headers):
 
 @pytest.fixture
 def builder_must_not_commit(monkeypatch):
-    """Assert AssetBuilder.build() / .load() / .build_batch() / .build_children()
-    never commit internally. Opt-in per test.
+    """Assert AssetBuilder.build() / .load() / .build_batch() / .build_children() /
+    .build_children_stream() never commit internally. Opt-in per test.
 
     HQ v2 invariant: L2 primitives flush, never commit. The caller (route,
     @task, poll handler) owns the transaction boundary. This fixture wraps the
@@ -140,7 +140,7 @@ def builder_must_not_commit(monkeypatch):
 
         monkeypatch.setattr(AssetBuilder, method_name, traced)
 
-    for name in ("build", "load", "build_batch", "build_children"):
+    for name in ("build", "load", "build_batch", "build_children", "build_children_stream"):
         _wrap_terminal(name)
 
     yield
@@ -0,0 +1,122 @@
+"""Pins the adaptive annotation limiter (``annotation/scheduler.py``).
+
+Pure asyncio, no provider: the semaphore contract, AIMD increase /
+decrease with its cooldown, the latency hold, and 429 detection from the
+status codes provider SDKs raise, through our providers' wrapping.
+"""
+import asyncio
+
+import httpx
+import pytest
+
+from app.api.modules.annotation.scheduler import AdaptiveLimiter, is_rate_limit_error
+
+
+class _StatusError(Exception):
+    def __init__(self, status_code):
+        super().__init__("provider error")
+        self.status_code = status_code
+
+
+class _GenaiError(Exception):
+    """google-genai ``APIError`` shape: int ``code``, string ``status``."""
+
+    def __init__(self, code, status):
+        super().__init__(f"{code} {status}")
+        self.code, self.status = code, status
+
+
+def _wrapped(inner):
+    """What our providers raise: a RuntimeError built inside ``except``."""
+    try:
+        try:
+            raise inner
+        except Exception as e:
+            raise RuntimeError(f"Anthropic generation failed: {e}")
+    except RuntimeError as outer:
+        return outer
+
+
+_429 = httpx.Response(429, request=httpx.Request("POST", "http://ollama/api/chat"))
+
+
+@pytest.mark.parametrize("exc,expected", [
+    (_StatusError(429), True),
+    (_StatusError(529), True),
+    (_StatusError(500), False),
+    (_GenaiError(429, "RESOURCE_EXHAUSTED"), True),
+    (httpx.HTTPStatusError("throttled", request=_429.request, response=_429), True),
+    (_wrapped(_StatusError(429)), True),
+    (_wrapped(_StatusError(400)), False),
+    # Message text alone never counts
+    (Exception("Error code: 429 - rate_limit_error"), False),
+    (RuntimeError("invalid JSON at offset 429: 'rate' expected"), False),
+])
+def test_rate_limit_detection(exc, expected):
+    assert is_rate_limit_error(exc) is expected
+
+
+def test_never_more_than_limit_in_flight():
+    limiter = AdaptiveLimiter(3)
+    peak = 0
+
+    async def call():
+        nonlocal peak
+        await limiter.acquire()
+        try:
+            peak = max(peak, limiter.in_flight)
+            await asyncio.sleep(0.001)
+        finally:
+            limiter.release()
+
+    async def main():
+        await asyncio.gather(*(call() for _ in range(20)))
+
+    asyncio.run(main())
+    assert peak == 3
+    assert limiter.in_flight == 0
+
+
+def test_throttle_halves_then_cooldown_absorbs_burst():
+    limiter = AdaptiveLimiter(16)
+    limiter.record_throttle()
+    assert limiter.limit == 8
+    # In-flight calls from before the cut report their 429s too.
+    limiter.record_throttle()
+    limiter.record_throttle()
+    assert limiter.limit == 8
+    assert limiter.throttles == 3
+
+
+def test_limit_floor_and_additive_recovery_to_ceiling():
+    limiter = AdaptiveLimiter(4, initial=1)
+    limiter.record_throttle()
+    assert limiter.limit == 1
+    for _ in range(20):
+        limiter.record_success()
+    assert limiter.limit == 4
+
+
+def test_increase_held_while_latency_is_inflated():
+    limiter = AdaptiveLimiter(10, initial=2, warmup=1)
+    limiter._observe_latency(1.0)
+    for _ in range(10):
+        limiter._observe_latency(10.0)
+    assert limiter.congested
+    limiter.record_success()
+    assert limiter.limit == 2
+
+
+def test_release_wakes_waiters_when_limit_grows():
+    limiter = AdaptiveLimiter(2, initial=1)
+
+    async def main():
+        await limiter.acquire()
+        waiter = asyncio.ensure_future(limiter.acquire())
+        await asyncio.sleep(0)
+        assert not waiter.done()
+        limiter.record_success()  # limit 1 → 2 frees a slot
+        await asyncio.wait_for(waiter, 1)
+
+    asyncio.run(main())
+    assert limiter.in_flight == 2
@@ -0,0 +1,103 @@
+"""Pins the write-behind annotation buffer (``annotation/write_buffer.py``).
+
+Session and stream writer are mocks: these lock the flush triggers
+(size / time), the one-INSERT-one-UPDATE-one-commit flush shape, the
+coalesced progress event, and the failure contract.
+"""
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.api.modules.annotation.models import Annotation
+from app.api.modules.annotation.write_buffer import AnnotationWriteBuffer
+
+
+def _run():
+    return SimpleNamespace(
+        id=7, parent_run_id=None, progress_total=10, progress_current=0,
+        status=SimpleNamespace(value="running"),
+    )
+
+
+def _ann(i):
+    return Annotation(asset_id=i, schema_id=1, run_id=7, infospace_id=1, user_id=1, value={"x": i})
+
+
+def _session(progress_after):
+    """INSERT ... RETURNING and UPDATE ... RETURNING share one result mock."""
+    session = MagicMock()
+    session.execute.return_value.all.return_value = []
+    session.execute.return_value.scalar.return_value = progress_after
+    return session
+
+
+@pytest.fixture(autouse=True)
+def _no_cache_invalidation():
+    with patch("app.api.modules.annotation.write_buffer.invalidate_runs"):
+        yield
+
+
+def test_empty_buffer_waits_indefinitely_and_is_not_due():
+    buf = AnnotationWriteBuffer(MagicMock(), _run(), max_rows=2, max_delay_ms=1000)
+    assert buf.seconds_until_due() is None
+    assert not buf.due
+    assert buf.flush() == 0
+
+
+def test_due_on_row_count():
+    buf = AnnotationWriteBuffer(MagicMock(), _run(), max_rows=2, max_delay_ms=60_000)
+    buf.add([_ann(1)])
+    assert not buf.due
+    buf.add([_ann(2)])
+    assert buf.due
+
+
+def test_due_on_elapsed_time():
+    buf = AnnotationWriteBuffer(MagicMock(), _run(), max_rows=100, max_delay_ms=10)
+    buf.add([_ann(1)])
+    time.sleep(0.02)
+    assert buf.seconds_until_due() == 0.0
+    assert buf.due
+
+
+def test_flush_commits_once_and_emits_one_progress_event():
+    session = _session(progress_after=3)
+    writer = MagicMock()
+    buf = AnnotationWriteBuffer(session, _run(), writer, max_rows=10)
+    buf.add([_ann(1), _ann(2)])
+    buf.add([_ann(3)])
+
+    assert buf.flush() == 3
+    # one INSERT + one UPDATE, one commit
+    assert session.execute.call_count == 2
+    session.commit.assert_called_once()
+    writer.send.assert_called_once()
+    event, payload = writer.send.call_args.args
+    assert event == "progress"
+    assert payload["progress_current"] == 3
+    assert buf.flushes == 1 and buf.persisted == 3
+
+
+def test_failed_results_still_flush_a_progress_event_without_sql():
+    session = MagicMock()
+    writer = MagicMock()
+    buf = AnnotationWriteBuffer(session, _run(), writer)
+    buf.add([])
+    assert buf.flush() == 0
+    session.execute.assert_not_called()
+    writer.send.assert_called_once()
+
+
+def test_commit_failure_rolls_back_and_records_error():
+    session = MagicMock()
+    session.execute.side_effect = RuntimeError("db down")
+    buf = AnnotationWriteBuffer(session, _run())
+    buf.add([_ann(1)])
+
+    assert buf.flush() == 0
+    session.rollback.assert_called_once()
+    assert buf.errors and "db down" in buf.errors[0]
+    # Buffer is cleared — a failed batch is dropped, not retried forever.
+    assert not buf.due
@@ -638,6 +638,38 @@ async def test_build_children_rejects_conflicting_parent(session, user_id, works
         session.commit()
 
 
+async def test_build_children_stream_copies_rows_in_batches(
+    session, user_id, workspace, builder_must_not_commit,
+):
+    """COPY path: lazy rows, fixed-size batches, same transaction, no ORM rows."""
+    parent = _make_asset(session, user_id, workspace, title="stream-parent", kind=AssetKind.CSV)
+    try:
+        builder = AssetBuilder(session, user_id, workspace)
+        rows = (
+            {"title": f"row-{i}", "text_content": f"c{i}", "file_info": {"n": i}}
+            for i in range(7)
+        )
+        written = await builder.build_children_stream(
+            parent.id, rows, kind=AssetKind.CSV_ROW, batch_size=3,
+        )
+        session.commit()
+
+        assert written == 7
+        children = session.exec(
+            select(Asset).where(Asset.parent_asset_id == parent.id).order_by(Asset.part_index)
+        ).all()
+        assert [c.part_index for c in children] == list(range(7))
+        assert children[4].kind == AssetKind.CSV_ROW
+        assert children[4].processing_status == ProcessingStatus.READY
+        assert children[4].file_info == {"n": 4}
+        assert len({c.uuid for c in children}) == 7
+    finally:
+        for child in session.exec(select(Asset).where(Asset.parent_asset_id == parent.id)).all():
+            session.delete(child)
+        session.delete(parent)
+        session.commit()
+
+
 # ─── Flush-never-commit invariant (HQ v2 enforcement) ────────────────────────
 
 async def test_build_does_not_commit_internally(
@@ -0,0 +1,214 @@
+"""Pins ``core.db.run_sync`` and load-tests the async engine.
+
+``run_sync`` dispatch and ``run_interleaved`` stepping are checked
+without a DB, including that ``AssetQuery``'s embedding path on an
+async-backed session never opens the sync engine. ``test_listing_load`` is an
+opt-in benchmark (``pytest -m scale``, requires PostgreSQL): it drives the
+feed listing at high concurrency through the sync engine (one threadpool
+thread per request, as ``SessionDep`` routes do) and through the async
+engine (``AsyncSessionDep`` + ``run_sync``) and reports throughput and p95.
+"""
+import asyncio
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from sqlalchemy import text
+from sqlmodel import Session
+
+from sqlalchemy.util import await_only, greenlet_spawn
+
+from app.core import db
+from app.core.db import ASYNC_OWNER, run_interleaved, run_sync
+
+CONCURRENCY = 200
+REQUESTS = 2000
+THREADPOOL = 40  # Starlette's default anyio limiter
+N_ASSETS = 50_000
+
+
+class _Owner:
+    def __init__(self):
+        self.calls = 0
+
+    async def run_sync(self, fn):
+        self.calls += 1
+        return fn("sync-facade")
+
+
+def test_run_sync_inline_for_sync_sessions():
+    session = Session()
+    assert asyncio.run(run_sync(session, lambda a, b=0: a + b, 2, b=3)) == 5
+    assert asyncio.run(run_sync(None, lambda: "no session")) == "no session"
+
+
+def test_run_sync_dispatches_to_async_owner():
+    session = Session()
+    owner = _Owner()
+    session.info[ASYNC_OWNER] = owner
+    assert asyncio.run(run_sync(session, lambda x: x * 2, 21)) == 42
+    assert owner.calls == 1
+
+
+class _GreenletOwner:
+    """Stands in for AsyncSession.run_sync: runs ``fn`` in a greenlet."""
+
+    def __init__(self, facade):
+        self.facade = facade
+
+    async def run_sync(self, fn):
+        return await greenlet_spawn(fn, self.facade)
+
+
+def _async_backed_session():
+    session = Session()
+    session.info[ASYNC_OWNER] = _GreenletOwner(session)
+    return session
+
+
+def test_run_interleaved_steps_coroutine_without_blocking_loop():
+    session = _async_backed_session()
+    ticks = []
+
+    async def helper(facade, n):
+        assert facade is session
+        # a "sync read" — only possible inside the owner's greenlet
+        await_only(asyncio.sleep(0.01))
+        await asyncio.sleep(0.01)  # a "provider call"
+        failed = asyncio.get_running_loop().create_future()
+        failed.set_exception(KeyError("boom"))
+        try:
+            await failed
+        except KeyError:
+            pass
+        return n * 2
+
+    async def main():
+        async def ticker():
+            for _ in range(5):
+                ticks.append(1)
+                await asyncio.sleep(0.002)
+
+        t = asyncio.create_task(ticker())
+        out = await run_interleaved(session, helper, 21)
+        await t
+        return out
+
+    assert asyncio.run(main()) == 42
+    assert len(ticks) == 5
+
+
+def test_asset_query_embedding_stays_on_async_connection(monkeypatch):
+    from app.api.modules.content.query import AssetQuery
+    from app.api.modules.embedding import similarity
+
+    session = _async_backed_session()
+    seen = []
+
+    async def search_by_text(facade, infospace_id, text, **kwargs):
+        seen.append(facade)
+        await_only(asyncio.sleep(0))  # raises outside the greenlet
+        return []
+
+    class _NoEngine:
+        def __getattr__(self, name):
+            raise AssertionError("sync engine used on the async path")
+
+    def _no_sync_session(*args, **kwargs):
+        raise AssertionError("sync Session opened on the async path")
+
+    monkeypatch.setattr(similarity, "search_by_text", search_by_text)
+    monkeypatch.setattr(db, "engine", _NoEngine())
+    monkeypatch.setattr(Session, "__init__", _no_sync_session)
+
+    rows = asyncio.run(AssetQuery(session, 1).semantic("climate").execute_async())
+    assert rows == []
+    assert seen == [session]
+
+
+# ─── Load test ───
+
+
+@pytest.fixture(scope="module")
+def seeded(request):
+    if "scale" not in (request.config.getoption("markexpr") or ""):
+        pytest.skip("benchmark is opt-in: pytest -m scale")
+    from app.core.db import engine
+    with Session(engine) as session:
+        session.execute(
+            text(
+                "INSERT INTO asset (title, kind, infospace_id, user_id, bundle_ids, uuid, "
+                "processing_status, stub, created_at, updated_at) "
+                "SELECT 'load ' || g, 'ARTICLE', 1, 1, '{}', gen_random_uuid()::text, "
+                "'READY', false, now() - g * interval '1 second', now() "
+                "FROM generate_series(1, :n) AS g"
+            ),
+            {"n": N_ASSETS},
+        )
+        session.commit()
+    yield
+    with Session(engine) as session:
+        session.execute(text("DELETE FROM asset WHERE infospace_id = 1 AND title LIKE 'load %'"))
+        session.commit()
+
+
+def _feed_query(session):
+    from app.api.modules.content.query import AssetQuery
+    return (
+        AssetQuery(session, 1)
+        .top_level_only()
+        .exclude_superseded()
+        .sort("created_at_desc")
+        .paginate(limit=50)
+    )
+
+
+async def _drive(one_request) -> tuple[float, list[float]]:
+    gate = asyncio.Semaphore(CONCURRENCY)
+    latencies: list[float] = []
+
+    async def timed():
+        async with gate:
+            started = time.perf_counter()
+            await one_request()
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(timed() for _ in range(REQUESTS)))
+    return time.perf_counter() - started, latencies
+
+
+def _report(label: str, elapsed: float, latencies: list[float]) -> float:
+    p95 = statistics.quantiles(latencies, n=20)[-1]
+    print(f"\n{label}: {REQUESTS / elapsed:.0f} req/s, p95 {p95 * 1000:.0f} ms")
+    return REQUESTS / elapsed
+
+
+@pytest.mark.scale
+def test_listing_load(seeded):
+    from app.api.modules.content.views import collect_feed
+    from app.core.db import async_engine, async_session_scope, engine
+
+    pool = ThreadPoolExecutor(max_workers=THREADPOOL)
+
+    async def sync_request():
+        def work():
+            with Session(engine) as session:
+                return asyncio.run(collect_feed(_feed_query(session)))
+        await asyncio.get_running_loop().run_in_executor(pool, work)
+
+    async def async_request():
+        async with async_session_scope() as session:
+            await collect_feed(_feed_query(session.sync_session))
+
+    async def main():
+        sync_rate = _report("sync engine + threadpool", *await _drive(sync_request))
+        async_rate = _report("async engine", *await _drive(async_request))
+        await async_engine.dispose()
+        return sync_rate, async_rate
+
+    sync_rate, async_rate = asyncio.run(main())
+    pool.shutdown()
+    engine.dispose()
+    assert async_rate > 0 and sync_rate > 0
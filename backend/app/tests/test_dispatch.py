@@ -0,0 +1,163 @@
+"""Pins the set-based dispatcher (``core/dispatch``) and benchmarks a cycle.
+
+The check statement is compiled for Postgres and quota handling runs
+against a stubbed ``_pending``, without a DB or Redis. ``test_cycle_scale``
+is an opt-in benchmark (``pytest -m scale``, requires PostgreSQL): it
+seeds N infospaces, runs one dispatch cycle for a check-query task and
+compares statement count and wall time with the per-infospace loop the
+dispatcher used to run.
+"""
+import time
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import event, exists, text
+from sqlalchemy.dialects import postgresql
+from sqlmodel import Session, select
+
+from app.core import dispatch, tasks
+from app.core.tasks import TaskDescriptor
+from app.models import Asset, Bundle, ProcessingStatus
+
+
+def _pending_assets(iid):
+    return (
+        select(Asset.id)
+        .where(
+            Asset.infospace_id == iid,
+            Asset.processing_status == ProcessingStatus.PENDING,
+            ~exists(select(Bundle.id).where(Bundle.infospace_id == iid, Bundle.asset_count == 0)),
+        )
+        .order_by(Asset.id)
+    )
+
+
+def _descriptor(**kw):
+    return TaskDescriptor(name="t", check=_pending_assets, celery_task_name="t", **kw)
+
+
+def test_check_statement_is_one_lateral_query():
+    sql = str(dispatch.check_statement(_descriptor(), [1, 2, 3], 25).compile(dialect=postgresql.dialect()))
+    assert sql.count("unnest(") == 1
+    assert "JOIN LATERAL" in sql
+    # Nested subqueries reference the outer infospace, not a fresh unnest
+    assert sql.count("= isp.iid") == 2
+    assert "ORDER BY asset.id" in sql and "LIMIT" in sql
+
+
+@pytest.fixture
+def sent(monkeypatch):
+    from app.core.celery_app import celery_app
+    calls = []
+    monkeypatch.setattr(celery_app, "send_task", lambda name, args, queue: calls.append(args))
+    monkeypatch.setattr(dispatch, "_get_redis", lambda: None)
+    monkeypatch.setattr(tasks, "_get_redis", lambda: None)
+    return calls
+
+
+def test_quotas_and_budget_apply_per_infospace(monkeypatch, sent):
+    found = {1: list(range(1, 11)), 2: list(range(11, 31))}
+    monkeypatch.setattr(dispatch, "_pending", lambda desc, ids, per: {i: found[i] for i in ids if i in found})
+    infospaces = [SimpleNamespace(id=1), SimpleNamespace(id=2), SimpleNamespace(id=3)]
+    desc = _descriptor(batch=5, max_concurrency=2)
+
+    # Two slots per infospace: infospace 2 keeps 10 of its 20 items for next cycle
+    assert dispatch._dispatch_task(desc, infospaces, budget=100) == 20
+    assert [a[1] for a in sent] == [1, 1, 2, 2]
+
+    sent.clear()
+    assert dispatch._dispatch_task(desc, infospaces, budget=12) == 15
+    assert [a[1] for a in sent] == [1, 1, 2]
+
+
+def test_dispatch_filter_is_evaluated_once_per_cycle(monkeypatch, sent):
+    monkeypatch.setattr(dispatch, "_pending", lambda desc, ids, per: {})
+    calls = []
+
+    def only_even(infospace):
+        calls.append(infospace.id)
+        return infospace.id % 2 == 0
+
+    desc = _descriptor(dispatch_filter=only_even)
+    infospaces = [SimpleNamespace(id=i) for i in range(1, 5)]
+    verdicts = {}
+    assert dispatch._filtered_ids(desc, infospaces, verdicts) == [2, 4]
+    assert dispatch._filtered_ids(desc, infospaces, verdicts) == [2, 4]
+    assert calls == [1, 2, 3, 4]
+
+
+# ─── Benchmark ───
+
+
+@pytest.fixture(scope="module", params=[500, 5000])
+def seeded(request):
+    if "scale" not in (request.config.getoption("markexpr") or ""):
+        pytest.skip("benchmark is opt-in: pytest -m scale")
+    from app.core.db import engine
+    n = request.param
+    with Session(engine) as session:
+        ids = [r[0] for r in session.execute(
+            text(
+                "INSERT INTO infospace (name, owner_id, uuid, created_at) "
+                "SELECT 'dispatch bench ' || g, 1, gen_random_uuid()::text, now() "
+                "FROM generate_series(1, :n) AS g RETURNING id"
+            ),
+            {"n": n},
+        ).fetchall()]
+        # Every infospace whose id ends in 0 has pending work
+        session.execute(
+            text(
+                "INSERT INTO asset (title, kind, infospace_id, user_id, bundle_ids, uuid, "
+                "processing_status, stub, created_at, updated_at) "
+                "SELECT 'dispatch ' || g, 'ARTICLE', i, 1, '{}', gen_random_uuid()::text, "
+                "'PENDING', false, now(), now() "
+                "FROM unnest(CAST(:ids AS int[])) AS i, generate_series(1, 3) AS g "
+                "WHERE i % 10 = 0"
+            ),
+            {"ids": ids},
+        )
+        session.commit()
+    yield ids
+    with Session(engine) as session:
+        session.execute(text("DELETE FROM asset WHERE infospace_id = ANY(:ids)"), {"ids": ids})
+        session.execute(text("DELETE FROM infospace WHERE id = ANY(:ids)"), {"ids": ids})
+        session.commit()
+
+
+@pytest.mark.scale
+def test_cycle_scale(seeded, sent):
+    from app.core.db import engine
+
+    desc = TaskDescriptor(
+        name="bench", celery_task_name="bench", batch=50, max_concurrency=4,
+        check=lambda iid: (
+            select(Asset.id)
+            .where(Asset.infospace_id == iid, Asset.processing_status == ProcessingStatus.PENDING)
+            .order_by(Asset.id)
+        ),
+    )
+    statements = []
+    listener = lambda *a: statements.append(1)  # noqa: E731
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        started = time.perf_counter()
+        infospaces = dispatch._load_infospaces(seeded)
+        dispatched = dispatch._dispatch_task(desc, infospaces, dispatch.MAX_DISPATCH_PER_CYCLE)
+        set_based = time.perf_counter() - started
+        set_based_statements = len(statements)
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+
+    started = time.perf_counter()
+    with Session(engine) as session:
+        for iid in seeded:
+            session.exec(desc.check(iid).limit(dispatch.MAX_PER_TASK_PER_CYCLE)).all()
+    per_infospace = time.perf_counter() - started
+
+    print(
+        f"\n{len(seeded)} infospaces: set-based {set_based * 1000:.0f} ms "
+        f"({set_based_statements} statements), per-infospace {per_infospace * 1000:.0f} ms "
+        f"({len(seeded)} statements)"
+    )
+    assert dispatched == 3 * sum(1 for iid in seeded if iid % 10 == 0)
+    assert set_based_statements <= 1 + -(-len(seeded) // dispatch.DISPATCH_CHECK_CHUNK)
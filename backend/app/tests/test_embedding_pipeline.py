@@ -0,0 +1,80 @@
+"""Pins the pipelined embedder (``embedding/pipeline.py``).
+
+Pure asyncio with a fake provider, no DB: token-budget packing, the
+per-provider in-flight bound, Matryoshka truncation, and that a failing
+batch stops its group from scheduling more work.
+"""
+import asyncio
+
+from app.api.modules.embedding import pipeline
+
+
+def test_token_batches_pack_by_budget_and_count():
+    work = [(1, "a" * 32), (2, "b" * 32), (3, "c" * 320), (4, "d"), (5, "e")]
+    # ~11 tokens each for the short ones, ~101 for the long one
+    batches = pipeline.token_batches(work, max_tokens=30, max_texts=2)
+    assert [[cid for cid, _ in b] for b in batches] == [[1, 2], [3], [4, 5]]
+    # An oversize single item still gets its own batch.
+    assert pipeline.token_batches([(9, "x" * 10_000)], max_tokens=10, max_texts=8) == [[(9, "x" * 10_000)]]
+
+
+def test_in_flight_limit_overrides(monkeypatch):
+    monkeypatch.setattr(pipeline.settings, "EMBEDDING_MAX_IN_FLIGHT", 4)
+    monkeypatch.setattr(pipeline.settings, "EMBEDDING_PROVIDER_IN_FLIGHT", "ollama=1, openai=8,bad")
+    assert pipeline.in_flight_limit("ollama") == 1
+    assert pipeline.in_flight_limit("OpenAI") == 8
+    assert pipeline.in_flight_limit("jina") == 4
+
+
+class _FakeProvider:
+    def __init__(self, dim=6, fail_on=None):
+        self.dim = dim
+        self.fail_on = fail_on
+        self.active = 0
+        self.peak = 0
+        self.calls = 0
+
+    async def embed_texts(self, texts, model_name=None):
+        self.calls += 1
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(0.01)
+            if self.fail_on is not None and self.calls == self.fail_on:
+                raise RuntimeError("provider down")
+            return [[float(len(t))] * self.dim for t in texts]
+        finally:
+            self.active -= 1
+
+
+def _run(provider, batches, limit):
+    written = []
+
+    async def go():
+        return await pipeline.embed_pipelined(
+            provider, "m", batches,
+            target_dim=4,
+            semaphore=asyncio.Semaphore(limit),
+            on_batch=written.extend,
+        )
+
+    return asyncio.run(go()), written
+
+
+def test_pipelined_batches_are_bounded_and_truncated():
+    provider = _FakeProvider()
+    batches = [[(i, "x" * i)] for i in range(1, 13)]
+    (count, failures), written = _run(provider, batches, limit=3)
+    assert (count, failures) == (12, 0)
+    assert provider.peak == 3
+    assert sorted(cid for cid, _ in written) == list(range(1, 13))
+    assert all(len(vec) == 4 for _, vec in written)
+
+
+def test_failure_stops_scheduling():
+    provider = _FakeProvider(fail_on=1)
+    batches = [[(i, "x")] for i in range(20)]
+    (count, failures), _ = _run(provider, batches, limit=1)
+    assert failures == 1
+    assert provider.calls == 1
+    assert count == 0
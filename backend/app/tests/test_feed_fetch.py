@@ -0,0 +1,127 @@
+"""Pins conditional feed fetching (``handlers/feed_fetch.py``) and the RSS
+poll handler's not-modified short cut, and that the cursor update a poll
+produces is actually persisted on ``Source.cursor_state``.
+
+No network: the shared client is swapped for one on an
+``httpx.MockTransport``. Persistence runs against in-memory SQLite.
+"""
+import asyncio
+
+import httpx
+import pytest
+from sqlmodel import Session
+
+from app.api.modules.content.handlers import feed_fetch
+from app.api.modules.content.services.poll_handlers import Prefetch
+from app.api.modules.content.services.poll_handlers.rss_poll_handler import RSSPollHandler
+from app.api.modules.content.services.source_service import _apply_cursor_update
+from app.models import Source
+
+FEED = b"""<?xml version="1.0"?>
+<rss version="2.0"><channel><title>Hansard</title>
+<item><title>Second reading</title><link>https://example.org/a</link><guid isPermaLink="false">a</guid></item>
+</channel></rss>"""
+
+
+@pytest.fixture
+def server(monkeypatch):
+    seen = []
+
+    def respond(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        if request.headers.get("if-none-match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(
+            200, content=FEED,
+            headers={"content-type": "application/rss+xml", "etag": '"v1"',
+                     "last-modified": "Tue, 06 Oct 2026 10:00:00 GMT"},
+        )
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(respond))
+    monkeypatch.setattr(feed_fetch, "_client", lambda: client)
+    return seen
+
+
+def test_conditional_get_round_trip(server):
+    async def run():
+        first = await feed_fetch.fetch_feed("https://example.org/feed")
+        again = await feed_fetch.fetch_feed_for_cursor("https://example.org/feed", first.validators())
+        return first, again
+
+    first, again = asyncio.run(run())
+    assert not first.not_modified
+    assert first.validators() == {"etag": '"v1"', "last_modified": "Tue, 06 Oct 2026 10:00:00 GMT"}
+    assert "if-none-match" not in server[0].headers
+    assert server[1].headers["if-modified-since"] == "Tue, 06 Oct 2026 10:00:00 GMT"
+    assert again.not_modified and again.content == b""
+    # validators survive a 304 so the next poll stays conditional
+    assert again.validators() == first.validators()
+
+    feed = asyncio.run(feed_fetch.parse_feed(first))
+    assert feed.feed.title == "Hansard"
+    assert [e.id for e in feed.entries] == ["a"]
+
+
+@pytest.fixture
+def source_session(sqlite_engine):
+    Source.__table__.create(sqlite_engine, checkfirst=True)
+    with Session(sqlite_engine) as session:
+        yield session
+
+
+def _reload(session, source_id):
+    session.expire_all()
+    return session.get(Source, source_id)
+
+
+def test_rss_poll_not_modified_persists_cursor(server, source_session):
+    source = Source(
+        name="hansard", kind="rss", infospace_id=1, user_id=1,
+        details={"feed_url": "https://example.org/feed"},
+        cursor_state={"etag": '"v1"', "last_guid": "a"},
+    )
+    source_session.add(source)
+    source_session.commit()
+    handler = RSSPollHandler()
+
+    async def run():
+        prefetched = await handler.prefetch(source)
+        # context=None: a not-modified poll must not reach the DB
+        result = await handler.poll(source, None, {"prefetched": prefetched})
+        return prefetched, result
+
+    prefetched, result = asyncio.run(run())
+    assert isinstance(prefetched, Prefetch) and prefetched.not_modified
+    assert result.assets == []
+    assert "last_guid" not in result.cursor_update
+    assert len(server) == 1
+
+    _apply_cursor_update(source, result.cursor_update)
+    source_session.add(source)
+    source_session.commit()
+
+    stored = _reload(source_session, source.id).cursor_state
+    assert stored["etag"] == '"v1"'
+    assert stored["last_guid"] == "a"
+    assert stored["last_poll_timestamp"] == result.cursor_update["last_poll_timestamp"]
+
+
+def test_cursor_update_clears_dropped_validators(source_session):
+    source = Source(
+        name="gazette", kind="rss", infospace_id=1, user_id=1,
+        cursor_state={"etag": '"old"', "last_modified": "Mon, 05 Oct 2026 10:00:00 GMT"},
+    )
+    source_session.add(source)
+    source_session.commit()
+
+    # a full response that only carried Last-Modified
+    _apply_cursor_update(source, {
+        "etag": None,
+        "last_modified": "Tue, 06 Oct 2026 10:00:00 GMT",
+    })
+    source_session.add(source)
+    source_session.commit()
+
+    assert _reload(source_session, source.id).cursor_state == {
+        "last_modified": "Tue, 06 Oct 2026 10:00:00 GMT",
+    }
@@ -0,0 +1,51 @@
+"""Pins the shape of ``AssetQuery.hybrid`` (``content/query.py``).
+
+No DB: the fused statement is compiled for Postgres and inspected. One
+statement carries both candidate legs, fuses them with a FULL OUTER JOIN,
+orders by a total ``(score, id)`` key and continues from a hybrid cursor.
+"""
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.api.modules.content.query import AssetQuery
+from app.core.cursor import encode_cursor
+
+VECTOR = [0.0] * 768
+
+
+def _sql(query: AssetQuery) -> str:
+    stmt = query._hybrid_statement("embedding_768", VECTOR, embedding_model_id=1)
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+def test_single_statement_fuses_both_legs():
+    sql = _sql(AssetQuery(None, 1).hybrid("climate policy").paginate(limit=10))
+    assert sql.count("WITH") == 1
+    for cte in ("fts AS", "ann_chunks AS", "ann AS"):
+        assert cte in sql
+    assert "FULL OUTER JOIN" in sql
+    assert "<=>" in sql
+    assert "ORDER BY page.score DESC, asset.id DESC" in sql
+
+
+def test_weighted_fusion_normalises_over_candidates():
+    sql = _sql(AssetQuery(None, 1).hybrid("climate", fusion="weighted"))
+    assert "max(fts.score) OVER ()" in sql
+    assert "min(fts.score) OVER ()" in sql
+
+
+def test_unknown_fusion_rejected():
+    with pytest.raises(ValueError):
+        AssetQuery(None, 1).hybrid("climate", fusion="borda")
+
+
+def test_hybrid_cursor_is_keyset_on_score_and_id():
+    cursor = encode_cursor(sort_field="hybrid", direction="desc", last_value=0.0312, last_id=42)
+    sql = _sql(AssetQuery(None, 1).hybrid("climate").paginate(cursor=cursor, limit=10))
+    assert "fused.score <" in sql
+    assert "fused.id <" in sql
+
+    # A listing cursor from another sort does not leak into hybrid ranking.
+    other = encode_cursor(sort_field="created_at", direction="desc", last_value=None, last_id=42)
+    sql = _sql(AssetQuery(None, 1).hybrid("climate").paginate(cursor=other, limit=10))
+    assert "fused.score <" not in sql
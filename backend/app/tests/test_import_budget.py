@@ -0,0 +1,112 @@
+"""Startup import budget for the API and Celery worker processes.
+
+Each entry point is imported in a fresh interpreter under
+``python -X importtime``. The test fails when
+
+  - a heavy SDK or parser (PyMuPDF, feedparser, newspaper4k, LLM SDKs,
+    pandas) is loaded at import time — these must stay lazy until the
+    first ``resolve()`` or first processor call, or
+  - the process's total import time exceeds its budget.
+
+The worker budget covers what a worker without ``-Q`` pays before its
+first task: ``core/celery_app``, the task modules and the per-queue
+preload (``WORKER_PRELOAD_*``) for every queue. The heavy-module check
+runs on the imports alone, and again for an ``embedding``-only worker
+with its preload.
+
+An entry point that fails to import fails the test — every dependency
+it reaches is a required one.
+
+Raise a budget only together with the change that justifies it.
+"""
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+BACKEND = Path(__file__).resolve().parents[2]
+
+# Never loaded while importing an entry point
+HEAVY = (
+    "fitz",
+    "feedparser",
+    "newspaper",
+    "anthropic",
+    "openai",
+    "google.genai",
+    "mistralai",
+    "ollama",
+    "pandas",
+)
+
+# Total import time of the process, in milliseconds
+# The API mounts the MCP server at import, so fastmcp (~1.5 s) is in its budget
+API_BUDGET_MS = 8000
+WORKER_BUDGET_MS = 6000
+
+_REPORT = "import json, sys; print(json.dumps(sorted(sys.modules)))"
+
+_WORKER = """
+import importlib
+from app.core.celery_app import celery
+for name in celery.conf.imports:
+    importlib.import_module(name)
+"""
+
+_EMBEDDING_WORKER = _WORKER + """
+from app.core.celery_app import preload_queue_stacks
+celery.amqp.queues.select(["embedding"])
+preload_queue_stacks()
+"""
+
+# No -Q: consumes, and preloads, every queue
+_FULL_WORKER = _WORKER + """
+from app.core.celery_app import preload_queue_stacks
+preload_queue_stacks()
+"""
+
+
+def _profile(code: str) -> tuple[set[str], int]:
+    """Run ``code`` under -X importtime; return (loaded modules, total import us)."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code + "\n" + _REPORT],
+        cwd=BACKEND, capture_output=True, text=True, timeout=300,
+    )
+    timings = [line for line in proc.stderr.splitlines() if line.startswith("import time:")]
+    if proc.returncode != 0:
+        error = "\n".join(line for line in proc.stderr.splitlines() if not line.startswith("import time:"))
+        pytest.fail(error[-4000:])
+
+    total = 0
+    for line in timings:
+        if "[us]" in line:
+            continue
+        _, cum, name = line.split("|")
+        if not name[1:].startswith(" "):  # top level: nested imports are indented
+            total += int(cum)
+    return set(json.loads(proc.stdout.splitlines()[-1])), total
+
+
+def _heavy(loaded: set[str], exclude: tuple[str, ...] = ()) -> list[str]:
+    return sorted(m for m in HEAVY if m in loaded and m not in exclude)
+
+
+def test_api_startup_stays_light():
+    loaded, total = _profile("import app.main")
+    assert _heavy(loaded) == []
+    assert total / 1000 <= API_BUDGET_MS
+
+
+def test_worker_startup_stays_light():
+    loaded, _ = _profile(_WORKER)
+    assert _heavy(loaded) == []
+    _, total = _profile(_FULL_WORKER)
+    assert total / 1000 <= WORKER_BUDGET_MS
+
+
+def test_embedding_worker_skips_pdf_and_llm_stacks():
+    # The OpenAI-compatible embedding provider may legitimately pull its SDK
+    loaded, _ = _profile(_EMBEDDING_WORKER)
+    assert _heavy(loaded, exclude=("openai",)) == []
@@ -0,0 +1,171 @@
+"""Pins the listing count strategy layer (``content/counts.py``).
+
+No DB: the EXPLAIN construct is compiled for Postgres, the drain is fed
+synthetic count events, and the generation bump is checked against a
+recording stand-in for Redis, including that a slow, failing Redis
+neither delays nor breaks the commit. ``asset_ops.cascade_delete`` runs against a
+stand-in session to pin that its Core DELETE is noted for invalidation.
+"""
+import asyncio
+import threading
+import time
+
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+from sqlmodel import Session
+
+from app.api.modules.content import asset_ops, counts
+from app.api.modules.content.schemas import (
+    AssetFeed,
+    AssetNode,
+    CountEvent,
+    DoneEvent,
+    ListingSection,
+    SectionEvent,
+)
+from app.core.sse import drain
+from app.models import Asset
+
+
+class _Pipeline:
+    def __init__(self, calls):
+        self.calls = calls
+
+    def incr(self, key):
+        self.calls.append(("incr", key))
+
+    def expire(self, key, seconds):
+        self.calls.append(("expire", key))
+
+    def execute(self):
+        self.calls.append(("execute",))
+
+
+class _Redis:
+    def __init__(self):
+        self.calls = []
+
+    def pipeline(self, transaction=True):
+        return _Pipeline(self.calls)
+
+
+class _StalledRedis(_Redis):
+    """Hangs, then fails, on every pipeline."""
+
+    def __init__(self):
+        super().__init__()
+        self.release = threading.Event()
+
+    def pipeline(self, transaction=True):
+        redis = self
+
+        class _Stalled(_Pipeline):
+            def execute(self):
+                redis.release.wait(5)
+                raise ConnectionError("redis down")
+
+        return _Stalled(self.calls)
+
+
+def test_estimate_explains_the_filtered_select():
+    stmt = counts._Explain(select(Asset.id).where(Asset.infospace_id == 3))
+    sql = str(stmt.compile(dialect=postgresql.dialect()))
+    assert sql.startswith("EXPLAIN (FORMAT JSON) SELECT asset.id")
+    assert "asset.infospace_id =" in sql
+
+
+def _drain(*count_events):
+    async def events():
+        section = ListingSection[AssetNode](items=[], total=-1)
+        yield SectionEvent(role="primary", section=section)
+        for ev in count_events:
+            yield ev
+        yield DoneEvent()
+    return asyncio.run(drain(events(), AssetFeed)).section
+
+
+def test_exact_followup_replaces_estimate():
+    section = _drain(CountEvent(total=1_200_000, approximate=True), CountEvent(total=1_187_113))
+    assert (section.total, section.approximate) == (1_187_113, False)
+
+    section = _drain(CountEvent(total=40_000_000, approximate=True))
+    assert (section.total, section.approximate) == (40_000_000, True)
+
+
+def test_asset_writes_bump_generation_on_commit(monkeypatch):
+    redis = _Redis()
+    monkeypatch.setattr(counts, "_redis", lambda: redis)
+    monkeypatch.setattr(counts, "_publish", lambda fn, *args: fn(*args))
+    monkeypatch.setattr(counts.settings, "LISTING_COUNT_MODE", "cached")
+    counts.install_listeners()
+    counts.install_listeners()  # idempotent
+
+    session = Session()
+    counts.note_asset_writes(session, [7, None, 7, 9])
+    session.commit()
+    assert redis.calls == [
+        ("incr", "listcount:gen:7"), ("expire", "listcount:gen:7"),
+        ("incr", "listcount:gen:9"), ("expire", "listcount:gen:9"),
+        ("execute",),
+    ]
+    assert counts.ASSET_WRITES not in session.info
+
+    redis.calls.clear()
+    session.begin()
+    counts.note_asset_writes(session, [7])
+    session.rollback()
+    session.commit()
+    assert redis.calls == []
+
+
+def test_stalled_redis_neither_delays_nor_breaks_commit(monkeypatch):
+    redis = _StalledRedis()
+    monkeypatch.setattr(counts, "_redis", lambda: redis)
+    monkeypatch.setattr(counts.settings, "LISTING_COUNT_MODE", "cached")
+    counts.install_listeners()
+
+    session = Session()
+    counts.note_asset_writes(session, [3])
+    started = time.perf_counter()
+    session.commit()
+    assert time.perf_counter() - started < 1
+
+    redis.release.set()
+    counts._publisher.submit(lambda: None).result(5)  # publisher drained
+    assert ("incr", "listcount:gen:3") in redis.calls
+
+
+class _Result:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def all(self):
+        return self.rows
+
+    def scalars(self):
+        return self
+
+
+class _DeleteSession:
+    """Returns no descendants/annotations; the asset DELETE returns ``deleted``."""
+
+    def __init__(self, deleted):
+        self.info = {}
+        self.deleted = deleted
+        self.statements = []
+
+    def exec(self, stmt):
+        self.statements.append(stmt)
+        returning = getattr(stmt, "_returning", ())
+        return _Result(self.deleted if returning else [])
+
+    def flush(self):
+        pass
+
+
+def test_cascade_delete_notes_asset_writes():
+    session = _DeleteSession(deleted=[3, 3, 4])
+    assert asset_ops.cascade_delete(session, [11, 12, 13]) == 3
+    assert session.info[counts.ASSET_WRITES] == {3, 4}
+    sql = str(session.statements[-1].compile(dialect=postgresql.dialect()))
+    assert sql.startswith("DELETE FROM asset") and "RETURNING asset.infospace_id" in sql
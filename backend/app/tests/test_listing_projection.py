@@ -0,0 +1,104 @@
+"""Pins the listing projection (``AssetQuery.columns`` / ``NODE_COLUMNS``).
+
+No DB for the shape tests: the statements are compiled for Postgres and the
+select list inspected. ``test_projection_payload`` is an opt-in benchmark
+(``pytest -m scale``, requires PostgreSQL) that seeds long-text assets and
+compares full-row and projected listing latency and payload.
+"""
+import time
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.dialects import postgresql
+from sqlmodel import Session
+
+from app.api.modules.content.query import NODE_COLUMNS, AssetQuery
+
+HEAVY = ("asset.text_content", "asset.fragments", "asset.file_info", "asset.blob_path")
+N_ASSETS = 500
+TEXT_CHARS = 200_000
+
+
+def _select_list(stmt) -> str:
+    sql = str(stmt.compile(dialect=postgresql.dialect()))
+    return sql.split("\nFROM asset", 1)[0]
+
+
+def test_listing_select_omits_heavy_columns():
+    full = _select_list(AssetQuery(None, 1)._build_base_select())
+    projected = _select_list(AssetQuery(None, 1).columns(*NODE_COLUMNS)._build_base_select())
+    for col in HEAVY:
+        assert col in full
+        assert col not in projected
+    for col in ("asset.id", "asset.title", "asset.bundle_ids", "asset.created_at"):
+        assert col in projected
+
+
+def test_hybrid_select_projects_asset_but_keeps_headline():
+    query = AssetQuery(None, 1).columns(*NODE_COLUMNS).hybrid("climate")
+    stmt = query._hybrid_statement("embedding_768", [0.0] * 768, embedding_model_id=1)
+    sql = str(stmt.compile(dialect=postgresql.dialect()))
+    asset_cols, rest = sql[sql.rindex("SELECT asset.id"):].split("page.score", 1)
+    assert "asset.text_content" not in asset_cols
+    assert "asset.fragments" not in asset_cols
+    assert "ts_headline" in rest
+
+
+# ─── Benchmark ───
+
+
+@pytest.fixture(scope="module")
+def pg_engine():
+    from app.core.config import settings
+    return create_engine(str(settings.SQLALCHEMY_DATABASE_URI), echo=False)
+
+
+@pytest.fixture
+def db(pg_engine, request):
+    if "scale" not in (request.config.getoption("markexpr") or ""):
+        pytest.skip("benchmark is opt-in: pytest -m scale")
+    connection = pg_engine.connect()
+    transaction = connection.begin()
+    session = Session(bind=connection)
+    yield session
+    session.close()
+    transaction.rollback()
+    connection.close()
+
+
+@pytest.mark.scale
+def test_projection_payload(db):
+    db.execute(
+        text(
+            "INSERT INTO asset (title, kind, infospace_id, user_id, bundle_ids, uuid, "
+            "processing_status, stub, text_content, fragments, created_at, updated_at) "
+            "SELECT 'a' || g, 'ARTICLE', 1, 1, '{}', gen_random_uuid()::text, 'READY', false, "
+            "repeat(md5(g::text), :reps), jsonb_build_object('summary', repeat('x', 2000)), "
+            "now(), now() FROM generate_series(1, :n) AS g"
+        ),
+        {"reps": TEXT_CHARS // 32, "n": N_ASSETS},
+    )
+
+    def timed(query):
+        db.expunge_all()
+        started = time.perf_counter()
+        rows = query.paginate(limit=N_ASSETS).execute()
+        return rows, time.perf_counter() - started
+
+    full_rows, full_s = timed(AssetQuery(db, 1))
+    node_rows, node_s = timed(AssetQuery(db, 1).columns(*NODE_COLUMNS))
+    assert [a.id for a in full_rows] == [a.id for a in node_rows]
+
+    # Stored size is after TOAST compression; text size is what goes over the wire
+    names = ", ".join(c.expression.name for c in NODE_COLUMNS)
+    full_bytes, node_bytes, full_wire, node_wire = db.execute(text(
+        f"SELECT sum(pg_column_size(asset.*)), sum(pg_column_size(ROW({names}))), "
+        f"sum(octet_length(asset.*::text)), sum(octet_length(ROW({names})::text)) "
+        "FROM asset WHERE infospace_id = 1"
+    )).one()
+    print(
+        f"\n{N_ASSETS} assets: full {full_s * 1000:.0f} ms / {full_bytes} B stored / "
+        f"{full_wire} B text, projected {node_s * 1000:.0f} ms / {node_bytes} B stored / "
+        f"{node_wire} B text"
+    )
+    assert node_bytes * 20 < full_bytes
@@ -0,0 +1,70 @@
+"""Pins the package-token scope cache (``identity_infospace_user/scope_cache.py``)
+and sorted ``PackageScope`` membership.
+
+No DB and no Redis: the Redis tier is made to fail, which must degrade to
+the local tier.
+"""
+from types import SimpleNamespace
+
+import pytest
+
+from app.api.modules.identity_infospace_user import scope_cache
+from app.api.modules.identity_infospace_user.access import PackageScope
+
+
+@pytest.fixture(autouse=True)
+def no_redis(monkeypatch):
+    def _down():
+        raise ConnectionError("redis down")
+    monkeypatch.setattr(scope_cache, "_redis", _down)
+    scope_cache._local.clear()
+
+
+def test_scope_fields_sorted_and_searchable():
+    scope = PackageScope(run_ids=(9, 3, 3, 5), asset_ids=None)
+    assert scope.run_ids == (3, 5, 9)
+    assert scope.asset_ids == ()
+    assert scope.contains("run_ids", 5)
+    assert not scope.contains("run_ids", 4)
+    assert not scope.contains("run_ids", 10)
+    assert not scope.contains("asset_ids", 1)
+
+
+def test_encode_round_trip_is_compact():
+    scope = PackageScope(
+        bundle_ids=(4, 17),
+        asset_ids=tuple(range(1_000, 201_000)),
+        downloadable_asset_ids=tuple(range(1_000, 201_000, 2)),
+        run_ids=(2_000_000_000,),
+    )
+    raw = scope_cache.encode(scope)
+    assert scope_cache.decode(raw) == scope
+    # 300k ids (1.2 MB as uint32); dense ranges collapse once delta-encoded
+    assert len(raw) < 8_000
+
+
+def test_local_tier_serves_without_redis():
+    pkg = SimpleNamespace(id=7, default_allow_download=True, default_allow_copy=False)
+    key = scope_cache.cache_key(pkg, "3:41", "12:90:2026-10-01")
+    assert key.startswith(f"{scope_cache.KEY_PREFIX}7:")
+    assert scope_cache.get(key) is None
+
+    scope = PackageScope(asset_ids=(1, 2, 3))
+    scope_cache.put(key, scope)
+    assert scope_cache.get(key) is scope
+
+    # Any watermark movement is a different key
+    assert scope_cache.cache_key(pkg, "4:42", "12:90:2026-10-01") != key
+    assert scope_cache.cache_key(pkg, "3:41", "12:90:2026-10-02") != key
+
+    scope_cache.invalidate_package(7)
+    assert scope_cache.get(key) is None
+
+
+def test_local_tier_bounded_by_ids():
+    local = scope_cache.LocalScopes(max_ids=10, ttl_seconds=60)
+    local.put("a", PackageScope(asset_ids=tuple(range(6))))
+    local.put("b", PackageScope(asset_ids=tuple(range(6))))
+    assert local.get("a") is None and local.get("b") is not None
+    local.put("huge", PackageScope(asset_ids=tuple(range(11))))
+    assert local.get("huge") is None
@@ -0,0 +1,152 @@
+"""Pins the page-parallel PDF extraction engine (``processors/pdf_processor.py``).
+
+No DB: synthetic PDFs are generated with PyMuPDF. Parallel extraction over
+the process pool must return exactly what in-process extraction returns,
+in page order. The 1,000-page benchmark is opt-in (``pytest -m scale``).
+``process`` runs against a stand-in session that records the bulk INSERT
+and what the session has noted for listing-count invalidation at commit.
+"""
+import asyncio
+import time
+from pathlib import Path
+
+import fitz
+import pytest
+
+from app.api.modules.content import counts
+from app.api.modules.content.models import Asset, AssetKind
+from app.api.modules.content.processors import pdf_processor
+from app.api.modules.content.processors.base import ProcessingContext
+
+
+def _synthetic_pdf(path, pages: int) -> str:
+    doc = fitz.open()
+    for i in range(pages):
+        page = doc.new_page()
+        for line in range(40):
+            page.insert_text((36, 40 + line * 18), f"Page {i + 1} line {line}: the committee resumed debate.")
+    doc.save(str(path))
+    doc.close()
+    return str(path)
+
+
+def test_page_ranges_cover_document_in_order():
+    ranges = pdf_processor.page_ranges(1000, workers=4)
+    assert ranges[0][0] == 0 and ranges[-1][1] == 1000
+    assert all(a[1] == b[0] for a, b in zip(ranges, ranges[1:]))
+    assert len(ranges) == 16
+    # Small documents are not shredded below MIN_RANGE_PAGES.
+    assert pdf_processor.page_ranges(20, workers=8) == [(0, 16), (16, 20)]
+    assert pdf_processor.page_ranges(0, workers=4) == []
+
+
+def test_parallel_matches_in_process(tmp_path):
+    path = _synthetic_pdf(tmp_path / "doc.pdf", 40)
+    sequential = pdf_processor.extract_pages(40, file_path=path, workers=0)
+    parallel = pdf_processor.extract_pages(40, file_path=path, workers=2, min_parallel_pages=1)
+    assert parallel == sequential
+    assert [p[0] for p in parallel] == list(range(40))
+    assert parallel[7][1].startswith("Page 8 line 0")
+
+
+def test_bytes_extract_in_process(tmp_path):
+    path = _synthetic_pdf(tmp_path / "doc.pdf", 3)
+    with open(path, "rb") as fh:
+        pages = pdf_processor.extract_pages(3, pdf_bytes=fh.read(), workers=4, min_parallel_pages=1)
+    assert [p[0] for p in pages] == [0, 1, 2]
+    assert all(p[3] is None for p in pages)
+
+
+class _Session:
+    def __init__(self):
+        self.info = {}
+        self.inserted = []
+        self.writes_at_commit = None
+
+    def scalars(self, stmt, rows):
+        self.inserted = rows
+        return iter(rows)
+
+    def commit(self):
+        self.writes_at_commit = set(self.info.get(counts.ASSET_WRITES, ()))
+
+
+class _Storage:
+    def __init__(self, path):
+        self.path = path
+
+    def get_file_path(self, blob_path):
+        return Path(self.path)
+
+
+def test_page_insert_is_noted_for_listing_counts(tmp_path):
+    path = _synthetic_pdf(tmp_path / "doc.pdf", 3)
+    session = _Session()
+    context = ProcessingContext(
+        session=session, bundle_service=None, user_id=1, infospace_id=7,
+        storage_provider=_Storage(path),
+    )
+    asset = Asset(id=5, title="doc", kind=AssetKind.PDF, blob_path="doc.pdf",
+                  infospace_id=7, user_id=1)
+
+    asyncio.run(pdf_processor.PDFProcessor(context).process(asset))
+    assert len(session.inserted) == 3
+    # Core INSERT never reaches session.new; the processor records it itself.
+    assert session.writes_at_commit == {7}
+
+
+def _extract_in_daemon(path, out):
+    out.put(pdf_processor.extract_pages(40, file_path=path, workers=2, min_parallel_pages=1))
+
+
+def test_parallel_runs_inside_daemonic_worker(tmp_path):
+    # Celery prefork children are daemonic billiard processes
+    import billiard
+
+    path = _synthetic_pdf(tmp_path / "doc.pdf", 40)
+    ctx = billiard.get_context("spawn")
+    out = ctx.Queue()
+    proc = ctx.Process(target=_extract_in_daemon, args=(path, out), daemon=True)
+    proc.start()
+    pages = out.get(timeout=120)
+    proc.join(30)
+    assert pages == pdf_processor.extract_pages(40, file_path=path, workers=0)
+
+
+def test_pool_failure_is_recorded_once(tmp_path, monkeypatch):
+    import billiard
+
+    attempts = []
+
+    def broken(method):
+        attempts.append(method)
+        raise AssertionError("daemonic processes are not allowed to have children")
+
+    monkeypatch.setattr(billiard, "get_context", broken)
+    monkeypatch.setattr(pdf_processor, "_pool", None)
+    monkeypatch.setattr(pdf_processor, "_pool_unavailable", False)
+
+    path = _synthetic_pdf(tmp_path / "doc.pdf", 20)
+    expected = pdf_processor.extract_pages(20, file_path=path, workers=0)
+    for _ in range(3):
+        assert pdf_processor.extract_pages(20, file_path=path, workers=2, min_parallel_pages=1) == expected
+    assert len(attempts) == 1
+
+
+@pytest.mark.scale
+def test_benchmark_1000_pages(tmp_path, request):
+    if "scale" not in (request.config.getoption("markexpr") or ""):
+        pytest.skip("benchmark is opt-in: pytest -m scale")
+    path = _synthetic_pdf(tmp_path / "big.pdf", 1000)
+    pdf_processor.extract_pages(64, file_path=path, workers=4, min_parallel_pages=1)  # warm the pool
+
+    started = time.perf_counter()
+    sequential = pdf_processor.extract_pages(1000, file_path=path, workers=0)
+    sequential_s = time.perf_counter() - started
+
+    started = time.perf_counter()
+    parallel = pdf_processor.extract_pages(1000, file_path=path, workers=4, min_parallel_pages=1)
+    parallel_s = time.perf_counter() - started
+
+    assert parallel == sequential
+    print(f"\n1000 pages: in-process {sequential_s:.2f}s, 4 workers {parallel_s:.2f}s")
@@ -0,0 +1,80 @@
+"""Pins the provider instance pool (``foundation_service_providers/registry.py``).
+
+No DB: fake descriptors and contexts exercise the credential fingerprint,
+TTL/LRU bounds, loop scoping and targeted invalidation.
+"""
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from app.api.modules.foundation_service_providers import registry
+from app.api.modules.foundation_service_providers.registry import _Context
+from app.core.config import settings
+
+
+@pytest.fixture(autouse=True)
+def _clean_pool(monkeypatch):
+    monkeypatch.setattr(settings, "PROVIDER_POOL_TTL_SECONDS", 60)
+    monkeypatch.setattr(settings, "PROVIDER_POOL_MAX_ENTRIES", 3)
+    registry.invalidate_provider_pool()
+    yield
+    registry.invalidate_provider_pool()
+
+
+def _desc(requires_api_key=True):
+    return SimpleNamespace(requires_api_key=requires_api_key, credential_key="openai")
+
+
+def _ctx(blob, owner_id=1):
+    return _Context(selection=None, encrypted_credentials=blob, owner_is_superuser=False, owner_id=owner_id)
+
+
+def test_fingerprint_tracks_credentials_not_plaintext():
+    desc = _desc()
+    a = registry._credential_fingerprint(desc, _ctx("enc-v1"), None)
+    assert a == registry._credential_fingerprint(desc, _ctx("enc-v1", owner_id=2), None)
+    assert a != registry._credential_fingerprint(desc, _ctx("enc-v2"), None)
+    runtime = registry._credential_fingerprint(desc, _ctx("enc-v1"), "sk-secret")
+    assert runtime.startswith("rt:") and "sk-secret" not in runtime
+    assert registry._credential_fingerprint(_desc(False), _ctx("enc-v1"), None) == "-"
+
+
+def test_pool_is_lru_bounded_and_expires(monkeypatch):
+    for i in range(3):
+        registry._pool_put(("k", i), f"inst{i}", owner_id=None)
+    assert registry._pool_get(("k", 0)) == "inst0"  # refresh
+    registry._pool_put(("k", 3), "inst3", owner_id=None)
+    assert registry._pool_get(("k", 1)) is None
+    assert registry._pool_get(("k", 0)) == "inst0"
+
+    now = [registry.time.monotonic()]
+    monkeypatch.setattr(registry.time, "monotonic", lambda: now[0])
+    now[0] += 61
+    assert registry._pool_get(("k", 0)) is None
+
+
+def test_entries_die_with_their_event_loop():
+    async def put():
+        registry._pool_put(("loop",), "inst", owner_id=None)
+
+    loop = asyncio.new_event_loop()
+    loop.run_until_complete(put())
+    loop.close()
+    assert registry._pool_get(("loop",)) is None
+
+
+def test_invalidation_is_scoped_to_owner():
+    registry._pool_put(("a",), "a", owner_id=1)
+    registry._pool_put(("b",), "b", owner_id=2)
+    registry._context_cache[("embedding", 10, "enrichment")] = (float("inf"), _ctx("x", owner_id=1))
+    registry._context_cache[("embedding", 20, "enrichment")] = (float("inf"), _ctx("y", owner_id=2))
+
+    registry.invalidate_provider_pool(owner_id=1)
+    assert registry._pool_get(("a",)) is None
+    assert registry._pool_get(("b",)) == "b"
+    assert list(registry._context_cache) == [("embedding", 20, "enrichment")]
+
+    registry.invalidate_provider_pool(infospace_id=20)
+    assert registry._context_cache == {}
+    assert registry._pool_get(("b",)) == "b"
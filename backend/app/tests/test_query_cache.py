@@ -0,0 +1,173 @@
+"""Pins the query-embedding cache (``embedding/query_cache.py``).
+
+Pure-logic, no Redis: key normalisation, float32 packing, the byte-bounded
+local LRU, that a Redis outage degrades to the local tier, and the Redis
+tier's byte counter against a minimal in-memory stand-in.
+"""
+import pytest
+
+from app.api.modules.embedding import query_cache
+from app.api.modules.embedding.query_cache import LocalLRU
+
+
+def test_normalisation_shares_near_identical_queries():
+    a = query_cache.redis_key(7, 768, "  Climate   Policy\n")
+    b = query_cache.redis_key(7, 768, "climate policy")
+    assert a == b
+    assert query_cache.redis_key(8, 768, "climate policy") != a
+    assert query_cache._entry_bytes(a) == 768 * 4
+
+
+def test_pack_roundtrip_is_float32():
+    vec = [0.5, -1.25, 3.0]
+    raw = query_cache.pack(vec)
+    assert len(raw) == 12
+    assert query_cache.unpack(raw) == vec
+
+
+def test_local_lru_is_bounded_by_bytes():
+    lru = LocalLRU(max_bytes=24, ttl_seconds=60)
+    lru.put((1, "a"), b"x" * 12)
+    lru.put((1, "b"), b"x" * 12)
+    assert lru.get((1, "a")) is not None  # refresh "a"
+    lru.put((1, "c"), b"x" * 12)
+    assert lru.get((1, "b")) is None
+    assert lru.get((1, "a")) is not None
+    assert lru.size_bytes == 24
+
+
+def test_local_lru_expires(monkeypatch):
+    lru = LocalLRU(max_bytes=1024, ttl_seconds=10)
+    now = [100.0]
+    monkeypatch.setattr(query_cache.time, "monotonic", lambda: now[0])
+    lru.put((1, "a"), b"x" * 4)
+    now[0] += 11
+    assert lru.get((1, "a")) is None
+    assert lru.size_bytes == 0
+
+
+def test_redis_outage_falls_back_to_local(monkeypatch):
+    def broken():
+        raise ConnectionError("redis down")
+
+    monkeypatch.setattr(query_cache, "_redis", broken)
+    monkeypatch.setattr(query_cache, "_local", LocalLRU(1024, 60))
+    monkeypatch.setattr(query_cache.settings, "EMBEDDING_QUERY_CACHE_ENABLED", True)
+
+    assert query_cache.get(1, 2, "q") is None
+    query_cache.put(1, 2, "q", [1.0, 2.0])
+    assert query_cache.get(1, 2, " Q ") == pytest.approx([1.0, 2.0])
+    # Wrong dimension never serves.
+    assert query_cache.get(1, 3, "q") is None
+
+
+class _FakeRedis:
+    """Just the commands the Redis tier uses; ``expire_value`` plays TTL."""
+
+    def __init__(self):
+        self.values = {}
+        self.index = {}
+        self.counters = {}
+
+    def expire_value(self, key):
+        self.values.pop(key, None)
+
+    def pipeline(self, transaction=True):
+        return _FakePipeline(self)
+
+    def get(self, key):
+        return self.values.get(key)
+
+    def set(self, key, value, ex=None, nx=False):
+        if key == query_cache.BYTES_KEY:
+            self.counters[key] = int(value)
+            return True
+        if nx and key in self.values:
+            return None
+        self.values[key] = value
+        return True
+
+    def zadd(self, name, mapping, nx=False, xx=False):
+        added = 0
+        for member, score in mapping.items():
+            exists = member in self.index
+            if (nx and exists) or (xx and not exists):
+                continue
+            self.index[member] = score
+            added += not exists
+        return added
+
+    def zpopmin(self, name, count):
+        popped = sorted(self.index.items(), key=lambda kv: kv[1])[:count]
+        for member, _ in popped:
+            del self.index[member]
+        return popped
+
+    def delete(self, *keys):
+        return sum(self.values.pop(k, None) is not None for k in keys)
+
+    def incrby(self, key, amount):
+        self.counters[key] = self.counters.get(key, 0) + amount
+        return self.counters[key]
+
+    def decrby(self, key, amount):
+        return self.incrby(key, -amount)
+
+
+class _FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.calls = []
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self.calls.append((name, args, kwargs))
+        return queue
+
+    def execute(self):
+        return [getattr(self.redis, name)(*a, **kw) for name, a, kw in self.calls]
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    r = _FakeRedis()
+    monkeypatch.setattr(query_cache, "_redis", lambda: r)
+    return r
+
+
+def test_redis_counter_counts_each_indexed_key_once(fake_redis, monkeypatch):
+    monkeypatch.setattr(query_cache.settings, "EMBEDDING_QUERY_CACHE_REDIS_MAX_BYTES", 10_000)
+    key = query_cache.redis_key(1, 2, "q")
+    raw = query_cache.pack([1.0, 2.0])
+
+    query_cache._redis_put(key, raw)
+    query_cache._redis_put(key, raw)  # value still live
+    fake_redis.expire_value(key)
+    query_cache._redis_put(key, raw)  # value expired, member still indexed
+    assert fake_redis.counters[query_cache.BYTES_KEY] == 8
+    assert query_cache._redis_get(key) == raw
+
+
+def test_redis_trim_uncounts_expired_members(fake_redis, monkeypatch):
+    monkeypatch.setattr(query_cache.settings, "EMBEDDING_QUERY_CACHE_REDIS_MAX_BYTES", 16)
+    monkeypatch.setattr(query_cache, "EVICT_BATCH", 1)
+    clock = iter(range(100))
+    monkeypatch.setattr(query_cache.time, "time", lambda: next(clock))
+    keys = [query_cache.redis_key(1, 2, q) for q in ("a", "b", "c")]
+    raw = query_cache.pack([1.0, 2.0])
+
+    query_cache._redis_put(keys[0], raw)
+    query_cache._redis_put(keys[1], raw)
+    fake_redis.expire_value(keys[0])
+    query_cache._redis_put(keys[2], raw)  # over cap: pops the oldest member
+
+    assert keys[0] not in fake_redis.index
+    assert set(fake_redis.index) == {keys[1], keys[2]}
+    assert fake_redis.counters[query_cache.BYTES_KEY] == 16
+
+
+def test_redis_get_never_reindexes_trimmed_key(fake_redis):
+    key = query_cache.redis_key(1, 2, "q")
+    fake_redis.values[key] = query_cache.pack([1.0, 2.0])
+    assert query_cache._redis_get(key) is not None
+    assert key not in fake_redis.index
@@ -0,0 +1,211 @@
+"""Pins the Formula result cache (``annotation/relation_cache.py``).
+
+Pure-logic, no DB: canonical key state, generation invalidation on
+commit, LRU trimming and hit/miss accounting against an in-memory Redis
+stand-in, and that the read path stays off the event loop.
+"""
+import asyncio
+import threading
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.orm import Session
+from sqlalchemy.util import greenlet_spawn
+
+from app.api.modules.annotation import relation_cache
+from app.api.modules.annotation.formula import Dimension, Formula, Measure
+from app.api.modules.annotation.query import OutputRelation
+from app.core.filters import FieldCondition, MergeMap, MergeMapEntry
+
+
+class _FakeRedis:
+    """Just the commands relation_cache uses."""
+
+    def __init__(self):
+        self.kv: dict = {}
+        self.zset: dict = {}
+        self.threads: set = set()
+
+    def get(self, k):
+        self.threads.add(threading.current_thread())
+        return self.kv.get(k)
+
+    def set(self, k, v, ex=None):
+        self.kv[k] = v
+
+    def delete(self, *keys):
+        for k in keys:
+            self.kv.pop(k, None)
+
+    def incr(self, k):
+        self.kv[k] = int(self.kv.get(k, 0)) + 1
+
+    def incrby(self, k, n):
+        self.kv[k] = int(self.kv.get(k, 0)) + n
+
+    def expire(self, k, ttl):
+        pass
+
+    def mget(self, keys):
+        return [self.kv.get(k) for k in keys]
+
+    def zadd(self, k, mapping):
+        self.zset.update(mapping)
+
+    def zcard(self, k):
+        return len(self.zset)
+
+    def zpopmin(self, k, n):
+        oldest = sorted(self.zset.items(), key=lambda kv: kv[1])[:n]
+        for member, _ in oldest:
+            del self.zset[member]
+        return oldest
+
+    def pipeline(self, transaction=False):
+        outer = self
+
+        class _Pipe:
+            def __init__(self):
+                self.results = []
+
+            def __getattr__(self, name):
+                def call(*a, **kw):
+                    self.results.append(getattr(outer, name)(*a, **kw))
+                    return self
+                return call
+
+            def execute(self):
+                return self.results
+
+        return _Pipe()
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    r = _FakeRedis()
+    monkeypatch.setattr(relation_cache, "_redis", lambda: r)
+    return r
+
+
+def _aq(**overrides):
+    base = dict(
+        _infospace_id=1, _run_ids=[3, 1], _schema_ids=[], _asset_ids=[],
+        _package_scope=None, _conditions=[], _merge_maps=[],
+        _limit=100, _cursor=None,
+    )
+    base.update(overrides)
+    return SimpleNamespace(**base)
+
+
+def _formula():
+    return Formula(
+        id="f", name="by_label",
+        group=[Dimension(name="label", kind="field", path="label")],
+        measures=[Measure(name="n", agg="count")],
+    )
+
+
+def test_state_is_order_insensitive_for_id_sets():
+    a = relation_cache.canonical_state(_aq(_run_ids=[3, 1]), _formula())
+    b = relation_cache.canonical_state(_aq(_run_ids=[1, 3]), _formula())
+    assert a == b
+
+
+def test_state_keeps_merge_map_order():
+    m1 = MergeMap(field_path="label", entries=[MergeMapEntry(keep="A", names=["a"])])
+    m2 = MergeMap(field_path="label", entries=[MergeMapEntry(keep="B", names=["a"])])
+    a = relation_cache.canonical_state(_aq(_merge_maps=[m1, m2]), _formula())
+    b = relation_cache.canonical_state(_aq(_merge_maps=[m2, m1]), _formula())
+    assert a != b
+
+
+def test_state_distinguishes_filters_and_scope():
+    cond = FieldCondition(path="label", operator="eq", value="x")
+    plain = relation_cache.canonical_state(_aq(), _formula())
+    filtered = relation_cache.canonical_state(_aq(_conditions=[cond]), _formula())
+    empty_scope = relation_cache.canonical_state(
+        _aq(_package_scope=SimpleNamespace(run_ids=())), _formula(),
+    )
+    assert plain != filtered
+    assert plain["scope"] is None and empty_scope["scope"] == []
+
+
+def test_get_put_roundtrip_counts_hits_and_misses(fake_redis):
+    rel = OutputRelation(rows=[], output_keys=["label"])
+    assert relation_cache.get("relcache:v1:k") is None
+    relation_cache.put("relcache:v1:k", rel)
+    assert relation_cache.get("relcache:v1:k") == rel
+    assert fake_redis.kv["relcache:miss"] == 1
+    assert fake_redis.kv["relcache:hit"] == 1
+
+
+def test_put_trims_lru_index(fake_redis, monkeypatch):
+    monkeypatch.setattr(relation_cache.settings, "RELATION_CACHE_MAX_ENTRIES", 2)
+    rel = OutputRelation(rows=[], output_keys=["label"])
+    for i in range(3):
+        fake_redis.zset[f"relcache:v1:{i}"] = float(i)
+        fake_redis.kv[f"relcache:v1:{i}"] = rel.model_dump_json()
+    relation_cache.put("relcache:v1:new", rel)
+    assert len(fake_redis.zset) == 2
+    assert "relcache:v1:0" not in fake_redis.kv
+    assert "relcache:v1:new" in fake_redis.kv
+
+
+def test_invalidate_moves_each_family_member(fake_redis):
+    relation_cache.invalidate_runs([7, None, 7, 2])
+    first = dict(fake_redis.kv)
+    assert set(first) == {"relcache:gen:7", "relcache:gen:2"}
+    relation_cache.invalidate_runs([7])
+    assert fake_redis.kv["relcache:gen:7"] != first["relcache:gen:7"]
+    assert fake_redis.kv["relcache:gen:2"] == first["relcache:gen:2"]
+
+
+def test_lookup_reads_no_db_and_misses_after_a_write(fake_redis):
+    aq = _aq()  # no _session: any DB read would fail the lookup
+    rel = OutputRelation(rows=[], output_keys=["label"])
+    key, cached = relation_cache.lookup(aq, _formula())
+    assert key is not None and cached is None
+    relation_cache.store(key, rel)
+    assert relation_cache.lookup(aq, _formula()) == (key, rel)
+
+    relation_cache.invalidate_runs([3])
+    new_key, cached = relation_cache.lookup(aq, _formula())
+    assert new_key != key and cached is None
+
+
+def test_marked_runs_invalidate_on_commit_only(fake_redis):
+    relation_cache.install_listeners()
+    relation_cache.install_listeners()  # idempotent
+    session = Session()
+    relation_cache.mark(session, [5, None])
+    session.commit()
+    assert "relcache:gen:5" in fake_redis.kv
+    assert relation_cache.PENDING not in session.info
+
+    fake_redis.kv.clear()
+    session.begin()
+    relation_cache.mark(session, [5])
+    session.rollback()
+    session.commit()
+    assert fake_redis.kv == {}
+
+
+def test_flush_collects_annotation_runs_only():
+    annotation = SimpleNamespace(__tablename__="annotation", run_id=4)
+    asset = SimpleNamespace(__tablename__="asset", run_id=9)
+    session = SimpleNamespace(info={}, new=[annotation], dirty=[asset], deleted=[])
+    relation_cache._collect_writes(session, None)
+    assert session.info[relation_cache.PENDING] == {4}
+
+
+def test_async_view_lookup_leaves_the_event_loop(fake_redis):
+    """``relation()`` under ``run_sync`` runs in a greenlet on the loop thread."""
+    loop_threads = set()
+
+    async def main():
+        loop_threads.add(threading.current_thread())
+        return await greenlet_spawn(relation_cache.lookup, _aq(), _formula())
+
+    key, _ = asyncio.run(main())
+    assert key is not None
+    assert fake_redis.threads and not fake_redis.threads & loop_threads
@@ -0,0 +1,128 @@
+"""Benchmark for set-based ``resolve_entities_batch`` — 10k raw entities.
+
+Opt-in (``pytest -m scale``). Seeds 5k entities into a fresh canon, then
+resolves 10k raw mentions: 5k case/whitespace variants of existing names
+and 5k new names. Asserts the batch stays set-based — statement count is
+independent of batch size — and reports wall time.
+
+The per-entity implementation issued one alias query plus one
+``session.get`` per hit and one INSERT per creation: ~15k round trips for
+this batch.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+import uuid
+
+import pytest
+from sqlalchemy import event
+
+from app.api.modules.graph.models import Entity
+from app.api.modules.graph.resolution import resolve_entities_batch
+from app.core.config import settings
+
+pytestmark = pytest.mark.scale
+
+API = settings.API_V1_STR
+N_EXISTING = 5_000
+N_NEW = 5_000
+
+
+@pytest.fixture(scope="module")
+def workspace(infospace_factory, user_id):
+    return infospace_factory(f"Resolution scale {uuid.uuid4().hex[:6]}", user_id)
+
+
+def _db_session():
+    from app.api.dependency_injection import get_db
+    gen = get_db()
+    return next(gen), gen
+
+
+class _StatementCounter:
+    def __init__(self, bind):
+        self.bind = bind
+        self.count = 0
+
+    def _on_execute(self, *args, **kwargs):
+        self.count += 1
+
+    def __enter__(self):
+        event.listen(self.bind, "before_cursor_execute", self._on_execute)
+        return self
+
+    def __exit__(self, *exc):
+        event.remove(self.bind, "before_cursor_execute", self._on_execute)
+
+
+def test_resolve_10k_raw_entities_is_set_based(client, headers, workspace):
+    canon_id = client.post(
+        f"{API}/infospaces/{workspace}/canons",
+        headers=headers,
+        json={"name": f"Scale-{uuid.uuid4().hex[:6]}"},
+    ).json()["id"]
+    tag = uuid.uuid4().hex[:6]
+
+    db, gen = _db_session()
+    try:
+        db.add_all([
+            Entity(
+                infospace_id=workspace,
+                canon_id=canon_id,
+                canonical_name=f"Org {tag} {i}",
+                entity_type="Organization",
+                aliases=[f"ORG{tag}{i}"],
+            )
+            for i in range(N_EXISTING)
+        ])
+        db.commit()
+
+        raw = (
+            [(f"  org {tag} {i} ", "Organization") for i in range(N_EXISTING)]
+            + [(f"New {tag} {i}", "Organization") for i in range(N_NEW)]
+        )
+
+        with _StatementCounter(db.get_bind()) as counter:
+            start = time.perf_counter()
+            result = asyncio.run(resolve_entities_batch(
+                session=db,
+                infospace_id=workspace,
+                canon_id=canon_id,
+                entities=raw,
+                use_embeddings=False,
+            ))
+            elapsed = time.perf_counter() - start
+        db.commit()
+        print(f"\nresolve_entities_batch: {len(raw)} raw entities in {elapsed:.2f}s, "
+              f"{counter.count} statements")
+
+        assert len(result) == len(raw)
+        existing_ids = {result[pair].id for pair in raw[:N_EXISTING]}
+        new_ids = {result[pair].id for pair in raw[N_EXISTING:]}
+        assert len(existing_ids) == N_EXISTING
+        assert len(new_ids) == N_NEW
+        assert not existing_ids & new_ids
+        # Projection + unnest alias query + hydration + batched INSERT
+        # (insertmanyvalues pages at 1000 rows) — nowhere near O(n).
+        assert counter.count <= 20
+
+        # A second pass resolves everything without creating rows.
+        with _StatementCounter(db.get_bind()) as counter:
+            again = asyncio.run(resolve_entities_batch(
+                session=db,
+                infospace_id=workspace,
+                canon_id=canon_id,
+                entities=raw,
+                use_embeddings=False,
+            ))
+        assert {e.id for e in again.values()} == existing_ids | new_ids
+        assert counter.count <= 5
+    finally:
+        db.rollback()
+        db.close()
+        try:
+            next(gen)
+        except StopIteration:
+            pass
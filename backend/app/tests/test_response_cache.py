@@ -0,0 +1,60 @@
+"""Pins the LLM response cache key (``annotation/response_cache.py``).
+
+Pure-logic, no DB: what does and does not move the content-addressed key,
+and the opt-in switch. Storage and LRU trimming run against Postgres in
+the functional suite.
+"""
+import pytest
+
+from app.api.modules.annotation import response_cache
+
+
+def _key(**overrides):
+    base = dict(
+        infospace_id=1,
+        text_content="The minister said ...",
+        media_inputs=[{"uuid": "u1", "type": "image", "content": b"\x89PNG", "mime_type": "image/png"}],
+        provider="anthropic",
+        model="claude-x",
+        strategy="single-shot",
+        response_schema={"type": "object", "properties": {"label": {"type": "string"}}},
+        instructions="Label the stance.",
+        thinking_enabled=False,
+        run_config={"temperature": 0.0},
+    )
+    base.update(overrides)
+    return response_cache.response_cache_key(**base)
+
+
+def test_key_is_stable():
+    assert _key() == _key()
+    assert len(_key()) == 64
+
+
+@pytest.mark.parametrize("override", [
+    {"infospace_id": 2},
+    {"text_content": "The minister denied ..."},
+    {"media_inputs": [{"uuid": "u1", "type": "image", "content": b"\x89PNG2", "mime_type": "image/png"}]},
+    {"model": "claude-y"},
+    {"provider": "openai"},
+    {"strategy": "two-phase"},
+    {"response_schema": {"type": "object", "properties": {"label": {"type": "integer"}}}},
+    {"instructions": "Label the tone."},
+    {"thinking_enabled": True},
+    {"run_config": {"temperature": 0.7}},
+])
+def test_key_moves_with_anything_the_provider_sees(override):
+    assert _key(**override) != _key()
+
+
+def test_key_ignores_non_generation_run_config():
+    assert _key(run_config={"temperature": 0.0, "annotation_concurrency": 9,
+                            "api_keys": {"anthropic": "sk"}, "response_cache": True}) == _key()
+
+
+def test_opt_in(monkeypatch):
+    monkeypatch.setattr(response_cache.settings, "ANNOTATION_RESPONSE_CACHE_ENABLED", True)
+    assert not response_cache.enabled_for({})
+    assert response_cache.enabled_for({"response_cache": True})
+    monkeypatch.setattr(response_cache.settings, "ANNOTATION_RESPONSE_CACHE_ENABLED", False)
+    assert not response_cache.enabled_for({"response_cache": True})
@@ -0,0 +1,179 @@
+"""Pins the streaming run export (``annotation/export.py``).
+
+Pure-logic, no DB: column ordering, contract → Parquet typing, cell
+coercion, the drainable Parquet sink, CSV chunking over a fake batch
+stream, and a Parquet round trip over fake cursor partitions. The SQL
+halves (path discovery, server-side cursor) are exercised against
+Postgres by the functional suite.
+"""
+import csv
+import io
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from app.api.modules.annotation.export import (
+    RunExport,
+    _coerce,
+    _DrainableSink,
+    collect_inline_justifications,
+    contract_value_kinds,
+    export_columns,
+)
+
+
+def test_columns_metadata_sorted_then_value_paths_sorted():
+    cols = export_columns(
+        ["value.b", "value.a.x"],
+        flatten_json=True,
+        include_metadata=False,
+        include_justifications=True,
+    )
+    meta, values = cols[:-2], cols[-2:]
+    assert meta == sorted(meta)
+    assert "justifications" in meta
+    assert "value_json" not in meta
+    assert values == ["value.a.x", "value.b"]
+
+
+def test_columns_unflattened_uses_value_json_only():
+    cols = export_columns(
+        ["value.ignored"],
+        flatten_json=False,
+        include_metadata=True,
+        include_justifications=False,
+    )
+    assert "value_json" in cols
+    assert not any(c.startswith("value.") for c in cols)
+    assert "asset_title" in cols and "schema_name" in cols
+
+
+def test_empty_values_keep_value_json_column_when_flattening():
+    cols = export_columns([], flatten_json=True, include_metadata=False,
+                          include_justifications=False, has_empty_values=True)
+    assert "value_json" in cols
+
+
+def test_contract_kinds_type_scalars_and_recurse_objects():
+    contract = {
+        "properties": {
+            "score": {"type": "integer"},
+            "ratio": {"type": ["number", "null"]},
+            "flag": {"type": "boolean"},
+            "label": {"type": "string"},
+            "meta": {"type": "object", "properties": {"n": {"type": "integer"}}},
+            "items": {"type": "array", "items": {"type": "object"}},
+        }
+    }
+    kinds = contract_value_kinds(contract)
+    assert kinds == {
+        "value.score": "int",
+        "value.ratio": "float",
+        "value.flag": "bool",
+        "value.meta.n": "int",
+    }
+
+
+@pytest.mark.parametrize("value,kind,expected", [
+    ("7", "int", 7),
+    ("7.0", "int", 7),
+    ("seven", "int", None),
+    ("", "float", None),
+    ("yes", "bool", True),
+    ("maybe", "bool", None),
+    (3, "string", "3"),
+])
+def test_coerce_is_best_effort(value, kind, expected):
+    assert _coerce(value, kind) == expected
+
+
+def test_sink_tell_survives_drain():
+    sink = _DrainableSink()
+    sink.write(b"abc")
+    assert sink.drain() == b"abc"
+    sink.write(b"de")
+    assert sink.tell() == 5
+    assert sink.drain() == b"de"
+    assert sink.drain() == b""
+
+
+def test_inline_justifications_collects_sibling_and_item_reasons():
+    value = {
+        "label": "x",
+        "label_justification": {"reasoning": "because"},
+        "items": [{"name": "a", "justification": {"reasoning": "seen"}}],
+    }
+    assert collect_inline_justifications(value) == ["label:because", "items[0]:seen"]
+
+
+def test_iter_csv_emits_header_then_one_chunk_per_batch(monkeypatch):
+    export = RunExport(session=None, run_ids=[1], columns=["annotation_id", "value.a"])
+    batches = [
+        [{"annotation_id": 1, "value.a": "x"}],
+        [{"annotation_id": 2, "value.a": "y"}, {"annotation_id": 3}],
+    ]
+    monkeypatch.setattr(RunExport, "iter_batches", lambda self: iter(batches))
+
+    chunks = list(export.iter_csv())
+    assert len(chunks) == 2
+    rows = list(csv.DictReader(io.StringIO(b"".join(chunks).decode("utf-8"))))
+    assert [r["annotation_id"] for r in rows] == ["1", "2", "3"]
+    assert rows[2]["value.a"] == ""
+
+
+class _Cursor:
+    """``session.exec(...)`` result: fixed-size partitions of row tuples."""
+
+    def __init__(self, rows, size):
+        self.rows, self.size = rows, size
+
+    def partitions(self):
+        for i in range(0, len(self.rows), self.size):
+            yield self.rows[i:i + self.size]
+
+
+def test_parquet_round_trip_keeps_every_column_and_row(monkeypatch):
+    pq = pytest.importorskip("pyarrow.parquet")
+
+    at = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    values = [
+        {"label": "a", "score": 1, "tags": []},
+        {"label": "b", "score": "2", "tags": []},
+        {"label": "c", "tags": []},
+        {},
+        {"label": "e", "score": 5, "tags": []},
+    ]
+    rows = [
+        (i, f"uuid-{i}", 100 + i, 10, 1, "success", at, None, value)
+        for i, value in enumerate(values, start=1)
+    ]
+    # What discovery returns for this family: ``value.tags`` is only ever []
+    columns = export_columns(
+        ["value.label", "value.score", "value.tags"],
+        flatten_json=True, include_metadata=False,
+        include_justifications=False, has_empty_values=True,
+    )
+    contract = {"properties": {
+        "label": {"type": "string"},
+        "score": {"type": "integer"},
+        "tags": {"type": "array", "items": {"type": "string"}},
+    }}
+    export = RunExport(
+        session=SimpleNamespace(exec=lambda stmt: _Cursor(rows, size=2)),
+        run_ids=[1], include_metadata=False, batch_size=2, columns=columns,
+        schemas={10: SimpleNamespace(output_contract=contract)},
+    )
+    monkeypatch.setattr(RunExport, "_statement", lambda self: None)
+
+    parquet = pq.ParquetFile(io.BytesIO(b"".join(export.iter_parquet())))
+    table = parquet.read()
+    assert table.column_names == columns
+    assert "value.tags" in table.column_names and "value_json" in table.column_names
+    assert table.num_rows == len(values)
+    assert parquet.metadata.num_row_groups == 3
+    assert str(table.schema.field("value.score").type) == "int64"
+    assert table.column("value.score").to_pylist() == [1, 2, None, None, 5]
+    # Present, all null: flatten_dict joins [] to "", which _coerce writes as null
+    assert table.column("value.tags").to_pylist() == [None] * len(values)
+    assert table.column("value_json").to_pylist() == [None, None, None, "{}", None]
@@ -0,0 +1,72 @@
+"""Pins the blockwise similarity engine (``core/similarity.py``).
+
+Pure NumPy, no DB: tiled results match brute-force cosine regardless of
+tile shape, zero vectors never match, ``top_k`` bounds partners per row,
+``limit`` keeps only the best pairs overall, and ``find_duplicates`` keeps
+its exact-duplicate shortcut.
+"""
+import asyncio
+
+import numpy as np
+import pytest
+
+from app.core.similarity import cosine, find_duplicates, similar_pairs
+
+
+def _brute(vectors, threshold):
+    n = len(vectors)
+    return sorted(
+        (i, j)
+        for i in range(n)
+        for j in range(i + 1, n)
+        if cosine(list(vectors[i]), list(vectors[j])) >= threshold
+    )
+
+
+@pytest.mark.parametrize("block_rows,block_cols", [(7, 11), (64, 64), (1024, 8192)])
+def test_tiled_pairs_match_brute_force(block_rows, block_cols):
+    rng = np.random.default_rng(0)
+    vectors = rng.normal(size=(120, 8)).astype(np.float32)
+    vectors[10] = vectors[3] * 5.0  # scale-invariant duplicate
+    got = similar_pairs(vectors, 0.6, block_rows=block_rows, block_cols=block_cols)
+    assert sorted((i, j) for i, j, _ in got) == _brute(vectors, 0.6)
+    assert all(i < j for i, j, _ in got)
+    sims = [s for _, _, s in got]
+    assert sims == sorted(sims, reverse=True)
+    assert (3, 10) in {(i, j) for i, j, _ in got}
+
+
+def test_zero_vectors_never_match():
+    vectors = [[0.0, 0.0], [0.0, 0.0], [1.0, 0.0]]
+    assert similar_pairs(vectors, 0.0 + 1e-9) == []
+
+
+def test_top_k_bounds_partners_per_row():
+    vectors = np.ones((50, 4), dtype=np.float32)
+    got = similar_pairs(vectors, 0.9, top_k=3, block_rows=8, block_cols=16)
+    per_row: dict[int, int] = {}
+    for i, _, _ in got:
+        per_row[i] = per_row.get(i, 0) + 1
+    assert max(per_row.values()) == 3
+
+
+def test_limit_keeps_most_similar_pairs_overall():
+    rng = np.random.default_rng(1)
+    vectors = rng.normal(size=(200, 6)).astype(np.float32)
+    full = similar_pairs(vectors, 0.3, block_rows=16, block_cols=32)
+    got = similar_pairs(vectors, 0.3, limit=25, block_rows=16, block_cols=32)
+    assert len(got) == 25
+    assert [s for _, _, s in got] == pytest.approx([s for _, _, s in full[:25]])
+    assert similar_pairs(vectors, 0.3, limit=0) == []
+
+
+def test_find_duplicates_keeps_exact_shortcut_and_embeds_representatives():
+    seen: list[list[str]] = []
+
+    async def embed(texts):
+        seen.append(texts)
+        return [[1.0, 0.0], [0.0, 1.0]][: len(texts)]
+
+    pairs = asyncio.run(find_duplicates(["Merkel", " merkel", "Biden"], embed, 0.9))
+    assert seen == [["Merkel", "Biden"]]
+    assert [(p.a_index, p.b_index, p.similarity) for p in pairs] == [(0, 1, 1.0)]
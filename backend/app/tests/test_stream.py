@@ -4,7 +4,9 @@ Tests for the presence infrastructure — stream_key, StreamWriter, StreamHub.
 Tests cover:
 - stream_key: format, param hashing, determinism
 - StreamWriter: XADD payload shape, fire-and-forget contract, counters
-- StreamHub: subscribe/unsubscribe, fan-out, XRANGE catch-up, cleanup
+- Buffered StreamWriter: pipelining, progress coalescing, size/time flush
+- StreamHub: subscribe/unsubscribe, fan-out, XRANGE catch-up, cleanup,
+  multi-key readers, tail pinning, in-memory stats
 - ctx.send: integration with TaskContext
 """
 import asyncio
@@ -152,6 +154,94 @@ class TestStreamWriter:
             assert "2026" in data["ts"]  # datetime serialized to string
 
 
+# ═══════════════════════════════════════════════════
+# StreamWriter(buffered=True) — pipelined, coalescing
+# ═══════════════════════════════════════════════════
+
+def _pipeline_redis(results=None):
+    """Mock redis whose pipeline records commands and returns ``results``."""
+    mock_redis = MagicMock()
+    pipe = mock_redis.pipeline.return_value
+    pipe.execute.side_effect = lambda raise_on_error=True: (
+        results if results is not None else [b"1-0"] * len(pipe.xadd.call_args_list) + [1, 1]
+    )
+    return mock_redis, pipe
+
+
+class TestBufferedStreamWriter:
+
+    @patch("app.core.redis.get_redis")
+    def test_close_writes_one_pipeline_in_order_with_latest_progress(self, mock_get_redis):
+        mock_redis, pipe = _pipeline_redis()
+        mock_get_redis.return_value = mock_redis
+
+        writer = StreamWriter("stream:5:test:1", buffered=True)
+        writer.send("progress", {"done": 1})
+        writer.send("row", {"id": 1})
+        writer.send("progress", {"done": 2})
+        writer.send("row", {"id": 2})
+        mock_redis.pipeline.assert_not_called()
+
+        assert writer.close() is True
+        pipe.execute.assert_called_once()
+        sent = [(c.args[1]["type"], json.loads(c.args[1]["data"])) for c in pipe.xadd.call_args_list]
+        # The superseded snapshot is gone; the latest keeps its send position
+        assert sent == [("row", {"id": 1}), ("progress", {"done": 2}), ("row", {"id": 2})]
+        assert call("stream:sent", 3) in pipe.incrby.call_args_list
+        assert call("stream:coalesced", 1) in pipe.incrby.call_args_list
+        mock_redis.incr.assert_not_called()
+
+    @patch("app.core.redis.get_redis")
+    def test_flushes_on_size(self, mock_get_redis, monkeypatch):
+        mock_redis, pipe = _pipeline_redis()
+        mock_get_redis.return_value = mock_redis
+        monkeypatch.setattr(StreamWriter, "FLUSH_EVENTS", 3)
+
+        writer = StreamWriter("stream:5:test:1", buffered=True)
+        for i in range(3):
+            writer.send("row", {"id": i})
+        assert pipe.xadd.call_count == 3
+        writer.close()
+        assert pipe.execute.call_count == 1  # nothing left to write
+
+    @patch("app.core.redis.get_redis")
+    def test_flushes_on_time(self, mock_get_redis, monkeypatch):
+        import time
+        mock_redis, pipe = _pipeline_redis()
+        mock_get_redis.return_value = mock_redis
+        monkeypatch.setattr(StreamWriter, "FLUSH_INTERVAL_MS", 10)
+
+        writer = StreamWriter("stream:5:test:1", buffered=True)
+        writer.send("progress", {"done": 1})
+        deadline = time.monotonic() + 2
+        while not pipe.execute.called and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert pipe.xadd.call_count == 1
+
+    @patch("app.core.redis.get_redis")
+    def test_family_writes_both_keys_in_one_pipeline(self, mock_get_redis):
+        from app.core.stream import FamilyStreamWriter
+        # Mirror write fails; the primary's result stands
+        mock_redis, pipe = _pipeline_redis(results=[b"1-0", Exception("mirror gone"), 2])
+        mock_get_redis.return_value = mock_redis
+
+        writer = FamilyStreamWriter("stream:5:run:2", "stream:5:run:1", buffered=True)
+        writer.send("progress", {"done": 1})
+        with patch("app.core.stream._incr") as mock_incr:
+            assert writer.close() is True
+        assert [c.args[0] for c in pipe.xadd.call_args_list] == ["stream:5:run:2", "stream:5:run:1"]
+        mock_incr.assert_any_call("stream:dropped", 1)
+
+    @patch("app.core.redis.get_redis")
+    def test_flush_never_raises(self, mock_get_redis):
+        mock_get_redis.side_effect = ConnectionError("Redis down")
+        writer = StreamWriter("stream:5:test:1", buffered=True)
+        assert writer.send("row", {}) is True
+        with patch("app.core.stream._incr") as mock_incr:
+            assert writer.close() is False
+        mock_incr.assert_called_with("stream:dropped", 1)
+
+
 # ═══════════════════════════════════════════════════
 # StreamHub — async fan-out
 # ═══════════════════════════════════════════════════
@@ -185,11 +275,10 @@ class TestStreamHub:
         await q.put({"id": "0", "type": "fill", "data": "{}"})  # fill it
         hub._entries["test_key"] = _HubEntry(subscribers={q})
 
-        with patch("app.core.stream._incr") as mock_incr:
-            hub._fan_out("test_key", {"id": "1", "type": "drop", "data": "{}"})
-            mock_incr.assert_called_with("stream:queue_full")
+        hub._fan_out("test_key", {"id": "1", "type": "drop", "data": "{}"})
 
         assert q.qsize() == 1  # still just the original message
+        assert hub._stats["stream:queue_full"] == 1  # counted in memory
 
     @pytest.mark.asyncio
     async def test_fan_out_ignores_unknown_key(self):
@@ -205,17 +294,156 @@ class TestStreamHub:
         q = asyncio.Queue()
         mock_task = MagicMock()
         mock_task.done.return_value = False
-        hub._entries["key"] = _HubEntry(subscribers={q}, reader_task=mock_task)
+        shard = hub._shard("key")
+        hub._entries["key"] = _HubEntry(subscribers={q}, cursor="0-0")
+        hub._shards[shard].add("key")
+        hub._readers[shard] = mock_task
 
-        with patch("app.core.stream._get_async_redis") as mock_redis, \
-             patch("app.core.stream._incr_neg"):
+        with patch("app.core.stream._get_async_redis") as mock_redis:
             mock_r = AsyncMock()
             mock_redis.return_value = mock_r
 
             await hub.unsubscribe("key", q)
 
         assert "key" not in hub._entries
+        # Last key of the shard: its reader stops
         mock_task.cancel.assert_called_once()
+        mock_r.expire.assert_awaited_once_with("key", StreamWriter.IDLE_TTL)
+        assert hub._stats["stream:active_connections"] == -1
+
+
+class _AsyncStreams:
+    """In-memory stand-in for the redis.asyncio stream commands the hub uses."""
+
+    def __init__(self):
+        self.streams: dict[str, list] = {}
+        self.xread_calls: list[dict] = []
+        self.counters: dict[str, int] = {}
+        self._seq = 0
+        self._written = asyncio.Event()
+
+    @staticmethod
+    def _after(entries, cursor):
+        seq = int(cursor.split("-")[0])
+        return [e for e in entries if int(e[0].split("-")[0]) > seq]
+
+    async def xadd(self, key, fields, maxlen=None, approximate=True):
+        self._seq += 1
+        entry_id = f"{self._seq}-0"
+        self.streams.setdefault(key, []).append((entry_id, fields))
+        self._written.set()
+        return entry_id
+
+    async def xrevrange(self, key, count=None):
+        return self.streams.get(key, [])[-1:]
+
+    async def xrange(self, key, min="-", count=None):
+        return [e for e in self.streams.get(key, []) if int(e[0].split("-")[0]) >= int(min.split("-")[0])]
+
+    async def xread(self, streams, count=None, block=None):
+        self.xread_calls.append(dict(streams))
+        for _ in range(2):
+            found = [(k, self._after(self.streams.get(k, []), c)[:count]) for k, c in streams.items()]
+            found = [(k, entries) for k, entries in found if entries]
+            if found:
+                return found
+            self._written.clear()
+            try:
+                await asyncio.wait_for(self._written.wait(), block / 1000)
+            except asyncio.TimeoutError:
+                return []
+        return []
+
+    async def expire(self, key, ttl):
+        return True
+
+    async def incrby(self, key, amount):
+        self.counters[key] = self.counters.get(key, 0) + amount
+
+    def pipeline(self, transaction=True):
+        redis, queued = self, []
+
+        class _Pipe:
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc):
+                return False
+
+            def __getattr__(self, name):
+                return lambda *a, **kw: queued.append(getattr(redis, name)(*a, **kw))
+
+            async def execute(self):
+                return [await c for c in queued]
+
+        return _Pipe()
+
+
+@pytest.fixture
+def streams(monkeypatch):
+    r = _AsyncStreams()
+    monkeypatch.setattr("app.core.stream._get_async_redis", lambda: r)
+    # Nothing on the event loop may touch the sync client
+    monkeypatch.setattr("app.core.redis.get_redis", MagicMock(side_effect=AssertionError("sync redis")))
+    return r
+
+
+class TestMultiplexedHub:
+
+    async def test_one_reader_serves_many_keys(self, streams, monkeypatch):
+        monkeypatch.setattr(StreamHub, "READERS", 1)
+        hub = StreamHub()
+        queues = {k: await hub.subscribe(k) for k in ("s:a", "s:b", "s:c")}
+        assert len(hub._readers) == 1
+
+        await streams.xadd("s:b", {"type": "progress", "data": '{"n": 1}'})
+        msg = await asyncio.wait_for(queues["s:b"].get(), 1)
+        assert (msg["type"], msg["data"]) == ("progress", '{"n": 1}')
+        assert queues["s:a"].empty() and queues["s:c"].empty()
+        assert {"s:a", "s:b", "s:c"} <= set(streams.xread_calls[-1])
+        await hub.aclose()
+
+    async def test_new_subscription_is_pinned_to_the_stream_tail(self, streams):
+        await streams.xadd("s:a", {"type": "old", "data": "{}"})
+        hub = StreamHub()
+        q = await hub.subscribe("s:a")
+        assert hub._entries["s:a"].cursor == "1-0"
+
+        await streams.xadd("s:a", {"type": "new", "data": "{}"})
+        assert (await asyncio.wait_for(q.get(), 1))["type"] == "new"
+        await hub.aclose()
+
+    async def test_tail_lookup_retries_then_pins_a_concrete_id(self, streams, monkeypatch):
+        monkeypatch.setattr(StreamHub, "TAIL_RETRY_DELAY", 0)
+        calls = []
+
+        async def flaky(key, count=None):
+            calls.append(key)
+            if len(calls) < 3:
+                raise ConnectionError("redis down")
+            return [("7-0", {})]
+
+        monkeypatch.setattr(streams, "xrevrange", flaky)
+        hub = StreamHub()
+        assert await hub._tail_id("s:a") == "7-0"
+
+        async def down(key, count=None):
+            raise ConnectionError("redis down")
+
+        monkeypatch.setattr(streams, "xrevrange", down)
+        monkeypatch.setattr("app.core.stream.time.time", lambda: 1000.0)
+        assert await hub._tail_id("s:a") == f"{1_000_000 - StreamHub.TAIL_CLOCK_SKEW_MS}-0"
+        assert hub._stats["stream:tail_fallback"] == 1
+        await hub.aclose()
+
+    async def test_stats_flush_in_one_pipeline(self, streams):
+        hub = StreamHub()
+        q = await hub.subscribe("s:a")
+        hub.incr("stream:reconnects")
+        await hub.unsubscribe("s:a", q)
+        await hub.aclose()
+        assert streams.counters == {"stream:reconnects": 1}  # +1 / -1 connection nets out
+        assert not hub._stats
 
 
 # ═══════════════════════════════════════════════════
@@ -257,3 +485,59 @@ class TestCtxSend:
 
         result = ctx.send("topic", 1, "event", {})
         assert result is False  # failed but didn't raise
+
+
+# ═══════════════════════════════════════════════════
+# StreamHub load — opt-in: pytest -m scale (needs Redis)
+# ═══════════════════════════════════════════════════
+
+@pytest.fixture
+def live_redis(request):
+    if "scale" not in (request.config.getoption("markexpr") or ""):
+        pytest.skip("load test is opt-in: pytest -m scale")
+    import redis
+    from app.core.config import settings
+    r = redis.Redis.from_url(settings.redis_url, decode_responses=True)
+    try:
+        r.ping()
+    except Exception as exc:
+        pytest.skip(f"Redis not reachable: {exc}")
+    return r
+
+
+@pytest.mark.scale
+async def test_hub_serves_5k_subscribers_on_a_few_connections(live_redis):
+    import time
+    import uuid
+
+    n_keys, per_key = 1000, 5
+    prefix = f"stream:0:hub_load:{uuid.uuid4().hex[:8]}"
+    keys = [f"{prefix}:{i}" for i in range(n_keys)]
+    hub = StreamHub()
+    clients_before = len(live_redis.client_list())
+
+    started = time.perf_counter()
+    subs = [(k, q) for k in keys for q in await asyncio.gather(*(hub.subscribe(k) for _ in range(per_key)))]
+    subscribe_s = time.perf_counter() - started
+    clients_during = len(live_redis.client_list())
+
+    try:
+        started = time.perf_counter()
+        pipe = live_redis.pipeline(transaction=False)
+        for k in keys:
+            pipe.xadd(k, {"type": "tick", "data": "{}"}, maxlen=StreamWriter.MAXLEN, approximate=True)
+        pipe.execute()
+        got = await asyncio.gather(*(asyncio.wait_for(q.get(), 30) for _, q in subs))
+        deliver_s = time.perf_counter() - started
+
+        print(
+            f"\n{len(subs)} subscribers / {n_keys} keys: subscribe {subscribe_s * 1000:.0f} ms, "
+            f"fan-out {deliver_s * 1000:.0f} ms, +{clients_during - clients_before} Redis connections"
+        )
+        assert all(m["type"] == "tick" for m in got)
+        assert clients_during - clients_before <= StreamHub.READERS + StreamHub.IO_CONCURRENCY + 2
+    finally:
+        for k, q in subs:
+            await hub.unsubscribe(k, q)
+        await hub.aclose()
+        live_redis.delete(*keys)
@@ -0,0 +1,97 @@
+"""Pins the streaming CSV/Excel row path (``AssetBuilder.build_children_stream``).
+
+No DB: row generators, the capped parent summary and the COPY tuple
+encoding are checked directly. The COPY round trip itself is covered in
+``test_asset_builder_identity.py``.
+"""
+import io
+from datetime import datetime, timezone
+
+import pytest
+
+from app.api.modules.content.models import AssetKind, ProcessingStatus
+from app.api.modules.content.processors.base import ProcessingContext, SummaryText
+from app.api.modules.content.processors.csv_processor import CSVProcessor
+from app.api.modules.content.processors.excel_processor import ExcelProcessor
+from app.api.modules.content.services.asset_builder import _COPY_COLUMNS, _copy_values
+
+
+def _context(**options):
+    return ProcessingContext(
+        session=None, bundle_service=None, user_id=1, infospace_id=1,
+        storage_provider=None, options=options,
+    )
+
+
+def test_summary_text_is_capped():
+    summary = SummaryText(max_chars=12)
+    for line in ("header", "row 1", "row 2"):
+        summary.add(line)
+    assert summary.text == "header\nrow 1"
+    assert summary.truncated
+    unbounded = SummaryText(max_chars=0)
+    unbounded.add("x" * 10_000)
+    assert not unbounded.truncated
+
+
+def test_csv_rows_are_lazy_field_dicts():
+    processor = CSVProcessor(_context())
+    stream = io.StringIO("name,party\nAda,Greens\n\n,\nBob,Liberals\n")
+    header, delimiter, reader = processor._read_header(stream, None, 0)
+    summary = processor._new_summary(header)
+    rows = processor._iter_row_children(reader, header, 0, 10, summary)
+
+    first = next(rows)
+    assert first["part_index"] == 0
+    assert first["text_content"] == "Ada | Greens"
+    assert first["file_info"]["original_row_data"] == {"name": "Ada", "party": "Greens"}
+    assert [r["title"] for r in rows] == ["2 | Bob | Liberals"]
+    assert summary.text.splitlines() == ["CSV Headers: name | party", "Ada | Greens", "Bob | Liberals"]
+
+
+def test_excel_rows_stream_from_read_only_sheet(tmp_path):
+    openpyxl = pytest.importorskip("openpyxl")
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.title = "Votes"
+    ws.append(["Roll call 12"])
+    ws.append(["member name", "vote cast", "constituency"])
+    ws.append(["Ada", "yes", "North"])
+    ws.append([None, None, None])
+    ws.append(["Bob", "no", "South"])
+    path = tmp_path / "votes.xlsx"
+    wb.save(path)
+
+    processor = ExcelProcessor(_context())
+    book = processor._open_workbook(path)
+    try:
+        head = list(processor._sheet_rows(book["Votes"], 0))
+    finally:
+        book.close()
+    assert len(head) == 4  # blank row dropped
+    idx, header = processor._detect_header_row(head, "Votes")
+    assert idx == 1
+    summary = SummaryText(1000)
+    rows = list(processor._iter_row_children(head[idx + 1:], header, "Votes", 0, "votes.xlsx", 10, summary))
+    assert [r["title"] for r in rows] == ["Votes | 1 | Ada | yes", "Votes | 2 | Bob | no"]
+    assert rows[1]["file_info"]["original_row_data"]["constituency"] == "South"
+
+
+def test_copy_values_match_columns():
+    now = datetime.now(timezone.utc)
+    values = _copy_values(
+        {"title": "r", "text_content": "t", "file_info": {"a": 1}},
+        kind=AssetKind.CSV_ROW, parent_id=7, user_id=3, infospace_id=5, position=4, now=now,
+    )
+    row = dict(zip(_COPY_COLUMNS, values))
+    assert len(values) == len(_COPY_COLUMNS)
+    # Postgres enums store member names
+    assert row["kind"] == "CSV_ROW"
+    assert row["processing_status"] == ProcessingStatus.READY.name
+    assert (row["parent_asset_id"], row["part_index"], row["infospace_id"]) == (7, 4, 5)
+    assert row["file_info"].obj == {"a": 1}
+    assert row["metadata"] is None
+
+    with pytest.raises(ValueError):
+        _copy_values({"blob_path": "x"}, kind=AssetKind.CSV_ROW, parent_id=7, user_id=3,
+                     infospace_id=5, position=0, now=now)
@@ -0,0 +1,142 @@
+"""Benchmark for set-based tree maintenance — 10k-bundle / 1M-asset subtree.
+
+Opt-in (``pytest -m scale``). Requires PostgreSQL, like ``test_tree.py``.
+Seeds a 10,100-bundle subtree (1 root, 100 branches, 100 leaves each) with
+1M assets spread over the leaves, then moves it between parents and copies
+it. Asserts statement counts are independent of subtree size and that the
+incremental counts match DB truth, and reports wall time.
+
+The per-bundle implementation issued one recount scan per bundle, one
+INSERT + one child recount per forked bundle, one membership UPDATE per
+forked bundle and up to 100 name probes: ~40k round trips for this copy.
+"""
+import time
+
+import pytest
+from sqlalchemy import create_engine, event, text
+from sqlmodel import Session
+
+from app.core.tree import ROOT, copy, move
+
+pytestmark = pytest.mark.scale
+
+BRANCHES = 100
+LEAVES_PER_BRANCH = 100
+N_ASSETS = 1_000_000
+MAX_STATEMENTS = 40
+
+
+@pytest.fixture(scope="module")
+def pg_engine():
+    from app.core.config import settings
+    return create_engine(str(settings.SQLALCHEMY_DATABASE_URI), echo=False)
+
+
+@pytest.fixture
+def db(pg_engine, request):
+    if "scale" not in (request.config.getoption("markexpr") or ""):
+        pytest.skip("benchmark is opt-in: pytest -m scale")
+    connection = pg_engine.connect()
+    transaction = connection.begin()
+    session = Session(bind=connection)
+    yield session
+    session.close()
+    transaction.rollback()
+    connection.close()
+
+
+def _bundles(db, names, parents):
+    return [r[0] for r in db.execute(
+        text(
+            "INSERT INTO bundle (name, infospace_id, user_id, parent_bundle_id, sealed, "
+            "asset_count, child_bundle_count, version, uuid, tags, created_at, updated_at) "
+            "SELECT n, 1, 1, p, false, 0, 0, '1.0', gen_random_uuid()::text, '[]'::json, now(), now() "
+            "FROM unnest(CAST(:names AS text[]), CAST(:parents AS int[])) WITH ORDINALITY AS v(n, p, o) "
+            "ORDER BY o RETURNING id"
+        ),
+        {"names": names, "parents": parents},
+    ).fetchall()]
+
+
+@pytest.fixture
+def subtree(db):
+    src = _bundles(db, ["src", "dst"], [ROOT, ROOT])
+    root = _bundles(db, ["big"], [src[0]])[0]
+    branches = _bundles(db, [f"b{i}" for i in range(BRANCHES)], [root] * BRANCHES)
+    leaves = _bundles(
+        db,
+        [f"l{i}" for i in range(BRANCHES * LEAVES_PER_BRANCH)],
+        [b for b in branches for _ in range(LEAVES_PER_BRANCH)],
+    )
+    db.execute(
+        text(
+            "INSERT INTO asset (title, kind, infospace_id, user_id, bundle_ids, uuid, "
+            "processing_status, stub, created_at, updated_at) "
+            "SELECT 'a' || g, 'ARTICLE', 1, 1, "
+            "ARRAY[(CAST(:leaves AS int[]))[1 + g % :n]], gen_random_uuid()::text, "
+            "'READY', false, now(), now() FROM generate_series(1, :total) AS g"
+        ),
+        {"leaves": leaves, "n": len(leaves), "total": N_ASSETS},
+    )
+    db.execute(
+        text("UPDATE bundle SET child_bundle_count = :c WHERE id = :bid"),
+        {"c": BRANCHES, "bid": root},
+    )
+    db.execute(
+        text("UPDATE bundle SET child_bundle_count = 1 WHERE id = :bid"), {"bid": src[0]},
+    )
+    db.execute(text("ANALYZE asset"))
+    return {"src": src[0], "dst": src[1], "root": root}
+
+
+class _StatementCounter:
+    def __init__(self, bind):
+        self.bind = bind
+        self.count = 0
+
+    def _on_execute(self, *args, **kwargs):
+        self.count += 1
+
+    def __enter__(self):
+        event.listen(self.bind, "before_cursor_execute", self._on_execute)
+        return self
+
+    def __exit__(self, *exc):
+        event.remove(self.bind, "before_cursor_execute", self._on_execute)
+
+
+def test_move_and_copy_10k_bundle_subtree(db, subtree):
+    bind = db.connection()
+
+    started = time.perf_counter()
+    with _StatementCounter(bind) as moved:
+        move(db, bundle_ids=[subtree["root"]], out_of=subtree["src"], to=subtree["dst"])
+    move_s = time.perf_counter() - started
+
+    started = time.perf_counter()
+    with _StatementCounter(bind) as copied:
+        result = copy(db, bundle_ids=[subtree["root"]], to=subtree["src"])
+    copy_s = time.perf_counter() - started
+
+    assert moved.count < MAX_STATEMENTS
+    assert copied.count < MAX_STATEMENTS
+    assert result.bundles == 1 + BRANCHES + BRANCHES * LEAVES_PER_BRANCH
+    assert result.assets == N_ASSETS
+
+    counts = dict(db.execute(
+        text("SELECT id, child_bundle_count FROM bundle WHERE id = ANY(:ids)"),
+        {"ids": [subtree["src"], subtree["dst"]]},
+    ).fetchall())
+    assert counts == {subtree["src"]: 1, subtree["dst"]: 1}
+
+    drift = db.execute(text("""
+        SELECT count(*) FROM bundle b
+        WHERE b.infospace_id = 1 AND b.name LIKE 'l%' AND b.asset_count <>
+              (SELECT count(*) FROM asset a WHERE a.bundle_ids @> ARRAY[b.id])
+    """)).scalar()
+    assert drift == 0
+
+    print(
+        f"\nmove 10k-bundle/1M-asset subtree: {move_s:.2f}s ({moved.count} statements); "
+        f"copy: {copy_s:.2f}s ({copied.count} statements)"
+    )
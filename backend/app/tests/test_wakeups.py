@@ -0,0 +1,110 @@
+"""Dirty-marker wakeups (``core/wakeups``) and their use in the dispatcher.
+
+Markers are published on commit and dropped on rollback; the dispatcher
+clears a (task, infospace) pair only once everything pending was sent.
+Runs without a DB or Redis.
+"""
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.orm import Session
+
+from app.core import dispatch, tasks, wakeups
+from app.core.config import settings
+from app.core.tasks import TaskDescriptor
+
+
+class _Redis:
+    """Just enough of the redis-py set API."""
+
+    def __init__(self):
+        self.sets: dict[str, set[str]] = {}
+
+    def sadd(self, key, *members):
+        self.sets.setdefault(key, set()).update(str(m) for m in members)
+
+    def srem(self, key, *members):
+        self.sets.get(key, set()).difference_update(str(m) for m in members)
+
+    def smembers(self, key):
+        return set(self.sets.get(key, ()))
+
+    def delete(self, key):
+        self.sets.pop(key, None)
+
+    def pipeline(self, transaction=True):
+        redis, queued = self, []
+
+        class _Pipe:
+            def __getattr__(self, name):
+                return lambda *a: queued.append(getattr(redis, name)(*a))
+
+            def execute(self):
+                return list(queued)
+
+        return _Pipe()
+
+
+@pytest.fixture
+def redis(monkeypatch):
+    r = _Redis()
+    monkeypatch.setattr(wakeups, "_get_redis", lambda: r)
+    return r
+
+
+def _descriptor(name="t", **kw):
+    return TaskDescriptor(name=name, check=lambda iid: None, celery_task_name=name, **kw)
+
+
+def test_marks_publish_on_commit_only(redis):
+    session = Session()
+    wakeups.mark(session, "asset", [7, None, 9])
+    session.commit()
+    assert redis.sets == {"wakeup:kind:asset": {"7", "9"}}
+    assert wakeups.PENDING not in session.info
+
+    redis.sets.clear()
+    session.begin()
+    wakeups.mark(session, "asset", [7])
+    session.rollback()
+    session.commit()
+    assert redis.sets == {}
+
+
+def test_fan_out_copies_kinds_to_every_waking_task(redis):
+    redis.sadd("wakeup:kind:asset", 1, 2)
+    redis.sadd("wakeup:kind:chunk", 3)
+    enrich = _descriptor("enrich", wakes_on=frozenset({"asset"}))
+    embed = _descriptor("embed", wakes_on=frozenset({"asset", "chunk"}))
+
+    wakeups.fan_out([enrich, embed])
+    assert wakeups.dirty_infospaces("enrich") == [1, 2]
+    assert wakeups.dirty_infospaces("embed") == [1, 2, 3]
+    assert "wakeup:kind:asset" not in redis.sets
+
+    wakeups.settle("embed", [1, 3])
+    assert wakeups.dirty_infospaces("embed") == [2]
+
+
+def test_only_fully_dispatched_infospaces_settle(monkeypatch):
+    from app.core.celery_app import celery_app
+    monkeypatch.setattr(celery_app, "send_task", lambda name, args, queue: None)
+    monkeypatch.setattr(dispatch, "_get_redis", lambda: None)
+    monkeypatch.setattr(tasks, "_get_redis", lambda: None)
+    # 1: a partial page, 2: a full page (more may follow), 3: nothing pending
+    found = {1: [1, 2, 3], 2: list(range(10, 20))}
+    monkeypatch.setattr(dispatch, "_pending", lambda desc, ids, per: {i: found[i] for i in ids if i in found})
+    desc = _descriptor(batch=5, max_concurrency=2, dispatch_filter=lambda isp: isp.id != 4)
+
+    settled = set()
+    infospaces = [SimpleNamespace(id=i) for i in range(1, 5)]
+    assert dispatch._dispatch_task(desc, infospaces, budget=100, settled=settled) == 13
+    assert settled == {1, 3, 4}
+
+
+def test_wakeup_tasks_sweep_slowly(monkeypatch):
+    monkeypatch.setattr(settings, "DISPATCH_WAKEUP_SWEEP_SECONDS", 900)
+    assert dispatch._sweep_interval(_descriptor(schedule=60)) == 60
+    assert dispatch._sweep_interval(_descriptor(schedule=60, wakes_on=frozenset({"asset"}))) == 900
+    assert dispatch._sweep_interval(_descriptor(schedule=3600, wakes_on=frozenset({"asset"}))) == 3600
+    assert dispatch._sweep_interval(_descriptor(wakes_on=frozenset({"asset"}))) is None
@@ -0,0 +1,108 @@
+"""Per-process worker event loop (``core/worker_loop``) behind ``run_async_in_celery``."""
+import asyncio
+import contextvars
+import signal
+
+import pytest
+
+from app.core import worker_loop
+from app.core.task_utils import run_async_in_celery
+
+
+@pytest.fixture(autouse=True)
+def fresh_loop():
+    yield
+    worker_loop.stop()
+
+
+def test_loop_and_loop_bound_clients_outlive_a_call():
+    async def client():
+        return asyncio.get_running_loop(), asyncio.Lock()
+
+    first_loop, lock = run_async_in_celery(client)
+    second_loop, _ = run_async_in_celery(client)
+    assert first_loop is second_loop and first_loop.is_running()
+
+    async def use(lock):
+        async with lock:  # a primitive bound to the loop keeps working
+            return True
+
+    assert run_async_in_celery(use, lock)
+
+
+def test_timeout_cancels_coroutine_on_the_loop():
+    seen = []
+
+    async def slow():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            seen.append("cancelled")
+            raise
+
+    with pytest.raises(TimeoutError):
+        worker_loop.run(slow(), timeout=0.05)
+    assert seen == ["cancelled"]
+
+
+def test_interrupted_caller_cancels_coroutine():
+    class SoftTimeLimit(Exception):
+        pass
+
+    def raise_limit(signum, frame):
+        raise SoftTimeLimit()
+
+    seen = []
+
+    async def slow():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            seen.append("cancelled")
+            raise
+
+    previous = signal.signal(signal.SIGALRM, raise_limit)
+    signal.setitimer(signal.ITIMER_REAL, 0.05)
+    try:
+        with pytest.raises(SoftTimeLimit):
+            worker_loop.run(slow())
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+    assert seen == ["cancelled"]
+
+
+def test_spawned_tasks_do_not_outlive_their_call():
+    spawned = []
+
+    async def fire_and_forget():
+        spawned.append(asyncio.get_running_loop().create_task(asyncio.sleep(10)))
+
+    worker_loop.run(fire_and_forget())
+    assert spawned[0].cancelled()
+
+
+def test_runs_in_callers_context_and_refuses_reentry():
+    var = contextvars.ContextVar("var", default=None)
+    var.set("caller")
+
+    async def read():
+        return var.get()
+
+    assert worker_loop.run(read()) == "caller"
+
+    async def nested():
+        return worker_loop.run(read())
+
+    with pytest.raises(RuntimeError):
+        worker_loop.run(nested())
+
+
+def test_stop_then_run_starts_a_new_loop():
+    async def current():
+        return asyncio.get_running_loop()
+
+    first = worker_loop.run(current())
+    worker_loop.stop()
+    assert first.is_closed()
+    assert worker_loop.run(current()) is not first